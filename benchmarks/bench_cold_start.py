@@ -0,0 +1,61 @@
+"""
+コールドスタートのベンチマーク
+
+YouTubeClient / VideoSearchService の生成コストと、
+サービスオブジェクト（ディスカバリードキュメントの解析）の生成コストを計測する。
+ネットワークには接続しない（同梱の静的ディスカバリードキュメントを使用）。
+
+使い方:
+    python benchmarks/bench_cold_start.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from googleapiclient.discovery import build
+
+from src.application.video_search_service import VideoSearchService
+from src.infrastructure.youtube_client import YouTubeClient, clear_service_cache
+
+ITERATIONS = 200
+API_KEY = "benchmark_dummy_key"
+
+
+def _measure(func, iterations: int = ITERATIONS) -> float:
+    """1回あたりの平均実行時間（ミリ秒）を返す"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def main():
+    """ベンチマークを実行"""
+    # 従来方式: コンストラクタごとにbuild()を実行
+    eager_ms = _measure(lambda: build("youtube", "v3", developerKey=API_KEY, static_discovery=True,
+                                      cache_discovery=False))
+
+    # 現在の方式: 生成時はbuild()を呼ばない
+    clear_service_cache()
+    construct_ms = _measure(lambda: VideoSearchService(YouTubeClient(api_key=API_KEY)))
+
+    # 初回API呼び出し時のサービスオブジェクト生成（1回のみ）
+    clear_service_cache()
+    client = YouTubeClient(api_key=API_KEY)
+    start = time.perf_counter()
+    client.youtube
+    first_access_ms = (time.perf_counter() - start) * 1000
+
+    # 2回目以降はプロセス全体で共有
+    shared_ms = _measure(lambda: YouTubeClient(api_key=API_KEY).youtube)
+
+    print(f"build()（従来の生成ごとのコスト）     : {eager_ms:8.3f} ms")
+    print(f"YouTubeClient + VideoSearchService生成: {construct_ms:8.3f} ms")
+    print(f"初回API呼び出し時のサービス生成       : {first_access_ms:8.3f} ms")
+    print(f"2回目以降（共有サービスの参照）       : {shared_ms:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
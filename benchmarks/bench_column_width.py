@@ -0,0 +1,95 @@
+"""
+Excelエクスポートのカラム幅計算のベンチマーク
+
+1文字ずつ判定する従来の計算と、ColumnWidthTrackerによる計算
+（上限に達した列の打ち切り＋encodeによる幅計算）の時間を比較する。
+
+使い方:
+    python benchmarks/bench_column_width.py [件数]
+"""
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.domain.models import VideoInfo
+from src.infrastructure.excel_exporter import ExcelExporter, ColumnWidthTracker, HEADERS
+
+DEFAULT_ROWS = 10_000
+ITERATIONS = 5
+
+WORDS = ["Python", "プログラミング", "入門", "講座", "料理", "レシピ", "ゲーム実況", "tutorial", "review"]
+
+
+def _make_videos(rows: int) -> list:
+    """ランダムなタイトル・概要・タグの動画情報を作成"""
+    rng = random.Random(0)
+    return [
+        VideoInfo(
+            video_id=f"vid{i:08d}",
+            title=" ".join(rng.choices(WORDS, k=5)),
+            url=f"https://www.youtube.com/watch?v=vid{i:08d}",
+            channel_name=rng.choice(WORDS) + "チャンネル",
+            channel_id="UC1234567890123456789012",
+            view_count=rng.randrange(10 ** 7),
+            like_count=rng.randrange(10 ** 5),
+            comment_count=rng.randrange(10 ** 4),
+            published_at=datetime(2024, 1, 1),
+            duration_seconds=rng.randrange(3600),
+            is_short=False,
+            description=" ".join(rng.choices(WORDS, k=300)),
+            tags=rng.choices(WORDS, k=15)
+        )
+        for i in range(rows)
+    ]
+
+
+def _legacy_widths(rows: list) -> list:
+    """従来の計算（全セルを1文字ずつ判定）"""
+    max_lengths = [sum(2 if ord(c) > 127 else 1 for c in header) for header in HEADERS]
+    for row in rows:
+        for col_idx, value in enumerate(row):
+            if value:
+                length = sum(2 if ord(c) > 127 else 1 for c in str(value))
+                max_lengths[col_idx] = max(max_lengths[col_idx], length)
+    return [min(max(length + 2, 20), 80) for length in max_lengths]
+
+
+def _tracker_widths(rows: list) -> list:
+    """ColumnWidthTrackerによる計算"""
+    tracker = ColumnWidthTracker(HEADERS)
+    for row in rows:
+        if tracker.all_saturated:
+            break
+        tracker.update(row)
+    return tracker.widths()
+
+
+def _measure(func, rows: list) -> float:
+    """1回あたりの平均時間（ミリ秒）を返す"""
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        func(rows)
+    return (time.perf_counter() - start) / ITERATIONS * 1000
+
+
+def main():
+    """ベンチマークを実行"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    exporter = ExcelExporter()
+    rows = [exporter._row_values(i, video) for i, video in enumerate(_make_videos(count), start=1)]
+
+    assert _legacy_widths(rows) == _tracker_widths(rows)
+
+    legacy_ms = _measure(_legacy_widths, rows)
+    tracker_ms = _measure(_tracker_widths, rows)
+    print(f"{count:,}行のカラム幅計算")
+    print(f"従来            {legacy_ms:10.2f} ms")
+    print(f"Tracker         {tracker_ms:10.2f} ms ({legacy_ms / tracker_ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+エクスポート形式ごとのファイルサイズ・書き出し時間・読み込み時間のベンチマーク
+
+指定件数（デフォルト5000件）の動画情報をExcel・CSV・JSON Lines・Parquetに出力し、
+ファイルサイズと、書き出し・読み込みにかかる時間を比較する。
+
+使い方:
+    python benchmarks/bench_export_formats.py [件数]
+"""
+import csv
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openpyxl import load_workbook
+
+from src.domain.models import VideoInfo
+from src.infrastructure.csv_exporter import CsvExporter, CSV_ENCODING
+from src.infrastructure.excel_exporter import ExcelExporter
+from src.infrastructure.jsonl_exporter import JsonlExporter
+from src.infrastructure.parquet_exporter import ParquetExporter, PYARROW_AVAILABLE
+
+DEFAULT_ROWS = 5_000
+
+WORDS = ["Python", "プログラミング", "入門", "講座", "料理", "レシピ", "ゲーム実況", "tutorial", "review"]
+CHANNELS = [f"チャンネル{i}" for i in range(200)]
+
+
+def _make_videos(rows: int) -> list:
+    """ランダムな動画情報を作成"""
+    rng = random.Random(0)
+    return [
+        VideoInfo(
+            video_id=f"vid{i:08d}",
+            title=" ".join(rng.choices(WORDS, k=5)),
+            url=f"https://www.youtube.com/watch?v=vid{i:08d}",
+            channel_name=rng.choice(CHANNELS),
+            channel_id=f"UC{rng.randrange(200):022d}",
+            view_count=rng.randrange(10 ** 7),
+            like_count=rng.randrange(10 ** 5),
+            comment_count=rng.randrange(10 ** 4),
+            published_at=datetime(2024, 1, 1) + timedelta(minutes=i),
+            duration_seconds=rng.randrange(3600),
+            is_short=rng.random() < 0.2,
+            description=" ".join(rng.choices(WORDS, k=50)),
+            tags=rng.choices(WORDS, k=8),
+            thumbnail_url=f"https://i.ytimg.com/vi/vid{i:08d}/hqdefault.jpg"
+        )
+        for i in range(rows)
+    ]
+
+
+def _load_xlsx(file_path: str) -> int:
+    wb = load_workbook(file_path, read_only=True)
+    return sum(1 for _ in wb.active.iter_rows(values_only=True)) - 1
+
+
+def _load_csv(file_path: str) -> int:
+    with open(file_path, encoding=CSV_ENCODING, newline="") as f:
+        return sum(1 for _ in csv.DictReader(f))
+
+
+def _load_jsonl(file_path: str) -> int:
+    with open(file_path, encoding="utf-8") as f:
+        return sum(1 for line in f if json.loads(line))
+
+
+def _load_parquet(file_path: str) -> int:
+    import pyarrow.parquet as pq
+    return pq.read_table(file_path).num_rows
+
+
+def main():
+    """ベンチマークを実行"""
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    videos = _make_videos(rows)
+
+    targets = [
+        (ExcelExporter, _load_xlsx),
+        (CsvExporter, _load_csv),
+        (JsonlExporter, _load_jsonl),
+    ]
+    if PYARROW_AVAILABLE:
+        targets.append((ParquetExporter, _load_parquet))
+    else:
+        print("pyarrowがインストールされていないため、Parquetは計測しません")
+
+    print(f"{rows:,}件の動画情報\n")
+    print(f"{'形式':<10} {'サイズ (MB)':>12} {'書き出し (s)':>13} {'読み込み (s)':>13}")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for exporter_class, load in targets:
+            exporter = exporter_class()
+            file_path = os.path.join(temp_dir, f"videos{exporter.file_extension}")
+
+            start = time.perf_counter()
+            exporter.export(videos, file_path)
+            write_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            assert load(file_path) == rows
+            load_seconds = time.perf_counter() - start
+
+            size_mb = os.path.getsize(file_path) / 1024 / 1024
+            print(f"{exporter.file_extension:<10} {size_mb:12.2f} {write_seconds:13.2f} {load_seconds:13.2f}")
+
+
+if __name__ == "__main__":
+    main()
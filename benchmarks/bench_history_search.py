@@ -0,0 +1,79 @@
+"""
+検索履歴検索のベンチマーク
+
+指定件数（デフォルト100万件）の検索履歴を一時データベースに登録し、
+全文検索インデックス（FTS5 trigram）とLIKEによる全件走査の検索時間を比較する。
+
+使い方:
+    python benchmarks/bench_history_search.py [件数]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.application.history_service import HistoryService
+
+DEFAULT_ROWS = 1_000_000
+ITERATIONS = 20
+QUERIES = ["python", "プログラミング", "料理 レシピ", "ゲーム実況", "zzz_not_found"]
+
+WORDS = [
+    "Python", "JavaScript", "プログラミング", "入門", "講座", "料理", "レシピ", "簡単",
+    "ゲーム実況", "マインクラフト", "旅行", "vlog", "猫", "犬", "音楽", "ライブ",
+    "筋トレ", "ダイエット", "メイク", "ニュース", "解説", "まとめ", "tutorial", "review",
+]
+
+
+def _populate(service: HistoryService, rows: int) -> None:
+    """ランダムなキーワードの履歴を登録（トリガーでインデックスも更新される）"""
+    rng = random.Random(0)
+    with service._db.connection() as conn:
+        conn.executemany("""
+            INSERT INTO search_history (
+                keyword, video_type, max_results, sort_order, result_count, searched_at
+            ) VALUES (?, 'all', 50, 'viewCount', 0, ?)
+        """, (
+            (" ".join(rng.sample(WORDS, 3)) + f" {i % 1000}", f"2024-01-01T00:00:{i % 60:02d}.{i:06d}")
+            for i in range(rows)
+        ))
+
+
+def _measure(service: HistoryService, query: str) -> float:
+    """1回あたりの平均検索時間（ミリ秒）を返す"""
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        service.search_history(query, limit=50)
+    return (time.perf_counter() - start) / ITERATIONS * 1000
+
+
+def main():
+    """ベンチマークを実行"""
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        service = HistoryService(os.path.join(temp_dir, "bench.db"))
+        if not service._fts_available:
+            print("このSQLiteでは全文検索インデックス（FTS5 trigram）が使えません")
+            return
+
+        start = time.perf_counter()
+        _populate(service, rows)
+        print(f"{rows:,}件の履歴を登録: {time.perf_counter() - start:.1f}秒\n")
+
+        print(f"{'クエリ':<16} {'FTS5 (ms)':>10} {'LIKE (ms)':>10} {'倍率':>7}")
+        for query in QUERIES:
+            service._fts_available = True
+            fts_ms = _measure(service, query)
+            service._fts_available = False
+            like_ms = _measure(service, query)
+            print(f"{query:<16} {fts_ms:10.2f} {like_ms:10.2f} {like_ms / fts_ms:6.1f}x")
+
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
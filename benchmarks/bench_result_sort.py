@@ -0,0 +1,69 @@
+"""
+検索結果のソートのベンチマーク
+
+指定件数（デフォルト1万件）の動画情報で表示用モデルを作成し、
+カラムごとのソート（第1キー＋第2キー）と表示範囲の取得にかかる時間を計測する。
+
+使い方:
+    python benchmarks/bench_result_sort.py [件数]
+"""
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.domain.models import VideoInfo
+from src.ui.result_model import ResultModel, COLUMNS
+
+DEFAULT_ROWS = 10_000
+ITERATIONS = 20
+PAGE_SIZE = 30
+
+WORDS = ["Python", "プログラミング", "入門", "講座", "料理", "レシピ", "ゲーム実況", "tutorial", "review"]
+
+
+def _make_videos(rows: int) -> list:
+    """ランダムな動画情報を作成"""
+    rng = random.Random(0)
+    return [
+        VideoInfo(
+            video_id=f"vid{i:08d}",
+            title=" ".join(rng.choices(WORDS, k=4)),
+            url=f"https://www.youtube.com/watch?v=vid{i:08d}",
+            channel_name=f"チャンネル{rng.randrange(200)}",
+            channel_id="UC1234567890123456789012",
+            view_count=rng.randrange(10 ** 7),
+            like_count=rng.randrange(10 ** 5),
+            comment_count=rng.randrange(10 ** 4),
+            published_at=datetime(2024, 1, 1) + timedelta(hours=rng.randrange(10000)),
+            duration_seconds=rng.randrange(3600),
+            is_short=rng.random() < 0.2
+        )
+        for i in range(rows)
+    ]
+
+
+def main():
+    """ベンチマークを実行"""
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    videos = _make_videos(rows)
+
+    start = time.perf_counter()
+    model = ResultModel(videos)
+    print(f"{rows:,}件のモデル作成（整形・ソートキー計算）: {(time.perf_counter() - start) * 1000:.1f} ms\n")
+
+    print(f"{'カラム':<12} {'ソート＋表示範囲 (ms)':>22}")
+    for column in COLUMNS:
+        start = time.perf_counter()
+        for i in range(ITERATIONS):
+            model.sort([(column, bool(i % 2)), ("views", True)])
+            model.window(0, PAGE_SIZE)
+        elapsed_ms = (time.perf_counter() - start) / ITERATIONS * 1000
+        print(f"{column:<12} {elapsed_ms:22.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+非同期動画検索サービス
+
+AsyncYouTubeClientを使い、1つのイベントループで多数の検索を並行して実行する
+アプリケーションサービス（ヘッドレスのバッチ処理向け）
+"""
+import asyncio
+from typing import AsyncIterator, List, Optional, Sequence, Union
+
+from src.utils.logger import get_logger
+from src.domain.models import VideoInfo, SearchCriteria
+from src.infrastructure.async_youtube_client import AsyncYouTubeClient
+from src.infrastructure.youtube_client import YouTubeAPIError
+from src.infrastructure.statistics_store import StatisticsStore
+
+logger = get_logger(__name__)
+
+
+class AsyncVideoSearchService:
+    """
+    非同期動画検索サービス
+
+    VideoSearchServiceと同じく、検索結果の統計情報を時系列ストアに記録する
+    """
+
+    def __init__(
+        self,
+        youtube_client: Optional[AsyncYouTubeClient] = None,
+        statistics_store: Optional[StatisticsStore] = None
+    ):
+        """
+        初期化
+
+        Args:
+            youtube_client: 非同期YouTubeクライアント（未指定の場合は自動生成）
+            statistics_store: 統計情報の時系列ストア（未指定の場合は記録しない）
+        """
+        self.youtube_client = youtube_client or AsyncYouTubeClient()
+        self.statistics_store = statistics_store
+        logger.info("AsyncVideoSearchServiceを初期化しました")
+
+    async def __aenter__(self) -> "AsyncVideoSearchService":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """クライアントのHTTPセッションを閉じる"""
+        await self.youtube_client.close()
+
+    async def search(self, criteria: SearchCriteria, max_units: Optional[int] = None) -> List[VideoInfo]:
+        """
+        検索条件に基づいて動画を検索
+
+        Args:
+            criteria: 検索条件
+            max_units: この検索で使用するクォータの上限（未指定の場合は残量まで）
+
+        Returns:
+            List[VideoInfo]: 動画情報リスト
+
+        Raises:
+            ValueError: バリデーションエラー
+            YouTubeAPIError: API呼び出しエラー
+        """
+        logger.info(f"動画検索を開始: キーワード='{criteria.keyword}'")
+
+        # バリデーション
+        criteria.validate()
+
+        try:
+            videos = await self.youtube_client.search_videos(criteria, max_units)
+            logger.info(f"検索完了: {len(videos)}件の動画を取得")
+
+        except YouTubeAPIError as e:
+            logger.error(f"動画検索に失敗: {e}")
+            raise
+
+        self._record_statistics(videos)
+        return videos
+
+    async def search_many(
+        self,
+        criteria_list: Sequence[SearchCriteria]
+    ) -> List[Union[List[VideoInfo], Exception]]:
+        """
+        複数の検索条件で並行して検索
+
+        同時に送るAPIリクエスト数はクライアントのmax_concurrencyまでに抑えられる。
+        一部の検索が失敗しても、他の検索は続ける
+
+        Args:
+            criteria_list: 検索条件のリスト
+
+        Returns:
+            List[Union[List[VideoInfo], Exception]]: 検索条件と同じ順の検索結果
+                    （失敗した検索は発生した例外）
+        """
+        results = await asyncio.gather(
+            *(self.search(criteria) for criteria in criteria_list),
+            return_exceptions=True
+        )
+
+        failed = sum(1 for result in results if isinstance(result, BaseException))
+        logger.info(f"{len(criteria_list)}件の検索が完了しました（失敗{failed}件）")
+        return results
+
+    async def iter_videos(
+        self,
+        criteria: SearchCriteria,
+        max_units: Optional[int] = None
+    ) -> AsyncIterator[VideoInfo]:
+        """
+        検索結果の動画を取得した順に1件ずつ返す非同期イテレータ
+
+        Args:
+            criteria: 検索条件
+            max_units: この検索で使用するクォータの上限（未指定の場合は残量まで）
+
+        Yields:
+            VideoInfo: 動画情報（検索順）
+
+        Raises:
+            ValueError: バリデーションエラー
+            YouTubeAPIError: API呼び出しエラー
+        """
+        async for batch in self.iter_batches(criteria, max_units):
+            for video in batch:
+                yield video
+
+    async def iter_batches(
+        self,
+        criteria: SearchCriteria,
+        max_units: Optional[int] = None
+    ) -> AsyncIterator[List[VideoInfo]]:
+        """
+        検索結果をページごとに返す非同期イテレータ
+
+        Args:
+            criteria: 検索条件
+            max_units: この検索で使用するクォータの上限（未指定の場合は残量まで）
+
+        Yields:
+            List[VideoInfo]: 1ページ分の動画情報リスト（検索順）
+
+        Raises:
+            ValueError: バリデーションエラー
+            YouTubeAPIError: API呼び出しエラー
+        """
+        criteria.validate()
+
+        async for batch in self.youtube_client.iter_batches(criteria, max_units):
+            self._record_statistics(batch)
+            yield batch
+
+    def _record_statistics(self, videos: List[VideoInfo]) -> None:
+        """
+        検索結果の統計情報を時系列ストアに記録（失敗しても検索結果は返す）
+
+        Args:
+            videos: 動画情報リスト
+        """
+        if self.statistics_store is None:
+            return
+
+        try:
+            self.statistics_store.record(videos)
+        except Exception as e:
+            logger.warning(f"統計情報の記録に失敗: {e}")
@@ -3,16 +3,60 @@
 
 検索履歴を記録・取得する
 """
-import sqlite3
 import os
-from typing import List, Optional
+import sys
+from array import array
+from dataclasses import replace
+from typing import List, Optional, Iterable
 from datetime import datetime
 
-from src.domain.models import SearchCriteria, SearchHistory
+from src.domain.models import SearchCriteria, SearchHistory, VideoInfo
+from src.database.connection import get_connection_manager, close_connection_manager
+from src.infrastructure.video_cache import VideoCache
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 全文検索インデックス（trigram）で検索できる語の最小文字数
+FTS_MIN_TERM_LENGTH = 3
+
+# 全文検索で並べ替えの対象とする候補数（新しい順）
+# bm25は一致件数に比例して遅くなるため、候補を絞ってから一致の度合いで並べる
+FTS_CANDIDATE_LIMIT = 500
+
+
+def _pack_counts(values: Iterable[int]) -> bytes:
+    """
+    整数リストをint64（リトルエンディアン）の配列に変換
+
+    Args:
+        values: 整数リスト
+
+    Returns:
+        bytes: 配列のバイト列
+    """
+    packed = array("q", values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _unpack_counts(blob: bytes) -> List[int]:
+    """
+    int64（リトルエンディアン）の配列を整数リストに変換
+
+    Args:
+        blob: 配列のバイト列
+
+    Returns:
+        List[int]: 整数リスト
+    """
+    values = array("q")
+    values.frombytes(blob)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tolist()
+
 
 class HistoryService:
     """
@@ -21,30 +65,47 @@ class HistoryService:
     検索履歴をデータベースで管理する
     """
 
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(self, db_path: Optional[str] = None, video_cache: Optional[VideoCache] = None):
         """
         初期化
 
         Args:
             db_path: データベースファイルパス
                     指定しない場合は環境変数DATABASE_PATHまたはデフォルトパスを使用
+            video_cache: 検索結果の復元に使う動画メタデータキャッシュ
+                    指定しない場合は同じデータベースのキャッシュを使用
         """
         self.db_path = db_path or os.getenv("DATABASE_PATH", "youtube_analyzer.db")
+        self._video_cache = video_cache
 
-        # データベースを初期化（テーブルが存在しない場合も対応）
-        from src.database.init_db import DatabaseInitializer
-        initializer = DatabaseInitializer(self.db_path)
-        initializer.initialize()
+        # 接続管理を取得（スキーマの初期化はプロセス内で1回だけ行われる）
+        self._db = get_connection_manager(self.db_path)
+        self._fts_available = self._has_fts_index()
 
         logger.info("HistoryServiceを初期化しました")
 
-    def add_history(self, criteria: SearchCriteria, result_count: int) -> SearchHistory:
+    def close(self) -> None:
+        """
+        データベース接続を閉じる（データベースファイルを削除する前に呼び出す）
+
+        接続は同じデータベースを使う他のサービスと共有しているため、それらの接続も閉じられる
+        """
+        close_connection_manager(self.db_path)
+
+    def add_history(
+        self,
+        criteria: SearchCriteria,
+        result_count: int,
+        videos: Optional[List[VideoInfo]] = None
+    ) -> SearchHistory:
         """
         検索履歴を追加
 
         Args:
             criteria: 検索条件
             result_count: 検索結果件数
+            videos: 検索結果の動画リスト（指定した場合は動画IDと統計情報を保存し、
+                    get_history_resultsで復元できるようにする）
 
         Returns:
             SearchHistory: 追加された検索履歴
@@ -52,34 +113,44 @@ class HistoryService:
         logger.info(f"検索履歴を追加: {criteria.keyword}, 結果件数={result_count}")
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            now = datetime.now()
-
-            cursor.execute("""
-                INSERT INTO search_history (
-                    keyword, min_view_count, max_view_count,
-                    video_type, published_after, published_before,
-                    max_results, sort_order, result_count, searched_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                criteria.keyword,
-                criteria.min_view_count,
-                criteria.max_view_count,
-                criteria.video_type.value if criteria.video_type else None,
-                criteria.published_after.isoformat() if criteria.published_after else None,
-                criteria.published_before.isoformat() if criteria.published_before else None,
-                criteria.max_results,
-                criteria.order,
-                result_count,
-                now.isoformat()
-            ))
-
-            history_id = cursor.lastrowid
-
-            conn.commit()
-            conn.close()
+            with self._db.connection() as conn:
+                cursor = conn.cursor()
+
+                now = datetime.now()
+
+                cursor.execute("""
+                    INSERT INTO search_history (
+                        keyword, min_view_count, max_view_count,
+                        video_type, published_after, published_before,
+                        max_results, sort_order, result_count, searched_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    criteria.keyword,
+                    criteria.min_view_count,
+                    criteria.max_view_count,
+                    criteria.video_type.value if criteria.video_type else None,
+                    criteria.published_after.isoformat() if criteria.published_after else None,
+                    criteria.published_before.isoformat() if criteria.published_before else None,
+                    criteria.max_results,
+                    criteria.order,
+                    result_count,
+                    now.isoformat()
+                ))
+
+                history_id = cursor.lastrowid
+
+                if videos is not None:
+                    cursor.execute("""
+                        INSERT INTO search_history_results (
+                            history_id, video_ids, view_counts, like_counts, comment_counts
+                        ) VALUES (?, ?, ?, ?, ?)
+                    """, (
+                        history_id,
+                        ",".join(video.video_id for video in videos),
+                        _pack_counts(video.view_count for video in videos),
+                        _pack_counts(video.like_count for video in videos),
+                        _pack_counts(video.comment_count for video in videos)
+                    ))
 
             # SearchHistoryオブジェクトを作成
             history = SearchHistory(
@@ -109,20 +180,19 @@ class HistoryService:
         logger.info(f"最近の検索履歴を取得: 上限={limit}件")
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self._db.connection() as conn:
+                cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT id, keyword, min_view_count, max_view_count,
-                       video_type, published_after, published_before,
-                       max_results, sort_order, result_count, searched_at
-                FROM search_history
-                ORDER BY searched_at DESC
-                LIMIT ?
-            """, (limit,))
+                cursor.execute("""
+                    SELECT id, keyword, min_view_count, max_view_count,
+                           video_type, published_after, published_before,
+                           max_results, sort_order, result_count, searched_at
+                    FROM search_history
+                    ORDER BY searched_at DESC
+                    LIMIT ?
+                """, (limit,))
 
-            rows = cursor.fetchall()
-            conn.close()
+                rows = cursor.fetchall()
 
             histories = [self._row_to_history(row) for row in rows]
             logger.info(f"{len(histories)}件の検索履歴を取得しました")
@@ -137,31 +207,70 @@ class HistoryService:
         """
         キーワードで検索履歴を検索
 
+        空白区切りの語をすべて含む履歴を返す。
+        全文検索インデックスが使える場合、3文字以上の語はインデックスで絞り込み、
+        新しい候補の中から完全一致・前方一致・部分一致の順（同順位は新しい順）に並べる。
+        3文字未満の語だけの場合やインデックスがない場合はLIKEで検索し、新しい順に並べる
+
         Args:
             keyword: 検索キーワード
             limit: 取得件数（デフォルト: 50）
 
         Returns:
-            List[SearchHistory]: 検索履歴のリスト（新しい順）
+            List[SearchHistory]: 検索履歴のリスト
         """
         logger.info(f"検索履歴を検索: キーワード={keyword}, 上限={limit}件")
 
+        terms = keyword.split() or [keyword]
+        # trigramトークナイザは3文字未満の語を検索できない
+        fts_terms = [term for term in terms if len(term) >= FTS_MIN_TERM_LENGTH] if self._fts_available else []
+        like_terms = [term for term in terms if term not in fts_terms]
+
+        like_conditions = "".join(" AND h.keyword LIKE ?" for _ in like_terms)
+        like_params = [f"%{term}%" for term in like_terms]
+
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT id, keyword, min_view_count, max_view_count,
-                       video_type, published_after, published_before,
-                       max_results, sort_order, result_count, searched_at
-                FROM search_history
-                WHERE keyword LIKE ?
-                ORDER BY searched_at DESC
-                LIMIT ?
-            """, (f"%{keyword}%", limit))
-
-            rows = cursor.fetchall()
-            conn.close()
+            with self._db.connection() as conn:
+                cursor = conn.cursor()
+
+                if fts_terms:
+                    # 新しい順に候補を絞ってから（インデックスを逆順に走査して打ち切る）、
+                    # 完全一致 → 前方一致 → 部分一致の順に並べる
+                    match_query = " ".join('"' + term.replace('"', '""') + '"' for term in fts_terms)
+                    query = keyword.strip()
+                    cursor.execute(f"""
+                        SELECT h.id, h.keyword, h.min_view_count, h.max_view_count,
+                               h.video_type, h.published_after, h.published_before,
+                               h.max_results, h.sort_order, h.result_count, h.searched_at
+                        FROM (
+                            SELECT search_history_fts.rowid AS id
+                            FROM search_history_fts
+                            JOIN search_history AS h ON h.id = search_history_fts.rowid
+                            WHERE search_history_fts MATCH ?{like_conditions}
+                            ORDER BY search_history_fts.rowid DESC
+                            LIMIT ?
+                        ) AS candidates
+                        JOIN search_history AS h ON h.id = candidates.id
+                        ORDER BY CASE
+                                     WHEN h.keyword = ? COLLATE NOCASE THEN 0
+                                     WHEN h.keyword LIKE ? THEN 1
+                                     ELSE 2
+                                 END,
+                                 h.searched_at DESC
+                        LIMIT ?
+                    """, [match_query] + like_params + [FTS_CANDIDATE_LIMIT, query, f"{query}%", limit])
+                else:
+                    cursor.execute(f"""
+                        SELECT h.id, h.keyword, h.min_view_count, h.max_view_count,
+                               h.video_type, h.published_after, h.published_before,
+                               h.max_results, h.sort_order, h.result_count, h.searched_at
+                        FROM search_history AS h
+                        WHERE 1 = 1{like_conditions}
+                        ORDER BY h.searched_at DESC
+                        LIMIT ?
+                    """, like_params + [limit])
+
+                rows = cursor.fetchall()
 
             histories = [self._row_to_history(row) for row in rows]
             logger.info(f"{len(histories)}件の検索履歴を取得しました")
@@ -172,6 +281,63 @@ class HistoryService:
             logger.error(f"検索履歴検索エラー: {e}", exc_info=True)
             raise
 
+    def get_history_results(self, history_id: int) -> Optional[List[VideoInfo]]:
+        """
+        保存した検索結果を復元
+
+        動画のメタデータは動画メタデータキャッシュから取得し、
+        統計情報は検索時点の値を使用する（APIは呼び出さない）
+
+        Args:
+            history_id: 検索履歴ID
+
+        Returns:
+            Optional[List[VideoInfo]]: 検索結果の動画リスト（検索時の順）
+                    検索結果が保存されていない、またはキャッシュにない動画がある場合はNone
+        """
+        try:
+            with self._db.connection() as conn:
+                row = conn.execute("""
+                    SELECT video_ids, view_counts, like_counts, comment_counts
+                    FROM search_history_results
+                    WHERE history_id = ?
+                """, (history_id,)).fetchone()
+
+        except Exception as e:
+            logger.error(f"検索結果取得エラー: {e}", exc_info=True)
+            raise
+
+        if not row:
+            logger.info(f"検索結果が保存されていません: ID={history_id}")
+            return None
+
+        video_ids_str, view_counts, like_counts, comment_counts = row
+        video_ids = video_ids_str.split(",") if video_ids_str else []
+
+        cached_videos = self._get_video_cache().get_many(video_ids)
+        missing_count = sum(1 for video_id in video_ids if video_id not in cached_videos)
+        if missing_count > 0:
+            logger.info(f"キャッシュにない動画があるため検索結果を復元できません: ID={history_id}, {missing_count}件")
+            return None
+
+        videos = [
+            replace(
+                cached_videos[video_id],
+                view_count=view_count,
+                like_count=like_count,
+                comment_count=comment_count
+            )
+            for video_id, view_count, like_count, comment_count in zip(
+                video_ids,
+                _unpack_counts(view_counts),
+                _unpack_counts(like_counts),
+                _unpack_counts(comment_counts)
+            )
+        ]
+
+        logger.info(f"検索結果を復元しました: ID={history_id}, {len(videos)}件")
+        return videos
+
     def get_history_by_id(self, history_id: int) -> Optional[SearchHistory]:
         """
         IDで検索履歴を取得
@@ -185,19 +351,18 @@ class HistoryService:
         logger.info(f"検索履歴を取得: ID={history_id}")
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self._db.connection() as conn:
+                cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT id, keyword, min_view_count, max_view_count,
-                       video_type, published_after, published_before,
-                       max_results, sort_order, result_count, searched_at
-                FROM search_history
-                WHERE id = ?
-            """, (history_id,))
+                cursor.execute("""
+                    SELECT id, keyword, min_view_count, max_view_count,
+                           video_type, published_after, published_before,
+                           max_results, sort_order, result_count, searched_at
+                    FROM search_history
+                    WHERE id = ?
+                """, (history_id,))
 
-            row = cursor.fetchone()
-            conn.close()
+                row = cursor.fetchone()
 
             if not row:
                 logger.warning(f"検索履歴が見つかりません: ID={history_id}")
@@ -224,14 +389,11 @@ class HistoryService:
         logger.info(f"検索履歴を削除: ID={history_id}")
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self._db.connection() as conn:
+                cursor = conn.cursor()
 
-            cursor.execute("DELETE FROM search_history WHERE id = ?", (history_id,))
-            deleted_count = cursor.rowcount
-
-            conn.commit()
-            conn.close()
+                cursor.execute("DELETE FROM search_history WHERE id = ?", (history_id,))
+                deleted_count = cursor.rowcount
 
             if deleted_count > 0:
                 logger.info(f"検索履歴を削除しました: ID={history_id}")
@@ -254,14 +416,11 @@ class HistoryService:
         logger.warning("すべての検索履歴を削除します")
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("DELETE FROM search_history")
-            deleted_count = cursor.rowcount
+            with self._db.connection() as conn:
+                cursor = conn.cursor()
 
-            conn.commit()
-            conn.close()
+                cursor.execute("DELETE FROM search_history")
+                deleted_count = cursor.rowcount
 
             logger.info(f"{deleted_count}件の検索履歴を削除しました")
             return deleted_count
@@ -270,6 +429,30 @@ class HistoryService:
             logger.error(f"検索履歴削除エラー: {e}", exc_info=True)
             raise
 
+    def _get_video_cache(self) -> VideoCache:
+        """
+        動画メタデータキャッシュを取得（初回呼び出し時に生成）
+
+        Returns:
+            VideoCache: 動画メタデータキャッシュ
+        """
+        if self._video_cache is None:
+            self._video_cache = VideoCache(self.db_path)
+        return self._video_cache
+
+    def _has_fts_index(self) -> bool:
+        """
+        検索履歴の全文検索インデックスが作成されているか確認
+
+        Returns:
+            bool: インデックスが使える場合True
+        """
+        with self._db.connection() as conn:
+            row = conn.execute("""
+                SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'search_history_fts'
+            """).fetchone()
+        return row is not None
+
     def _row_to_history(self, row: tuple) -> SearchHistory:
         """
         データベース行をSearchHistoryオブジェクトに変換
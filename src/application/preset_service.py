@@ -3,12 +3,12 @@
 
 検索条件のプリセットを保存・読込・削除する
 """
-import sqlite3
 import os
 from typing import List, Optional
 from datetime import datetime
 
 from src.domain.models import SearchCriteria, SearchPreset
+from src.database.connection import get_connection_manager, close_connection_manager
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -31,13 +31,19 @@ class PresetService:
         """
         self.db_path = db_path or os.getenv("DATABASE_PATH", "youtube_analyzer.db")
 
-        # データベースを初期化（テーブルが存在しない場合も対応）
-        from src.database.init_db import DatabaseInitializer
-        initializer = DatabaseInitializer(self.db_path)
-        initializer.initialize()
+        # 接続管理を取得（スキーマの初期化はプロセス内で1回だけ行われる）
+        self._db = get_connection_manager(self.db_path)
 
         logger.info("PresetServiceを初期化しました")
 
+    def close(self) -> None:
+        """
+        データベース接続を閉じる（データベースファイルを削除する前に呼び出す）
+
+        接続は同じデータベースを使う他のサービスと共有しているため、それらの接続も閉じられる
+        """
+        close_connection_manager(self.db_path)
+
     def save_preset(self, name: str, criteria: SearchCriteria) -> SearchPreset:
         """
         プリセットを保存
@@ -63,69 +69,66 @@ class PresetService:
         logger.info(f"プリセットを保存: {name}")
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            now = datetime.now().isoformat()
-
-            # 既存のプリセットを確認
-            cursor.execute("SELECT id FROM search_presets WHERE name = ?", (name,))
-            existing = cursor.fetchone()
-
-            if existing:
-                # 更新
-                cursor.execute("""
-                    UPDATE search_presets
-                    SET keyword = ?,
-                        min_view_count = ?,
-                        max_view_count = ?,
-                        video_type = ?,
-                        published_after = ?,
-                        published_before = ?,
-                        max_results = ?,
-                        sort_order = ?,
-                        updated_at = ?
-                    WHERE name = ?
-                """, (
-                    criteria.keyword,
-                    criteria.min_view_count,
-                    criteria.max_view_count,
-                    criteria.video_type.value if criteria.video_type else None,
-                    criteria.published_after.isoformat() if criteria.published_after else None,
-                    criteria.published_before.isoformat() if criteria.published_before else None,
-                    criteria.max_results,
-                    criteria.order,
-                    now,
-                    name
-                ))
-                preset_id = existing[0]
-                logger.info(f"既存のプリセットを更新しました: {name}")
-            else:
-                # 新規作成
-                cursor.execute("""
-                    INSERT INTO search_presets (
-                        name, keyword, min_view_count, max_view_count,
-                        video_type, published_after, published_before,
-                        max_results, sort_order, created_at, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    name,
-                    criteria.keyword,
-                    criteria.min_view_count,
-                    criteria.max_view_count,
-                    criteria.video_type.value if criteria.video_type else None,
-                    criteria.published_after.isoformat() if criteria.published_after else None,
-                    criteria.published_before.isoformat() if criteria.published_before else None,
-                    criteria.max_results,
-                    criteria.order,
-                    now,
-                    now
-                ))
-                preset_id = cursor.lastrowid
-                logger.info(f"新しいプリセットを作成しました: {name}")
-
-            conn.commit()
-            conn.close()
+            with self._db.connection() as conn:
+                cursor = conn.cursor()
+
+                now = datetime.now().isoformat()
+
+                # 既存のプリセットを確認
+                cursor.execute("SELECT id FROM search_presets WHERE name = ?", (name,))
+                existing = cursor.fetchone()
+
+                if existing:
+                    # 更新
+                    cursor.execute("""
+                        UPDATE search_presets
+                        SET keyword = ?,
+                            min_view_count = ?,
+                            max_view_count = ?,
+                            video_type = ?,
+                            published_after = ?,
+                            published_before = ?,
+                            max_results = ?,
+                            sort_order = ?,
+                            updated_at = ?
+                        WHERE name = ?
+                    """, (
+                        criteria.keyword,
+                        criteria.min_view_count,
+                        criteria.max_view_count,
+                        criteria.video_type.value if criteria.video_type else None,
+                        criteria.published_after.isoformat() if criteria.published_after else None,
+                        criteria.published_before.isoformat() if criteria.published_before else None,
+                        criteria.max_results,
+                        criteria.order,
+                        now,
+                        name
+                    ))
+                    preset_id = existing[0]
+                    logger.info(f"既存のプリセットを更新しました: {name}")
+                else:
+                    # 新規作成
+                    cursor.execute("""
+                        INSERT INTO search_presets (
+                            name, keyword, min_view_count, max_view_count,
+                            video_type, published_after, published_before,
+                            max_results, sort_order, created_at, updated_at
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, (
+                        name,
+                        criteria.keyword,
+                        criteria.min_view_count,
+                        criteria.max_view_count,
+                        criteria.video_type.value if criteria.video_type else None,
+                        criteria.published_after.isoformat() if criteria.published_after else None,
+                        criteria.published_before.isoformat() if criteria.published_before else None,
+                        criteria.max_results,
+                        criteria.order,
+                        now,
+                        now
+                    ))
+                    preset_id = cursor.lastrowid
+                    logger.info(f"新しいプリセットを作成しました: {name}")
 
             # SearchPresetオブジェクトを作成
             preset = SearchPreset(
@@ -155,19 +158,18 @@ class PresetService:
         logger.info(f"プリセットを読み込み: {name}")
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self._db.connection() as conn:
+                cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT id, name, keyword, min_view_count, max_view_count,
-                       video_type, published_after, published_before,
-                       max_results, sort_order, created_at, updated_at
-                FROM search_presets
-                WHERE name = ?
-            """, (name,))
+                cursor.execute("""
+                    SELECT id, name, keyword, min_view_count, max_view_count,
+                           video_type, published_after, published_before,
+                           max_results, sort_order, created_at, updated_at
+                    FROM search_presets
+                    WHERE name = ?
+                """, (name,))
 
-            row = cursor.fetchone()
-            conn.close()
+                row = cursor.fetchone()
 
             if not row:
                 logger.warning(f"プリセットが見つかりません: {name}")
@@ -191,19 +193,18 @@ class PresetService:
         logger.info("プリセット一覧を取得")
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self._db.connection() as conn:
+                cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT id, name, keyword, min_view_count, max_view_count,
-                       video_type, published_after, published_before,
-                       max_results, sort_order, created_at, updated_at
-                FROM search_presets
-                ORDER BY updated_at DESC
-            """)
+                cursor.execute("""
+                    SELECT id, name, keyword, min_view_count, max_view_count,
+                           video_type, published_after, published_before,
+                           max_results, sort_order, created_at, updated_at
+                    FROM search_presets
+                    ORDER BY updated_at DESC
+                """)
 
-            rows = cursor.fetchall()
-            conn.close()
+                rows = cursor.fetchall()
 
             presets = [self._row_to_preset(row) for row in rows]
             logger.info(f"{len(presets)}件のプリセットを取得しました")
@@ -227,14 +228,11 @@ class PresetService:
         logger.info(f"プリセットを削除: {name}")
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("DELETE FROM search_presets WHERE name = ?", (name,))
-            deleted_count = cursor.rowcount
+            with self._db.connection() as conn:
+                cursor = conn.cursor()
 
-            conn.commit()
-            conn.close()
+                cursor.execute("DELETE FROM search_presets WHERE name = ?", (name,))
+                deleted_count = cursor.rowcount
 
             if deleted_count > 0:
                 logger.info(f"プリセットを削除しました: {name}")
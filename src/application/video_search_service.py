@@ -3,12 +3,15 @@
 
 YouTube動画の検索ロジックを提供するアプリケーションサービス
 """
-from typing import List, Optional
+from typing import Callable, List, Optional
 from datetime import datetime
 
 from src.utils.logger import get_logger
+from src.utils.cancellation import CancellationToken
 from src.domain.models import VideoInfo, SearchCriteria, SearchHistory
 from src.infrastructure.youtube_client import YouTubeClient, YouTubeAPIError
+from src.infrastructure.statistics_store import StatisticsStore
+from src.infrastructure.video_fields import resolve_field_profile
 
 logger = get_logger(__name__)
 
@@ -20,45 +23,95 @@ class VideoSearchService:
     YouTube APIを使用した動画検索の高レベルインターフェースを提供
     """
 
-    def __init__(self, youtube_client: Optional[YouTubeClient] = None):
+    def __init__(
+        self,
+        youtube_client: Optional[YouTubeClient] = None,
+        statistics_store: Optional[StatisticsStore] = None
+    ):
         """
         初期化
 
         Args:
             youtube_client: YouTubeクライアント（未指定の場合は自動生成）
+            statistics_store: 統計情報の時系列ストア（未指定の場合は記録しない）
         """
         self.youtube_client = youtube_client or YouTubeClient()
+        self.statistics_store = statistics_store
         logger.info("VideoSearchServiceを初期化しました")
 
-    def search(self, criteria: SearchCriteria) -> List[VideoInfo]:
+    def search(
+        self,
+        criteria: SearchCriteria,
+        max_units: Optional[int] = None,
+        on_batch: Optional[Callable[[List[VideoInfo]], None]] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        field_profile: Optional[str] = None
+    ) -> List[VideoInfo]:
         """
         検索条件に基づいて動画を検索
 
         Args:
             criteria: 検索条件
+            max_units: この検索で使用するAPIクォータの上限（未指定の場合は残量まで）
+            on_batch: 取得した動画情報をバッチごとに検索順で受け取るコールバック
+                    （バックグラウンドのスレッドから呼び出される）
+            cancel_token: キャンセルトークン（API呼び出しの合間に確認する）
+            field_profile: 出力先に合わせて取得するフィールドのプロファイル
+                    （full、compact、no_description。未指定の場合はクライアントの設定）
 
         Returns:
             List[VideoInfo]: 動画情報リスト
 
         Raises:
             ValueError: バリデーションエラー
+            OperationCancelledError: 検索がキャンセルされた場合
             YouTubeAPIError: API呼び出しエラー
         """
         logger.info(f"動画検索を開始: キーワード='{criteria.keyword}'")
 
         # バリデーション
         criteria.validate()
+        omit_fields = None if field_profile is None else resolve_field_profile(field_profile)
 
         # YouTube APIで検索
         try:
-            videos = self.youtube_client.search_videos(criteria)
+            videos = self.youtube_client.search_videos(
+                criteria, max_units=max_units, on_batch=on_batch, cancel_token=cancel_token,
+                omit_fields=omit_fields
+            )
             logger.info(f"検索完了: {len(videos)}件の動画を取得")
-            return videos
 
         except YouTubeAPIError as e:
             logger.error(f"動画検索に失敗: {e}")
             raise
 
+        self._record_statistics(videos)
+        return videos
+
+    def _record_statistics(self, videos: List[VideoInfo]) -> None:
+        """
+        検索結果の統計情報を時系列ストアに記録（失敗しても検索結果は返す）
+
+        Args:
+            videos: 動画情報リスト
+        """
+        if self.statistics_store is None:
+            return
+
+        try:
+            self.statistics_store.record(videos)
+        except Exception as e:
+            logger.warning(f"統計情報の記録に失敗: {e}")
+
+    def get_remaining_quota(self) -> Optional[int]:
+        """
+        本日のAPIクォータ残量を取得
+
+        Returns:
+            Optional[int]: 残りユニット数（クォータを記録していない場合はNone）
+        """
+        return self.youtube_client.get_remaining_quota()
+
     def get_video_by_id(self, video_id: str) -> Optional[VideoInfo]:
         """
         動画IDから動画情報を取得
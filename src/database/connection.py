@@ -0,0 +1,176 @@
+"""
+データベース接続管理
+
+SQLiteの接続をスレッドごとに保持して使い回す。
+接続時にWALモードとsynchronous=NORMALを設定し、読み取りと書き込みが
+互いを待たないようにする。スキーマの初期化はデータベースごとに1回だけ行う
+"""
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 接続ごとにキャッシュするプリペアドステートメント数
+CACHED_STATEMENTS = 256
+
+# ロック待ちのタイムアウト（秒）
+BUSY_TIMEOUT = 30.0
+
+
+class ConnectionManager:
+    """
+    データベース接続管理
+
+    sqlite3.Connectionはスレッド間で共有できないため、スレッドごとに
+    1つの接続を生成して保持する。終了したスレッドの接続は次回の接続生成時に閉じる
+    """
+
+    def __init__(self, db_path: str):
+        """
+        初期化
+
+        Args:
+            db_path: データベースファイルパス
+        """
+        self.db_path = db_path
+        self._connections: Dict[threading.Thread, sqlite3.Connection] = {}
+        self._lock = threading.Lock()
+
+    def get_connection(self) -> sqlite3.Connection:
+        """
+        現在のスレッド用の接続を取得（初回呼び出し時に生成）
+
+        Returns:
+            sqlite3.Connection: データベース接続
+        """
+        thread = threading.current_thread()
+        with self._lock:
+            conn = self._connections.get(thread)
+            if conn is not None:
+                return conn
+
+            self._close_dead_threads()
+            conn = self._connect()
+            self._connections[thread] = conn
+            return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        トランザクション付きで接続を使用する
+
+        ブロックを正常に抜けた場合はコミットし、例外の場合はロールバックする
+
+        Yields:
+            sqlite3.Connection: データベース接続
+        """
+        conn = self.get_connection()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def close_all(self) -> None:
+        """すべてのスレッドの接続を閉じる"""
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+
+        for conn in connections:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        新しい接続を生成してPRAGMAを設定
+
+        Returns:
+            sqlite3.Connection: データベース接続
+        """
+        # 接続は生成したスレッドだけが使うが、終了処理では別スレッドから閉じるため
+        # check_same_thread=Falseとする
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=BUSY_TIMEOUT,
+            cached_statements=CACHED_STATEMENTS,
+            check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        logger.debug(f"データベース接続を生成しました: {self.db_path} ({threading.current_thread().name})")
+        return conn
+
+    def _close_dead_threads(self) -> None:
+        """終了したスレッドの接続を閉じる（ロック取得済みで呼び出す）"""
+        for thread in [thread for thread in self._connections if not thread.is_alive()]:
+            self._connections.pop(thread).close()
+
+
+_managers: Dict[str, ConnectionManager] = {}
+_managers_lock = threading.Lock()
+
+
+def get_connection_manager(db_path: Optional[str] = None) -> ConnectionManager:
+    """
+    データベースファイルごとの接続管理を取得
+
+    初回取得時にスキーマを初期化する（プロセス内でデータベースごとに1回）
+
+    Args:
+        db_path: データベースファイルパス
+                指定しない場合は環境変数DATABASE_PATHまたはデフォルトパスを使用
+
+    Returns:
+        ConnectionManager: 接続管理
+    """
+    db_path = db_path or os.getenv("DATABASE_PATH", "youtube_analyzer.db")
+    key = os.path.abspath(db_path)
+
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None:
+            from src.database.init_db import DatabaseInitializer
+            DatabaseInitializer(db_path).initialize()
+
+            manager = ConnectionManager(db_path)
+            _managers[key] = manager
+        return manager
+
+
+def close_connection_manager(db_path: Optional[str] = None) -> None:
+    """
+    データベースファイルの接続をすべて閉じ、接続管理を破棄する
+
+    データベースファイルを削除する前に呼び出す（WALモードの-wal/-shmファイルを残さず、
+    Windowsでは開いたままのファイルを削除できないため）。
+    次回のget_connection_managerでは接続管理を生成し直す
+
+    Args:
+        db_path: データベースファイルパス
+                指定しない場合は環境変数DATABASE_PATHまたはデフォルトパスを使用
+    """
+    db_path = db_path or os.getenv("DATABASE_PATH", "youtube_analyzer.db")
+    key = os.path.abspath(db_path)
+
+    with _managers_lock:
+        manager = _managers.pop(key, None)
+
+    if manager is not None:
+        manager.close_all()
+        logger.debug(f"データベース接続を閉じました: {db_path}")
+
+
+def close_all_connections() -> None:
+    """すべてのデータベースの接続を閉じ、接続管理を破棄する（テスト・終了処理用）"""
+    with _managers_lock:
+        managers = list(_managers.values())
+        _managers.clear()
+
+    for manager in managers:
+        manager.close_all()
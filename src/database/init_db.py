@@ -48,6 +48,24 @@ class DatabaseInitializer:
             # 検索履歴テーブル
             self._create_search_history_table(cursor)
 
+            # 検索履歴の全文検索インデックス
+            self._create_search_history_fts(cursor)
+
+            # 検索履歴ごとの検索結果テーブル
+            self._create_search_history_results_table(cursor)
+
+            # 動画メタデータキャッシュテーブル
+            self._create_video_cache_table(cursor)
+
+            # 検索結果キャッシュテーブル
+            self._create_search_result_cache_table(cursor)
+
+            # APIクォータ使用量テーブル
+            self._create_api_quota_usage_table(cursor)
+
+            # 動画統計情報の時系列テーブル
+            self._create_video_statistics_table(cursor)
+
             conn.commit()
             conn.close()
 
@@ -114,6 +132,196 @@ class DatabaseInitializer:
 
         logger.info("検索履歴テーブルを作成しました")
 
+    def _create_search_history_fts(self, cursor: sqlite3.Cursor) -> None:
+        """
+        検索履歴キーワードの全文検索インデックス（FTS5）を作成
+
+        日本語のキーワードも部分一致で検索できるようtrigramトークナイザを使い、
+        search_historyとはトリガーで同期する。
+        FTS5またはtrigramが使えないSQLite（3.34未満）では作成しない
+
+        Args:
+            cursor: データベースカーソル
+        """
+        cursor.execute("""
+            SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'search_history_fts'
+        """)
+        if cursor.fetchone():
+            return
+
+        try:
+            cursor.execute("""
+                CREATE VIRTUAL TABLE search_history_fts USING fts5(
+                    keyword,
+                    content='search_history',
+                    content_rowid='id',
+                    tokenize='trigram'
+                )
+            """)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"全文検索インデックスを作成できません（LIKE検索を使用します）: {e}")
+            return
+
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS search_history_fts_insert
+            AFTER INSERT ON search_history BEGIN
+                INSERT INTO search_history_fts (rowid, keyword) VALUES (new.id, new.keyword);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS search_history_fts_delete
+            AFTER DELETE ON search_history BEGIN
+                INSERT INTO search_history_fts (search_history_fts, rowid, keyword)
+                VALUES ('delete', old.id, old.keyword);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS search_history_fts_update
+            AFTER UPDATE OF keyword ON search_history BEGIN
+                INSERT INTO search_history_fts (search_history_fts, rowid, keyword)
+                VALUES ('delete', old.id, old.keyword);
+                INSERT INTO search_history_fts (rowid, keyword) VALUES (new.id, new.keyword);
+            END
+        """)
+
+        # 既存の履歴をインデックスに登録
+        cursor.execute("INSERT INTO search_history_fts (search_history_fts) VALUES ('rebuild')")
+
+        logger.info("検索履歴の全文検索インデックスを作成しました")
+
+    def _create_search_history_results_table(self, cursor: sqlite3.Cursor) -> None:
+        """
+        検索履歴ごとの検索結果テーブルを作成
+
+        1回の検索につき1行で、動画IDはカンマ区切り、統計情報は
+        int64（リトルエンディアン）の配列として列ごとにまとめて保存する。
+        動画のメタデータは動画メタデータキャッシュから復元する
+
+        Args:
+            cursor: データベースカーソル
+        """
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS search_history_results (
+                history_id INTEGER PRIMARY KEY,
+                video_ids TEXT NOT NULL,
+                view_counts BLOB NOT NULL,
+                like_counts BLOB NOT NULL,
+                comment_counts BLOB NOT NULL
+            )
+        """)
+
+        # 履歴の削除に合わせて検索結果も削除
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS search_history_results_delete
+            AFTER DELETE ON search_history BEGIN
+                DELETE FROM search_history_results WHERE history_id = old.id;
+            END
+        """)
+
+        logger.info("検索結果テーブルを作成しました")
+
+    def _create_video_cache_table(self, cursor: sqlite3.Cursor) -> None:
+        """
+        動画メタデータキャッシュテーブルを作成
+
+        snippet/contentDetailsとstatisticsは鮮度が異なるため、取得日時を別々に保持する
+
+        Args:
+            cursor: データベースカーソル
+        """
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS video_cache (
+                video_id TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                channel_name TEXT NOT NULL,
+                channel_id TEXT NOT NULL,
+                published_at TEXT NOT NULL,
+                duration_seconds INTEGER NOT NULL,
+                description TEXT,
+                tags TEXT,
+                thumbnail_url TEXT,
+                view_count INTEGER NOT NULL,
+                like_count INTEGER NOT NULL,
+                comment_count INTEGER NOT NULL,
+                details_fetched_at TEXT NOT NULL,
+                statistics_fetched_at TEXT NOT NULL
+            )
+        """)
+
+        logger.info("動画メタデータキャッシュテーブルを作成しました")
+
+    def _create_search_result_cache_table(self, cursor: sqlite3.Cursor) -> None:
+        """
+        検索結果キャッシュテーブルを作成
+
+        search.list APIのページごとの動画IDを、正規化した検索条件のハッシュをキーに保存する
+
+        Args:
+            cursor: データベースカーソル
+        """
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS search_result_cache (
+                cache_key TEXT PRIMARY KEY,
+                keyword TEXT NOT NULL,
+                pages TEXT NOT NULL,
+                exhausted INTEGER NOT NULL,
+                fetched_at TEXT NOT NULL,
+                last_accessed_at TEXT NOT NULL
+            )
+        """)
+
+        # LRU削除用のインデックス
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_search_result_cache_last_accessed_at
+            ON search_result_cache(last_accessed_at)
+        """)
+
+        logger.info("検索結果キャッシュテーブルを作成しました")
+
+    def _create_api_quota_usage_table(self, cursor: sqlite3.Cursor) -> None:
+        """
+        APIクォータ使用量テーブルを作成
+
+        APIキー（のハッシュ）と太平洋時間の日付ごとに使用ユニット数を記録する
+
+        Args:
+            cursor: データベースカーソル
+        """
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS api_quota_usage (
+                key_id TEXT NOT NULL,
+                usage_date TEXT NOT NULL,
+                units INTEGER NOT NULL,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (key_id, usage_date)
+            )
+        """)
+
+        logger.info("APIクォータ使用量テーブルを作成しました")
+
+    def _create_video_statistics_table(self, cursor: sqlite3.Cursor) -> None:
+        """
+        動画統計情報の時系列テーブルを作成
+
+        (video_id, observed_at)を主キーとするWITHOUT ROWIDテーブルとし、
+        動画ごとの観測値を日時順に連続して格納する
+
+        Args:
+            cursor: データベースカーソル
+        """
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS video_statistics (
+                video_id TEXT NOT NULL,
+                observed_at TEXT NOT NULL,
+                view_count INTEGER NOT NULL,
+                like_count INTEGER NOT NULL,
+                comment_count INTEGER NOT NULL,
+                PRIMARY KEY (video_id, observed_at)
+            ) WITHOUT ROWID
+        """)
+
+        logger.info("動画統計情報テーブルを作成しました")
+
     def drop_all_tables(self) -> None:
         """
         すべてのテーブルを削除
@@ -127,7 +335,13 @@ class DatabaseInitializer:
             cursor = conn.cursor()
 
             cursor.execute("DROP TABLE IF EXISTS search_presets")
+            cursor.execute("DROP TABLE IF EXISTS search_history_fts")
+            cursor.execute("DROP TABLE IF EXISTS search_history_results")
             cursor.execute("DROP TABLE IF EXISTS search_history")
+            cursor.execute("DROP TABLE IF EXISTS video_cache")
+            cursor.execute("DROP TABLE IF EXISTS search_result_cache")
+            cursor.execute("DROP TABLE IF EXISTS api_quota_usage")
+            cursor.execute("DROP TABLE IF EXISTS video_statistics")
 
             conn.commit()
             conn.close()
@@ -0,0 +1,149 @@
+"""
+APIキープール
+
+複数のYouTube Data APIキーに呼び出しを分散し、
+クォータ超過したキーをリセットまで除外する
+"""
+import os
+import threading
+import time
+from typing import List, Optional, Dict
+from datetime import date
+
+from src.infrastructure.quota_tracker import pacific_today
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# rateLimitExceeded（短時間のレート制限）で除外する秒数
+DEFAULT_RATE_LIMIT_COOLDOWN = 60
+
+
+def load_api_keys_from_env() -> List[str]:
+    """
+    環境変数からAPIキーを読み込む
+
+    YOUTUBE_API_KEYS（カンマ区切り）とYOUTUBE_API_KEYを重複なく結合する
+
+    Returns:
+        List[str]: APIキーリスト（YOUTUBE_API_KEYが先頭）
+    """
+    keys = []
+    candidates = [os.getenv("YOUTUBE_API_KEY", "")] + os.getenv("YOUTUBE_API_KEYS", "").split(",")
+    for key in candidates:
+        key = key.strip()
+        if key and key not in keys:
+            keys.append(key)
+    return keys
+
+
+class ApiKeyPool:
+    """
+    APIキープール
+
+    利用可能なキーをラウンドロビンで割り当てる。
+    quotaExceededのキーは太平洋時間の日付が変わるまで、
+    rateLimitExceededのキーは一定時間、割り当て対象から外す。
+    """
+
+    def __init__(self, api_keys: List[str], rate_limit_cooldown: int = DEFAULT_RATE_LIMIT_COOLDOWN):
+        """
+        初期化
+
+        Args:
+            api_keys: APIキーリスト
+            rate_limit_cooldown: レート制限時にキーを除外する秒数
+
+        Raises:
+            ValueError: APIキーが1つも指定されていない場合
+        """
+        if not api_keys:
+            raise ValueError("APIキーが指定されていません")
+
+        self.api_keys = list(api_keys)
+        self.rate_limit_cooldown = rate_limit_cooldown
+
+        self._lock = threading.Lock()
+        self._next_index = 0
+        self._exhausted_on: Dict[str, date] = {}
+        self._cooldown_until: Dict[str, float] = {}
+
+        logger.info(f"ApiKeyPoolを初期化しました: {len(self.api_keys)}キー")
+
+    def acquire(self) -> Optional[str]:
+        """
+        次に使用するAPIキーを取得
+
+        Returns:
+            Optional[str]: APIキー（すべてのキーが利用できない場合はNone）
+        """
+        with self._lock:
+            for _ in range(len(self.api_keys)):
+                api_key = self.api_keys[self._next_index]
+                self._next_index = (self._next_index + 1) % len(self.api_keys)
+                if self._is_available(api_key):
+                    return api_key
+            return None
+
+    def available_keys(self) -> List[str]:
+        """
+        現在利用可能なAPIキーを取得
+
+        Returns:
+            List[str]: APIキーリスト
+        """
+        with self._lock:
+            return [api_key for api_key in self.api_keys if self._is_available(api_key)]
+
+    def mark_exhausted(self, api_key: str) -> None:
+        """
+        APIキーを本日（太平洋時間）のクォータ超過として除外
+
+        Args:
+            api_key: APIキー
+        """
+        with self._lock:
+            self._exhausted_on[api_key] = pacific_today()
+        logger.warning(f"APIキー{self._key_label(api_key)}のクォータが上限に達したため、リセットまで除外します")
+
+    def mark_rate_limited(self, api_key: str) -> None:
+        """
+        APIキーをレート制限として一定時間除外
+
+        Args:
+            api_key: APIキー
+        """
+        with self._lock:
+            self._cooldown_until[api_key] = time.monotonic() + self.rate_limit_cooldown
+        logger.warning(
+            f"APIキー{self._key_label(api_key)}がレート制限に達したため、"
+            f"{self.rate_limit_cooldown}秒間除外します"
+        )
+
+    def _is_available(self, api_key: str) -> bool:
+        """
+        APIキーが利用可能か判定（ロック取得済みで呼び出す）
+
+        Args:
+            api_key: APIキー
+
+        Returns:
+            bool: 利用可能ならTrue
+        """
+        exhausted_on = self._exhausted_on.get(api_key)
+        if exhausted_on is not None:
+            if exhausted_on == pacific_today():
+                return False
+            del self._exhausted_on[api_key]
+
+        cooldown_until = self._cooldown_until.get(api_key)
+        if cooldown_until is not None:
+            if time.monotonic() < cooldown_until:
+                return False
+            del self._cooldown_until[api_key]
+
+        return True
+
+    def _key_label(self, api_key: str) -> str:
+        """ログ用のキー表示（番号と末尾4文字のみ）"""
+        return f"#{self.api_keys.index(api_key) + 1}(...{api_key[-4:]})"
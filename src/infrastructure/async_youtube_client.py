@@ -0,0 +1,469 @@
+"""
+YouTube Data API v3 非同期クライアント
+
+asyncioとaiohttpでYouTube Data API v3を呼び出す。
+1つのイベントループで多数のキーワードの検索を並行して実行するためのもので、
+リクエストパラメータの生成・レスポンスのパース・フィルタリング・
+クォータ予算に合わせたページ数の計算はYouTubeClientと共通
+"""
+import asyncio
+import json
+import os
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+from src.utils.logger import get_logger
+from src.domain.models import VideoInfo, SearchCriteria
+from src.infrastructure.youtube_client import (
+    YouTubeAPIError, QuotaExceededError, QUOTA_EXCEEDED_REASONS, RATE_LIMIT_REASONS, MAX_SEARCH_PAGES,
+    deadline_passed, plan_max_pages, build_search_params, extract_video_ids, split_batches, parse_video_items, filter_videos, parse_error_reasons
+)
+from src.infrastructure.quota_tracker import QuotaTracker, SEARCH_LIST_COST, VIDEOS_LIST_COST
+from src.infrastructure.api_key_pool import ApiKeyPool, load_api_keys_from_env
+from src.infrastructure.retry_policy import RetryPolicy
+from src.infrastructure.video_fields import resolve_omit_fields, build_video_fields
+
+logger = get_logger(__name__)
+
+# YouTube Data API v3のエンドポイント
+API_BASE_URL = "https://www.googleapis.com/youtube/v3"
+
+# 同時に実行するAPIリクエスト数のデフォルト
+DEFAULT_MAX_CONCURRENCY = 16
+
+# aiohttpの接続エラー（再試行の対象）
+if AIOHTTP_AVAILABLE:
+    CLIENT_CONNECTION_ERRORS = (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError)
+else:
+    CLIENT_CONNECTION_ERRORS = ()
+
+
+class YouTubeHTTPError(YouTubeAPIError):
+    """
+    YouTube APIがエラーのステータスを返した
+
+    Attributes:
+        status: HTTPステータスコード
+        reasons: エラー理由（quotaExceededなど）
+    """
+
+    def __init__(self, status: int, reasons: Optional[set] = None, message: str = ""):
+        detail = message or ", ".join(sorted(reasons or []))
+        super().__init__(f"YouTube APIエラー（HTTP {status}）" + (f": {detail}" if detail else ""))
+        self.status = status
+        self.reasons = reasons or set()
+
+
+class AsyncYouTubeClient:
+    """
+    YouTube Data API v3 非同期クライアント
+
+    APIキーの切り替え（quotaExceeded・レート制限）、クォータ使用量の記録と
+    残量に合わせたページ数の制限、一時的なエラーの再試行はYouTubeClientと同じ。
+    動画メタデータキャッシュ・検索結果キャッシュは使用せず、
+    失敗したページがあっても取得済みの結果を返さずに例外を送出する
+
+    Attributes:
+        key_pool: APIキープール
+        max_concurrency: 同時に実行するAPIリクエスト数の上限（クライアント全体）
+        retry_policy: 一時的なエラーに対するリトライポリシー
+        quota_tracker: APIクォータ使用量の記録（Noneの場合は記録しない）
+        omit_fields: videos.listで取得しない属性
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_keys: Optional[List[str]] = None,
+        session: Optional[Any] = None,
+        max_concurrency: Optional[int] = None,
+        quota_tracker: Optional[QuotaTracker] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        omit_fields: Optional[Iterable[str]] = None
+    ):
+        """
+        初期化
+
+        Args:
+            api_key: APIキー（api_keyとapi_keysがどちらも未指定の場合は環境変数から取得）
+            api_keys: キープールに登録する追加のAPIキー
+            session: HTTPセッション（aiohttp.ClientSessionと同じget()を持つオブジェクト）
+                    未指定の場合は最初のリクエスト時にaiohttp.ClientSessionを生成し、close()で閉じる
+            max_concurrency: 同時に実行するAPIリクエスト数の上限
+                    （未指定の場合は環境変数YOUTUBE_ASYNC_MAX_CONCURRENCY、デフォルト16）
+            quota_tracker: APIクォータ使用量の記録（未指定の場合は記録しない）
+            retry_policy: リトライポリシー（未指定の場合はデフォルト設定、
+                    検索の期限は環境変数YOUTUBE_SEARCH_DEADLINE、デフォルト120秒）
+            omit_fields: videos.listで取得しない属性
+                    （未指定の場合は環境変数YOUTUBE_FIELD_PROFILEのプロファイル、デフォルトfull）
+
+        Raises:
+            ImportError: sessionを指定せず、aiohttpがインストールされていない場合
+            YouTubeAPIError: APIキーが取得できない場合
+        """
+        if session is None and not AIOHTTP_AVAILABLE:
+            raise ImportError(
+                "非同期クライアントにはaiohttpが必要です。\n"
+                "pip install aiohttp を実行してください"
+            )
+
+        if api_key or api_keys:
+            keys = list(dict.fromkeys(key for key in [api_key] + list(api_keys or []) if key))
+        else:
+            keys = load_api_keys_from_env()
+        if not keys:
+            raise YouTubeAPIError("YOUTUBE_API_KEYが設定されていません")
+
+        self.key_pool = ApiKeyPool(keys)
+        self.max_concurrency = max(1, max_concurrency or int(
+            os.getenv("YOUTUBE_ASYNC_MAX_CONCURRENCY", str(DEFAULT_MAX_CONCURRENCY))
+        ))
+        self.quota_tracker = quota_tracker
+        self.retry_policy = retry_policy or RetryPolicy(
+            deadline=float(os.getenv("YOUTUBE_SEARCH_DEADLINE", "120"))
+        )
+        self.omit_fields = resolve_omit_fields(omit_fields)
+        self._video_fields = build_video_fields(self.omit_fields)
+
+        self._session = session
+        self._owns_session = session is None
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        logger.info(
+            f"YouTube API非同期クライアントを初期化しました: APIキー{len(keys)}個、"
+            f"同時リクエスト数{self.max_concurrency}"
+        )
+
+    async def __aenter__(self) -> "AsyncYouTubeClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """このクライアントが生成したHTTPセッションを閉じる"""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> Any:
+        """
+        HTTPセッションを取得（未指定の場合は初回呼び出し時に生成）
+
+        Returns:
+            HTTPセッション
+        """
+        if self._session is None:
+            timeout = aiohttp.ClientTimeout(total=float(os.getenv("YOUTUBE_HTTP_TIMEOUT", "60")))
+            self._session = aiohttp.ClientSession(timeout=timeout)
+        return self._session
+
+    async def search_videos(self, criteria: SearchCriteria, max_units: Optional[int] = None) -> List[VideoInfo]:
+        """
+        検索条件に基づいて動画を検索
+
+        Args:
+            criteria: 検索条件
+            max_units: この検索で使用するクォータの上限（未指定の場合は残量まで）
+
+        Returns:
+            List[VideoInfo]: 動画情報リスト（フィルタリング後、最大max_results件）
+
+        Raises:
+            QuotaExceededError: すべてのAPIキーが利用できない、または1ページも取得できないほど
+                    クォータが不足している場合
+            YouTubeAPIError: API呼び出しエラー
+        """
+        videos = []
+        async for batch in self.iter_batches(criteria, max_units):
+            videos.extend(batch)
+        return videos
+
+    async def iter_videos(
+        self,
+        criteria: SearchCriteria,
+        max_units: Optional[int] = None
+    ) -> AsyncIterator[VideoInfo]:
+        """
+        検索結果の動画を1件ずつ返す非同期イテレータ
+
+        Args:
+            criteria: 検索条件
+            max_units: この検索で使用するクォータの上限（未指定の場合は残量まで）
+
+        Yields:
+            VideoInfo: 動画情報（検索順、フィルタリング後）
+        """
+        async for batch in self.iter_batches(criteria, max_units):
+            for video in batch:
+                yield video
+
+    async def iter_batches(
+        self,
+        criteria: SearchCriteria,
+        max_units: Optional[int] = None
+    ) -> AsyncIterator[List[VideoInfo]]:
+        """
+        検索結果をsearch.listのページごとに返す非同期イテレータ
+
+        次ページのsearch.listと取得済みページのvideos.listを並行して実行する。
+        クォータ残量（またはmax_units）で取得できるページ数までに抑え、
+        途中で反復をやめた場合、実行中の詳細取得はキャンセルする
+
+        Args:
+            criteria: 検索条件
+            max_units: この検索で使用するクォータの上限（未指定の場合は残量まで）
+
+        Yields:
+            List[VideoInfo]: 1ページ分の動画情報リスト（検索順、フィルタリング後、合計max_results件まで）
+
+        Raises:
+            QuotaExceededError: すべてのAPIキーが利用できない、または1ページも取得できないほど
+                    クォータが不足している場合
+            YouTubeAPIError: API呼び出しエラー
+        """
+        criteria.validate()
+        logger.info(f"動画検索開始（非同期）: キーワード='{criteria.keyword}', 最大取得数={criteria.max_results}")
+
+        deadline_at = None
+        if self.retry_policy.deadline is not None:
+            deadline_at = time.monotonic() + self.retry_policy.deadline
+
+        remaining = criteria.max_results
+        pending: Optional[asyncio.Task] = None
+
+        try:
+            max_pages = plan_max_pages(criteria, await self.get_remaining_quota(), max_units)
+            async for page_ids in self._iter_search_pages(criteria, max_pages, deadline_at):
+                # 期限を過ぎたら新しいページの詳細取得は開始せず、開始済みの分で結果を返す
+                if deadline_passed(deadline_at):
+                    logger.warning("検索の期限を過ぎたため、取得済みのページで結果を返します")
+                    break
+                # このページの詳細取得を開始してから前ページの結果を返す（次ページのsearch.listと並行させる）
+                previous, pending = pending, asyncio.ensure_future(self._fetch_videos(page_ids, deadline_at))
+                if previous is not None:
+                    batch = filter_videos(await previous, criteria)[:remaining]
+                    remaining -= len(batch)
+                    if batch:
+                        yield batch
+
+            if pending is not None:
+                last, pending = pending, None
+                batch = filter_videos(await last, criteria)[:remaining]
+                if batch:
+                    yield batch
+
+        except YouTubeAPIError:
+            raise
+        except Exception as e:
+            logger.error(f"予期しないエラー: {e}", exc_info=True)
+            raise YouTubeAPIError(f"予期しないエラー: {e}")
+        finally:
+            # 途中で終了した場合、先行して開始した詳細取得を残さない
+            if pending is not None:
+                if not pending.done():
+                    pending.cancel()
+                elif not pending.cancelled():
+                    pending.exception()
+
+    async def get_video_by_id(self, video_id: str) -> Optional[VideoInfo]:
+        """
+        動画IDから動画情報を取得
+
+        Args:
+            video_id: YouTube動画ID
+
+        Returns:
+            Optional[VideoInfo]: 動画情報（見つからない場合はNone）
+
+        Raises:
+            YouTubeAPIError: API呼び出しエラー
+        """
+        videos = await self._fetch_videos([video_id])
+        return videos[0] if videos else None
+
+    async def get_remaining_quota(self) -> Optional[int]:
+        """
+        本日（太平洋時間）のクォータ残量を取得
+
+        SQLiteの読み込みでイベントループを止めないよう、別スレッドで実行する
+
+        Returns:
+            Optional[int]: 残りユニット数（クォータを記録していない場合はNone）
+        """
+        if self.quota_tracker is None:
+            return None
+        api_keys = self.key_pool.available_keys()
+        return await asyncio.to_thread(
+            lambda: sum(self.quota_tracker.get_remaining(api_key) for api_key in api_keys)
+        )
+
+    async def _iter_search_pages(
+        self,
+        criteria: SearchCriteria,
+        max_pages: Optional[int] = None,
+        deadline_at: Optional[float] = None
+    ) -> AsyncIterator[List[str]]:
+        """
+        search.list APIのページごとに動画IDを返す
+
+        Args:
+            criteria: 検索条件
+            max_pages: 取得する最大ページ数（Noneの場合は制限なし）
+            deadline_at: 検索の期限（time.monotonic()基準、Noneの場合は無制限）
+
+        Yields:
+            List[str]: 1ページ分の動画IDリスト（合計はmax_results件まで、期限を過ぎたら打ち切る）
+
+        Raises:
+            QuotaExceededError: 1ページも取得できないほどクォータが不足している場合
+        """
+        video_id_count = 0
+        next_page_token = None
+        max_iterations = MAX_SEARCH_PAGES
+        if max_pages is not None:
+            if max_pages <= 0:
+                raise QuotaExceededError("APIクォータの残量が不足しているため検索できません")
+            max_iterations = min(max_iterations, max_pages)
+
+        for _ in range(max_iterations):
+            if deadline_passed(deadline_at):
+                logger.warning("検索の期限を過ぎたため、search.listの取得を打ち切ります")
+                return
+
+            response = await self._get_json(
+                "search", build_search_params(criteria, next_page_token), SEARCH_LIST_COST, deadline_at
+            )
+
+            page_ids = extract_video_ids(response)[:criteria.max_results - video_id_count]
+            if page_ids:
+                video_id_count += len(page_ids)
+                yield page_ids
+
+            next_page_token = response.get("nextPageToken")
+            if not next_page_token or video_id_count >= criteria.max_results:
+                break
+
+    async def _fetch_videos(self, video_ids: List[str], deadline_at: Optional[float] = None) -> List[VideoInfo]:
+        """
+        videos.list APIで動画詳細を取得（50件ごとのバッチを並行して実行）
+
+        Args:
+            video_ids: 動画IDリスト
+            deadline_at: 検索の期限（time.monotonic()基準、Noneの場合は無制限）
+
+        Returns:
+            List[VideoInfo]: 動画情報リスト（入力順、見つからない動画は含まない）
+        """
+        responses = await asyncio.gather(*(
+            self._get_json(
+                "videos",
+                {"part": "snippet,statistics,contentDetails", "id": ",".join(batch_ids), "fields": self._video_fields},
+                VIDEOS_LIST_COST,
+                deadline_at
+            )
+            for batch_ids in split_batches(video_ids)
+        ))
+        return [video for response in responses for video in parse_video_items(response)]
+
+    async def _get_json(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        cost: int,
+        deadline_at: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        キープールのAPIキーでGETリクエストを実行し、クォータ使用量を記録
+
+        quotaExceededのキーは除外して次のキーで再実行し、レート制限のキーは他のキーが
+        あれば一時的に外す。5xx・429・接続エラー・タイムアウトはリトライポリシーに従って
+        再試行する（エラー応答の本文がJSONでない場合もステータスコードで判断する）
+
+        Args:
+            endpoint: エンドポイント名（search、videos）
+            params: リクエストパラメータ（APIキーを除く）
+            cost: このリクエストのクォータコスト（ユニット）
+            deadline_at: 検索の期限（time.monotonic()基準、Noneの場合は無制限）
+
+        Returns:
+            Dict[str, Any]: APIレスポンス
+
+        Raises:
+            QuotaExceededError: すべてのAPIキーが利用できない場合
+            YouTubeHTTPError: 再試行できない、または再試行しても失敗したAPIエラー
+        """
+        url = f"{API_BASE_URL}/{endpoint}"
+        attempt = 1
+
+        while True:
+            api_key = self.key_pool.acquire()
+            if api_key is None:
+                raise QuotaExceededError("すべてのAPIキーがクォータ上限またはレート制限に達しています")
+
+            reasons = set()
+            try:
+                async with self._semaphore:
+                    async with self._get_session().get(url, params={**params, "key": api_key}) as response:
+                        status = response.status
+                        body = await response.text()
+
+                # エラー応答でもクォータは消費される
+                await self._record_quota(api_key, cost)
+                try:
+                    content = json.loads(body)
+                except ValueError:
+                    # プロキシやロードバランサーが返すHTMLのエラーページなど
+                    if status < 400:
+                        raise YouTubeAPIError(f"YouTube APIのレスポンスがJSONではありません（HTTP {status}）")
+                    content = None
+                if status < 400:
+                    return content
+
+                reasons = parse_error_reasons(content)
+                if status == 403 and reasons & QUOTA_EXCEEDED_REASONS:
+                    self.key_pool.mark_exhausted(api_key)
+                    continue
+                if (status in (403, 429) and reasons & RATE_LIMIT_REASONS
+                        and len(self.key_pool.available_keys()) > 1):
+                    self.key_pool.mark_rate_limited(api_key)
+                    continue
+                error: Exception = YouTubeHTTPError(status, reasons)
+            except CLIENT_CONNECTION_ERRORS as e:
+                error = ConnectionError(str(e))
+            except asyncio.TimeoutError as e:
+                error = e
+
+            delay = self.retry_policy.next_delay(error, attempt, deadline_at, reasons)
+            if delay is None:
+                if isinstance(error, YouTubeAPIError):
+                    raise error
+                raise YouTubeAPIError(f"YouTube API呼び出しエラー: {error!r}") from error
+
+            logger.warning(
+                f"一時的なエラーのため{delay:.1f}秒後に再試行します"
+                f"（{attempt}/{self.retry_policy.max_attempts}）: {error!r}"
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _record_quota(self, api_key: str, cost: int) -> None:
+        """
+        クォータ使用量を記録（SQLiteへの書き込みは別スレッドで行い、失敗してもAPI呼び出しは失敗させない）
+
+        Args:
+            api_key: 使用したAPIキー
+            cost: 使用ユニット数
+        """
+        if self.quota_tracker is None:
+            return
+        try:
+            await asyncio.to_thread(self.quota_tracker.record, api_key, cost)
+        except Exception as e:
+            logger.warning(f"クォータ使用量の記録に失敗: {e}")
@@ -0,0 +1,157 @@
+"""
+ファイルエクスポートの共通インターフェース
+
+Excel・CSV・JSON Lines・Parquetの各エクスポーターが実装する
+"""
+from abc import ABC, abstractmethod
+from typing import List, Dict, Any, FrozenSet, Iterable
+
+from src.domain.models import VideoInfo
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# データ連携用フォーマット（CSV・JSON Lines・Parquet）の列名
+EXPORT_FIELDS = [
+    "video_id",
+    "title",
+    "url",
+    "channel_name",
+    "channel_id",
+    "view_count",
+    "like_count",
+    "comment_count",
+    "published_at",
+    "duration_seconds",
+    "is_short",
+    "description",
+    "tags",
+    "thumbnail_url"
+]
+
+# 表形式（Excel・Google Sheets）の列ごとの属性（先頭のNoは行番号）
+TABLE_FIELDS = [
+    "no",
+    "title",
+    "url",
+    "channel_name",
+    "channel_id",
+    "view_count",
+    "like_count",
+    "comment_count",
+    "published_at",
+    "duration_seconds",
+    "is_short",
+    "description",
+    "tags",
+    "thumbnail_url"
+]
+
+
+def export_fields(omit_fields: Iterable[str] = ()) -> List[str]:
+    """
+    省略する属性を除いたデータ連携用フォーマットの列名
+
+    Args:
+        omit_fields: 省略する属性（取得していない属性の空の列を出力しないため）
+
+    Returns:
+        List[str]: 列名
+    """
+    omit_fields = set(omit_fields)
+    return [field for field in EXPORT_FIELDS if field not in omit_fields]
+
+
+def table_column_indexes(omit_fields: Iterable[str] = ()) -> List[int]:
+    """
+    省略する属性を除いた表形式の列番号
+
+    Args:
+        omit_fields: 省略する属性
+
+    Returns:
+        List[int]: 出力する列の番号（0始まり）
+    """
+    omit_fields = set(omit_fields)
+    return [index for index, field in enumerate(TABLE_FIELDS) if field not in omit_fields]
+
+
+def video_to_record(video: VideoInfo) -> Dict[str, Any]:
+    """
+    動画情報をエクスポート用のレコードに変換
+
+    Args:
+        video: 動画情報
+
+    Returns:
+        Dict[str, Any]: 列名 → 値（published_atはdatetime、tagsはリストのまま）
+    """
+    return {
+        "video_id": video.video_id,
+        "title": video.title,
+        "url": video.url,
+        "channel_name": video.channel_name,
+        "channel_id": video.channel_id,
+        "view_count": video.view_count,
+        "like_count": video.like_count,
+        "comment_count": video.comment_count,
+        "published_at": video.published_at,
+        "duration_seconds": video.duration_seconds,
+        "is_short": video.is_short,
+        "description": video.description,
+        "tags": list(video.tags) if video.tags else [],
+        "thumbnail_url": video.thumbnail_url
+    }
+
+
+class BaseExporter(ABC):
+    """
+    ファイルエクスポーターの基底クラス
+
+    サブクラスはfile_extension・file_type_nameと_writeを実装する
+    """
+
+    # ファイルの拡張子（例: ".csv"）
+    file_extension: str = ""
+
+    # ファイル保存ダイアログに表示するファイルの種類
+    file_type_name: str = ""
+
+    def export(self, videos: List[VideoInfo], file_path: str, omit_fields: Iterable[str] = ()) -> None:
+        """
+        動画情報をファイルにエクスポート
+
+        Args:
+            videos: エクスポートする動画情報リスト
+            file_path: 出力先ファイルパス
+            omit_fields: 出力しない属性（description、tags、thumbnail_url。
+                    取得を省略したフィールドプロファイルの列を出力しないため）
+
+        Raises:
+            ValueError: videosが空の場合
+            IOError: ファイル書き込みに失敗した場合
+        """
+        if not videos:
+            raise ValueError("エクスポートする動画が指定されていません")
+
+        logger.info(f"{self.file_type_name}エクスポート開始: {len(videos)}件の動画を {file_path} に出力")
+
+        try:
+            self._write(videos, file_path, frozenset(omit_fields))
+
+            logger.info(f"{self.file_type_name}エクスポート完了: {file_path}")
+
+        except Exception as e:
+            logger.error(f"{self.file_type_name}エクスポートエラー: {e}", exc_info=True)
+            raise IOError(f"{self.file_type_name}の書き込みに失敗しました: {e}")
+
+    @abstractmethod
+    def _write(self, videos: List[VideoInfo], file_path: str, omit_fields: FrozenSet[str] = frozenset()) -> None:
+        """
+        ファイルを書き出す
+
+        Args:
+            videos: エクスポートする動画情報リスト（空でない）
+            file_path: 出力先ファイルパス
+            omit_fields: 出力しない属性
+        """
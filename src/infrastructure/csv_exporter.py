@@ -0,0 +1,50 @@
+"""
+CSVエクスポート機能
+
+動画情報をCSVファイルに出力する
+"""
+import csv
+from typing import FrozenSet, List
+
+from src.domain.models import VideoInfo
+from src.infrastructure.base_exporter import BaseExporter, export_fields, video_to_record
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Excelで開いても文字化けしないようBOM付きUTF-8で出力する
+CSV_ENCODING = "utf-8-sig"
+
+
+class CsvExporter(BaseExporter):
+    """
+    CSVファイルにエクスポートするクラス
+
+    1行ずつファイルに書き出す。公開日はISO 8601形式、タグはカンマ区切りで出力する
+    """
+
+    file_extension = ".csv"
+    file_type_name = "CSVファイル"
+
+    def __init__(self):
+        """初期化"""
+        logger.info("CsvExporterを初期化しました")
+
+    def _write(self, videos: List[VideoInfo], file_path: str, omit_fields: FrozenSet[str] = frozenset()) -> None:
+        """
+        CSVファイルを書き出す
+
+        Args:
+            videos: エクスポートする動画情報リスト
+            file_path: 出力先ファイルパス
+            omit_fields: 出力しない属性
+        """
+        with open(file_path, "w", encoding=CSV_ENCODING, newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=export_fields(omit_fields), extrasaction="ignore")
+            writer.writeheader()
+
+            for video in videos:
+                record = video_to_record(video)
+                record["published_at"] = video.published_at.isoformat()
+                record["tags"] = ", ".join(record["tags"])
+                writer.writerow(record)
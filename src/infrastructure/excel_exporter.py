@@ -4,198 +4,291 @@ Excel エクスポート機能
 動画情報をExcelファイル(.xlsx)に出力する
 """
 import os
-from typing import List
+from typing import FrozenSet, List, Any, Optional
 from datetime import datetime
 from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, PatternFill
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, Alignment, PatternFill, NamedStyle
 from openpyxl.utils import get_column_letter
 
 from src.domain.models import VideoInfo
+from src.infrastructure.base_exporter import BaseExporter, table_column_indexes
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-
-class ExcelExporter:
+# ヘッダー
+HEADERS = [
+    "No",
+    "タイトル",
+    "URL",
+    "チャンネル名",
+    "チャンネルID",
+    "再生回数",
+    "いいね数",
+    "コメント数",
+    "公開日",
+    "動画の長さ",
+    "種類",
+    "概要",
+    "タグ",
+    "サムネイルURL"
+]
+
+# 名前付きスタイル（ワークブックに1回だけ登録し、セルからは名前で参照する）
+HEADER_STYLE = "video_header"
+LINK_STYLE = "video_link"
+NUMBER_STYLE = "video_number"
+DATE_STYLE = "video_date"
+
+# 列番号（1始まり） → セルのスタイル
+COLUMN_STYLES = {
+    3: LINK_STYLE,
+    6: NUMBER_STYLE,
+    7: NUMBER_STYLE,
+    8: NUMBER_STYLE,
+    9: DATE_STYLE,
+    14: LINK_STYLE,
+}
+
+# ハイパーリンクを設定する列番号
+LINK_COLUMNS = {3, 14}
+
+# カラム幅の範囲（文字数）
+MIN_COLUMN_WIDTH = 20
+MAX_COLUMN_WIDTH = 80
+
+
+class ExcelExporter(BaseExporter):
     """
     Excelファイルにエクスポートするクラス
 
-    動画情報をExcelファイル(.xlsx)に出力する
+    動画情報をExcelファイル(.xlsx)に出力する。
+    openpyxlのwrite-onlyモードで行を順に書き出すため、
+    件数が多くてもワークシート全体をメモリに保持しない
     """
 
+    file_extension = ".xlsx"
+    file_type_name = "Excelファイル"
+
     def __init__(self):
         """初期化"""
         logger.info("ExcelExporterを初期化しました")
 
-    def export(self, videos: List[VideoInfo], file_path: str) -> None:
+    def _write(self, videos: List[VideoInfo], file_path: str, omit_fields: FrozenSet[str] = frozenset()) -> None:
         """
-        動画情報をExcelファイルにエクスポート
+        Excelファイルを書き出す
 
         Args:
             videos: エクスポートする動画情報リスト
             file_path: 出力先ファイルパス
-
-        Raises:
-            ValueError: videosが空の場合
-            IOError: ファイル書き込みに失敗した場合
+            omit_fields: 出力しない属性
         """
-        if not videos:
-            raise ValueError("エクスポートする動画が指定されていません")
-
-        logger.info(f"Excelエクスポート開始: {len(videos)}件の動画を {file_path} に出力")
-
-        try:
-            # ワークブック作成
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "YouTube動画リスト"
-
-            # ヘッダー設定
-            self._create_header(ws)
+        columns = table_column_indexes(omit_fields)
 
-            # データ行を追加
-            for idx, video in enumerate(videos, start=2):
-                self._add_video_row(ws, idx, video)
+        # ワークブック作成（write-onlyモード）
+        wb = Workbook(write_only=True)
+        self._register_styles(wb)
+        ws = wb.create_sheet("YouTube動画リスト")
 
-            # カラム幅を自動調整
-            self._auto_adjust_column_width(ws)
+        # write-onlyモードでは列幅を最初の行より前に書き出すため、先に計算する
+        self._set_column_widths(ws, videos, columns)
 
-            # ファイル保存
-            wb.save(file_path)
+        # ヘッダー
+        ws.append([self._styled_cell(ws, HEADERS[col], HEADER_STYLE) for col in columns])
 
-            logger.info(f"Excelエクスポート完了: {file_path}")
+        # データ行を順に書き出す
+        for index, video in enumerate(videos, start=1):
+            row = self._video_row_cells(ws, index, video)
+            ws.append([row[col] for col in columns])
 
-        except Exception as e:
-            logger.error(f"Excelエクスポートエラー: {e}", exc_info=True)
-            raise IOError(f"Excelファイルの書き込みに失敗しました: {e}")
+        # ファイル保存
+        wb.save(file_path)
 
-    def _create_header(self, ws) -> None:
+    def _register_styles(self, wb: Workbook) -> None:
         """
-        ヘッダー行を作成
+        セルのスタイルを名前付きスタイルとして登録
 
         Args:
-            ws: ワークシート
+            wb: ワークブック
         """
-        headers = [
-            "No",
-            "タイトル",
-            "URL",
-            "チャンネル名",
-            "チャンネルID",
-            "再生回数",
-            "いいね数",
-            "コメント数",
-            "公開日",
-            "動画の長さ",
-            "種類",
-            "概要",
-            "タグ",
-            "サムネイルURL"
-        ]
+        wb.add_named_style(NamedStyle(
+            name=HEADER_STYLE,
+            font=Font(bold=True, color="FFFFFF"),
+            fill=PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid"),
+            alignment=Alignment(horizontal="center", vertical="center")
+        ))
+        wb.add_named_style(NamedStyle(name=LINK_STYLE, font=Font(color="0563C1", underline="single")))
+        wb.add_named_style(NamedStyle(name=NUMBER_STYLE, number_format='#,##0'))
+        wb.add_named_style(NamedStyle(name=DATE_STYLE, number_format='yyyy-mm-dd'))
+
+    def _row_values(self, index: int, video: VideoInfo) -> List[Any]:
+        """
+        動画情報の行の値を作成
+
+        Args:
+            index: 行番号（1始まり）
+            video: 動画情報
 
-        # ヘッダースタイル
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        header_alignment = Alignment(horizontal="center", vertical="center")
+        Returns:
+            List[Any]: 列ごとの値
+        """
+        # Excelはタイムゾーン付きdatetimeをサポートしないため、タイムゾーンを削除
+        published_at_naive = video.published_at.replace(tzinfo=None) if video.published_at.tzinfo else video.published_at
 
-        for col_idx, header in enumerate(headers, start=1):
-            cell = ws.cell(row=1, column=col_idx)
-            cell.value = header
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_alignment
+        return [
+            index,
+            video.title,
+            video.url,
+            video.channel_name,
+            video.channel_id,
+            video.view_count,
+            video.like_count,
+            video.comment_count,
+            published_at_naive,
+            video.duration_formatted,
+            "ショート" if video.is_short else "通常",
+            video.description,
+            ", ".join(video.tags) if video.tags else "",
+            video.thumbnail_url or None
+        ]
 
-    def _add_video_row(self, ws, row_idx: int, video: VideoInfo) -> None:
+    def _video_row_cells(self, ws, index: int, video: VideoInfo) -> List[Any]:
         """
-        動画情報の行を追加
+        動画情報の行を作成（スタイルが必要な列のみセルオブジェクトにする）
 
         Args:
             ws: ワークシート
-            row_idx: 行インデックス
+            index: 行番号（1始まり）
             video: 動画情報
+
+        Returns:
+            List[Any]: 列ごとの値またはセル
         """
-        # No
-        ws.cell(row=row_idx, column=1).value = row_idx - 1
+        row = self._row_values(index, video)
 
-        # タイトル
-        ws.cell(row=row_idx, column=2).value = video.title
+        for col_idx, style in COLUMN_STYLES.items():
+            value = row[col_idx - 1]
+            if value is None:
+                continue
+            cell = self._styled_cell(ws, value, style)
+            if col_idx in LINK_COLUMNS:
+                cell.hyperlink = value
+            row[col_idx - 1] = cell
 
-        # URL（ハイパーリンク）
-        url_cell = ws.cell(row=row_idx, column=3)
-        url_cell.value = video.url
-        url_cell.hyperlink = video.url
-        url_cell.font = Font(color="0563C1", underline="single")
+        return row
 
-        # チャンネル名
-        ws.cell(row=row_idx, column=4).value = video.channel_name
+    def _styled_cell(self, ws, value: Any, style: str) -> WriteOnlyCell:
+        """
+        名前付きスタイルを設定したセルを作成
 
-        # チャンネルID
-        ws.cell(row=row_idx, column=5).value = video.channel_id
+        Args:
+            ws: ワークシート
+            value: セルの値
+            style: 名前付きスタイル
 
-        # 再生回数
-        views_cell = ws.cell(row=row_idx, column=6)
-        views_cell.value = video.view_count
-        views_cell.number_format = '#,##0'
+        Returns:
+            WriteOnlyCell: セル
+        """
+        cell = WriteOnlyCell(ws, value=value)
+        cell.style = style
+        return cell
 
-        # いいね数
-        likes_cell = ws.cell(row=row_idx, column=7)
-        likes_cell.value = video.like_count
-        likes_cell.number_format = '#,##0'
+    def _set_column_widths(self, ws, videos: List[VideoInfo], columns: Optional[List[int]] = None) -> None:
+        """
+        ヘッダーと全行の値からカラム幅を計算して設定
 
-        # コメント数
-        comments_cell = ws.cell(row=row_idx, column=8)
-        comments_cell.value = video.comment_count
-        comments_cell.number_format = '#,##0'
+        Args:
+            ws: ワークシート
+            videos: 動画情報リスト
+            columns: 出力する列の番号（0始まり、Noneの場合はすべての列）
+        """
+        if columns is None:
+            columns = list(range(len(HEADERS)))
+        tracker = ColumnWidthTracker([HEADERS[col] for col in columns])
 
-        # 公開日（タイムゾーン情報を削除）
-        published_cell = ws.cell(row=row_idx, column=9)
-        # Excelはタイムゾーン付きdatetimeをサポートしないため、タイムゾーンを削除
-        published_at_naive = video.published_at.replace(tzinfo=None) if video.published_at.tzinfo else video.published_at
-        published_cell.value = published_at_naive
-        published_cell.number_format = 'yyyy-mm-dd'
+        for index, video in enumerate(videos, start=1):
+            row = self._row_values(index, video)
+            tracker.update([row[col] for col in columns])
 
-        # 動画の長さ
-        ws.cell(row=row_idx, column=10).value = video.duration_formatted
+        for col_idx, width in enumerate(tracker.widths(), start=1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = width
 
-        # 種類
-        video_type = "ショート" if video.is_short else "通常"
-        ws.cell(row=row_idx, column=11).value = video_type
 
-        # 概要
-        ws.cell(row=row_idx, column=12).value = video.description
+class ColumnWidthTracker:
+    """
+    行を追加するたびにカラム幅を更新するクラス
 
-        # タグ（カンマ区切り）
-        tags_str = ", ".join(video.tags) if video.tags else ""
-        ws.cell(row=row_idx, column=13).value = tags_str
+    上限幅に達した列はそれ以降の値の幅を計算しない
+    """
 
-        # サムネイルURL（ハイパーリンク）
-        if video.thumbnail_url:
-            thumb_cell = ws.cell(row=row_idx, column=14)
-            thumb_cell.value = video.thumbnail_url
-            thumb_cell.hyperlink = video.thumbnail_url
-            thumb_cell.font = Font(color="0563C1", underline="single")
+    def __init__(self, headers: List[str], min_width: int = MIN_COLUMN_WIDTH, max_width: int = MAX_COLUMN_WIDTH):
+        """
+        初期化
 
-    def _auto_adjust_column_width(self, ws) -> None:
+        Args:
+            headers: ヘッダー（ヘッダーの幅も含めて計算する）
+            min_width: 最小幅（文字数）
+            max_width: 最大幅（文字数）
         """
-        カラム幅を自動調整
+        self.min_width = min_width
+        self.max_width = max_width
+        # 値の表示幅の上限（これに余白2文字を足すと最大幅）
+        self._cap = max_width - 2
+        self._max_lengths = [0] * len(headers)
+        self._open_columns = list(range(len(headers)))
+        self.update(headers)
+
+    def update(self, values: List[Any]) -> None:
+        """
+        1行分の値でカラム幅を更新
 
         Args:
-            ws: ワークシート
+            values: 列ごとの値
         """
-        for column_cells in ws.columns:
-            max_length = 0
-            column_letter = get_column_letter(column_cells[0].column)
-
-            for cell in column_cells:
-                try:
-                    if cell.value:
-                        # セル値の長さを計算（日本語は2文字分としてカウント）
-                        cell_value = str(cell.value)
-                        length = sum(2 if ord(c) > 127 else 1 for c in cell_value)
-                        max_length = max(max_length, length)
-                except:
-                    pass
-
-            # 最大幅を制限（20〜80文字）
-            adjusted_width = min(max(max_length + 2, 20), 80)
-            ws.column_dimensions[column_letter].width = adjusted_width
+        max_lengths = self._max_lengths
+        saturated = False
+
+        for col_idx in self._open_columns:
+            value = values[col_idx]
+            if not value:
+                continue
+            length = display_width(value, self._cap)
+            if length > max_lengths[col_idx]:
+                max_lengths[col_idx] = length
+                if length >= self._cap:
+                    saturated = True
+
+        if saturated:
+            self._open_columns = [i for i in self._open_columns if max_lengths[i] < self._cap]
+
+    def widths(self) -> List[int]:
+        """
+        カラム幅を取得
+
+        Returns:
+            List[int]: 列ごとの幅（最小幅〜最大幅）
+        """
+        return [
+            min(max(length + 2, self.min_width), self.max_width)
+            for length in self._max_lengths
+        ]
+
+
+def display_width(value: Any, cap: Optional[int] = None) -> int:
+    """
+    セル値の表示幅を計算（ASCII以外の文字は2文字分としてカウント）
+
+    Args:
+        value: セルの値
+        cap: 幅の上限（文字数が上限以上の場合は幅を数えずに上限を返す）
+
+    Returns:
+        int: 表示幅
+    """
+    text = value if isinstance(value, str) else str(value)
+    length = len(text)
+    if cap is not None and length >= cap:
+        return cap
+    # ASCII文字はencodeで残り、それ以外は2文字分
+    return 2 * length - len(text.encode("ascii", "ignore"))
@@ -0,0 +1,153 @@
+"""
+HTTP接続プール
+
+YouTube API呼び出し用のHTTPトランスポート。
+requestsのコネクションプールを使い、スレッド・検索をまたいでTLS接続を再利用する
+（googleapiclientのHttpRequest.execute(http=...)にhttplib2.Httpの代わりに渡せる）
+"""
+import os
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from typing import Optional, Dict, Tuple
+
+import httplib2
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+# 接続プールの最大接続数（デフォルト）
+DEFAULT_POOL_SIZE = 10
+
+# 接続・読み取りのタイムアウト（秒、googleapiclientのbuild_httpと同じ）
+DEFAULT_TIMEOUT = 60.0
+
+# requestsが展開済みの本文に対して意味を持たなくなるヘッダー
+_DROPPED_RESPONSE_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class PooledHttp:
+    """
+    httplib2.Http互換のプール付きHTTPクライアント
+
+    requests.Sessionの接続プール（urllib3）はスレッドセーフなため、
+    1つのインスタンスを複数のワーカースレッドから同時に使用できる
+    """
+
+    def __init__(self, pool_size: Optional[int] = None, timeout: Optional[float] = None):
+        """
+        初期化
+
+        Args:
+            pool_size: ホストごとに保持する最大接続数
+                    指定しない場合は環境変数YOUTUBE_HTTP_POOL_SIZEまたは10
+            timeout: タイムアウト（秒）
+                    指定しない場合は環境変数YOUTUBE_HTTP_TIMEOUTまたは60
+
+        Raises:
+            ImportError: requestsがインストールされていない場合
+        """
+        if not REQUESTS_AVAILABLE:
+            raise ImportError("requestsがインストールされていません")
+
+        self.pool_size = pool_size or int(os.getenv("YOUTUBE_HTTP_POOL_SIZE", str(DEFAULT_POOL_SIZE)))
+        self.timeout = timeout or float(os.getenv("YOUTUBE_HTTP_TIMEOUT", str(DEFAULT_TIMEOUT)))
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # スレッド間で共有するため、Cookieによるセッション状態を持たない
+        self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+        logger.info(f"HTTP接続プールを初期化しました: 最大{self.pool_size}接続")
+
+    def request(
+        self,
+        uri: str,
+        method: str = "GET",
+        body=None,
+        headers: Optional[Dict[str, str]] = None,
+        redirections: int = 5,
+        connection_type=None
+    ) -> Tuple[httplib2.Response, bytes]:
+        """
+        HTTPリクエストを送信（httplib2.Http.requestと同じ呼び出し形式）
+
+        Args:
+            uri: リクエストURI
+            method: HTTPメソッド
+            body: リクエスト本文
+            headers: リクエストヘッダー
+            redirections: リダイレクトの最大回数
+            connection_type: 未使用（httplib2との互換のため）
+
+        Returns:
+            Tuple[httplib2.Response, bytes]: レスポンスヘッダーと本文
+
+        Raises:
+            ConnectionError: 接続に失敗した場合
+            TimeoutError: タイムアウトした場合
+        """
+        try:
+            response = self.session.request(
+                method,
+                uri,
+                data=body,
+                headers=headers,
+                timeout=self.timeout,
+                allow_redirects=redirections > 0
+            )
+        except requests.exceptions.Timeout as e:
+            # リトライポリシーが判定できるよう組み込みの例外に変換する
+            raise TimeoutError(str(e)) from e
+        except requests.exceptions.ConnectionError as e:
+            raise ConnectionError(str(e)) from e
+
+        info = {
+            key.lower(): value
+            for key, value in response.headers.items()
+            if key.lower() not in _DROPPED_RESPONSE_HEADERS
+        }
+        info["status"] = str(response.status_code)
+        info["reason"] = response.reason or ""
+
+        return httplib2.Response(info), response.content
+
+    def close(self) -> None:
+        """プール内の接続をすべて閉じる"""
+        self.session.close()
+
+
+_shared_http: Optional[PooledHttp] = None
+_shared_http_lock = threading.Lock()
+
+
+def get_shared_http() -> PooledHttp:
+    """
+    プロセス全体で共有するHTTPクライアントを取得（初回呼び出し時に生成）
+
+    Returns:
+        PooledHttp: 共有HTTPクライアント
+    """
+    global _shared_http
+    with _shared_http_lock:
+        if _shared_http is None:
+            _shared_http = PooledHttp()
+        return _shared_http
+
+
+def close_shared_http() -> None:
+    """共有HTTPクライアントを破棄する（テスト・終了処理用）"""
+    global _shared_http
+    with _shared_http_lock:
+        if _shared_http is not None:
+            _shared_http.close()
+            _shared_http = None
@@ -0,0 +1,46 @@
+"""
+JSON Linesエクスポート機能
+
+動画情報をJSON Linesファイル（1行1動画のJSON）に出力する
+"""
+import json
+from typing import FrozenSet, List
+
+from src.domain.models import VideoInfo
+from src.infrastructure.base_exporter import BaseExporter, video_to_record
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class JsonlExporter(BaseExporter):
+    """
+    JSON Linesファイルにエクスポートするクラス
+
+    1行ずつファイルに書き出す。公開日はISO 8601形式、タグは配列で出力する
+    """
+
+    file_extension = ".jsonl"
+    file_type_name = "JSON Linesファイル"
+
+    def __init__(self):
+        """初期化"""
+        logger.info("JsonlExporterを初期化しました")
+
+    def _write(self, videos: List[VideoInfo], file_path: str, omit_fields: FrozenSet[str] = frozenset()) -> None:
+        """
+        JSON Linesファイルを書き出す
+
+        Args:
+            videos: エクスポートする動画情報リスト
+            file_path: 出力先ファイルパス
+            omit_fields: 出力しない属性
+        """
+        with open(file_path, "w", encoding="utf-8") as f:
+            for video in videos:
+                record = video_to_record(video)
+                record["published_at"] = video.published_at.isoformat()
+                for field in omit_fields:
+                    record.pop(field, None)
+                f.write(json.dumps(record, ensure_ascii=False))
+                f.write("\n")
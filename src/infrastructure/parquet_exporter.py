@@ -0,0 +1,104 @@
+"""
+Parquetエクスポート機能
+
+動画情報を列指向のParquetファイルに出力する
+"""
+import os
+from typing import FrozenSet, List, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+from src.domain.models import VideoInfo
+from src.infrastructure.base_exporter import BaseExporter, EXPORT_FIELDS, video_to_record
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 1回に書き出す行数（Parquetの行グループの単位）
+DEFAULT_BATCH_SIZE = 10000
+
+# 圧縮方式
+COMPRESSION = "zstd"
+
+
+def _build_schema() -> "pa.Schema":
+    """
+    Parquetファイルのスキーマを作成
+
+    チャンネル名・チャンネルIDは同じ値が繰り返し出現するため辞書エンコードする
+
+    Returns:
+        pa.Schema: スキーマ
+    """
+    dictionary_string = pa.dictionary(pa.int32(), pa.string())
+    types = {
+        "video_id": pa.string(),
+        "title": pa.string(),
+        "url": pa.string(),
+        "channel_name": dictionary_string,
+        "channel_id": dictionary_string,
+        "view_count": pa.int64(),
+        "like_count": pa.int64(),
+        "comment_count": pa.int64(),
+        "published_at": pa.timestamp("s", tz="UTC"),
+        "duration_seconds": pa.int32(),
+        "is_short": pa.bool_(),
+        "description": pa.string(),
+        "tags": pa.list_(pa.string()),
+        "thumbnail_url": pa.string(),
+    }
+    return pa.schema([(field, types[field]) for field in EXPORT_FIELDS])
+
+
+class ParquetExporter(BaseExporter):
+    """
+    Parquetファイルにエクスポートするクラス
+
+    一定行数ごとに行グループとして書き出すため、件数が多くても
+    全行分の列データをメモリに保持しない
+    """
+
+    file_extension = ".parquet"
+    file_type_name = "Parquetファイル"
+
+    def __init__(self, batch_size: Optional[int] = None):
+        """
+        初期化
+
+        Args:
+            batch_size: 1回に書き出す行数
+                    指定しない場合は環境変数PARQUET_BATCH_SIZEまたは10000
+
+        Raises:
+            ImportError: pyarrowがインストールされていない場合
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError(
+                "pyarrowがインストールされていません。\n"
+                "pip install pyarrow を実行してください。"
+            )
+
+        self.batch_size = batch_size or int(os.getenv("PARQUET_BATCH_SIZE", str(DEFAULT_BATCH_SIZE)))
+        self.schema = _build_schema()
+
+        logger.info(f"ParquetExporterを初期化しました: {self.batch_size}行ごとに書き出し")
+
+    def _write(self, videos: List[VideoInfo], file_path: str, omit_fields: FrozenSet[str] = frozenset()) -> None:
+        """
+        Parquetファイルを書き出す
+
+        Args:
+            videos: エクスポートする動画情報リスト
+            file_path: 出力先ファイルパス
+            omit_fields: 出力しない属性
+        """
+        schema = pa.schema([field for field in self.schema if field.name not in omit_fields])
+        with pq.ParquetWriter(file_path, schema, compression=COMPRESSION) as writer:
+            for start in range(0, len(videos), self.batch_size):
+                records = [video_to_record(video) for video in videos[start:start + self.batch_size]]
+                writer.write_table(pa.Table.from_pylist(records, schema=schema))
@@ -0,0 +1,175 @@
+"""
+APIクォータ管理
+
+YouTube Data API v3のクォータ使用量をAPIキー・日付ごとに記録する
+（クォータは太平洋時間の0時にリセットされる）
+"""
+import os
+import hashlib
+from typing import Optional
+from datetime import datetime, date, timedelta, timezone
+
+from src.database.connection import get_connection_manager, close_connection_manager
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# API呼び出しごとのクォータコスト（ユニット）
+SEARCH_LIST_COST = 100
+VIDEOS_LIST_COST = 1
+
+# 1日あたりのクォータ上限（デフォルト）
+DEFAULT_DAILY_QUOTA = 10000
+
+try:
+    from zoneinfo import ZoneInfo
+    _PACIFIC_TZ = ZoneInfo("America/Los_Angeles")
+except Exception:
+    # tzdataが利用できない環境（Windowsなど）では米国の夏時間規則で計算する
+    _PACIFIC_TZ = None
+
+
+def _nth_sunday(year: int, month: int, n: int) -> date:
+    """指定月の第n日曜日を返す"""
+    first = date(year, month, 1)
+    first_sunday = first + timedelta(days=(6 - first.weekday()) % 7)
+    return first_sunday + timedelta(weeks=n - 1)
+
+
+def pacific_today(now: Optional[datetime] = None) -> date:
+    """
+    太平洋時間での今日の日付を取得
+
+    Args:
+        now: 基準日時（タイムゾーン付き、未指定の場合は現在時刻）
+
+    Returns:
+        date: 太平洋時間の日付
+    """
+    now = now or datetime.now(timezone.utc)
+
+    if _PACIFIC_TZ is not None:
+        return now.astimezone(_PACIFIC_TZ).date()
+
+    # 夏時間: 3月第2日曜 2:00 PST（10:00 UTC）〜 11月第1日曜 2:00 PDT（9:00 UTC）
+    utc_now = now.astimezone(timezone.utc)
+    year = utc_now.year
+    dst_start = datetime.combine(_nth_sunday(year, 3, 2), datetime.min.time(), timezone.utc) + timedelta(hours=10)
+    dst_end = datetime.combine(_nth_sunday(year, 11, 1), datetime.min.time(), timezone.utc) + timedelta(hours=9)
+    offset = timedelta(hours=-7) if dst_start <= utc_now < dst_end else timedelta(hours=-8)
+    return (utc_now + offset).date()
+
+
+def api_key_id(api_key: str) -> str:
+    """
+    APIキーを記録用の識別子に変換（キー自体はデータベースに保存しない）
+
+    Args:
+        api_key: APIキー
+
+    Returns:
+        str: APIキーのハッシュ（先頭16文字）
+    """
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+class QuotaTracker:
+    """
+    APIクォータ使用量の記録
+
+    APIキーごと・太平洋時間の日付ごとに使用ユニット数をデータベースに保存する
+    """
+
+    def __init__(self, db_path: Optional[str] = None, daily_limit: Optional[int] = None):
+        """
+        初期化
+
+        Args:
+            db_path: データベースファイルパス
+                    指定しない場合は環境変数DATABASE_PATHまたはデフォルトパスを使用
+            daily_limit: 1日あたりのクォータ上限
+                    指定しない場合は環境変数YOUTUBE_DAILY_QUOTAまたは10,000
+        """
+        self.db_path = db_path or os.getenv("DATABASE_PATH", "youtube_analyzer.db")
+        self.daily_limit = daily_limit or int(os.getenv("YOUTUBE_DAILY_QUOTA", str(DEFAULT_DAILY_QUOTA)))
+
+        # 接続管理を取得（スキーマの初期化はプロセス内で1回だけ行われる）
+        self._db = get_connection_manager(self.db_path)
+
+        logger.info(f"QuotaTrackerを初期化しました: 上限={self.daily_limit}ユニット/日")
+
+    def close(self) -> None:
+        """
+        データベース接続を閉じる（データベースファイルを削除する前に呼び出す）
+
+        接続は同じデータベースを使う他のサービスと共有しているため、それらの接続も閉じられる
+        """
+        close_connection_manager(self.db_path)
+
+    def record(self, api_key: str, units: int) -> None:
+        """
+        クォータ使用量を記録
+
+        Args:
+            api_key: 使用したAPIキー
+            units: 使用ユニット数
+        """
+        try:
+            with self._db.connection() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute("""
+                    INSERT INTO api_quota_usage (key_id, usage_date, units, updated_at)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT (key_id, usage_date)
+                    DO UPDATE SET units = units + excluded.units,
+                                  updated_at = excluded.updated_at
+                """, (
+                    api_key_id(api_key),
+                    pacific_today().isoformat(),
+                    units,
+                    datetime.now().isoformat()
+                ))
+
+        except Exception as e:
+            logger.error(f"クォータ使用量記録エラー: {e}", exc_info=True)
+            raise
+
+    def get_used(self, api_key: str) -> int:
+        """
+        本日（太平洋時間）のクォータ使用量を取得
+
+        Args:
+            api_key: APIキー
+
+        Returns:
+            int: 使用ユニット数
+        """
+        try:
+            with self._db.connection() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute("""
+                    SELECT units FROM api_quota_usage
+                    WHERE key_id = ? AND usage_date = ?
+                """, (api_key_id(api_key), pacific_today().isoformat()))
+
+                row = cursor.fetchone()
+
+            return row[0] if row else 0
+
+        except Exception as e:
+            logger.error(f"クォータ使用量取得エラー: {e}", exc_info=True)
+            raise
+
+    def get_remaining(self, api_key: str) -> int:
+        """
+        本日（太平洋時間）のクォータ残量を取得
+
+        Args:
+            api_key: APIキー
+
+        Returns:
+            int: 残りユニット数
+        """
+        return max(0, self.daily_limit - self.get_used(api_key))
@@ -0,0 +1,120 @@
+"""
+リトライポリシー
+
+YouTube APIの一時的なエラー（5xx、接続リセットなど）に対する
+指数バックオフ（ジッター付き）の再試行ルールを定義する
+"""
+import random
+import socket
+import ssl
+import time
+import http.client
+from dataclasses import dataclass
+from typing import Optional, Set
+
+from googleapiclient.errors import HttpError
+
+# 再試行するHTTPステータスコード
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# 再試行するネットワークエラー（接続リセット、タイムアウト、応答途中の切断など）
+RETRYABLE_EXCEPTIONS = (
+    ConnectionError,
+    TimeoutError,
+    socket.timeout,
+    ssl.SSLError,
+    http.client.HTTPException,
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    リトライポリシー
+
+    Attributes:
+        max_attempts: 最大試行回数（初回を含む）
+        base_delay: バックオフの基準待ち時間（秒）
+        max_delay: 1回あたりの待ち時間の上限（秒）
+        deadline: 1回の検索にかける時間の上限（秒、Noneの場合は無制限）
+    """
+    max_attempts: int = 5
+    base_delay: float = 1.0
+    max_delay: float = 32.0
+    deadline: Optional[float] = 120.0
+
+    def __post_init__(self):
+        """バリデーション"""
+        if self.max_attempts < 1:
+            raise ValueError("最大試行回数は1以上を指定してください")
+
+        if self.base_delay < 0 or self.max_delay < 0:
+            raise ValueError("待ち時間は0以上を指定してください")
+
+    def is_retryable(self, error: Exception, reasons: Optional[Set[str]] = None) -> bool:
+        """
+        再試行すべきエラーか判定
+
+        Args:
+            error: 発生したエラー
+            reasons: APIエラーの理由（rateLimitExceededなど）
+
+        Returns:
+            bool: 再試行すべきならTrue
+        """
+        if isinstance(error, HttpError):
+            status = error.resp.status
+        else:
+            # HTTPステータスを持つその他のAPIエラー（非同期クライアントなど）
+            status = getattr(error, "status", None)
+
+        if isinstance(status, int):
+            if status in RETRYABLE_STATUS_CODES:
+                return True
+            # 403でもレート制限は時間をおけば成功する
+            return status == 403 and bool(
+                (reasons or set()) & {"rateLimitExceeded", "userRateLimitExceeded"}
+            )
+
+        return isinstance(error, RETRYABLE_EXCEPTIONS)
+
+    def compute_delay(self, attempt: int) -> float:
+        """
+        次の再試行までの待ち時間を計算（Full Jitter方式）
+
+        Args:
+            attempt: 失敗した試行の回数（1から始まる）
+
+        Returns:
+            float: 待ち時間（秒）
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def next_delay(
+        self,
+        error: Exception,
+        attempt: int,
+        deadline_at: Optional[float] = None,
+        reasons: Optional[Set[str]] = None
+    ) -> Optional[float]:
+        """
+        再試行する場合の待ち時間を返す
+
+        Args:
+            error: 発生したエラー
+            attempt: 失敗した試行の回数（1から始まる）
+            deadline_at: 検索の期限（time.monotonic()基準、Noneの場合は無制限）
+            reasons: APIエラーの理由
+
+        Returns:
+            Optional[float]: 待ち時間（秒）。再試行しない場合はNone
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(error, reasons):
+            return None
+
+        delay = self.compute_delay(attempt)
+        if deadline_at is not None and time.monotonic() + delay >= deadline_at:
+            return None
+
+        return delay
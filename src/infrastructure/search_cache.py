@@ -0,0 +1,224 @@
+"""
+検索結果キャッシュ
+
+search.list APIの結果（ページごとの動画IDリスト）をSQLiteに保存し、
+同じ検索条件での再検索時にAPIクォータを消費しないようにする
+"""
+import os
+import json
+import hashlib
+import unicodedata
+from typing import List, Optional
+from datetime import datetime, timedelta
+
+from src.domain.models import SearchCriteria
+from src.database.connection import get_connection_manager, close_connection_manager
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# キャッシュの有効期間（秒）
+DEFAULT_MAX_AGE = 60 * 60
+
+# 保持するキャッシュの最大件数（超えた分は最終参照日時が古いものから削除）
+DEFAULT_MAX_ENTRIES = 500
+
+
+def make_search_cache_key(criteria: SearchCriteria) -> str:
+    """
+    検索条件からキャッシュキーを生成
+
+    search.list APIに渡すパラメータのみを対象とし、キーワードは
+    NFKC正規化・空白の統一・大文字小文字の同一視を行う。
+    再生回数・動画タイプ・最大取得件数は取得後のフィルタ条件のため含めない。
+
+    Args:
+        criteria: 検索条件
+
+    Returns:
+        str: キャッシュキー（SHA-256の16進文字列）
+    """
+    keyword = " ".join(unicodedata.normalize("NFKC", criteria.keyword).split()).casefold()
+
+    payload = {
+        "keyword": keyword,
+        "order": criteria.order,
+        "region_code": criteria.region_code,
+        "language": criteria.language,
+        "published_after": criteria.published_after.isoformat() if criteria.published_after else None,
+        "published_before": criteria.published_before.isoformat() if criteria.published_before else None,
+    }
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class SearchResultCache:
+    """
+    検索結果キャッシュ
+
+    正規化した検索条件のハッシュをキーに、ページごとの動画IDリストを保存する
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        max_age: Optional[int] = None,
+        max_entries: Optional[int] = None
+    ):
+        """
+        初期化
+
+        Args:
+            db_path: データベースファイルパス
+                    指定しない場合は環境変数DATABASE_PATHまたはデフォルトパスを使用
+            max_age: キャッシュの有効期間（秒）
+                    指定しない場合は環境変数SEARCH_CACHE_MAX_AGEまたは1時間
+            max_entries: 保持するキャッシュの最大件数
+                    指定しない場合は環境変数SEARCH_CACHE_MAX_ENTRIESまたは500件
+        """
+        self.db_path = db_path or os.getenv("DATABASE_PATH", "youtube_analyzer.db")
+
+        if max_age is None:
+            max_age = int(os.getenv("SEARCH_CACHE_MAX_AGE", str(DEFAULT_MAX_AGE)))
+        if max_entries is None:
+            max_entries = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", str(DEFAULT_MAX_ENTRIES)))
+
+        self.max_age = timedelta(seconds=max_age)
+        self.max_entries = max_entries
+
+        # 接続管理を取得（スキーマの初期化はプロセス内で1回だけ行われる）
+        self._db = get_connection_manager(self.db_path)
+
+        logger.info(f"SearchResultCacheを初期化しました: max_age={max_age}秒, max_entries={max_entries}件")
+
+    def close(self) -> None:
+        """
+        データベース接続を閉じる（データベースファイルを削除する前に呼び出す）
+
+        接続は同じデータベースを使う他のサービスと共有しているため、それらの接続も閉じられる
+        """
+        close_connection_manager(self.db_path)
+
+    def get(self, criteria: SearchCriteria) -> Optional[List[List[str]]]:
+        """
+        検索条件に対応するキャッシュを取得
+
+        有効期間内で、かつmax_results件を満たす（または最終ページまで取得済みの）
+        キャッシュのみを返す
+
+        Args:
+            criteria: 検索条件
+
+        Returns:
+            Optional[List[List[str]]]: ページごとの動画IDリスト（キャッシュがない場合はNone）
+        """
+        cache_key = make_search_cache_key(criteria)
+
+        try:
+            with self._db.connection() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute("""
+                    SELECT pages, exhausted, fetched_at
+                    FROM search_result_cache
+                    WHERE cache_key = ?
+                """, (cache_key,))
+
+                row = cursor.fetchone()
+                if not row:
+                    return None
+
+                pages_json, exhausted, fetched_at = row
+
+                if datetime.fromisoformat(fetched_at) < datetime.now() - self.max_age:
+                    logger.debug(f"検索結果キャッシュが期限切れです: {criteria.keyword}")
+                    return None
+
+                pages = json.loads(pages_json)
+                if not exhausted and sum(len(page) for page in pages) < criteria.max_results:
+                    logger.debug(f"検索結果キャッシュの件数が不足しています: {criteria.keyword}")
+                    return None
+
+                cursor.execute("""
+                    UPDATE search_result_cache
+                    SET last_accessed_at = ?
+                    WHERE cache_key = ?
+                """, (datetime.now().isoformat(), cache_key))
+
+            logger.info(f"検索結果キャッシュを使用: キーワード='{criteria.keyword}'")
+            return pages
+
+        except Exception as e:
+            logger.error(f"検索結果キャッシュ取得エラー: {e}", exc_info=True)
+            raise
+
+    def put(self, criteria: SearchCriteria, pages: List[List[str]], exhausted: bool) -> None:
+        """
+        検索結果を保存
+
+        Args:
+            criteria: 検索条件
+            pages: ページごとの動画IDリスト
+            exhausted: 最終ページまで取得済みかどうか
+        """
+        cache_key = make_search_cache_key(criteria)
+        now = datetime.now().isoformat()
+
+        try:
+            with self._db.connection() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute("""
+                    INSERT OR REPLACE INTO search_result_cache (
+                        cache_key, keyword, pages, exhausted, fetched_at, last_accessed_at
+                    ) VALUES (?, ?, ?, ?, ?, ?)
+                """, (
+                    cache_key,
+                    criteria.keyword,
+                    json.dumps(pages, separators=(",", ":")),
+                    1 if exhausted else 0,
+                    now,
+                    now
+                ))
+
+                # 最大件数を超えた分を最終参照日時が古い順に削除
+                cursor.execute("""
+                    DELETE FROM search_result_cache
+                    WHERE cache_key NOT IN (
+                        SELECT cache_key FROM search_result_cache
+                        ORDER BY last_accessed_at DESC
+                        LIMIT ?
+                    )
+                """, (self.max_entries,))
+                evicted_count = cursor.rowcount
+
+            logger.debug(f"検索結果キャッシュを保存: キーワード='{criteria.keyword}', {len(pages)}ページ")
+            if evicted_count > 0:
+                logger.info(f"検索結果キャッシュを{evicted_count}件削除しました（上限{self.max_entries}件）")
+
+        except Exception as e:
+            logger.error(f"検索結果キャッシュ保存エラー: {e}", exc_info=True)
+            raise
+
+    def clear(self) -> int:
+        """
+        キャッシュをすべて削除
+
+        Returns:
+            int: 削除した件数
+        """
+        logger.warning("検索結果キャッシュをすべて削除します")
+
+        try:
+            with self._db.connection() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute("DELETE FROM search_result_cache")
+                deleted_count = cursor.rowcount
+
+            logger.info(f"{deleted_count}件の検索結果キャッシュを削除しました")
+            return deleted_count
+
+        except Exception as e:
+            logger.error(f"検索結果キャッシュ削除エラー: {e}", exc_info=True)
+            raise
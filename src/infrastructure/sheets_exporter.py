@@ -4,21 +4,101 @@ Google Sheets エクスポート機能
 動画情報をGoogle Spreadsheetsに出力する
 """
 import os
-from typing import List, Optional
+import json
+import time
+import hashlib
+from collections import deque
+from pathlib import Path
+from typing import List, Optional, Callable, Any, Dict, Iterable, Tuple
 from datetime import datetime
 
 try:
     import gspread
+    from gspread.utils import rowcol_to_a1, a1_to_rowcol
     from google.oauth2.service_account import Credentials
     GSPREAD_AVAILABLE = True
 except ImportError:
     GSPREAD_AVAILABLE = False
 
 from src.domain.models import VideoInfo
+from src.infrastructure.base_exporter import TABLE_FIELDS, table_column_indexes
+from src.infrastructure.retry_policy import RetryPolicy, RETRYABLE_STATUS_CODES
 from src.utils.logger import get_logger
+from src.utils.cancellation import CancellationToken, OperationCancelledError
 
 logger = get_logger(__name__)
 
+# 1回の書き込みリクエストで送る行数
+DEFAULT_CHUNK_SIZE = 500
+
+# 1分あたりの書き込みリクエスト数の上限（Sheets APIのユーザーあたりの書き込みクォータ）
+DEFAULT_WRITES_PER_MINUTE = 60
+
+# 書き込みの進捗（チェックポイント）を保存するディレクトリ
+# （起動時の作業ディレクトリによらず、ログディレクトリと同じアプリケーションのディレクトリに置く）
+APP_DIR = Path(__file__).parent.parent.parent
+DEFAULT_CHECKPOINT_DIR = str(APP_DIR / "sheets_checkpoints")
+
+# 更新モードで動画を識別する列（URL列、0始まり）
+KEY_COLUMN_INDEX = 2
+
+# カラム幅（ピクセル）
+COLUMN_WIDTHS = [
+    50,   # No
+    400,  # タイトル
+    300,  # URL
+    150,  # チャンネル名
+    200,  # チャンネルID
+    100,  # 再生回数
+    100,  # いいね数
+    100,  # コメント数
+    100,  # 公開日
+    100,  # 動画の長さ
+    80,   # 種類
+    400,  # 概要
+    200,  # タグ
+    300,  # サムネイルURL
+]
+
+
+class WriteRateLimiter:
+    """
+    書き込みリクエストのレート制限
+
+    直近1分間のリクエスト時刻を保持し、上限に達している場合は
+    最も古いリクエストから1分経過するまで待つ
+    """
+
+    def __init__(self, requests_per_minute: int, window: float = 60.0):
+        """
+        初期化
+
+        Args:
+            requests_per_minute: 1分あたりのリクエスト数の上限（0以下の場合は制限しない）
+            window: 制限の単位時間（秒）
+        """
+        self.requests_per_minute = requests_per_minute
+        self.window = window
+        self._sent_at = deque()
+
+    def wait(self) -> None:
+        """リクエストを送ってよい時刻まで待つ"""
+        if self.requests_per_minute <= 0:
+            return
+
+        now = time.monotonic()
+        while self._sent_at and now - self._sent_at[0] >= self.window:
+            self._sent_at.popleft()
+
+        if len(self._sent_at) >= self.requests_per_minute:
+            delay = self._sent_at[0] + self.window - now
+            logger.info(f"Google Sheetsの書き込み上限に達したため{delay:.1f}秒待機します")
+            time.sleep(delay)
+            self._sent_at.popleft()
+            now = time.monotonic()
+
+        self._sent_at.append(now)
+
 
 class SheetsExporter:
     """
@@ -27,13 +107,28 @@ class SheetsExporter:
     動画情報をGoogle Spreadsheetsに出力する
     """
 
-    def __init__(self, credentials_path: Optional[str] = None):
+    def __init__(
+        self,
+        credentials_path: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        writes_per_minute: Optional[int] = None,
+        checkpoint_dir: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None
+    ):
         """
         初期化
 
         Args:
             credentials_path: Google API認証情報のJSONファイルパス
                             指定しない場合は環境変数GOOGLE_CREDENTIALS_PATHを使用
+            chunk_size: 1回の書き込みリクエストで送る行数
+                            指定しない場合は環境変数SHEETS_CHUNK_SIZEまたは500
+            writes_per_minute: 1分あたりの書き込みリクエスト数の上限
+                            指定しない場合は環境変数SHEETS_WRITES_PER_MINUTEまたは60
+            checkpoint_dir: 書き込みの進捗を保存するディレクトリ
+                            指定しない場合は環境変数SHEETS_CHECKPOINT_DIR（相対パスはアプリケーションの
+                            ディレクトリ基準）またはアプリケーションのディレクトリのsheets_checkpoints
+            retry_policy: 429・5xxエラーに対するリトライポリシー
 
         Raises:
             ImportError: gspreadがインストールされていない場合
@@ -58,6 +153,19 @@ class SheetsExporter:
         if not os.path.exists(self.credentials_path):
             raise ValueError(f"認証情報ファイルが見つかりません: {self.credentials_path}")
 
+        self.chunk_size = chunk_size or int(os.getenv("SHEETS_CHUNK_SIZE", str(DEFAULT_CHUNK_SIZE)))
+        if self.chunk_size < 1:
+            raise ValueError("SHEETS_CHUNK_SIZEは1以上を指定してください")
+
+        if writes_per_minute is None:
+            writes_per_minute = int(os.getenv("SHEETS_WRITES_PER_MINUTE", str(DEFAULT_WRITES_PER_MINUTE)))
+        self.rate_limiter = WriteRateLimiter(writes_per_minute)
+
+        self.checkpoint_dir = checkpoint_dir or str(
+            APP_DIR / os.getenv("SHEETS_CHECKPOINT_DIR", DEFAULT_CHECKPOINT_DIR)
+        )
+        self.retry_policy = retry_policy or RetryPolicy(deadline=None)
+
         # Google Sheets APIクライアントを初期化
         try:
             scopes = [
@@ -70,12 +178,22 @@ class SheetsExporter:
             )
             self.client = gspread.authorize(creds)
             logger.info("SheetsExporterを初期化しました")
+
+            # スプレッドシート名 → スプレッドシート、(スプレッドシートID, ワークシート名) → ワークシート
+            # 同じセッションで繰り返しエクスポートする場合の取得リクエストを省略する
+            self._spreadsheets: Dict[str, Any] = {}
+            self._worksheets: Dict[Tuple[str, str], Any] = {}
+            # (スプレッドシートID, ワークシートID) → このエクスポーターで拡張した後の行数
+            # （キャッシュしたワークシートのrow_countは取得時の値のまま更新されないため）
+            self._row_counts: Dict[Tuple[str, int], int] = {}
         except Exception as e:
             logger.error(f"Google Sheets APIクライアントの初期化に失敗: {e}", exc_info=True)
             raise
 
     def export(self, videos: List[VideoInfo], spreadsheet_name: str,
-               worksheet_name: str = "YouTube動画リスト") -> str:
+               worksheet_name: str = "YouTube動画リスト", upsert: bool = False,
+               cancel_token: Optional[CancellationToken] = None,
+               omit_fields: Iterable[str] = ()) -> str:
         """
         動画情報をGoogle Spreadsheetsにエクスポート
 
@@ -83,22 +201,46 @@ class SheetsExporter:
             videos: エクスポートする動画情報リスト
             spreadsheet_name: スプレッドシート名
             worksheet_name: ワークシート名（デフォルト: "YouTube動画リスト"）
+            upsert: Trueの場合はシートをクリアせず、URLが一致する行の変更されたセルの更新と
+                    新しい動画の行の追加のみを行う
+            cancel_token: キャンセルトークン（チャンクの書き込み前に確認する。
+                    キャンセルした場合も進捗は保存され、再度エクスポートすると続きから書き込む）
+            omit_fields: 出力しない属性（description、tags、thumbnail_url）
+                    更新モードでは列の配置を変えず、既存の行のその列の値をそのまま残す
 
         Returns:
             str: スプレッドシートのURL
 
         Raises:
             ValueError: videosが空の場合
+            OperationCancelledError: エクスポートがキャンセルされた場合
             Exception: API呼び出しに失敗した場合
         """
         if not videos:
             raise ValueError("エクスポートする動画が指定されていません")
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
 
         logger.info(
             f"Google Sheetsエクスポート開始: {len(videos)}件の動画を "
             f"{spreadsheet_name}/{worksheet_name} に出力"
         )
 
+        if upsert:
+            return self._upsert(videos, spreadsheet_name, worksheet_name, omit_fields)
+
+        # ヘッダー行・データ行を作成（省略する属性の列は出力しない）
+        columns = table_column_indexes(omit_fields)
+        headers = [self._create_headers()[col] for col in columns]
+        data_rows = []
+        for idx, video in enumerate(videos, start=1):
+            row = self._create_video_row(idx, video)
+            data_rows.append([row[col] for col in columns])
+
+        checkpoint_path = self._checkpoint_path(spreadsheet_name, worksheet_name)
+        fingerprint = self._fingerprint(headers, data_rows)
+        rows_written = self._load_checkpoint(checkpoint_path, fingerprint)
+
         try:
             # スプレッドシートを作成または取得
             spreadsheet = self._get_or_create_spreadsheet(spreadsheet_name)
@@ -106,38 +248,520 @@ class SheetsExporter:
             # ワークシートを作成または取得
             worksheet = self._get_or_create_worksheet(spreadsheet, worksheet_name)
 
-            # 既存のデータをクリア
-            worksheet.clear()
+            # 行数が足りない場合はワークシートを拡張
+            required_rows = len(data_rows) + 1
+            requests = self._expand_grid_requests(worksheet, required_rows)
+
+            if rows_written == 0:
+                # 既存のデータのクリア、ヘッダー行と書式の設定を最初のデータと同じリクエストで送信
+                requests.append(self._clear_request(worksheet))
+                requests.append(self._update_cells_request(worksheet, 'A1', [headers]))
+                requests.extend(self._sheet_format_requests(worksheet, columns))
+            else:
+                logger.info(f"前回のエクスポートの続きから書き込みます: {rows_written}/{len(data_rows)}行書き込み済み")
+
+            # データ行をチャンクごとに書き込み、書き込むたびに進捗を保存
+            for start in range(rows_written, len(data_rows), self.chunk_size):
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+                chunk = data_rows[start:start + self.chunk_size]
+                requests.append(self._update_cells_request(worksheet, f'A{start + 2}', chunk))
+                self._send_requests(worksheet, requests, required_rows)
+                requests = []
+
+                rows_written = start + len(chunk)
+                self._save_checkpoint(checkpoint_path, fingerprint, rows_written)
+                logger.debug(f"Google Sheetsに書き込みました: {rows_written}/{len(data_rows)}行")
+
+            self._delete_checkpoint(checkpoint_path)
+
+            spreadsheet_url = spreadsheet.url
+            logger.info(f"Google Sheetsエクスポート完了: {spreadsheet_url}")
+
+            return spreadsheet_url
+
+        except OperationCancelledError:
+            logger.info(f"Google Sheetsエクスポートをキャンセルしました: {rows_written}/{len(data_rows)}行書き込み済み")
+            raise
 
-            # ヘッダー行を作成
-            headers = self._create_headers()
+        except Exception as e:
+            logger.error(f"Google Sheetsエクスポートエラー: {e}", exc_info=True)
+            self._forget_handles(spreadsheet_name, worksheet_name)
+            message = f"Google Sheetsへの書き込みに失敗しました: {e}"
+            if rows_written > 0:
+                message += (
+                    f"\n{rows_written}/{len(data_rows)}行まで書き込み済みです。"
+                    "同じ内容で再度エクスポートすると続きから書き込みます。"
+                )
+            raise Exception(message)
+
+    def _upsert(
+        self,
+        videos: List[VideoInfo],
+        spreadsheet_name: str,
+        worksheet_name: str,
+        omit_fields: Iterable[str] = ()
+    ) -> str:
+        """
+        既存のシートとの差分のみを書き込む
 
-            # データ行を作成
-            data_rows = [self._create_video_row(idx, video)
-                        for idx, video in enumerate(videos, start=1)]
+        シートの値を1回で読み込み、URLをキーに差分を計算して、
+        変更されたセルと追加する行を1回のbatch_updateで送信する。
+        今回の動画に含まれない既存の行はそのまま残す
 
-            # すべてのデータを一括で書き込み（効率化）
-            all_data = [headers] + data_rows
-            worksheet.update('A1', all_data)
+        Args:
+            videos: エクスポートする動画情報リスト
+            spreadsheet_name: スプレッドシート名
+            worksheet_name: ワークシート名
+            omit_fields: 取得していない属性（既存の行のその列は更新しない）
 
-            # ヘッダー行のフォーマット設定
-            self._format_header(worksheet)
+        Returns:
+            str: スプレッドシートのURL
 
-            # カラム幅を調整
-            self._adjust_column_widths(worksheet)
+        Raises:
+            Exception: API呼び出しに失敗した場合
+        """
+        headers = self._create_headers()
+        kept_columns = set(table_column_indexes(omit_fields))
+        omitted_columns = {col for col in range(len(TABLE_FIELDS)) if col not in kept_columns}
+
+        try:
+            spreadsheet = self._get_or_create_spreadsheet(spreadsheet_name)
+            worksheet = self._get_or_create_worksheet(spreadsheet, worksheet_name)
+
+            existing_values = self._call_read(worksheet.get_all_values)
+            data, updated_count, appended_count, header_written = self._diff_rows(
+                existing_values, headers, videos, omitted_columns
+            )
+
+            # 行数が足りない場合はワークシートを拡張
+            required_rows = max(len(existing_values), 1) + appended_count
+            requests = self._expand_grid_requests(worksheet, required_rows)
+            requests.extend(
+                self._update_cells_request(worksheet, item["range"].split(":")[0], item["values"])
+                for item in data
+            )
+
+            # 新しいシートの場合のみ書式を設定（既存のシートの書式はそのまま）
+            if header_written:
+                requests.extend(self._sheet_format_requests(worksheet))
+
+            if requests:
+                self._send_requests(worksheet, requests, required_rows)
 
             spreadsheet_url = spreadsheet.url
-            logger.info(f"Google Sheetsエクスポート完了: {spreadsheet_url}")
+            logger.info(
+                f"Google Sheets更新完了: {updated_count}行を更新、{appended_count}行を追加 "
+                f"（{len(data)}範囲）: {spreadsheet_url}"
+            )
 
             return spreadsheet_url
 
         except Exception as e:
-            logger.error(f"Google Sheetsエクスポートエラー: {e}", exc_info=True)
-            raise Exception(f"Google Sheetsへの書き込みに失敗しました: {e}")
+            logger.error(f"Google Sheets更新エラー: {e}", exc_info=True)
+            self._forget_handles(spreadsheet_name, worksheet_name)
+            raise Exception(f"Google Sheetsの更新に失敗しました: {e}")
+
+    def _diff_rows(
+        self,
+        existing_values: List[List[str]],
+        headers: List[str],
+        videos: List[VideoInfo],
+        omitted_columns: Iterable[int] = ()
+    ) -> Tuple[List[Dict[str, Any]], int, int, bool]:
+        """
+        既存のシートの値と動画情報の差分を計算
+
+        Args:
+            existing_values: シートの値（1行目はヘッダー）
+            headers: ヘッダー行
+            videos: 動画情報リスト
+            omitted_columns: 既存の値を残す列の番号（0始まり、取得していない属性の列）
+
+        Returns:
+            Tuple: (batch_updateのデータ, 更新した行数, 追加した行数, ヘッダーを書き込むか)
+        """
+        data = []
+
+        header_written = not existing_values or existing_values[0][:len(headers)] != headers
+        if header_written:
+            data.append({"range": "A1", "values": [headers]})
+
+        # URL → 行番号（1始まり）
+        row_numbers = {
+            row[KEY_COLUMN_INDEX]: row_number
+            for row_number, row in enumerate(existing_values[1:], start=2)
+            if len(row) > KEY_COLUMN_INDEX and row[KEY_COLUMN_INDEX]
+        }
+
+        updated_rows = set()
+        appended_rows = []
+        appended_keys = set()
+        next_row_number = max(len(existing_values), 1) + 1
+
+        for video in videos:
+            row_number = row_numbers.get(video.url)
+
+            if row_number is None:
+                if video.url in appended_keys:
+                    continue
+                appended_keys.add(video.url)
+                # Noは既存のデータ行からの連番
+                appended_rows.append(self._normalize_row(
+                    self._create_video_row(next_row_number + len(appended_rows) - 1, video)
+                ))
+                continue
+
+            # Noは既存の値のまま、それ以外の列で変更されたセルの範囲を追加
+            new_row = self._normalize_row(self._create_video_row(0, video))
+            old_row = existing_values[row_number - 1]
+            old_row = old_row + [""] * (len(new_row) - len(old_row))
+            for col in omitted_columns:
+                new_row[col] = old_row[col]
+
+            col = 1
+            while col < len(new_row):
+                if new_row[col] == old_row[col]:
+                    col += 1
+                    continue
+                end = col
+                while end + 1 < len(new_row) and new_row[end + 1] != old_row[end + 1]:
+                    end += 1
+                data.append({
+                    "range": f"{rowcol_to_a1(row_number, col + 1)}:{rowcol_to_a1(row_number, end + 1)}",
+                    "values": [new_row[col:end + 1]]
+                })
+                updated_rows.add(row_number)
+                col = end + 1
+
+        if appended_rows:
+            data.append({"range": f"A{next_row_number}", "values": appended_rows})
+
+        return data, len(updated_rows), len(appended_rows), header_written
+
+    def _send_requests(self, worksheet, requests: List[Dict[str, Any]], required_rows: int) -> None:
+        """
+        リクエストをまとめて1回のbatch_updateで送信
+
+        Args:
+            worksheet: ワークシートオブジェクト
+            requests: batch_updateのリクエスト
+            required_rows: 送信後のワークシートの行数（拡張した場合）
+        """
+        self._call_write(worksheet.spreadsheet.batch_update, {'requests': requests})
+
+        if self._row_count(worksheet) < required_rows:
+            self._row_counts[(worksheet.spreadsheet.id, worksheet.id)] = required_rows
+
+    def _row_count(self, worksheet) -> int:
+        """
+        ワークシートの現在の行数を取得（このエクスポーターで拡張した場合は拡張後の行数）
+
+        Args:
+            worksheet: ワークシートオブジェクト
+
+        Returns:
+            int: 行数
+        """
+        return self._row_counts.get((worksheet.spreadsheet.id, worksheet.id), worksheet.row_count)
+
+    def _expand_grid_requests(self, worksheet, required_rows: int) -> List[Dict[str, Any]]:
+        """
+        ワークシートの行数が足りない場合に拡張するリクエストを作成
+
+        Args:
+            worksheet: ワークシートオブジェクト
+            required_rows: 必要な行数
+
+        Returns:
+            List[Dict[str, Any]]: リクエスト（拡張が不要な場合は空）
+        """
+        if self._row_count(worksheet) >= required_rows:
+            return []
+
+        return [{
+            'updateSheetProperties': {
+                'properties': {'sheetId': worksheet.id, 'gridProperties': {'rowCount': required_rows}},
+                'fields': 'gridProperties.rowCount'
+            }
+        }]
+
+    def _clear_request(self, worksheet) -> Dict[str, Any]:
+        """
+        ワークシートの値をすべてクリアするリクエストを作成
+
+        Args:
+            worksheet: ワークシートオブジェクト
+
+        Returns:
+            Dict[str, Any]: リクエスト
+        """
+        return {
+            'updateCells': {
+                'range': {'sheetId': worksheet.id},
+                'fields': 'userEnteredValue'
+            }
+        }
+
+    def _update_cells_request(self, worksheet, start_cell: str, rows: List[List[Optional[str]]]) -> Dict[str, Any]:
+        """
+        指定したセルから値を書き込むリクエストを作成
+
+        Args:
+            worksheet: ワークシートオブジェクト
+            start_cell: 書き込みを開始するセル（A1形式）
+            rows: 行データ（空の値はセルをクリアする）
+
+        Returns:
+            Dict[str, Any]: リクエスト
+        """
+        row, col = a1_to_rowcol(start_cell)
+        return {
+            'updateCells': {
+                'start': {'sheetId': worksheet.id, 'rowIndex': row - 1, 'columnIndex': col - 1},
+                'rows': [
+                    {'values': [{'userEnteredValue': {'stringValue': value}} if value else {} for value in values]}
+                    for values in rows
+                ],
+                'fields': 'userEnteredValue'
+            }
+        }
+
+    def _sheet_format_requests(self, worksheet, columns: Optional[List[int]] = None) -> List[Dict[str, Any]]:
+        """
+        ヘッダー行の書式・カラム幅・ヘッダー行の固定のリクエストを作成
+
+        Args:
+            worksheet: ワークシートオブジェクト
+            columns: 出力する列の番号（0始まり、Noneの場合はすべての列）
+
+        Returns:
+            List[Dict[str, Any]]: リクエスト
+        """
+        widths = COLUMN_WIDTHS if columns is None else [COLUMN_WIDTHS[col] for col in columns]
+        requests = [
+            {
+                'repeatCell': {
+                    'range': {
+                        'sheetId': worksheet.id,
+                        'startRowIndex': 0,
+                        'endRowIndex': 1,
+                        'startColumnIndex': 0,
+                        'endColumnIndex': len(widths)
+                    },
+                    'cell': {
+                        'userEnteredFormat': {
+                            'textFormat': {
+                                'bold': True,
+                                'foregroundColor': {'red': 1.0, 'green': 1.0, 'blue': 1.0}
+                            },
+                            'backgroundColor': {'red': 0.27, 'green': 0.45, 'blue': 0.77},
+                            'horizontalAlignment': 'CENTER'
+                        }
+                    },
+                    'fields': 'userEnteredFormat(textFormat,backgroundColor,horizontalAlignment)'
+                }
+            },
+            {
+                'updateSheetProperties': {
+                    'properties': {'sheetId': worksheet.id, 'gridProperties': {'frozenRowCount': 1}},
+                    'fields': 'gridProperties.frozenRowCount'
+                }
+            }
+        ]
+
+        for col_idx, width in enumerate(widths):
+            requests.append({
+                'updateDimensionProperties': {
+                    'range': {
+                        'sheetId': worksheet.id,
+                        'dimension': 'COLUMNS',
+                        'startIndex': col_idx,
+                        'endIndex': col_idx + 1
+                    },
+                    'properties': {'pixelSize': width},
+                    'fields': 'pixelSize'
+                }
+            })
+
+        return requests
+
+    def _normalize_row(self, row: List[Optional[str]]) -> List[str]:
+        """
+        行の値をシートから読み込んだ値と比較できる形にする（Noneは空文字）
+
+        Args:
+            row: 行データ
+
+        Returns:
+            List[str]: 行データ
+        """
+        return ["" if value is None else value for value in row]
+
+    def _call_write(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        書き込みリクエストを送信（レート制限付き、429・5xxエラーは再試行）
+
+        Args:
+            func: 書き込みを行うgspreadのメソッド
+            *args: メソッドの引数
+            **kwargs: メソッドのキーワード引数
+
+        Returns:
+            Any: メソッドの戻り値
+        """
+        return self._call_with_retry(True, func, *args, **kwargs)
+
+    def _call_read(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        読み込みリクエストを送信（429・5xxエラーは再試行）
+
+        Args:
+            func: 読み込みを行うgspreadのメソッド
+            *args: メソッドの引数
+            **kwargs: メソッドのキーワード引数
+
+        Returns:
+            Any: メソッドの戻り値
+        """
+        return self._call_with_retry(False, func, *args, **kwargs)
+
+    def _call_with_retry(self, rate_limited: bool, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        リクエストを送信（429・5xxエラーは再試行）
+
+        Args:
+            rate_limited: 書き込みのレート制限を適用するか
+            func: gspreadのメソッド
+            *args: メソッドの引数
+            **kwargs: メソッドのキーワード引数
+
+        Returns:
+            Any: メソッドの戻り値
+
+        Raises:
+            gspread.exceptions.APIError: 再試行しないエラー、または再試行回数を超えた場合
+        """
+        attempt = 0
+        while True:
+            if rate_limited:
+                self.rate_limiter.wait()
+            try:
+                return func(*args, **kwargs)
+            except gspread.exceptions.APIError as e:
+                attempt += 1
+                status = e.response.status_code
+                if status not in RETRYABLE_STATUS_CODES or attempt >= self.retry_policy.max_attempts:
+                    raise
+
+                delay = self.retry_policy.compute_delay(attempt)
+                # Retry-Afterが指定されている場合はそれより短くしない
+                retry_after = e.response.headers.get("Retry-After")
+                if retry_after and retry_after.isdigit():
+                    delay = max(delay, float(retry_after))
+
+                logger.warning(
+                    f"Google Sheets APIエラー（{status}）のため{delay:.1f}秒後に再試行します"
+                    f"（{attempt}/{self.retry_policy.max_attempts}）"
+                )
+                time.sleep(delay)
+
+    def _checkpoint_path(self, spreadsheet_name: str, worksheet_name: str) -> str:
+        """
+        チェックポイントファイルのパスを取得
+
+        Args:
+            spreadsheet_name: スプレッドシート名
+            worksheet_name: ワークシート名
+
+        Returns:
+            str: チェックポイントファイルのパス
+        """
+        key = hashlib.sha256(f"{spreadsheet_name}\0{worksheet_name}".encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.checkpoint_dir, f"{key}.json")
+
+    def _fingerprint(self, headers: List[str], data_rows: List[List[str]]) -> str:
+        """
+        書き込む内容のフィンガープリントを計算（内容が同じ場合のみ続きから書き込む）
+
+        Args:
+            headers: ヘッダー行
+            data_rows: データ行
+
+        Returns:
+            str: フィンガープリント
+        """
+        digest = hashlib.sha256()
+        for row in [headers] + data_rows:
+            digest.update(json.dumps(row, ensure_ascii=False).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _load_checkpoint(self, checkpoint_path: str, fingerprint: str) -> int:
+        """
+        チェックポイントから書き込み済みの行数を取得
+
+        Args:
+            checkpoint_path: チェックポイントファイルのパス
+            fingerprint: 書き込む内容のフィンガープリント
+
+        Returns:
+            int: 書き込み済みのデータ行数（チェックポイントがない・内容が異なる場合は0）
+        """
+        try:
+            with open(checkpoint_path, encoding="utf-8") as f:
+                checkpoint = json.load(f)
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError) as e:
+            logger.warning(f"チェックポイントの読み込みに失敗したため最初から書き込みます: {e}")
+            return 0
+
+        if checkpoint.get("fingerprint") != fingerprint:
+            logger.info("前回のエクスポートと内容が異なるため最初から書き込みます")
+            return 0
+
+        return int(checkpoint.get("rows_written", 0))
+
+    def _save_checkpoint(self, checkpoint_path: str, fingerprint: str, rows_written: int) -> None:
+        """
+        書き込み済みの行数をチェックポイントに保存
+
+        Args:
+            checkpoint_path: チェックポイントファイルのパス
+            fingerprint: 書き込む内容のフィンガープリント
+            rows_written: 書き込み済みのデータ行数
+        """
+        try:
+            os.makedirs(self.checkpoint_dir, exist_ok=True)
+            temp_path = f"{checkpoint_path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({
+                    "fingerprint": fingerprint,
+                    "rows_written": rows_written,
+                    "updated_at": datetime.now().isoformat()
+                }, f)
+            # 書き込み途中で中断しても壊れたファイルが残らないよう置き換える
+            os.replace(temp_path, checkpoint_path)
+        except OSError as e:
+            logger.warning(f"チェックポイントの保存に失敗: {e}")
+
+    def _delete_checkpoint(self, checkpoint_path: str) -> None:
+        """
+        チェックポイントを削除
+
+        Args:
+            checkpoint_path: チェックポイントファイルのパス
+        """
+        try:
+            os.remove(checkpoint_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"チェックポイントの削除に失敗: {e}")
 
     def _get_or_create_spreadsheet(self, spreadsheet_name: str):
         """
-        スプレッドシートを取得または作成
+        スプレッドシートを取得または作成（取得済みの場合はキャッシュを使用）
 
         Args:
             spreadsheet_name: スプレッドシート名
@@ -145,6 +769,10 @@ class SheetsExporter:
         Returns:
             スプレッドシートオブジェクト
         """
+        spreadsheet = self._spreadsheets.get(spreadsheet_name)
+        if spreadsheet is not None:
+            return spreadsheet
+
         try:
             # 既存のスプレッドシートを検索
             spreadsheet = self.client.open(spreadsheet_name)
@@ -154,11 +782,12 @@ class SheetsExporter:
             spreadsheet = self.client.create(spreadsheet_name)
             logger.info(f"新しいスプレッドシートを作成しました: {spreadsheet_name}")
 
+        self._spreadsheets[spreadsheet_name] = spreadsheet
         return spreadsheet
 
     def _get_or_create_worksheet(self, spreadsheet, worksheet_name: str):
         """
-        ワークシートを取得または作成
+        ワークシートを取得または作成（取得済みの場合はキャッシュを使用）
 
         Args:
             spreadsheet: スプレッドシートオブジェクト
@@ -167,6 +796,11 @@ class SheetsExporter:
         Returns:
             ワークシートオブジェクト
         """
+        key = (spreadsheet.id, worksheet_name)
+        worksheet = self._worksheets.get(key)
+        if worksheet is not None:
+            return worksheet
+
         try:
             worksheet = spreadsheet.worksheet(worksheet_name)
             logger.info(f"既存のワークシートを開きました: {worksheet_name}")
@@ -179,8 +813,23 @@ class SheetsExporter:
             )
             logger.info(f"新しいワークシートを作成しました: {worksheet_name}")
 
+        self._worksheets[key] = worksheet
         return worksheet
 
+    def _forget_handles(self, spreadsheet_name: str, worksheet_name: str) -> None:
+        """
+        キャッシュしたスプレッドシート・ワークシートを破棄（削除された場合などに備え、失敗時に呼び出す）
+
+        Args:
+            spreadsheet_name: スプレッドシート名
+            worksheet_name: ワークシート名
+        """
+        spreadsheet = self._spreadsheets.pop(spreadsheet_name, None)
+        if spreadsheet is not None:
+            worksheet = self._worksheets.pop((spreadsheet.id, worksheet_name), None)
+            if worksheet is not None:
+                self._row_counts.pop((spreadsheet.id, worksheet.id), None)
+
     def _create_headers(self) -> List[str]:
         """
         ヘッダー行を作成
@@ -241,68 +890,3 @@ class SheetsExporter:
             tags_str,
             video.thumbnail_url
         ]
-
-    def _format_header(self, worksheet) -> None:
-        """
-        ヘッダー行のフォーマット設定
-
-        Args:
-            worksheet: ワークシートオブジェクト
-        """
-        try:
-            # ヘッダー行を太字に
-            worksheet.format('A1:N1', {
-                'textFormat': {'bold': True},
-                'backgroundColor': {'red': 0.27, 'green': 0.45, 'blue': 0.77},
-                'horizontalAlignment': 'CENTER',
-                'textFormat': {'foregroundColor': {'red': 1.0, 'green': 1.0, 'blue': 1.0}}
-            })
-        except Exception as e:
-            logger.warning(f"ヘッダーフォーマット設定に失敗: {e}")
-
-    def _adjust_column_widths(self, worksheet) -> None:
-        """
-        カラム幅を調整
-
-        Args:
-            worksheet: ワークシートオブジェクト
-        """
-        try:
-            # カラム幅の設定
-            column_widths = {
-                'A': 50,   # No
-                'B': 400,  # タイトル
-                'C': 300,  # URL
-                'D': 150,  # チャンネル名
-                'E': 200,  # チャンネルID
-                'F': 100,  # 再生回数
-                'G': 100,  # いいね数
-                'H': 100,  # コメント数
-                'I': 100,  # 公開日
-                'J': 100,  # 動画の長さ
-                'K': 80,   # 種類
-                'L': 400,  # 概要
-                'M': 200,  # タグ
-                'N': 300,  # サムネイルURL
-            }
-
-            requests = []
-            for col, width in column_widths.items():
-                col_idx = ord(col) - ord('A')
-                requests.append({
-                    'updateDimensionProperties': {
-                        'range': {
-                            'sheetId': worksheet.id,
-                            'dimension': 'COLUMNS',
-                            'startIndex': col_idx,
-                            'endIndex': col_idx + 1
-                        },
-                        'properties': {'pixelSize': width},
-                        'fields': 'pixelSize'
-                    }
-                })
-
-            worksheet.spreadsheet.batch_update({'requests': requests})
-
-        except Exception as e:
-            logger.warning(f"カラム幅調整に失敗: {e}")
@@ -0,0 +1,263 @@
+"""
+動画統計情報の時系列ストア
+
+検索のたびに取得した再生回数・高評価数・コメント数を追記し、
+動画ごとの伸びをAPIを呼ばずに参照できるようにする
+"""
+import os
+from dataclasses import dataclass
+from typing import List, Optional, Dict, Iterable
+from datetime import datetime, date, timedelta
+
+from src.domain.models import VideoInfo
+from src.database.connection import get_connection_manager, close_connection_manager
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# この日数より古い観測値は1日1件（その日の最後の値）に間引く
+DEFAULT_DOWNSAMPLE_AFTER_DAYS = 30
+
+
+@dataclass(frozen=True)
+class StatisticsObservation:
+    """
+    統計情報の観測値
+
+    Attributes:
+        video_id: YouTube動画ID
+        observed_at: 観測日時（この値になったことを最初に確認した日時）
+        view_count: 再生回数
+        like_count: 高評価数
+        comment_count: コメント数
+    """
+    video_id: str
+    observed_at: datetime
+    view_count: int
+    like_count: int
+    comment_count: int
+
+
+class StatisticsStore:
+    """
+    動画統計情報の時系列ストア
+
+    観測値は追記のみで、直前の観測値から変化のない値は記録しない。
+    (video_id, observed_at)を主キーとするクラスタ化テーブルのため、
+    動画ごとの期間指定の参照は連続した範囲の読み取りになる
+    """
+
+    def __init__(self, db_path: Optional[str] = None, downsample_after_days: Optional[int] = None):
+        """
+        初期化
+
+        Args:
+            db_path: データベースファイルパス
+                    指定しない場合は環境変数DATABASE_PATHまたはデフォルトパスを使用
+            downsample_after_days: 観測値を1日1件に間引くまでの日数
+                    指定しない場合は環境変数STATISTICS_DOWNSAMPLE_AFTER_DAYSまたは30日
+        """
+        self.db_path = db_path or os.getenv("DATABASE_PATH", "youtube_analyzer.db")
+
+        if downsample_after_days is None:
+            downsample_after_days = int(
+                os.getenv("STATISTICS_DOWNSAMPLE_AFTER_DAYS", str(DEFAULT_DOWNSAMPLE_AFTER_DAYS))
+            )
+        self.downsample_after = timedelta(days=downsample_after_days)
+
+        # 接続管理を取得（スキーマの初期化はプロセス内で1回だけ行われる）
+        self._db = get_connection_manager(self.db_path)
+        self._last_downsampled_on: Optional[date] = None
+
+        logger.info(f"StatisticsStoreを初期化しました: {downsample_after_days}日より古い観測値を間引く")
+
+    def close(self) -> None:
+        """
+        データベース接続を閉じる（データベースファイルを削除する前に呼び出す）
+
+        接続は同じデータベースを使う他のサービスと共有しているため、それらの接続も閉じられる
+        """
+        close_connection_manager(self.db_path)
+
+    def record(self, videos: Iterable[VideoInfo], observed_at: Optional[datetime] = None) -> int:
+        """
+        動画の統計情報を記録
+
+        直前の観測値と同じ値の動画は記録しない。
+        1日に1回、古い観測値の間引きも行う
+
+        Args:
+            videos: 動画情報リスト
+            observed_at: 観測日時（未指定の場合は現在時刻）
+
+        Returns:
+            int: 記録した件数
+        """
+        observed_at_str = (observed_at or datetime.now()).isoformat()
+        rows = [
+            (video.video_id, observed_at_str, video.view_count, video.like_count, video.comment_count)
+            for video in videos
+        ]
+        if not rows:
+            return 0
+
+        try:
+            with self._db.connection() as conn:
+                cursor = conn.cursor()
+
+                cursor.executemany("""
+                    INSERT OR IGNORE INTO video_statistics (
+                        video_id, observed_at, view_count, like_count, comment_count
+                    )
+                    SELECT ?1, ?2, ?3, ?4, ?5
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM (
+                            SELECT view_count, like_count, comment_count
+                            FROM video_statistics
+                            WHERE video_id = ?1 AND observed_at <= ?2
+                            ORDER BY observed_at DESC
+                            LIMIT 1
+                        ) AS latest
+                        WHERE latest.view_count = ?3
+                          AND latest.like_count = ?4
+                          AND latest.comment_count = ?5
+                    )
+                """, rows)
+                recorded_count = cursor.rowcount
+
+            logger.debug(f"統計情報を記録しました: {recorded_count}件（変化なし{len(rows) - recorded_count}件）")
+
+        except Exception as e:
+            logger.error(f"統計情報記録エラー: {e}", exc_info=True)
+            raise
+
+        if self._last_downsampled_on != date.today():
+            self._last_downsampled_on = date.today()
+            self.downsample()
+
+        return recorded_count
+
+    def get_history(
+        self,
+        video_id: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> List[StatisticsObservation]:
+        """
+        動画の観測値を期間指定で取得
+
+        Args:
+            video_id: YouTube動画ID
+            start: 期間の開始（この日時を含む、未指定の場合は最初から）
+            end: 期間の終了（この日時を含まない、未指定の場合は最後まで）
+
+        Returns:
+            List[StatisticsObservation]: 観測値のリスト（古い順）
+        """
+        try:
+            with self._db.connection() as conn:
+                rows = conn.execute("""
+                    SELECT video_id, observed_at, view_count, like_count, comment_count
+                    FROM video_statistics
+                    WHERE video_id = ? AND observed_at >= ? AND observed_at < ?
+                    ORDER BY observed_at
+                """, (
+                    video_id,
+                    start.isoformat() if start else "",
+                    end.isoformat() if end else "9999",
+                )).fetchall()
+
+            return [self._row_to_observation(row) for row in rows]
+
+        except Exception as e:
+            logger.error(f"統計情報取得エラー: {e}", exc_info=True)
+            raise
+
+    def get_as_of(self, video_ids: Iterable[str], at: datetime) -> Dict[str, StatisticsObservation]:
+        """
+        指定日時の時点での各動画の統計情報を取得（伸びの計算の基準値）
+
+        Args:
+            video_ids: 動画IDリスト
+            at: 基準日時
+
+        Returns:
+            Dict[str, StatisticsObservation]: 動画ID → 基準日時以前で最新の観測値
+                    （基準日時以前の観測値がない動画は含まない）
+        """
+        at_str = at.isoformat()
+        observations = {}
+
+        try:
+            with self._db.connection() as conn:
+                cursor = conn.cursor()
+                for video_id in video_ids:
+                    # 主キーの範囲を逆順にたどるため、1件あたりの参照は一定時間
+                    row = cursor.execute("""
+                        SELECT video_id, observed_at, view_count, like_count, comment_count
+                        FROM video_statistics
+                        WHERE video_id = ? AND observed_at <= ?
+                        ORDER BY observed_at DESC
+                        LIMIT 1
+                    """, (video_id, at_str)).fetchone()
+                    if row:
+                        observations[video_id] = self._row_to_observation(row)
+
+            return observations
+
+        except Exception as e:
+            logger.error(f"統計情報取得エラー: {e}", exc_info=True)
+            raise
+
+    def downsample(self, now: Optional[datetime] = None) -> int:
+        """
+        古い観測値を1日1件（その日の最後の観測値）に間引く
+
+        Args:
+            now: 基準日時（未指定の場合は現在時刻）
+
+        Returns:
+            int: 削除した件数
+        """
+        cutoff = ((now or datetime.now()) - self.downsample_after).isoformat()
+
+        try:
+            with self._db.connection() as conn:
+                cursor = conn.execute("""
+                    DELETE FROM video_statistics AS observation
+                    WHERE observed_at < ?
+                      AND EXISTS (
+                          SELECT 1 FROM video_statistics AS later
+                          WHERE later.video_id = observation.video_id
+                            AND later.observed_at > observation.observed_at
+                            AND later.observed_at < date(observation.observed_at, '+1 day')
+                      )
+                """, (cutoff,))
+                deleted_count = cursor.rowcount
+
+            if deleted_count > 0:
+                logger.info(f"古い統計情報を間引きました: {deleted_count}件")
+            return deleted_count
+
+        except Exception as e:
+            logger.error(f"統計情報間引きエラー: {e}", exc_info=True)
+            raise
+
+    def _row_to_observation(self, row: tuple) -> StatisticsObservation:
+        """
+        データベース行をStatisticsObservationオブジェクトに変換
+
+        Args:
+            row: データベース行
+
+        Returns:
+            StatisticsObservation: 観測値
+        """
+        video_id, observed_at, view_count, like_count, comment_count = row
+        return StatisticsObservation(
+            video_id=video_id,
+            observed_at=datetime.fromisoformat(observed_at),
+            view_count=view_count,
+            like_count=like_count,
+            comment_count=comment_count
+        )
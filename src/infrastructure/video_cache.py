@@ -0,0 +1,313 @@
+"""
+動画メタデータキャッシュ
+
+videos.list APIで取得した動画情報をSQLiteに保存し、再取得を減らす
+"""
+import sqlite3
+import os
+import json
+from dataclasses import dataclass, field
+from typing import List, Optional, Dict, Iterable
+from datetime import datetime, timedelta
+
+from src.domain.models import VideoInfo
+from src.database.connection import get_connection_manager, close_connection_manager
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# snippet/contentDetailsの有効期間（秒）: タイトルや長さはほとんど変わらない
+DEFAULT_DETAILS_TTL = 7 * 24 * 60 * 60
+
+# statisticsの有効期間（秒）: 再生回数などはすぐに古くなる
+DEFAULT_STATISTICS_TTL = 60 * 60
+
+# SQLiteのプレースホルダ数上限を超えないよう、IN句を分割するサイズ
+_QUERY_CHUNK_SIZE = 500
+
+
+@dataclass
+class VideoCacheLookup:
+    """
+    キャッシュ参照結果
+
+    Attributes:
+        fresh: すべてのパートが有効期間内の動画（動画ID → 動画情報）
+        stale_statistics: statisticsのみ期限切れの動画（動画ID → 動画情報）
+        missing: キャッシュにない、またはsnippet/contentDetailsが期限切れの動画ID
+    """
+    fresh: Dict[str, VideoInfo] = field(default_factory=dict)
+    stale_statistics: Dict[str, VideoInfo] = field(default_factory=dict)
+    missing: List[str] = field(default_factory=list)
+
+
+class VideoCache:
+    """
+    動画メタデータキャッシュ
+
+    動画IDをキーに、パースしたVideoInfoをデータベースに保存する
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        details_ttl: Optional[int] = None,
+        statistics_ttl: Optional[int] = None
+    ):
+        """
+        初期化
+
+        Args:
+            db_path: データベースファイルパス
+                    指定しない場合は環境変数DATABASE_PATHまたはデフォルトパスを使用
+            details_ttl: snippet/contentDetailsの有効期間（秒）
+                        指定しない場合は環境変数VIDEO_CACHE_DETAILS_TTLまたは7日
+            statistics_ttl: statisticsの有効期間（秒）
+                        指定しない場合は環境変数VIDEO_CACHE_STATISTICS_TTLまたは1時間
+        """
+        self.db_path = db_path or os.getenv("DATABASE_PATH", "youtube_analyzer.db")
+
+        if details_ttl is None:
+            details_ttl = int(os.getenv("VIDEO_CACHE_DETAILS_TTL", str(DEFAULT_DETAILS_TTL)))
+        if statistics_ttl is None:
+            statistics_ttl = int(os.getenv("VIDEO_CACHE_STATISTICS_TTL", str(DEFAULT_STATISTICS_TTL)))
+
+        self.details_ttl = timedelta(seconds=details_ttl)
+        self.statistics_ttl = timedelta(seconds=statistics_ttl)
+
+        # 接続管理を取得（スキーマの初期化はプロセス内で1回だけ行われる）
+        self._db = get_connection_manager(self.db_path)
+
+        logger.info(
+            f"VideoCacheを初期化しました: details_ttl={details_ttl}秒, statistics_ttl={statistics_ttl}秒"
+        )
+
+    def close(self) -> None:
+        """
+        データベース接続を閉じる（データベースファイルを削除する前に呼び出す）
+
+        接続は同じデータベースを使う他のサービスと共有しているため、それらの接続も閉じられる
+        """
+        close_connection_manager(self.db_path)
+
+    def lookup(self, video_ids: List[str]) -> VideoCacheLookup:
+        """
+        動画IDのキャッシュ状態を参照
+
+        Args:
+            video_ids: 動画IDリスト
+
+        Returns:
+            VideoCacheLookup: パートごとの鮮度で分類した参照結果
+        """
+        now = datetime.now()
+        details_limit = now - self.details_ttl
+        statistics_limit = now - self.statistics_ttl
+
+        rows = self._select_rows(video_ids)
+        result = VideoCacheLookup()
+
+        for video_id in video_ids:
+            row = rows.get(video_id)
+            if row is None or datetime.fromisoformat(row["details_fetched_at"]) < details_limit:
+                result.missing.append(video_id)
+            elif datetime.fromisoformat(row["statistics_fetched_at"]) < statistics_limit:
+                result.stale_statistics[video_id] = self._row_to_video(row)
+            else:
+                result.fresh[video_id] = self._row_to_video(row)
+
+        logger.debug(
+            f"動画キャッシュ参照: 有効={len(result.fresh)}件, "
+            f"統計期限切れ={len(result.stale_statistics)}件, 未取得={len(result.missing)}件"
+        )
+        return result
+
+    def get_many(self, video_ids: List[str]) -> Dict[str, VideoInfo]:
+        """
+        有効期間に関係なく、キャッシュされている動画情報を取得
+
+        Args:
+            video_ids: 動画IDリスト
+
+        Returns:
+            Dict[str, VideoInfo]: 動画ID → 動画情報（キャッシュにない動画は含まない）
+        """
+        rows = self._select_rows(video_ids)
+        return {video_id: self._row_to_video(row) for video_id, row in rows.items()}
+
+    def put_many(self, videos: Iterable[VideoInfo]) -> None:
+        """
+        snippet/statistics/contentDetailsをすべて取得した動画情報を保存
+
+        Args:
+            videos: 動画情報リスト
+        """
+        now = datetime.now().isoformat()
+        rows = [
+            (
+                video.video_id,
+                video.title,
+                video.channel_name,
+                video.channel_id,
+                video.published_at.isoformat(),
+                video.duration_seconds,
+                video.description,
+                json.dumps(video.tags, ensure_ascii=False),
+                video.thumbnail_url,
+                video.view_count,
+                video.like_count,
+                video.comment_count,
+                now,
+                now
+            )
+            for video in videos
+        ]
+        if not rows:
+            return
+
+        try:
+            with self._db.connection() as conn:
+                cursor = conn.cursor()
+
+                cursor.executemany("""
+                    INSERT OR REPLACE INTO video_cache (
+                        video_id, title, channel_name, channel_id, published_at,
+                        duration_seconds, description, tags, thumbnail_url,
+                        view_count, like_count, comment_count,
+                        details_fetched_at, statistics_fetched_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, rows)
+
+            logger.debug(f"動画キャッシュを保存しました: {len(rows)}件")
+
+        except Exception as e:
+            logger.error(f"動画キャッシュ保存エラー: {e}", exc_info=True)
+            raise
+
+    def update_statistics(self, videos: Iterable[VideoInfo]) -> None:
+        """
+        statisticsのみ再取得した動画の統計情報を更新
+
+        Args:
+            videos: 動画情報リスト
+        """
+        now = datetime.now().isoformat()
+        rows = [
+            (video.view_count, video.like_count, video.comment_count, now, video.video_id)
+            for video in videos
+        ]
+        if not rows:
+            return
+
+        try:
+            with self._db.connection() as conn:
+                cursor = conn.cursor()
+
+                cursor.executemany("""
+                    UPDATE video_cache
+                    SET view_count = ?,
+                        like_count = ?,
+                        comment_count = ?,
+                        statistics_fetched_at = ?
+                    WHERE video_id = ?
+                """, rows)
+
+            logger.debug(f"動画キャッシュの統計情報を更新しました: {len(rows)}件")
+
+        except Exception as e:
+            logger.error(f"動画キャッシュ更新エラー: {e}", exc_info=True)
+            raise
+
+    def clear(self) -> int:
+        """
+        キャッシュをすべて削除
+
+        Returns:
+            int: 削除した件数
+        """
+        logger.warning("動画キャッシュをすべて削除します")
+
+        try:
+            with self._db.connection() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute("DELETE FROM video_cache")
+                deleted_count = cursor.rowcount
+
+            logger.info(f"{deleted_count}件の動画キャッシュを削除しました")
+            return deleted_count
+
+        except Exception as e:
+            logger.error(f"動画キャッシュ削除エラー: {e}", exc_info=True)
+            raise
+
+    def _select_rows(self, video_ids: List[str]) -> Dict[str, sqlite3.Row]:
+        """
+        動画IDに対応するキャッシュ行を取得
+
+        Args:
+            video_ids: 動画IDリスト
+
+        Returns:
+            Dict[str, sqlite3.Row]: 動画ID → データベース行
+        """
+        rows = {}
+        if not video_ids:
+            return rows
+
+        try:
+            with self._db.connection() as conn:
+                # 接続は共有のため、行の形式はカーソル単位で指定する
+                cursor = conn.cursor()
+                cursor.row_factory = sqlite3.Row
+
+                for i in range(0, len(video_ids), _QUERY_CHUNK_SIZE):
+                    chunk = video_ids[i:i + _QUERY_CHUNK_SIZE]
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor.execute(f"""
+                        SELECT video_id, title, channel_name, channel_id, published_at,
+                               duration_seconds, description, tags, thumbnail_url,
+                               view_count, like_count, comment_count,
+                               details_fetched_at, statistics_fetched_at
+                        FROM video_cache
+                        WHERE video_id IN ({placeholders})
+                    """, chunk)
+
+                    for row in cursor.fetchall():
+                        rows[row["video_id"]] = row
+
+            return rows
+
+        except Exception as e:
+            logger.error(f"動画キャッシュ取得エラー: {e}", exc_info=True)
+            raise
+
+    def _row_to_video(self, row: sqlite3.Row) -> VideoInfo:
+        """
+        データベース行をVideoInfoオブジェクトに変換
+
+        Args:
+            row: データベース行
+
+        Returns:
+            VideoInfo: 動画情報
+        """
+        video_id = row["video_id"]
+        duration_seconds = row["duration_seconds"]
+
+        return VideoInfo(
+            video_id=video_id,
+            title=row["title"],
+            url=f"https://www.youtube.com/watch?v={video_id}",
+            channel_name=row["channel_name"],
+            channel_id=row["channel_id"],
+            view_count=row["view_count"],
+            like_count=row["like_count"],
+            comment_count=row["comment_count"],
+            published_at=datetime.fromisoformat(row["published_at"]),
+            duration_seconds=duration_seconds,
+            is_short=duration_seconds <= 60,
+            description=row["description"] or "",
+            tags=json.loads(row["tags"]) if row["tags"] else [],
+            thumbnail_url=row["thumbnail_url"] or ""
+        )
@@ -0,0 +1,119 @@
+"""
+APIレスポンスのフィールド指定
+
+VideoInfoの生成に必要なフィールドだけをfieldsパラメータで要求し、
+videos.list / search.listのレスポンスサイズを削減する
+"""
+import os
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+
+# VideoInfoの属性 → videos.listのフィールドパス
+VIDEO_FIELD_PATHS: Dict[str, Tuple[str, ...]] = {
+    "video_id": ("id",),
+    "title": ("snippet/title",),
+    "channel_name": ("snippet/channelTitle",),
+    "channel_id": ("snippet/channelId",),
+    "published_at": ("snippet/publishedAt",),
+    "view_count": ("statistics/viewCount",),
+    "like_count": ("statistics/likeCount",),
+    "comment_count": ("statistics/commentCount",),
+    "duration_seconds": ("contentDetails/duration",),
+    "is_short": ("contentDetails/duration",),
+    "description": ("snippet/description",),
+    "tags": ("snippet/tags",),
+    "thumbnail_url": ("snippet/thumbnails/high/url",),
+}
+
+# 省略できる属性（省略した場合は空の値になる）
+OPTIONAL_VIDEO_FIELDS = frozenset({"description", "tags", "thumbnail_url"})
+
+# 出力先ごとのフィールドプロファイル（省略する属性）
+FIELD_PROFILES: Dict[str, FrozenSet[str]] = {
+    "full": frozenset(),
+    "compact": frozenset({"description", "tags", "thumbnail_url"}),
+    "no_description": frozenset({"description"}),
+}
+
+# search.listで使用するフィールド（動画IDと次ページトークンのみ）
+SEARCH_LIST_FIELDS = "nextPageToken,items/id/videoId"
+
+# statisticsのみ取得する場合のフィールド
+STATISTICS_FIELDS = "items(id,statistics(viewCount,likeCount,commentCount))"
+
+
+def resolve_field_profile(profile: Optional[str] = None) -> FrozenSet[str]:
+    """
+    フィールドプロファイルの省略する属性を取得
+
+    Args:
+        profile: プロファイル名（full、compact、no_description）
+                指定しない場合は環境変数YOUTUBE_FIELD_PROFILE（デフォルト: full）
+
+    Returns:
+        FrozenSet[str]: 省略する属性
+
+    Raises:
+        ValueError: 不明なプロファイルが指定された場合
+    """
+    if profile is None:
+        profile = os.getenv("YOUTUBE_FIELD_PROFILE", "full")
+    if profile not in FIELD_PROFILES:
+        raise ValueError(f"不明なフィールドプロファイルです: {profile}")
+    return FIELD_PROFILES[profile]
+
+
+def resolve_omit_fields(omit_fields: Optional[Iterable[str]] = None) -> FrozenSet[str]:
+    """
+    省略する属性を決定
+
+    Args:
+        omit_fields: 省略する属性
+                指定しない場合は環境変数YOUTUBE_FIELD_PROFILEのプロファイル（デフォルト: full）
+
+    Returns:
+        FrozenSet[str]: 省略する属性
+
+    Raises:
+        ValueError: 不明なプロファイル、または省略できない属性が指定された場合
+    """
+    if omit_fields is None:
+        return resolve_field_profile()
+
+    omit_fields = frozenset(omit_fields)
+    invalid = omit_fields - OPTIONAL_VIDEO_FIELDS
+    if invalid:
+        raise ValueError(f"省略できない属性が指定されています: {', '.join(sorted(invalid))}")
+    return omit_fields
+
+
+def build_video_fields(omit_fields: Iterable[str] = ()) -> str:
+    """
+    videos.listのfieldsパラメータを生成
+
+    Args:
+        omit_fields: 省略する属性
+
+    Returns:
+        str: fieldsパラメータ（例: items(id,snippet(title,...),statistics(...),contentDetails(duration))）
+    """
+    omit_fields = set(omit_fields)
+
+    # 部分ごとにフィールドをまとめる（重複を除き、定義順を保つ）
+    parts: Dict[str, Dict[str, None]] = {}
+    for attribute, paths in VIDEO_FIELD_PATHS.items():
+        if attribute in omit_fields:
+            continue
+        for path in paths:
+            part, _, sub_path = path.partition("/")
+            parts.setdefault(part, {})
+            if sub_path:
+                parts[part][sub_path] = None
+
+    selectors = []
+    for part, sub_paths in parts.items():
+        if sub_paths:
+            selectors.append(f"{part}({','.join(sub_paths)})")
+        else:
+            selectors.append(part)
+
+    return f"items({','.join(selectors)})"
@@ -4,82 +4,473 @@ YouTube APIクライアント
 YouTube Data API v3とのやり取りを担当
 """
 import os
-from typing import List, Optional, Dict, Any
+import json
+import threading
+import time
+from dataclasses import replace
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import List, Optional, Dict, Any, Iterator, Callable, Iterable, FrozenSet
 from datetime import datetime
 import isodate
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
 from src.utils.logger import get_logger
+from src.utils.cancellation import CancellationToken, OperationCancelledError
 from src.domain.models import VideoInfo, SearchCriteria, VideoType
+from src.infrastructure.video_cache import VideoCache
+from src.infrastructure.search_cache import SearchResultCache
+from src.infrastructure.quota_tracker import QuotaTracker, SEARCH_LIST_COST, VIDEOS_LIST_COST
+from src.infrastructure.api_key_pool import ApiKeyPool, load_api_keys_from_env
+from src.infrastructure.retry_policy import RetryPolicy
+from src.infrastructure.http_pool import get_shared_http
+from src.infrastructure.video_fields import (
+    resolve_omit_fields, build_video_fields, SEARCH_LIST_FIELDS, STATISTICS_FIELDS
+)
 
 logger = get_logger(__name__)
 
+# キーの1日のクォータ超過を示すエラー理由
+QUOTA_EXCEEDED_REASONS = {"quotaExceeded", "dailyLimitExceeded"}
+
+# キーの短時間のレート制限を示すエラー理由
+RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+
 
 class YouTubeAPIError(Exception):
     """YouTube API関連のエラー"""
     pass
 
 
+class QuotaExceededError(YouTubeAPIError):
+    """APIクォータ不足のエラー"""
+    pass
+
+
+# APIキーごとのサービスオブジェクト（プロセス全体で共有）
+_services: Dict[str, Any] = {}
+_services_lock = threading.Lock()
+
+
+def get_youtube_service(api_key: str):
+    """
+    APIキーに対応するサービスオブジェクトを取得（初回呼び出し時に生成）
+
+    ディスカバリードキュメントはライブラリ同梱の静的ファイルを使用し、
+    生成したサービスオブジェクトはプロセス全体で再利用する
+
+    Args:
+        api_key: APIキー
+
+    Returns:
+        googleapiclientのサービスオブジェクト
+
+    Raises:
+        YouTubeAPIError: サービスオブジェクトの生成に失敗した場合
+    """
+    with _services_lock:
+        service = _services.get(api_key)
+        if service is None:
+            try:
+                service = build(
+                    "youtube", "v3",
+                    developerKey=api_key,
+                    static_discovery=True,
+                    cache_discovery=False
+                )
+            except Exception as e:
+                logger.error(f"YouTube APIクライアントの初期化に失敗: {e}", exc_info=True)
+                raise YouTubeAPIError(f"YouTube APIクライアントの初期化に失敗: {e}")
+            _services[api_key] = service
+            logger.info("YouTube APIサービスオブジェクトを生成しました")
+        return service
+
+
+def clear_service_cache() -> None:
+    """共有しているサービスオブジェクトを破棄する"""
+    with _services_lock:
+        _services.clear()
+
+
+# videos.list APIの1リクエストで指定できる動画IDの最大数
+VIDEOS_LIST_BATCH_SIZE = 50
+
+# search.listの最大ページ数（無限ループ防止）
+MAX_SEARCH_PAGES = 10
+
+
+def build_search_params(criteria: SearchCriteria, page_token: Optional[str] = None) -> Dict[str, Any]:
+    """
+    search.list APIのリクエストパラメータを生成
+
+    Args:
+        criteria: 検索条件
+        page_token: 次ページトークン
+
+    Returns:
+        Dict[str, Any]: リクエストパラメータ（APIキーは含まない）
+    """
+    params = {
+        "part": "id",
+        "q": criteria.keyword,
+        "type": "video",
+        # 1リクエストあたり最大50件まで取得可能
+        "maxResults": min(criteria.max_results, 50),
+        "order": criteria.order,
+        "regionCode": criteria.region_code,
+        "relevanceLanguage": criteria.language,
+        "fields": SEARCH_LIST_FIELDS,
+    }
+
+    # 公開日範囲
+    if criteria.published_after:
+        params["publishedAfter"] = criteria.published_after.isoformat() + "Z"
+    if criteria.published_before:
+        params["publishedBefore"] = criteria.published_before.isoformat() + "Z"
+
+    # ページネーション
+    if page_token:
+        params["pageToken"] = page_token
+
+    return params
+
+
+def extract_video_ids(response: Dict[str, Any]) -> List[str]:
+    """
+    search.list APIのレスポンスから動画IDを取り出す
+
+    Args:
+        response: search.list APIのレスポンス
+
+    Returns:
+        List[str]: 動画IDリスト（レスポンス順）
+    """
+    video_ids = []
+    for item in response.get("items", []):
+        video_id = item["id"].get("videoId")
+        if video_id:
+            video_ids.append(video_id)
+    return video_ids
+
+
+def split_batches(video_ids: List[str]) -> List[List[str]]:
+    """
+    動画IDをvideos.list APIの1リクエスト分（最大50件）ずつに分割
+
+    Args:
+        video_ids: 動画IDリスト
+
+    Returns:
+        List[List[str]]: バッチごとの動画IDリスト
+    """
+    return [
+        video_ids[i:i + VIDEOS_LIST_BATCH_SIZE]
+        for i in range(0, len(video_ids), VIDEOS_LIST_BATCH_SIZE)
+    ]
+
+
+def parse_video_item(item: Dict[str, Any]) -> Optional[VideoInfo]:
+    """
+    videos.list APIのレスポンスアイテムからVideoInfoオブジェクトを生成
+
+    Args:
+        item: videos.list APIのレスポンスアイテム
+
+    Returns:
+        Optional[VideoInfo]: 動画情報（パースエラー時はNone）
+    """
+    try:
+        video_id = item["id"]
+        snippet = item["snippet"]
+        statistics = item["statistics"]
+        content_details = item["contentDetails"]
+
+        # 動画の長さをパース（ISO 8601形式 → 秒数）
+        duration_str = content_details["duration"]
+        duration_seconds = int(isodate.parse_duration(duration_str).total_seconds())
+
+        # ショート動画判定（60秒以下）
+        is_short = duration_seconds <= 60
+
+        # 公開日時をパース
+        published_at_str = snippet["publishedAt"]
+        published_at = datetime.fromisoformat(published_at_str.replace("Z", "+00:00"))
+
+        return VideoInfo(
+            video_id=video_id,
+            title=snippet["title"],
+            url=f"https://www.youtube.com/watch?v={video_id}",
+            channel_name=snippet["channelTitle"],
+            channel_id=snippet["channelId"],
+            view_count=int(statistics.get("viewCount", 0)),
+            like_count=int(statistics.get("likeCount", 0)),
+            comment_count=int(statistics.get("commentCount", 0)),
+            published_at=published_at,
+            duration_seconds=duration_seconds,
+            is_short=is_short,
+            description=snippet.get("description", ""),
+            tags=snippet.get("tags", []),
+            thumbnail_url=snippet.get("thumbnails", {}).get("high", {}).get("url", "")
+        )
+
+    except Exception as e:
+        logger.warning(f"動画情報のパースに失敗: {e}")
+        return None
+
+
+def parse_video_items(response: Dict[str, Any]) -> List[VideoInfo]:
+    """
+    videos.list APIのレスポンスから動画情報リストを生成（パースできないアイテムは除外）
+
+    Args:
+        response: videos.list APIのレスポンス
+
+    Returns:
+        List[VideoInfo]: 動画情報リスト（レスポンス順）
+    """
+    videos = []
+    for item in response.get("items", []):
+        video_info = parse_video_item(item)
+        if video_info:
+            videos.append(video_info)
+    return videos
+
+
+def filter_videos(videos: List[VideoInfo], criteria: SearchCriteria) -> List[VideoInfo]:
+    """
+    動画リストを検索条件（再生回数、動画タイプ）でフィルタリング
+
+    Args:
+        videos: 動画情報リスト
+        criteria: 検索条件
+
+    Returns:
+        List[VideoInfo]: フィルタリング後の動画情報リスト
+    """
+    filtered = []
+
+    for video in videos:
+        # 再生回数フィルタ
+        if criteria.min_view_count is not None and video.view_count < criteria.min_view_count:
+            continue
+        if criteria.max_view_count is not None and video.view_count > criteria.max_view_count:
+            continue
+
+        # 動画タイプフィルタ
+        if criteria.video_type == VideoType.SHORT and not video.is_short:
+            continue
+        if criteria.video_type == VideoType.NORMAL and video.is_short:
+            continue
+
+        filtered.append(video)
+
+    return filtered
+
+
+def parse_error_reasons(content: Any) -> set:
+    """
+    APIエラーのレスポンス本文からエラー理由（reason）を取り出す
+
+    Args:
+        content: エラーレスポンスのJSON（dict）
+
+    Returns:
+        set: エラー理由の集合
+    """
+    if not isinstance(content, dict):
+        return set()
+    error = content.get("error", {})
+    errors = error.get("errors", []) if isinstance(error, dict) else []
+    return {item.get("reason") for item in errors if isinstance(item, dict)}
+
+
+def deadline_passed(deadline_at: Optional[float]) -> bool:
+    """
+    検索の期限を過ぎたかどうか
+
+    Args:
+        deadline_at: 検索の期限（time.monotonic()基準、Noneの場合は無制限）
+
+    Returns:
+        bool: 期限を過ぎている場合True
+    """
+    return deadline_at is not None and time.monotonic() >= deadline_at
+
+
+def plan_max_pages(
+    criteria: SearchCriteria,
+    remaining_quota: Optional[int],
+    max_units: Optional[int] = None
+) -> Optional[int]:
+    """
+    クォータ予算内で取得できるsearch.listのページ数を計算
+
+    1ページあたりsearch.list（100ユニット）とvideos.list（1ユニット）を見込む
+
+    Args:
+        criteria: 検索条件
+        remaining_quota: クォータ残量（記録していない場合はNone）
+        max_units: この検索で使用するクォータの上限
+
+    Returns:
+        Optional[int]: 取得可能なページ数（予算の制約がない場合はNone）
+    """
+    budget = remaining_quota
+    if max_units is not None:
+        budget = max_units if budget is None else min(budget, max_units)
+    if budget is None:
+        return None
+
+    per_page = min(criteria.max_results, 50)
+    pages_needed = -(-criteria.max_results // per_page)
+    max_pages = budget // (SEARCH_LIST_COST + VIDEOS_LIST_COST)
+
+    if max_pages < pages_needed:
+        logger.warning(
+            f"クォータ予算（{budget}ユニット）に合わせて取得ページ数を制限: "
+            f"{pages_needed}ページ → {max_pages}ページ"
+        )
+    return max_pages
+
+
 class YouTubeClient:
     """
     YouTube Data API v3クライアント
 
     Attributes:
-        api_key: YouTube Data API v3のAPIキー
+        api_key: YouTube Data API v3のAPIキー（キープールの先頭キー）
+        key_pool: APIキープール
+        max_workers: videos.list APIの同時実行数
+        retry_policy: 一時的なエラーに対するリトライポリシー
+        video_cache: 動画メタデータキャッシュ（Noneの場合はキャッシュしない）
+        search_cache: 検索結果キャッシュ（Noneの場合はキャッシュしない）
+        quota_tracker: APIクォータ使用量の記録（Noneの場合は記録しない）
+        omit_fields: videos.listで取得しない属性（description、tags、thumbnail_url）
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        video_cache: Optional[VideoCache] = None,
+        search_cache: Optional[SearchResultCache] = None,
+        quota_tracker: Optional[QuotaTracker] = None,
+        api_keys: Optional[List[str]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        omit_fields: Optional[Iterable[str]] = None
+    ):
         """
         初期化
 
         Args:
             api_key: APIキー（未指定の場合は環境変数から取得）
+            max_workers: videos.list APIの同時実行数
+                        （未指定の場合は環境変数YOUTUBE_MAX_CONCURRENCY、デフォルト4）
+                        1を指定すると逐次実行になる
+            video_cache: 動画メタデータキャッシュ（未指定の場合はキャッシュしない）
+            search_cache: 検索結果キャッシュ（未指定の場合はキャッシュしない）
+            quota_tracker: APIクォータ使用量の記録（未指定の場合は記録しない）
+            api_keys: キープールに登録する追加のAPIキー
+                     （api_keyとapi_keysがどちらも未指定の場合は、
+                     環境変数YOUTUBE_API_KEYとYOUTUBE_API_KEYSから取得）
+            retry_policy: リトライポリシー（未指定の場合はデフォルト設定、
+                     検索の期限は環境変数YOUTUBE_SEARCH_DEADLINE、デフォルト120秒）
+            omit_fields: videos.listで取得しない属性（出力先で使わない列など）
+                     （未指定の場合は環境変数YOUTUBE_FIELD_PROFILEのプロファイル、デフォルトfull）
 
         Raises:
             YouTubeAPIError: APIキーが取得できない場合
+            ValueError: 省略できない属性が指定された場合
         """
-        self.api_key = api_key or os.getenv("YOUTUBE_API_KEY")
-        if not self.api_key:
+        if api_key or api_keys:
+            keys = [key for key in [api_key] + list(api_keys or []) if key]
+            keys = list(dict.fromkeys(keys))
+        else:
+            keys = load_api_keys_from_env()
+        if not keys:
             raise YouTubeAPIError("YOUTUBE_API_KEYが設定されていません")
 
-        try:
-            self.youtube = build("youtube", "v3", developerKey=self.api_key)
-            logger.info("YouTube APIクライアントを初期化しました")
-        except Exception as e:
-            logger.error(f"YouTube APIクライアントの初期化に失敗: {e}", exc_info=True)
-            raise YouTubeAPIError(f"YouTube APIクライアントの初期化に失敗: {e}")
-
-    def search_videos(self, criteria: SearchCriteria) -> List[VideoInfo]:
+        self.api_key = keys[0]
+        self.key_pool = ApiKeyPool(keys)
+
+        self.max_workers = max(1, max_workers or int(os.getenv("YOUTUBE_MAX_CONCURRENCY", "4")))
+        self.video_cache = video_cache
+        self.search_cache = search_cache
+        self.quota_tracker = quota_tracker
+        self.retry_policy = retry_policy or RetryPolicy(
+            deadline=float(os.getenv("YOUTUBE_SEARCH_DEADLINE", "120"))
+        )
+        self.omit_fields = resolve_omit_fields(omit_fields)
+        self._video_fields = build_video_fields(self.omit_fields)
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+        # サービスオブジェクトは最初のAPI呼び出し時に生成する
+        logger.info(f"YouTube APIクライアントを初期化しました: APIキー{len(keys)}個")
+
+    @property
+    def youtube(self):
+        """先頭のAPIキーのサービスオブジェクト（初回参照時に生成）"""
+        return get_youtube_service(self.api_key)
+
+    def search_videos(
+        self,
+        criteria: SearchCriteria,
+        max_units: Optional[int] = None,
+        on_batch: Optional[Callable[[List[VideoInfo]], None]] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        omit_fields: Optional[Iterable[str]] = None
+    ) -> List[VideoInfo]:
         """
         検索条件に基づいて動画を検索
 
+        クォータ残量（またはmax_units）で取得できるページ数に合わせて
+        ページネーションの深さを抑え、途中で失敗しないようにする。
+        一時的なエラーは再試行し、それでも失敗したページがあれば
+        取得済みのページ分だけで結果を返す。
+
         Args:
             criteria: 検索条件
+            max_units: この検索で使用するクォータの上限（未指定の場合は残量まで）
+            on_batch: videos.listの1バッチ分の詳細を取得するたびに、フィルタリング後の
+                    動画情報リストを検索順で受け取るコールバック（検索スレッドまたは
+                    詳細取得のワーカースレッドから呼び出される。すべてのバッチを渡してから戻る）
+            cancel_token: キャンセルトークン（search.listのページ・videos.listのバッチの
+                    取得前に確認し、キャンセルされていれば検索を打ち切る）
+            omit_fields: この検索のvideos.listで取得しない属性（出力先で使わない列など）
+                    （未指定の場合はクライアントのomit_fields）
 
         Returns:
             List[VideoInfo]: 動画情報リスト
 
         Raises:
+            QuotaExceededError: 1ページも取得できないほどクォータが不足している場合
+            OperationCancelledError: 検索がキャンセルされた場合
             YouTubeAPIError: API呼び出しエラー
         """
         criteria.validate()
+        omit_fields = self.omit_fields if omit_fields is None else resolve_omit_fields(omit_fields)
 
         logger.info(f"動画検索開始: キーワード='{criteria.keyword}', 最大取得数={criteria.max_results}")
 
         try:
-            # Step 1: search.list APIで動画IDを取得
-            video_ids = self._search_video_ids(criteria)
+            # Step 1-2: search.listのページ取得とvideos.listの詳細取得をパイプライン実行
+            max_pages = self._plan_max_pages(criteria, max_units)
+            deadline_at = None
+            if self.retry_policy.deadline is not None:
+                deadline_at = time.monotonic() + self.retry_policy.deadline
+            batch_callback = None
+            if on_batch is not None:
+                batch_callback = self._filtered_batch_callback(criteria, on_batch)
+            videos = self._search_and_fetch_details(
+                criteria, max_pages, deadline_at, batch_callback, cancel_token, omit_fields
+            )
 
-            if not video_ids:
+            if not videos:
                 logger.info("検索結果が0件でした")
                 return []
 
-            logger.info(f"検索結果: {len(video_ids)}件の動画IDを取得")
-
-            # Step 2: videos.list APIで動画詳細を取得
-            videos = self._get_video_details(video_ids)
-
             # Step 3: フィルタリング（再生回数、動画タイプ）
             filtered_videos = self._filter_videos(videos, criteria)
 
@@ -87,6 +478,8 @@ class YouTubeClient:
 
             return filtered_videos[:criteria.max_results]
 
+        except (YouTubeAPIError, OperationCancelledError):
+            raise
         except HttpError as e:
             logger.error(f"YouTube API呼び出しエラー: {e}", exc_info=True)
             raise YouTubeAPIError(f"YouTube API呼び出しエラー: {e}")
@@ -94,6 +487,198 @@ class YouTubeClient:
             logger.error(f"予期しないエラー: {e}", exc_info=True)
             raise YouTubeAPIError(f"予期しないエラー: {e}")
 
+    def get_remaining_quota(self) -> Optional[int]:
+        """
+        本日（太平洋時間）のクォータ残量を取得
+
+        Returns:
+            Optional[int]: 残りユニット数（クォータを記録していない場合はNone）
+        """
+        if self.quota_tracker is None:
+            return None
+        return sum(self.quota_tracker.get_remaining(api_key) for api_key in self.key_pool.available_keys())
+
+    def _plan_max_pages(self, criteria: SearchCriteria, max_units: Optional[int] = None) -> Optional[int]:
+        """
+        クォータ予算内で取得できるsearch.listのページ数を計算
+
+        Args:
+            criteria: 検索条件
+            max_units: この検索で使用するクォータの上限
+
+        Returns:
+            Optional[int]: 取得可能なページ数（予算の制約がない場合はNone）
+        """
+        return plan_max_pages(criteria, self.get_remaining_quota(), max_units)
+
+    def _filtered_batch_callback(
+        self,
+        criteria: SearchCriteria,
+        on_batch: Callable[[List[VideoInfo]], None]
+    ) -> Callable[[List[VideoInfo]], None]:
+        """
+        バッチをフィルタリングし、合計max_results件までを渡すコールバックを作成
+
+        Args:
+            criteria: 検索条件
+            on_batch: フィルタリング後のバッチを受け取るコールバック
+
+        Returns:
+            Callable[[List[VideoInfo]], None]: 取得したままのバッチを受け取るコールバック
+        """
+        delivered_count = 0
+
+        def deliver(videos: List[VideoInfo]) -> None:
+            nonlocal delivered_count
+            batch = self._filter_videos(videos, criteria)[:criteria.max_results - delivered_count]
+            if not batch:
+                return
+            delivered_count += len(batch)
+            try:
+                on_batch(batch)
+            except Exception as e:
+                logger.warning(f"検索結果のバッチの受け渡しに失敗: {e}", exc_info=True)
+
+        return deliver
+
+    def _search_and_fetch_details(
+        self,
+        criteria: SearchCriteria,
+        max_pages: Optional[int] = None,
+        deadline_at: Optional[float] = None,
+        on_batch: Optional[Callable[[List[VideoInfo]], None]] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        omit_fields: Optional[FrozenSet[str]] = None
+    ) -> List[VideoInfo]:
+        """
+        search.listのページごとに、videos.listの詳細取得を並行して開始する
+
+        次ページのsearch.listを待つ間に、取得済みページの詳細取得を進める。
+        途中のページやバッチが失敗しても、取得できた分は結果として返す。
+
+        Args:
+            criteria: 検索条件
+            max_pages: search.list APIで取得する最大ページ数（Noneの場合は制限なし）
+            deadline_at: 検索の期限（time.monotonic()基準、Noneの場合は無制限）
+            on_batch: バッチの詳細取得が完了するたびに、そのバッチの動画情報リストを
+                    検索順で受け取るコールバック（失敗したバッチは渡さない）
+            cancel_token: キャンセルトークン
+            omit_fields: videos.listで取得しない属性（Noneの場合はクライアントのomit_fields）
+
+        Returns:
+            List[VideoInfo]: 動画情報リスト（検索結果順）
+
+        Raises:
+            OperationCancelledError: 検索がキャンセルされた場合
+        """
+        executor = self._get_executor() if self.max_workers > 1 else None
+        futures: List[Future] = []
+        video_id_count = 0
+
+        # 先頭から順に、完了したバッチをコールバックに渡す（後のバッチが先に完了しても順序を保つ）
+        delivered = 0
+        deliver_lock = threading.Lock()
+
+        def deliver_ready(_future: Optional[Future] = None) -> None:
+            nonlocal delivered
+            with deliver_lock:
+                while delivered < len(futures) and futures[delivered].done():
+                    future = futures[delivered]
+                    delivered += 1
+                    if not future.cancelled() and future.exception() is None:
+                        on_batch(future.result())
+
+        deadline_reached = False
+        try:
+            for page_ids in self._iter_search_pages(criteria, max_pages, deadline_at, cancel_token):
+                video_id_count += len(page_ids)
+                for batch_ids in self._split_batches(page_ids):
+                    # 期限を過ぎたら新しいバッチは投入せず、投入済みの分で結果を返す
+                    if deadline_passed(deadline_at):
+                        deadline_reached = True
+                        break
+                    if executor is not None:
+                        future = executor.submit(
+                            self._fetch_video_batch, batch_ids, deadline_at, cancel_token, omit_fields
+                        )
+                    else:
+                        future = self._run_inline(
+                            self._fetch_video_batch, batch_ids, deadline_at, cancel_token, omit_fields
+                        )
+                    futures.append(future)
+                    if on_batch is not None:
+                        future.add_done_callback(deliver_ready)
+                if deadline_reached:
+                    logger.warning(f"検索の期限を過ぎたため、投入済みの{len(futures)}バッチで結果を返します")
+                    break
+        except OperationCancelledError:
+            self._cancel_futures(futures)
+            raise
+        except Exception as e:
+            if not futures:
+                raise
+            logger.warning(
+                f"search.listの取得に失敗したため、取得済みの{video_id_count}件で結果を返します: {e}"
+            )
+
+        logger.info(f"検索結果: {video_id_count}件の動画IDを取得")
+
+        videos = []
+        errors = []
+        for future in futures:
+            try:
+                videos.extend(future.result())
+            except Exception as e:
+                errors.append(e)
+
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+
+        # 完了通知のコールバックより先に結果を受け取った場合に備え、残りのバッチをここで渡す
+        if on_batch is not None:
+            deliver_ready()
+
+        if errors:
+            if len(errors) == len(futures):
+                raise errors[0]
+            logger.warning(
+                f"videos.listの{len(errors)}/{len(futures)}バッチの取得に失敗したため、"
+                f"除外して結果を返します: {errors[0]}"
+            )
+
+        return videos
+
+    def _cancel_futures(self, futures: List[Future]) -> None:
+        """
+        未着手の詳細取得をキャンセル（実行中のものは完了を待つ）
+
+        Args:
+            futures: 詳細取得のFutureリスト
+        """
+        for future in futures:
+            future.cancel()
+        for future in futures:
+            if not future.cancelled():
+                future.exception()
+
+    def _run_inline(self, func: Callable[..., Any], *args) -> Future:
+        """
+        関数を現在のスレッドで実行し、結果を完了済みのFutureとして返す
+
+        Args:
+            func: 実行する関数
+            *args: 関数の引数
+
+        Returns:
+            Future: 実行結果（例外を含む）
+        """
+        future: Future = Future()
+        try:
+            future.set_result(func(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
     def _search_video_ids(self, criteria: SearchCriteria) -> List[str]:
         """
         search.list APIで動画IDを取得
@@ -104,48 +689,99 @@ class YouTubeClient:
         Returns:
             List[str]: 動画IDリスト
         """
-        video_ids = []
-        next_page_token = None
-        max_iterations = 10  # 無限ループ防止
+        return [video_id for page_ids in self._iter_search_pages(criteria) for video_id in page_ids]
+
+    def _iter_search_pages(
+        self,
+        criteria: SearchCriteria,
+        max_pages: Optional[int] = None,
+        deadline_at: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> Iterator[List[str]]:
+        """
+        search.list APIのページごとに動画IDを返す
 
-        # 1リクエストあたり最大50件まで取得可能
-        per_page = min(criteria.max_results, 50)
+        Args:
+            criteria: 検索条件
+            max_pages: APIで取得する最大ページ数（Noneの場合は制限なし、キャッシュ使用時は無関係）
+            deadline_at: 検索の期限（time.monotonic()基準、Noneの場合は無制限）
+            cancel_token: キャンセルトークン（各ページの取得前に確認する）
+
+        Yields:
+            List[str]: 1ページ分の動画IDリスト（合計はmax_results件まで、期限を過ぎたら打ち切る）
+
+        Raises:
+            OperationCancelledError: 検索がキャンセルされた場合（取得途中のページはキャッシュしない）
+        """
+        if self.search_cache is not None:
+            cached_pages = self.search_cache.get(criteria)
+            if cached_pages is not None:
+                yield from self._truncate_pages(cached_pages, criteria.max_results)
+                return
+
+        fetched_pages = []
+        video_id_count = 0
+        next_page_token = None
+        max_iterations = MAX_SEARCH_PAGES
+        if max_pages is not None:
+            if max_pages <= 0:
+                raise QuotaExceededError("APIクォータの残量が不足しているため検索できません")
+            max_iterations = min(max_iterations, max_pages)
 
         for _ in range(max_iterations):
-            request_params = {
-                "part": "id",
-                "q": criteria.keyword,
-                "type": "video",
-                "maxResults": per_page,
-                "order": criteria.order,
-                "regionCode": criteria.region_code,
-                "relevanceLanguage": criteria.language,
-            }
-
-            # 公開日範囲
-            if criteria.published_after:
-                request_params["publishedAfter"] = criteria.published_after.isoformat() + "Z"
-            if criteria.published_before:
-                request_params["publishedBefore"] = criteria.published_before.isoformat() + "Z"
-
-            # ページネーション
-            if next_page_token:
-                request_params["pageToken"] = next_page_token
-
-            response = self.youtube.search().list(**request_params).execute()
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+
+            # 期限を過ぎたら次のページは取得しない（取得途中のページはキャッシュしない）
+            if deadline_passed(deadline_at):
+                logger.warning("検索の期限を過ぎたため、search.listの取得を打ち切ります")
+                return
+
+            request_params = build_search_params(criteria, next_page_token)
+
+            response = self._execute(
+                lambda youtube: youtube.search().list(**request_params),
+                SEARCH_LIST_COST,
+                deadline_at
+            )
 
             # 動画IDを抽出
-            for item in response.get("items", []):
-                video_id = item["id"].get("videoId")
-                if video_id:
-                    video_ids.append(video_id)
+            page_ids = extract_video_ids(response)
+
+            fetched_pages.append(page_ids)
+
+            page_ids = page_ids[:criteria.max_results - video_id_count]
+            if page_ids:
+                video_id_count += len(page_ids)
+                yield page_ids
 
             # 次ページがあるかチェック
             next_page_token = response.get("nextPageToken")
-            if not next_page_token or len(video_ids) >= criteria.max_results:
+            if not next_page_token or video_id_count >= criteria.max_results:
                 break
 
-        return video_ids[:criteria.max_results]
+        if self.search_cache is not None:
+            self.search_cache.put(criteria, fetched_pages, exhausted=not next_page_token)
+
+    def _truncate_pages(self, pages: List[List[str]], max_results: int) -> Iterator[List[str]]:
+        """
+        ページごとの動画IDリストを合計max_results件までに切り詰める
+
+        Args:
+            pages: ページごとの動画IDリスト
+            max_results: 最大件数
+
+        Yields:
+            List[str]: 1ページ分の動画IDリスト
+        """
+        remaining = max_results
+        for page_ids in pages:
+            if remaining <= 0:
+                break
+            page_ids = page_ids[:remaining]
+            if page_ids:
+                remaining -= len(page_ids)
+                yield page_ids
 
     def _get_video_details(self, video_ids: List[str]) -> List[VideoInfo]:
         """
@@ -157,25 +793,280 @@ class YouTubeClient:
         Returns:
             List[VideoInfo]: 動画情報リスト
         """
-        videos = []
+        batches = self._split_batches(video_ids)
+
+        if self.max_workers <= 1 or len(batches) <= 1:
+            results = [self._fetch_video_batch(batch_ids) for batch_ids in batches]
+        else:
+            # バッチを並列に取得（executor.mapは入力順で結果を返す）
+            logger.debug(f"videos.listを並列実行: {len(batches)}バッチ, 同時実行数={self.max_workers}")
+            results = list(self._get_executor().map(self._fetch_video_batch, batches))
+
+        return [video for batch_videos in results for video in batch_videos]
 
-        # videos.list APIは1リクエストで最大50件まで
-        batch_size = 50
+    def _split_batches(self, video_ids: List[str]) -> List[List[str]]:
+        """
+        動画IDをvideos.list APIの1リクエスト分（最大50件）ずつに分割
+
+        Args:
+            video_ids: 動画IDリスト
+
+        Returns:
+            List[List[str]]: バッチごとの動画IDリスト
+        """
+        return split_batches(video_ids)
+
+    def _fetch_video_batch(
+        self,
+        batch_ids: List[str],
+        deadline_at: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        omit_fields: Optional[FrozenSet[str]] = None
+    ) -> List[VideoInfo]:
+        """
+        1バッチ（最大50件）の動画詳細を取得
 
-        for i in range(0, len(video_ids), batch_size):
-            batch_ids = video_ids[i:i + batch_size]
-            response = self.youtube.videos().list(
+        キャッシュが有効な場合は、未取得または期限切れの動画のみAPIに問い合わせる
+        （statisticsのみ期限切れの動画はstatisticsパートだけを取得する）。
+        属性を省略して取得した動画は、完全な情報ではないためキャッシュに保存しない
+
+        Args:
+            batch_ids: 動画IDリスト（最大50件）
+            deadline_at: 検索の期限（time.monotonic()基準、Noneの場合は無制限）
+            cancel_token: キャンセルトークン（取得前に確認する）
+            omit_fields: videos.listで取得しない属性（Noneの場合はクライアントのomit_fields）
+
+        Returns:
+            List[VideoInfo]: 動画情報リスト（入力順、見つからない動画は含まない）
+
+        Raises:
+            OperationCancelledError: 検索がキャンセルされた場合
+        """
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+        if omit_fields is None:
+            omit_fields = self.omit_fields
+
+        if self.video_cache is None:
+            return self._request_video_batch(batch_ids, deadline_at, omit_fields)
+
+        lookup = self.video_cache.lookup(batch_ids)
+        videos_by_id = dict(lookup.fresh)
+
+        if lookup.missing:
+            fetched = self._request_video_batch(lookup.missing, deadline_at, omit_fields)
+            if not omit_fields:
+                self.video_cache.put_many(fetched)
+            videos_by_id.update((video.video_id, video) for video in fetched)
+
+        if lookup.stale_statistics:
+            refreshed = self._request_video_statistics(lookup.stale_statistics, deadline_at)
+            self.video_cache.update_statistics(refreshed)
+            videos_by_id.update((video.video_id, video) for video in refreshed)
+
+        return [videos_by_id[video_id] for video_id in batch_ids if video_id in videos_by_id]
+
+    def _request_video_batch(
+        self,
+        batch_ids: List[str],
+        deadline_at: Optional[float] = None,
+        omit_fields: Optional[FrozenSet[str]] = None
+    ) -> List[VideoInfo]:
+        """
+        videos.list APIで1バッチ（最大50件）の動画詳細を取得
+
+        Args:
+            batch_ids: 動画IDリスト（最大50件）
+            deadline_at: 検索の期限（time.monotonic()基準、Noneの場合は無制限）
+            omit_fields: 取得しない属性（Noneの場合はクライアントのomit_fields）
+
+        Returns:
+            List[VideoInfo]: 動画情報リスト（レスポンス順）
+        """
+        fields = self._video_fields if omit_fields is None else build_video_fields(omit_fields)
+        response = self._execute(
+            lambda youtube: youtube.videos().list(
                 part="snippet,statistics,contentDetails",
-                id=",".join(batch_ids)
-            ).execute()
+                id=",".join(batch_ids),
+                fields=fields
+            ),
+            VIDEOS_LIST_COST,
+            deadline_at
+        )
+
+        return parse_video_items(response)
+
+    def _request_video_statistics(
+        self,
+        cached_videos: Dict[str, VideoInfo],
+        deadline_at: Optional[float] = None
+    ) -> List[VideoInfo]:
+        """
+        videos.list APIでstatisticsのみを取得し、キャッシュ済みの動画情報に反映
+
+        Args:
+            cached_videos: 動画ID → キャッシュ済みの動画情報（最大50件）
+            deadline_at: 検索の期限（time.monotonic()基準、Noneの場合は無制限）
+
+        Returns:
+            List[VideoInfo]: 統計情報を更新した動画情報リスト
+        """
+        response = self._execute(
+            lambda youtube: youtube.videos().list(
+                part="statistics",
+                id=",".join(cached_videos.keys()),
+                fields=STATISTICS_FIELDS
+            ),
+            VIDEOS_LIST_COST,
+            deadline_at
+        )
 
-            for item in response.get("items", []):
-                video_info = self._parse_video_item(item)
-                if video_info:
-                    videos.append(video_info)
+        videos = []
+        for item in response.get("items", []):
+            cached = cached_videos.get(item.get("id"))
+            if cached is None:
+                continue
+            statistics = item.get("statistics", {})
+            videos.append(replace(
+                cached,
+                view_count=int(statistics.get("viewCount", 0)),
+                like_count=int(statistics.get("likeCount", 0)),
+                comment_count=int(statistics.get("commentCount", 0))
+            ))
 
         return videos
 
+    def _execute(
+        self,
+        build_request: Callable[[Any], Any],
+        cost: int,
+        deadline_at: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        キープールのAPIキーでリクエストを実行し、クォータ使用量を記録
+
+        クォータ超過・レート制限のエラーが返った場合は、そのキーを除外して
+        次のキーで同じリクエストを再実行する。5xxや接続エラーなどの一時的な
+        エラーはリトライポリシーに従い、待ち時間をおいて再試行する。
+
+        Args:
+            build_request: サービスオブジェクトからHttpRequestを生成する関数
+            cost: このリクエストのクォータコスト（ユニット）
+            deadline_at: 検索の期限（time.monotonic()基準、Noneの場合は無制限）
+
+        Returns:
+            Dict[str, Any]: APIレスポンス
+
+        Raises:
+            QuotaExceededError: すべてのAPIキーが利用できない場合
+            HttpError: 再試行できない、または再試行しても失敗したAPIエラー
+        """
+        attempt = 1
+
+        while True:
+            api_key = self.key_pool.acquire()
+            if api_key is None:
+                raise QuotaExceededError("すべてのAPIキーがクォータ上限またはレート制限に達しています")
+
+            request = build_request(get_youtube_service(api_key))
+            reasons = set()
+            try:
+                response = request.execute(http=self._get_http())
+            except HttpError as e:
+                # エラー応答でもクォータは消費される
+                self._record_quota(api_key, cost)
+
+                reasons = self._get_error_reasons(e)
+                if e.resp.status == 403 and reasons & QUOTA_EXCEEDED_REASONS:
+                    self.key_pool.mark_exhausted(api_key)
+                    continue
+                if (e.resp.status in (403, 429) and reasons & RATE_LIMIT_REASONS
+                        and len(self.key_pool.available_keys()) > 1):
+                    self.key_pool.mark_rate_limited(api_key)
+                    continue
+                error: Exception = e
+            except Exception as e:
+                error = e
+            else:
+                # 受け取ったレスポンスは、記録の成否にかかわらず返す（再実行するとクォータを二重に消費する）
+                self._record_quota(api_key, cost)
+                return response
+
+            delay = self.retry_policy.next_delay(error, attempt, deadline_at, reasons)
+            if delay is None:
+                raise error
+
+            logger.warning(
+                f"一時的なエラーのため{delay:.1f}秒後に再試行します"
+                f"（{attempt}/{self.retry_policy.max_attempts}）: {error}"
+            )
+            time.sleep(delay)
+            attempt += 1
+
+    def _record_quota(self, api_key: str, cost: int) -> None:
+        """
+        クォータ使用量を記録（記録に失敗してもAPI呼び出しは失敗させない）
+
+        Args:
+            api_key: 使用したAPIキー
+            cost: 使用ユニット数
+        """
+        if self.quota_tracker is None:
+            return
+
+        try:
+            self.quota_tracker.record(api_key, cost)
+        except Exception as e:
+            logger.warning(f"クォータ使用量の記録に失敗: {e}")
+
+    def _get_error_reasons(self, error: HttpError) -> set:
+        """
+        HttpErrorからエラー理由（reason）を取り出す
+
+        Args:
+            error: APIエラー
+
+        Returns:
+            set: エラー理由の集合
+        """
+        try:
+            return parse_error_reasons(json.loads(error.content.decode("utf-8")))
+        except Exception:
+            return set()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        videos.list API用のスレッドプールを取得（初回呼び出し時に生成）
+
+        Returns:
+            ThreadPoolExecutor: スレッドプール
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="youtube-api"
+                )
+            return self._executor
+
+    def close(self) -> None:
+        """スレッドプールを終了する"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+    def _get_http(self):
+        """
+        API呼び出しに使用するHTTPクライアントを取得
+
+        プロセス全体で共有する接続プールを使い、検索をまたいでTLS接続を再利用する
+
+        Returns:
+            PooledHttp: スレッドセーフなHTTPクライアント
+        """
+        return get_shared_http()
+
     def _parse_video_item(self, item: Dict[str, Any]) -> Optional[VideoInfo]:
         """
         APIレスポンスからVideoInfoオブジェクトを生成
@@ -186,43 +1077,7 @@ class YouTubeClient:
         Returns:
             Optional[VideoInfo]: 動画情報（パースエラー時はNone）
         """
-        try:
-            video_id = item["id"]
-            snippet = item["snippet"]
-            statistics = item["statistics"]
-            content_details = item["contentDetails"]
-
-            # 動画の長さをパース（ISO 8601形式 → 秒数）
-            duration_str = content_details["duration"]
-            duration_seconds = int(isodate.parse_duration(duration_str).total_seconds())
-
-            # ショート動画判定（60秒以下）
-            is_short = duration_seconds <= 60
-
-            # 公開日時をパース
-            published_at_str = snippet["publishedAt"]
-            published_at = datetime.fromisoformat(published_at_str.replace("Z", "+00:00"))
-
-            return VideoInfo(
-                video_id=video_id,
-                title=snippet["title"],
-                url=f"https://www.youtube.com/watch?v={video_id}",
-                channel_name=snippet["channelTitle"],
-                channel_id=snippet["channelId"],
-                view_count=int(statistics.get("viewCount", 0)),
-                like_count=int(statistics.get("likeCount", 0)),
-                comment_count=int(statistics.get("commentCount", 0)),
-                published_at=published_at,
-                duration_seconds=duration_seconds,
-                is_short=is_short,
-                description=snippet.get("description", ""),
-                tags=snippet.get("tags", []),
-                thumbnail_url=snippet.get("thumbnails", {}).get("high", {}).get("url", "")
-            )
-
-        except Exception as e:
-            logger.warning(f"動画情報のパースに失敗: {e}")
-            return None
+        return parse_video_item(item)
 
     def _filter_videos(self, videos: List[VideoInfo], criteria: SearchCriteria) -> List[VideoInfo]:
         """
@@ -235,24 +1090,7 @@ class YouTubeClient:
         Returns:
             List[VideoInfo]: フィルタリング後の動画情報リスト
         """
-        filtered = []
-
-        for video in videos:
-            # 再生回数フィルタ
-            if criteria.min_view_count is not None and video.view_count < criteria.min_view_count:
-                continue
-            if criteria.max_view_count is not None and video.view_count > criteria.max_view_count:
-                continue
-
-            # 動画タイプフィルタ
-            if criteria.video_type == VideoType.SHORT and not video.is_short:
-                continue
-            if criteria.video_type == VideoType.NORMAL and video.is_short:
-                continue
-
-            filtered.append(video)
-
-        return filtered
+        return filter_videos(videos, criteria)
 
     def get_video_by_id(self, video_id: str) -> Optional[VideoInfo]:
         """
@@ -268,17 +1106,12 @@ class YouTubeClient:
             YouTubeAPIError: API呼び出しエラー
         """
         try:
-            response = self.youtube.videos().list(
-                part="snippet,statistics,contentDetails",
-                id=video_id
-            ).execute()
-
-            items = response.get("items", [])
-            if not items:
+            videos = self._fetch_video_batch([video_id])
+            if not videos:
                 logger.warning(f"動画ID {video_id} が見つかりませんでした")
                 return None
 
-            return self._parse_video_item(items[0])
+            return videos[0]
 
         except HttpError as e:
             logger.error(f"YouTube API呼び出しエラー: {e}", exc_info=True)
@@ -23,8 +23,8 @@ def main():
         from dotenv import load_dotenv
         load_dotenv()
 
-        api_key = os.getenv("YOUTUBE_API_KEY")
-        if not api_key:
+        from src.infrastructure.api_key_pool import load_api_keys_from_env
+        if not load_api_keys_from_env():
             import tkinter.messagebox as messagebox
             root = tk.Tk()
             root.withdraw()  # メインウィンドウを隠す
@@ -42,6 +42,10 @@ def main():
         app = MainWindow(root)
         app.run()
 
+        # WALの内容をデータベースファイルに反映してから終了する
+        from src.database.connection import close_all_connections
+        close_all_connections()
+
     except KeyboardInterrupt:
         logger.info("アプリケーションを終了しました（Ctrl+C）")
     except Exception as e:
@@ -22,19 +22,27 @@ class HistoryPanel(tk.Toplevel):
     過去の検索履歴を表示し、履歴から再検索できる
     """
 
-    def __init__(self, parent, on_search_callback: Optional[Callable[[SearchCriteria], None]] = None):
+    def __init__(
+        self,
+        parent,
+        on_search_callback: Optional[Callable[[SearchCriteria], None]] = None,
+        on_restore_callback: Optional[Callable[[SearchHistory], bool]] = None
+    ):
         """
         初期化
 
         Args:
             parent: 親ウィンドウ
             on_search_callback: 履歴から再検索する時のコールバック関数
+            on_restore_callback: 保存済みの検索結果を表示する時のコールバック関数
+                    （表示できた場合はTrueを返す）
         """
         super().__init__(parent)
         self.title("検索履歴")
         self.geometry("800x500")
 
         self.on_search_callback = on_search_callback
+        self.on_restore_callback = on_restore_callback
         self.history_service = HistoryService()
 
         self._create_widgets()
@@ -102,7 +110,7 @@ class HistoryPanel(tk.Toplevel):
 
         self.tree.pack(fill=tk.BOTH, expand=True)
 
-        # ダブルクリックで再検索
+        # ダブルクリックで保存済みの検索結果を表示（保存されていない場合は再検索）
         self.tree.bind('<Double-1>', self._on_double_click)
 
         # ボタンパネル
@@ -199,6 +207,12 @@ class HistoryPanel(tk.Toplevel):
 
     def _on_double_click(self, event):
         """アイテムがダブルクリックされた時の処理"""
+        history = self._get_selected_history()
+        if history and self.on_restore_callback and self.on_restore_callback(history):
+            logger.info(f"履歴から検索結果を表示: {history.criteria.keyword}")
+            self.destroy()  # ウィンドウを閉じる
+            return
+
         self._research_selected()
 
     def _research_selected(self):
@@ -3,22 +3,42 @@
 
 アプリケーションのメインウィンドウ
 """
+import os
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import threading
-from typing import List
+from typing import FrozenSet, List, Optional, Type
 
 from src.ui.search_panel import SearchPanel
 from src.ui.result_panel import ResultPanel
 from src.ui.history_panel import HistoryPanel
-from src.domain.models import SearchCriteria, VideoInfo
+from src.ui.result_model import ResultModel
+from src.domain.models import SearchCriteria, VideoInfo, SearchHistory
 from src.application.video_search_service import VideoSearchService
 from src.application.history_service import HistoryService
+from src.infrastructure.base_exporter import BaseExporter
 from src.infrastructure.excel_exporter import ExcelExporter
+from src.infrastructure.csv_exporter import CsvExporter
+from src.infrastructure.jsonl_exporter import JsonlExporter
+from src.infrastructure.parquet_exporter import ParquetExporter
+from src.infrastructure.youtube_client import YouTubeClient
+from src.infrastructure.video_cache import VideoCache
+from src.infrastructure.search_cache import SearchResultCache
+from src.infrastructure.quota_tracker import QuotaTracker
+from src.infrastructure.statistics_store import StatisticsStore
+from src.infrastructure.video_fields import resolve_field_profile
 from src.utils.logger import get_logger
+from src.utils.cancellation import CancellationToken, OperationCancelledError
+from src.utils.job_manager import JobManager
 
 logger = get_logger(__name__)
 
+# フィールドプロファイル → メニューの表示名
+FIELD_PROFILE_LABELS = {
+    "full": "すべての列",
+    "no_description": "概要を除く",
+    "compact": "概要・タグ・サムネイルURLを除く",
+}
+
 
 class MainWindow:
     """
@@ -38,11 +58,21 @@ class MainWindow:
         self.root.title("YouTube Video Analyzer")
         self.root.geometry("1000x700")
 
+        # 検索・エクスポートは上限付きのワーカープールで実行する
+        self.job_manager = JobManager()
+
         # サービス初期化
         try:
-            self.video_search_service = VideoSearchService()
+            youtube_client = YouTubeClient(
+                video_cache=VideoCache(),
+                search_cache=SearchResultCache(),
+                quota_tracker=QuotaTracker()
+            )
+            self.video_search_service = VideoSearchService(youtube_client, StatisticsStore())
             self.history_service = HistoryService()
             self.excel_exporter = ExcelExporter()
+            # Google Sheetsエクスポーターは初回のエクスポート時に生成し、以降は使い回す
+            self.sheets_exporter = None
             logger.info("サービスを初期化しました")
         except Exception as e:
             logger.error(f"サービスの初期化に失敗: {e}", exc_info=True)
@@ -53,10 +83,16 @@ class MainWindow:
             self.root.destroy()
             return
 
+        # エクスポートする列（検索で取得するフィールドもこれに合わせる）
+        self.field_profile = tk.StringVar(value=os.getenv("YOUTUBE_FIELD_PROFILE", "full"))
+
         self._create_menu()
         self._create_widgets()
         self._create_statusbar()
 
+        # Escキーで実行中の検索を中止
+        self.root.bind('<Escape>', lambda event: self._cancel_search())
+
         logger.info("MainWindowを初期化しました")
 
     def _create_menu(self):
@@ -67,8 +103,17 @@ class MainWindow:
         # ファイルメニュー
         file_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="ファイル", menu=file_menu)
+        field_menu = tk.Menu(file_menu, tearoff=0)
+        for profile, label in FIELD_PROFILE_LABELS.items():
+            field_menu.add_radiobutton(label=label, variable=self.field_profile, value=profile)
+        file_menu.add_cascade(label="エクスポートする列", menu=field_menu)
+        file_menu.add_separator()
         file_menu.add_command(label="Excelにエクスポート", command=self._export_to_excel)
+        file_menu.add_command(label="CSVにエクスポート", command=lambda: self._export_to_file(CsvExporter))
+        file_menu.add_command(label="JSON Linesにエクスポート", command=lambda: self._export_to_file(JsonlExporter))
+        file_menu.add_command(label="Parquetにエクスポート", command=lambda: self._export_to_file(ParquetExporter))
         file_menu.add_command(label="Google Sheetsにエクスポート", command=self._export_to_sheets)
+        file_menu.add_command(label="Google Sheetsを更新（差分のみ）", command=lambda: self._export_to_sheets(upsert=True))
         file_menu.add_separator()
         file_menu.add_command(label="終了", command=self.root.quit)
 
@@ -76,6 +121,7 @@ class MainWindow:
         view_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="表示", menu=view_menu)
         view_menu.add_command(label="検索履歴", command=self._show_history)
+        view_menu.add_command(label="検索を中止", accelerator="Esc", command=self._cancel_search)
 
         # ヘルプメニュー
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -128,76 +174,132 @@ class MainWindow:
         Args:
             criteria: 検索条件
         """
-        # 検索を別スレッドで実行（UIをフリーズさせないため）
-        thread = threading.Thread(
-            target=self._execute_search,
-            args=(criteria,),
-            daemon=True
-        )
-        thread.start()
+        # 検索をワーカープールで実行（UIをフリーズさせないため）
+        # 実行中の検索があればキャンセルし、その結果は表示しない
+        self._search_started()
+        self.job_manager.submit("search", self._execute_search, criteria, self.field_profile.get(), supersede=True)
 
-    def _execute_search(self, criteria: SearchCriteria):
+    def _execute_search(self, token: CancellationToken, criteria: SearchCriteria, field_profile: Optional[str] = None):
         """
-        検索を実行（バックグラウンドスレッド）
+        検索を実行（ワーカースレッド）
+
+        UIの更新はtokenを付けてメインスレッドに渡し、キャンセル済みの検索の更新は捨てる
 
         Args:
+            token: この検索のキャンセルトークン
             criteria: 検索条件
+            field_profile: 取得するフィールドのプロファイル（メニューで選択したエクスポートする列）
         """
         try:
-            # UI更新（メインスレッド）
-            self.root.after(0, self._search_started)
-
-            # 検索条件を保存（履歴記録用）
-            self._last_search_criteria = criteria
-
-            # 検索実行
+            # 検索実行（取得したバッチから順に表示する。表示用の整形はワーカー側で済ませておく）
             logger.info(f"検索実行: {criteria.keyword}")
-            videos = self.video_search_service.search(criteria)
+            videos = self.video_search_service.search(
+                criteria,
+                on_batch=lambda batch: self.root.after(
+                    0, self._search_batch_received, token, batch, ResultModel(batch)
+                ),
+                cancel_token=token,
+                field_profile=field_profile
+            )
 
             # UI更新（メインスレッド）
-            self.root.after(0, self._search_completed, videos)
+            self.root.after(0, self._search_completed, token, criteria, videos)
+
+        except OperationCancelledError:
+            logger.info(f"検索をキャンセルしました: {criteria.keyword}")
 
         except Exception as e:
             logger.error(f"検索エラー: {e}", exc_info=True)
-            self.root.after(0, self._search_error, str(e))
+            self.root.after(0, self._search_error, token, str(e))
+
+    def _cancel_search(self):
+        """実行中の検索を中止（取得済みの結果は表示したままにし、エクスポートできるようにする）"""
+        if not self.job_manager.cancel("search"):
+            return
+
+        self.progress.stop()
+        self.progress.pack_forget()
+        self.search_panel.set_enabled(True)
+        self.result_panel.finish_results(self.result_panel.videos)
+        self.statusbar.config(text=f"検索を中止しました: {len(self.result_panel.videos)}件取得済み")
 
     def _search_started(self):
         """検索開始時のUI更新"""
         self.search_panel.set_enabled(False)
         self.result_panel.clear()
-        self.statusbar.config(text="検索中...")
+        self.statusbar.config(text="検索中...（Escで中止）")
         self.progress.pack(side=tk.BOTTOM, fill=tk.X, before=self.statusbar)
         self.progress.start(10)
         logger.info("検索を開始しました")
 
-    def _search_completed(self, videos: List[VideoInfo]):
+    def _search_batch_received(self, token: CancellationToken, videos: List[VideoInfo], model: ResultModel):
+        """
+        検索中に動画情報のバッチを取得した時のUI更新
+
+        Args:
+            token: 検索のキャンセルトークン（キャンセル済みの場合は何もしない）
+            videos: 取得した動画リスト
+            model: videosから作成済みの表示用モデル
+        """
+        if token.is_cancelled:
+            return
+
+        self.result_panel.append_results(videos, model)
+        self.statusbar.config(text=f"検索中... {len(self.result_panel.videos)}件取得（Escで中止）")
+
+    def _search_completed(self, token: CancellationToken, criteria: SearchCriteria, videos: List[VideoInfo]):
         """
         検索完了時のUI更新
 
         Args:
+            token: 検索のキャンセルトークン（キャンセル済みの場合は何もしない）
+            criteria: 検索条件
             videos: 検索結果の動画リスト
         """
+        if token.is_cancelled:
+            return
+
         self.progress.stop()
         self.progress.pack_forget()
         self.search_panel.set_enabled(True)
-        self.result_panel.display_results(videos)
-        self.statusbar.config(text=f"検索完了: {len(videos)}件の動画を取得しました")
+        self.result_panel.finish_results(videos)
+        self.statusbar.config(text=f"検索完了: {len(videos)}件の動画を取得しました{self._quota_status_text()}")
         logger.info(f"検索完了: {len(videos)}件")
 
-        # 検索履歴に記録（最後に実行した検索条件を保存）
-        if hasattr(self, '_last_search_criteria'):
-            try:
-                self.history_service.add_history(self._last_search_criteria, len(videos))
-            except Exception as e:
-                logger.warning(f"検索履歴の記録に失敗: {e}")
+        # 検索履歴に記録
+        try:
+            self.history_service.add_history(criteria, len(videos), videos)
+        except Exception as e:
+            logger.warning(f"検索履歴の記録に失敗: {e}")
 
-    def _search_error(self, error_message: str):
+    def _quota_status_text(self) -> str:
+        """
+        ステータスバー用のクォータ残量表示を作成
+
+        Returns:
+            str: クォータ残量の表示文字列（取得できない場合は空文字）
+        """
+        try:
+            remaining = self.video_search_service.get_remaining_quota()
+        except Exception as e:
+            logger.warning(f"クォータ残量の取得に失敗: {e}")
+            return ""
+
+        if remaining is None:
+            return ""
+        return f"（本日のAPIクォータ残り: {remaining:,}ユニット）"
+
+    def _search_error(self, token: CancellationToken, error_message: str):
         """
         検索エラー時のUI更新
 
         Args:
+            token: 検索のキャンセルトークン（キャンセル済みの場合は何もしない）
             error_message: エラーメッセージ
         """
+        if token.is_cancelled:
+            return
+
         self.progress.stop()
         self.progress.pack_forget()
         self.search_panel.set_enabled(True)
@@ -206,13 +308,16 @@ class MainWindow:
         messagebox.showerror("検索エラー", f"検索中にエラーが発生しました:\n\n{error_message}")
         logger.error(f"検索エラー: {error_message}")
 
-    def _on_export(self, videos: List[VideoInfo]):
+    def _on_export(self, videos: List[VideoInfo], exporter: Optional[BaseExporter] = None):
         """
         エクスポート処理
 
         Args:
             videos: エクスポートする動画リスト
+            exporter: 使用するエクスポーター（指定しない場合はExcel）
         """
+        exporter = exporter or self.excel_exporter
+
         # outputフォルダを作成（存在しない場合）
         import os
         output_dir = "output"
@@ -222,42 +327,47 @@ class MainWindow:
 
         # デフォルトのファイル名（日時付き）
         from datetime import datetime
-        default_filename = f"youtube_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+        default_filename = f"youtube_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}{exporter.file_extension}"
 
         # ファイル保存ダイアログ（outputフォルダをデフォルトに）
         filename = filedialog.asksaveasfilename(
             initialdir=output_dir,
             initialfile=default_filename,
-            defaultextension=".xlsx",
-            filetypes=[("Excelファイル", "*.xlsx"), ("すべてのファイル", "*.*")],
+            defaultextension=exporter.file_extension,
+            filetypes=[(exporter.file_type_name, f"*{exporter.file_extension}"), ("すべてのファイル", "*.*")],
             title="エクスポート先を選択"
         )
 
         if not filename:
             return
 
-        # エクスポートを別スレッドで実行
-        thread = threading.Thread(
-            target=self._execute_export,
-            args=(videos, filename),
-            daemon=True
-        )
-        thread.start()
-
-    def _execute_export(self, videos: List[VideoInfo], filename: str):
+        # エクスポートをワーカープールで実行
+        self.job_manager.submit("export", self._execute_export, videos, filename, exporter, self._export_omit_fields())
+
+    def _execute_export(
+        self,
+        token: CancellationToken,
+        videos: List[VideoInfo],
+        filename: str,
+        exporter: BaseExporter,
+        omit_fields: FrozenSet[str] = frozenset()
+    ):
         """
-        エクスポートを実行（バックグラウンドスレッド）
+        エクスポートを実行（ワーカースレッド）
 
         Args:
+            token: キャンセルトークン（アプリケーション終了時のみキャンセルされる）
             videos: エクスポートする動画リスト
             filename: 保存先ファイル名
+            exporter: 使用するエクスポーター
+            omit_fields: 出力しない属性
         """
         try:
             # UI更新
             self.root.after(0, self._export_started)
 
-            # Excelエクスポート実行
-            self.excel_exporter.export(videos, filename)
+            # エクスポート実行
+            exporter.export(videos, filename, omit_fields)
 
             logger.info(f"エクスポート完了: {filename}")
 
@@ -298,20 +408,70 @@ class MainWindow:
         self.statusbar.config(text="エクスポートエラー")
         messagebox.showerror("エクスポートエラー", f"エクスポート中にエラーが発生しました:\n\n{error_message}")
 
-    def _export_to_excel(self):
-        """Excelエクスポート（メニューから）"""
+    def _export_omit_fields(self) -> FrozenSet[str]:
+        """
+        メニューで選択したエクスポートする列から、出力しない属性を取得
+
+        Returns:
+            FrozenSet[str]: 出力しない属性
+        """
+        return resolve_field_profile(self.field_profile.get())
+
+    def _get_export_videos(self) -> Optional[List[VideoInfo]]:
+        """
+        メニューからのエクスポート対象の検索結果を取得
+
+        検索中は取得途中の結果をエクスポートしないよう、完了または中止を待つよう案内する
+
+        Returns:
+            Optional[List[VideoInfo]]: エクスポートする動画リスト（エクスポートできない場合はNone）
+        """
+        if self.job_manager.current("search") is not None:
+            messagebox.showinfo("エクスポート", "検索中です。検索の完了を待つか、検索を中止してからエクスポートしてください")
+            return None
+
         videos = self.result_panel.videos
         if not videos:
             messagebox.showinfo("エクスポート", "エクスポートする検索結果がありません")
+            return None
+        return videos
+
+    def _export_to_excel(self):
+        """Excelエクスポート（メニューから）"""
+        videos = self._get_export_videos()
+        if videos is None:
             return
 
         self._on_export(videos)
 
-    def _export_to_sheets(self):
-        """Google Sheetsエクスポート"""
-        videos = self.result_panel.videos
-        if not videos:
-            messagebox.showinfo("エクスポート", "エクスポートする検索結果がありません")
+    def _export_to_file(self, exporter_class: Type[BaseExporter]):
+        """
+        CSV・JSON Lines・Parquetエクスポート（メニューから）
+
+        Args:
+            exporter_class: 使用するエクスポーターのクラス
+        """
+        videos = self._get_export_videos()
+        if videos is None:
+            return
+
+        try:
+            exporter = exporter_class()
+        except ImportError as e:
+            messagebox.showerror("エクスポートエラー", str(e))
+            return
+
+        self._on_export(videos, exporter)
+
+    def _export_to_sheets(self, upsert: bool = False):
+        """
+        Google Sheetsエクスポート
+
+        Args:
+            upsert: Trueの場合は既存のシートとの差分のみを書き込む
+        """
+        videos = self._get_export_videos()
+        if videos is None:
             return
 
         # スプレッドシート名を入力
@@ -326,21 +486,28 @@ class MainWindow:
         if not spreadsheet_name:
             return
 
-        # エクスポートを別スレッドで実行
-        thread = threading.Thread(
-            target=self._execute_sheets_export,
-            args=(videos, spreadsheet_name),
-            daemon=True
+        # エクスポートをワーカープールで実行
+        self.job_manager.submit(
+            "export", self._execute_sheets_export, videos, spreadsheet_name, upsert, self._export_omit_fields()
         )
-        thread.start()
 
-    def _execute_sheets_export(self, videos: List[VideoInfo], spreadsheet_name: str):
+    def _execute_sheets_export(
+        self,
+        token: CancellationToken,
+        videos: List[VideoInfo],
+        spreadsheet_name: str,
+        upsert: bool = False,
+        omit_fields: FrozenSet[str] = frozenset()
+    ):
         """
-        Google Sheetsエクスポートを実行（バックグラウンドスレッド）
+        Google Sheetsエクスポートを実行（ワーカースレッド）
 
         Args:
+            token: キャンセルトークン（書き込みの区切りごとに確認する）
             videos: エクスポートする動画リスト
             spreadsheet_name: スプレッドシート名
+            upsert: Trueの場合は既存のシートとの差分のみを書き込む
+            omit_fields: 出力しない属性
         """
         try:
             # UI更新
@@ -348,8 +515,10 @@ class MainWindow:
 
             # SheetsExporterをインポート
             try:
-                from src.infrastructure.sheets_exporter import SheetsExporter
-                exporter = SheetsExporter()
+                if self.sheets_exporter is None:
+                    from src.infrastructure.sheets_exporter import SheetsExporter
+                    self.sheets_exporter = SheetsExporter()
+                exporter = self.sheets_exporter
             except ImportError as e:
                 raise Exception(
                     "Google Sheetsエクスポートに必要なライブラリがインストールされていません。\n"
@@ -363,13 +532,18 @@ class MainWindow:
                 )
 
             # エクスポート実行
-            url = exporter.export(videos, spreadsheet_name)
+            url = exporter.export(
+                videos, spreadsheet_name, upsert=upsert, cancel_token=token, omit_fields=omit_fields
+            )
 
             logger.info(f"Google Sheetsエクスポート完了: {url}")
 
             # UI更新
             self.root.after(0, self._sheets_export_completed, url)
 
+        except OperationCancelledError:
+            logger.info(f"Google Sheetsエクスポートをキャンセルしました: {spreadsheet_name}")
+
         except Exception as e:
             logger.error(f"Google Sheetsエクスポートエラー: {e}", exc_info=True)
             self.root.after(0, self._export_error, str(e))
@@ -399,7 +573,8 @@ class MainWindow:
         try:
             history_panel = HistoryPanel(
                 self.root,
-                on_search_callback=self._on_search_from_history
+                on_search_callback=self._on_search_from_history,
+                on_restore_callback=self._restore_from_history
             )
             logger.info("検索履歴パネルを開きました")
         except Exception as e:
@@ -419,6 +594,38 @@ class MainWindow:
         # 検索実行
         self._on_search(criteria)
 
+    def _restore_from_history(self, history: SearchHistory) -> bool:
+        """
+        保存済みの検索結果を表示（APIは呼び出さない）
+
+        実行中の検索は中止し、その結果で表示を上書きしないようにする
+
+        Args:
+            history: 検索履歴
+
+        Returns:
+            bool: 表示できた場合True（検索結果が保存されていない場合False）
+        """
+        try:
+            videos = self.history_service.get_history_results(history.history_id)
+        except Exception as e:
+            logger.warning(f"検索結果の復元に失敗: {e}")
+            return False
+
+        if videos is None:
+            return False
+
+        # 検索中の場合は中止して、プログレスバー・検索パネルを元に戻してから表示する
+        self._cancel_search()
+        self.search_panel.set_search_criteria(history.criteria)
+        self.result_panel.display_results(videos)
+        executed_at = history.executed_at.strftime('%Y-%m-%d %H:%M') if history.executed_at else ""
+        self.statusbar.config(
+            text=f"履歴から表示: {len(videos)}件の動画（{executed_at}時点の再生回数、APIクォータ消費なし）"
+        )
+        logger.info(f"履歴から検索結果を表示: {history.criteria.keyword}, {len(videos)}件")
+        return True
+
     def _show_about(self):
         """バージョン情報を表示"""
         messagebox.showinfo(
@@ -432,4 +639,8 @@ class MainWindow:
     def run(self):
         """アプリケーションを実行"""
         logger.info("アプリケーションを起動しました")
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            # 実行中の検索・エクスポートをキャンセル（Google Sheetsは再実行で続きから書き込める）
+            self.job_manager.shutdown()
@@ -0,0 +1,192 @@
+"""
+検索結果の表示用モデル
+
+検索結果の動画リストと、表示用に整形済みの行データを保持する。
+tkinterに依存しないため、バックグラウンドスレッドで作成できる
+"""
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.domain.models import VideoInfo
+
+# 表示カラム（ResultPanelのTreeviewのカラムと同じ順）
+COLUMNS = (
+    'title',
+    'channel',
+    'views',
+    'duration',
+    'published',
+    'type',
+    'url'
+)
+
+# 整形済みの行（COLUMNSの順の表示文字列）
+RowValues = Tuple[str, ...]
+
+# カラム → ソートキー（表示文字列ではなく動画情報の値で比較する）
+SORT_KEY_FUNCTIONS: Dict[str, Callable[[VideoInfo], Any]] = {
+    'title': lambda video: video.title.casefold(),
+    'channel': lambda video: video.channel_name.casefold(),
+    'views': lambda video: video.view_count,
+    'duration': lambda video: video.duration_seconds,
+    'published': lambda video: video.published_at.timestamp(),
+    'type': lambda video: video.is_short,
+    'url': lambda video: video.url,
+}
+
+
+def format_row(video: VideoInfo) -> RowValues:
+    """
+    動画情報を表示用の行に整形
+
+    Args:
+        video: 動画情報
+
+    Returns:
+        RowValues: 表示文字列のタプル
+    """
+    return (
+        video.title,
+        video.channel_name,
+        f"{video.view_count:,}",
+        video.duration_formatted,
+        video.published_at.strftime('%Y-%m-%d'),
+        "ショート" if video.is_short else "通常",
+        video.url
+    )
+
+
+class ResultModel:
+    """
+    検索結果の表示用モデル
+
+    動画リストを作成時に整形しておき、表示位置（0始まり）を指定して
+    行を取り出せるようにする。カラムごとのソートキーも作成時に計算しておく。
+    表示順は並び替えられるが、元の動画リストの順は変えない
+    """
+
+    def __init__(self, videos: Optional[List[VideoInfo]] = None):
+        """
+        初期化（すべての行を整形する）
+
+        Args:
+            videos: 動画情報リスト
+        """
+        self.videos: List[VideoInfo] = list(videos or [])
+        self.rows: List[RowValues] = [format_row(video) for video in self.videos]
+        self._sort_keys: Dict[str, List[Any]] = {
+            column: [key_function(video) for video in self.videos]
+            for column, key_function in SORT_KEY_FUNCTIONS.items()
+        }
+        # 表示位置 → videos・rowsのインデックス
+        self._order: List[int] = list(range(len(self.videos)))
+
+    def extend(self, other: 'ResultModel') -> None:
+        """
+        別のモデルの行を末尾に追加（整形済みの行とソートキーをそのまま使う）
+
+        追加した行は現在の表示順の末尾に並ぶ。並び替えている場合は
+        追加後にsort()で並び替え直す
+
+        Args:
+            other: 追加する行のモデル
+        """
+        offset = len(self.videos)
+        self.videos.extend(other.videos)
+        self.rows.extend(other.rows)
+        for column, keys in self._sort_keys.items():
+            keys.extend(other._sort_keys[column])
+        self._order.extend(offset + index for index in other._order)
+
+    def __len__(self) -> int:
+        """行数"""
+        return len(self._order)
+
+    def window(self, start: int, count: int) -> List[RowValues]:
+        """
+        表示位置の範囲の行を取得
+
+        Args:
+            start: 開始位置
+            count: 行数
+
+        Returns:
+            List[RowValues]: 整形済みの行（範囲外の分は含まない）
+        """
+        rows = self.rows
+        return [rows[index] for index in self._order[start:start + count]]
+
+    def video_at(self, position: int) -> Optional[VideoInfo]:
+        """
+        表示位置の動画情報を取得
+
+        Args:
+            position: 表示位置
+
+        Returns:
+            Optional[VideoInfo]: 動画情報（範囲外の場合はNone）
+        """
+        if 0 <= position < len(self._order):
+            return self.videos[self._order[position]]
+        return None
+
+    def reorder(self, order: Sequence[int]) -> None:
+        """
+        表示順を設定
+
+        Args:
+            order: 表示順に並べたvideos・rowsのインデックス
+
+        Raises:
+            ValueError: すべての行をちょうど1回ずつ含まない場合
+        """
+        if sorted(order) != list(range(len(self.videos))):
+            raise ValueError("表示順にはすべての行をちょうど1回ずつ指定してください")
+        self._order = list(order)
+
+    def position_of(self, index: int) -> Optional[int]:
+        """
+        videosのインデックスの動画の表示位置を取得
+
+        Args:
+            index: videosのインデックス
+
+        Returns:
+            Optional[int]: 表示位置（範囲外の場合はNone）
+        """
+        if 0 <= index < len(self.videos):
+            return self._order.index(index)
+        return None
+
+    def index_at(self, position: int) -> Optional[int]:
+        """
+        表示位置の動画のvideosのインデックスを取得
+
+        Args:
+            position: 表示位置
+
+        Returns:
+            Optional[int]: videosのインデックス（範囲外の場合はNone）
+        """
+        if 0 <= position < len(self._order):
+            return self._order[position]
+        return None
+
+    def sort(self, keys: Sequence[Tuple[str, bool]]) -> None:
+        """
+        複数のカラムで並び替え（安定ソート、キーが同じ行は元の動画リストの順）
+
+        Args:
+            keys: (カラム名, 降順か)のリスト（先頭が第1キー）
+
+        Raises:
+            ValueError: 不明なカラム名の場合
+        """
+        for column, _ in keys:
+            if column not in self._sort_keys:
+                raise ValueError(f"不明なカラムです: {column}")
+
+        # 安定ソートを優先度の低いキーから順に適用する
+        order = list(range(len(self.videos)))
+        for column, descending in reversed(keys):
+            order.sort(key=self._sort_keys[column].__getitem__, reverse=descending)
+        self._order = order
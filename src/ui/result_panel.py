@@ -5,19 +5,46 @@
 """
 import tkinter as tk
 from tkinter import ttk
-from typing import List, Callable, Optional
+from typing import List, Callable, Optional, Tuple
 
 from src.domain.models import VideoInfo
+from src.ui.result_model import ResultModel, COLUMNS
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# ウィジェットのサイズが決まるまでの表示行数
+DEFAULT_PAGE_SIZE = 30
+
+# 行の高さ・ヘッダーの高さ（ピクセル、テーマから取得できない場合）
+DEFAULT_ROW_HEIGHT = 20
+HEADING_HEIGHT = 25
+
+# マウスホイール1回でスクロールする行数
+WHEEL_SCROLL_ROWS = 3
+
+# カラムの見出し
+HEADINGS = {
+    'title': 'タイトル',
+    'channel': 'チャンネル',
+    'views': '再生回数',
+    'duration': '長さ',
+    'published': '公開日',
+    'type': '種類',
+    'url': 'URL',
+}
+
+# ソートに使うカラムの数の上限（第1キー〜第3キー）
+MAX_SORT_KEYS = 3
+
 
 class ResultPanel(ttk.Frame):
     """
     検索結果表示パネル
 
-    動画リストをTreeviewで表示し、ソート機能を提供する
+    動画リストをTreeviewで表示し、ソート機能を提供する。
+    Treeviewには見えている範囲の行だけを作成し、スクロールに合わせて
+    行の値を入れ替えるため、件数が多くても表示・クリアの時間は変わらない
     """
 
     def __init__(self, parent, on_export_callback: Optional[Callable[[List[VideoInfo]], None]] = None):
@@ -32,6 +59,12 @@ class ResultPanel(ttk.Frame):
         self.on_export_callback = on_export_callback
         self.videos: List[VideoInfo] = []
 
+        # 表示用モデルと、表示している範囲（先頭の表示位置と行数）
+        self.model = ResultModel()
+        self._offset = 0
+        self._page_size = DEFAULT_PAGE_SIZE
+        self._selected_position: Optional[int] = None
+
         self._create_widgets()
         logger.info("ResultPanelを初期化しました")
 
@@ -62,44 +95,28 @@ class ResultPanel(ttk.Frame):
         tree_frame = ttk.Frame(self)
         tree_frame.pack(fill=tk.BOTH, expand=True)
 
-        # スクロールバー
-        y_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL)
-        y_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # スクロールバー（縦方向はTreeviewではなくモデルの表示位置と連動）
+        self.y_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self._on_yscroll)
+        self.y_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         x_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL)
         x_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
 
         # Treeview（テーブル表示）
-        columns = (
-            'title',
-            'channel',
-            'views',
-            'duration',
-            'published',
-            'type',
-            'url'
-        )
-
         self.tree = ttk.Treeview(
             tree_frame,
-            columns=columns,
+            columns=COLUMNS,
             show='headings',
-            yscrollcommand=y_scrollbar.set,
+            selectmode='browse',
             xscrollcommand=x_scrollbar.set
         )
 
         # スクロールバーとTreeviewを連動
-        y_scrollbar.config(command=self.tree.yview)
         x_scrollbar.config(command=self.tree.xview)
 
         # カラムの設定
-        self.tree.heading('title', text='タイトル', command=lambda: self._sort_column('title'))
-        self.tree.heading('channel', text='チャンネル', command=lambda: self._sort_column('channel'))
-        self.tree.heading('views', text='再生回数', command=lambda: self._sort_column('views'))
-        self.tree.heading('duration', text='長さ', command=lambda: self._sort_column('duration'))
-        self.tree.heading('published', text='公開日', command=lambda: self._sort_column('published'))
-        self.tree.heading('type', text='種類', command=lambda: self._sort_column('type'))
-        self.tree.heading('url', text='URL', command=lambda: self._sort_column('url'))
+        for col, text in HEADINGS.items():
+            self.tree.heading(col, text=text, command=lambda col=col: self._sort_column(col))
 
         # カラムの幅設定
         self.tree.column('title', width=300, minwidth=200)
@@ -112,53 +129,46 @@ class ResultPanel(ttk.Frame):
 
         self.tree.pack(fill=tk.BOTH, expand=True)
 
+        # 行の高さ（表示行数の計算用）
+        try:
+            self._row_height = int(ttk.Style().lookup('Treeview', 'rowheight') or DEFAULT_ROW_HEIGHT)
+        except (ValueError, tk.TclError):
+            self._row_height = DEFAULT_ROW_HEIGHT
+
         # ダブルクリックでURLを開く
         self.tree.bind('<Double-1>', self._on_double_click)
 
-        # ソート用の変数
-        self._sort_reverse = {}
+        # 選択・サイズ変更・スクロール操作
+        self.tree.bind('<<TreeviewSelect>>', self._on_select)
+        self.tree.bind('<Configure>', self._on_resize)
+        self.tree.bind('<MouseWheel>', self._on_mousewheel)
+        self.tree.bind('<Button-4>', self._on_mousewheel)
+        self.tree.bind('<Button-5>', self._on_mousewheel)
+        for key in ('<Up>', '<Down>', '<Prior>', '<Next>', '<Home>', '<End>'):
+            self.tree.bind(key, self._on_key)
+
+        # ソートキー（(カラム名, 降順か)のリスト、先頭が第1キー）
+        self._sort_keys: List[Tuple[str, bool]] = []
 
-    def display_results(self, videos: List[VideoInfo]):
+    def display_results(self, videos: List[VideoInfo], model: Optional[ResultModel] = None):
         """
         検索結果を表示
 
         Args:
             videos: 動画情報リスト
+            model: videosから作成済みの表示用モデル
+                    （バックグラウンドスレッドで整形しておく場合、指定しない場合はここで作成）
         """
         self.videos = videos
+        self.model = model if model is not None else ResultModel(videos)
+        self._offset = 0
+        self._selected_position = None
+        self._sort_keys = []
+        self._update_headings()
 
-        # 既存のアイテムをクリア
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        # 動画情報を追加
-        for video in videos:
-            # 再生回数をカンマ区切りでフォーマット
-            views_formatted = f"{video.view_count:,}"
-
-            # 動画の長さをフォーマット
-            duration_formatted = video.duration_formatted
-
-            # 公開日をフォーマット
-            published_formatted = video.published_at.strftime('%Y-%m-%d')
-
-            # 動画タイプ
-            video_type = "ショート" if video.is_short else "通常"
-
-            self.tree.insert(
-                '',
-                tk.END,
-                values=(
-                    video.title,
-                    video.channel_name,
-                    views_formatted,
-                    duration_formatted,
-                    published_formatted,
-                    video_type,
-                    video.url
-                ),
-                tags=(video.video_id,)
-            )
+        # 既存の行をまとめて削除してから、見えている範囲の行を作成
+        self.tree.delete(*self.tree.get_children())
+        self._render()
 
         # 結果件数を更新
         self.result_label.config(text=f"検索結果: {len(videos)}件")
@@ -170,80 +180,235 @@ class ResultPanel(ttk.Frame):
 
         logger.info(f"{len(videos)}件の検索結果を表示しました")
 
-    def _sort_column(self, col: str):
+    def append_results(self, videos: List[VideoInfo], model: Optional[ResultModel] = None):
         """
-        カラムでソート
+        検索中に取得した動画情報を末尾に追加して表示
+
+        ソート中の場合は追加後に並び替え直す。エクスポートは検索の完了まで無効にする
 
         Args:
-            col: カラム名
+            videos: 追加する動画情報リスト
+            model: videosから作成済みの表示用モデル
+                    （バックグラウンドスレッドで整形しておく場合、指定しない場合はここで作成）
         """
-        # ソート順を切り替え
-        reverse = self._sort_reverse.get(col, False)
-        self._sort_reverse[col] = not reverse
-
-        # データを取得してソート
-        data = [(self.tree.set(child, col), child) for child in self.tree.get_children('')]
-
-        # 数値カラムの場合は数値としてソート
-        if col in ['views', 'duration']:
-            # カンマを削除して数値に変換
-            data.sort(
-                key=lambda x: self._parse_number(x[0]),
-                reverse=reverse
-            )
+        if not videos:
+            return
+
+        self.videos = self.videos + videos
+        self.model.extend(model if model is not None else ResultModel(videos))
+
+        if self._sort_keys:
+            # 選択中の動画は並び替え後も選択したままにする
+            selected_index = None
+            if self._selected_position is not None:
+                selected_index = self.model.index_at(self._selected_position)
+            self.model.sort(self._sort_keys)
+            if selected_index is not None:
+                self._selected_position = self.model.position_of(selected_index)
+        self._render()
+
+        self.result_label.config(text=f"検索結果: {len(self.videos)}件（取得中）")
+        if hasattr(self, 'export_button'):
+            self.export_button.config(state=tk.DISABLED)
+
+        logger.debug(f"{len(videos)}件の検索結果を追加しました（計{len(self.videos)}件）")
+
+    def finish_results(self, videos: List[VideoInfo]):
+        """
+        検索の完了時に最終的な結果を表示
+
+        追加済みの行が結果と一致する場合は、行を作り直さずに件数とエクスポートボタンのみ更新する
+
+        Args:
+            videos: 動画情報リスト
+        """
+        if [video.video_id for video in self.model.videos] != [video.video_id for video in videos]:
+            self.display_results(videos)
+            return
+
+        self.videos = videos
+        self.result_label.config(text=f"検索結果: {len(videos)}件")
+        if self.on_export_callback and hasattr(self, 'export_button'):
+            state = tk.NORMAL if videos else tk.DISABLED
+            self.export_button.config(state=state)
+
+        logger.info(f"{len(videos)}件の検索結果を表示しました")
+
+    def _render(self):
+        """表示している範囲の行をTreeviewに反映"""
+        total = len(self.model)
+        self._offset = max(0, min(self._offset, total - self._page_size))
+        rows = self.model.window(self._offset, self._page_size)
+
+        # 行数の過不足を調整（行のIDは表示範囲内の位置）
+        items = self.tree.get_children()
+        for slot in range(len(items), len(rows)):
+            self.tree.insert('', tk.END, iid=str(slot))
+        if len(items) > len(rows):
+            self.tree.delete(*items[len(rows):])
+
+        for slot, values in enumerate(rows):
+            self.tree.item(str(slot), values=values)
+
+        # 選択中の動画が表示範囲内にあれば選択状態にする
+        position = self._selected_position
+        if position is not None and self._offset <= position < self._offset + len(rows):
+            self.tree.selection_set(str(position - self._offset))
+        elif self.tree.selection():
+            self.tree.selection_remove(*self.tree.selection())
+
+        # スクロールバーの位置
+        if total:
+            self.y_scrollbar.set(self._offset / total, (self._offset + len(rows)) / total)
         else:
-            data.sort(reverse=reverse)
+            self.y_scrollbar.set(0.0, 1.0)
 
-        # ソート後の順序で並び替え
-        for index, (_, child) in enumerate(data):
-            self.tree.move(child, '', index)
+    def _scroll_to(self, offset: int):
+        """
+        表示範囲の先頭を移動
 
-        logger.info(f"カラム '{col}' でソートしました（降順={reverse}）")
+        Args:
+            offset: 先頭の表示位置
+        """
+        offset = max(0, min(offset, len(self.model) - self._page_size))
+        if offset != self._offset:
+            self._offset = offset
+            self._render()
 
-    def _parse_number(self, value: str) -> int:
+    def _on_yscroll(self, *args):
         """
-        数値文字列を整数に変換
+        縦スクロールバーの操作
 
         Args:
-            value: 数値文字列（カンマ区切り可）
+            *args: ('moveto', 位置) または ('scroll', 量, 'units' | 'pages')
+        """
+        if args[0] == 'moveto':
+            self._scroll_to(int(float(args[1]) * len(self.model)))
+        elif args[0] == 'scroll':
+            step = self._page_size if args[2] == 'pages' else 1
+            self._scroll_to(self._offset + int(args[1]) * step)
 
-        Returns:
-            int: 整数値
+    def _on_mousewheel(self, event):
         """
-        try:
-            # カンマを削除
-            cleaned = value.replace(',', '')
-            # 時間形式（HH:MM:SS）の場合は秒数に変換
-            if ':' in cleaned:
-                parts = cleaned.split(':')
-                if len(parts) == 2:  # MM:SS
-                    return int(parts[0]) * 60 + int(parts[1])
-                elif len(parts) == 3:  # HH:MM:SS
-                    return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-            return int(cleaned)
-        except (ValueError, AttributeError):
-            return 0
+        マウスホイールでスクロール
 
-    def _on_double_click(self, event):
+        Args:
+            event: イベントオブジェクト
         """
-        アイテムがダブルクリックされた時の処理
+        if event.num == 4 or getattr(event, 'delta', 0) > 0:
+            self._scroll_to(self._offset - WHEEL_SCROLL_ROWS)
+        else:
+            self._scroll_to(self._offset + WHEEL_SCROLL_ROWS)
+        return "break"
+
+    def _on_resize(self, event):
+        """
+        Treeviewのサイズ変更に合わせて表示行数を変更
 
         Args:
             event: イベントオブジェクト
         """
-        item = self.tree.selection()
-        if not item:
-            return
+        page_size = max(1, (event.height - HEADING_HEIGHT) // self._row_height)
+        if page_size != self._page_size:
+            self._page_size = page_size
+            self._render()
 
-        # 選択されたアイテムのvideo_idを取得
-        tags = self.tree.item(item[0], 'tags')
-        if not tags:
-            return
+    def _on_key(self, event):
+        """
+        矢印キー・PageUp/PageDown・Home/Endで選択を移動
+
+        Args:
+            event: イベントオブジェクト
+        """
+        total = len(self.model)
+        if not total:
+            return "break"
+
+        current = self._selected_position if self._selected_position is not None else self._offset
+        position = {
+            'Up': current - 1,
+            'Down': current + 1,
+            'Prior': current - self._page_size,
+            'Next': current + self._page_size,
+            'Home': 0,
+            'End': total - 1,
+        }[event.keysym]
+        self._select_position(max(0, min(position, total - 1)))
+        return "break"
+
+    def _select_position(self, position: int):
+        """
+        表示位置の行を選択し、表示範囲外ならスクロール
+
+        Args:
+            position: 表示位置
+        """
+        self._selected_position = position
+        if position < self._offset:
+            self._offset = position
+        elif position >= self._offset + self._page_size:
+            self._offset = position - self._page_size + 1
+        self._render()
+        self.tree.focus(str(position - self._offset))
+
+    def _on_select(self, event):
+        """
+        行が選択された時に選択中の表示位置を記録
 
-        video_id = tags[0]
+        Args:
+            event: イベントオブジェクト
+        """
+        selection = self.tree.selection()
+        if selection:
+            self._selected_position = self._offset + int(selection[0])
 
-        # 対応する動画を探す
-        video = next((v for v in self.videos if v.video_id == video_id), None)
+    def _sort_column(self, col: str):
+        """
+        カラムでソート
+
+        クリックしたカラムを第1キーにし、それまでのキーは第2キー以降として残す。
+        第1キーのカラムを再度クリックした場合は昇順・降順を切り替える
+
+        Args:
+            col: カラム名
+        """
+        if self._sort_keys and self._sort_keys[0][0] == col:
+            self._sort_keys[0] = (col, not self._sort_keys[0][1])
+        else:
+            self._sort_keys = [(col, False)] + [key for key in self._sort_keys if key[0] != col]
+            del self._sort_keys[MAX_SORT_KEYS:]
+
+        # 選択中の動画はソート後も選択したままにする
+        selected_index = None
+        if self._selected_position is not None:
+            selected_index = self.model.index_at(self._selected_position)
+
+        self.model.sort(self._sort_keys)
+
+        if selected_index is not None:
+            self._select_position(self.model.position_of(selected_index))
+        else:
+            self._render()
+        self._update_headings()
+
+        logger.info(f"ソートしました: {self._sort_keys}")
+
+    def _update_headings(self):
+        """第1キーのカラムの見出しにソート方向を表示"""
+        primary = self._sort_keys[0] if self._sort_keys else None
+        for col, text in HEADINGS.items():
+            if primary and primary[0] == col:
+                text += " ▼" if primary[1] else " ▲"
+            self.tree.heading(col, text=text)
+
+    def _on_double_click(self, event):
+        """
+        アイテムがダブルクリックされた時の処理
+
+        Args:
+            event: イベントオブジェクト
+        """
+        video = self.get_selected_video()
         if video:
             # ブラウザでURLを開く
             import webbrowser
@@ -259,8 +424,13 @@ class ResultPanel(ttk.Frame):
     def clear(self):
         """表示をクリア"""
         self.videos = []
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.model = ResultModel()
+        self._offset = 0
+        self._selected_position = None
+        self._sort_keys = []
+        self._update_headings()
+        self.tree.delete(*self.tree.get_children())
+        self.y_scrollbar.set(0.0, 1.0)
         self.result_label.config(text="検索結果: 0件")
         if hasattr(self, 'export_button'):
             self.export_button.config(state=tk.DISABLED)
@@ -273,13 +443,7 @@ class ResultPanel(ttk.Frame):
         Returns:
             Optional[VideoInfo]: 選択されている動画情報（未選択の場合はNone）
         """
-        item = self.tree.selection()
-        if not item:
-            return None
-
-        tags = self.tree.item(item[0], 'tags')
-        if not tags:
+        if self._selected_position is None:
             return None
 
-        video_id = tags[0]
-        return next((v for v in self.videos if v.video_id == video_id), None)
+        return self.model.video_at(self._selected_position)
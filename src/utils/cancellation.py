@@ -0,0 +1,44 @@
+"""
+キャンセルトークン
+
+バックグラウンドの処理に中止を伝えるためのトークンを提供します。
+処理側はAPI呼び出しの合間などの区切りでトークンを確認し、中止されていれば打ち切ります。
+"""
+
+import threading
+
+
+class OperationCancelledError(Exception):
+    """処理がキャンセルされた"""
+    pass
+
+
+class CancellationToken:
+    """
+    キャンセルトークン
+
+    cancel()はどのスレッドから呼び出してもよい。一度キャンセルしたトークンは元に戻らない
+    """
+
+    def __init__(self):
+        """初期化"""
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """キャンセルする"""
+        self._event.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """キャンセルされているか"""
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        """
+        キャンセルされていれば例外を送出
+
+        Raises:
+            OperationCancelledError: キャンセルされている場合
+        """
+        if self._event.is_set():
+            raise OperationCancelledError("処理がキャンセルされました")
@@ -0,0 +1,194 @@
+"""
+バックグラウンドジョブ管理
+
+UIをブロックしないための処理（検索・エクスポート）を、上限付きのワーカープールで実行します。
+ジョブごとにキャンセルトークンを発行し、同じ名前の新しいジョブで古いジョブを置き換えられます。
+"""
+
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from src.utils.cancellation import CancellationToken
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# ワーカースレッド数のデフォルト
+DEFAULT_MAX_WORKERS = 4
+
+
+@dataclass(eq=False)
+class Job:
+    """
+    実行中（または実行待ち）のジョブ
+
+    Attributes:
+        name: ジョブ名（置き換えの単位）
+        future: 実行結果
+        token: ジョブに渡したキャンセルトークン
+    """
+    name: str
+    future: Future = field(repr=False)
+    token: CancellationToken = field(repr=False)
+
+    def cancel(self) -> None:
+        """ジョブをキャンセル（実行待ちの場合は実行しない）"""
+        self.token.cancel()
+        self.future.cancel()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """キャンセルされているか"""
+        return self.token.is_cancelled
+
+
+class JobManager:
+    """
+    バックグラウンドジョブ管理
+
+    ジョブは上限付きのワーカープールで実行し、呼び出すたびにスレッドを生成しない。
+    supersede=Trueで投入したジョブは、同じ名前の実行中のジョブをキャンセルして置き換える。
+    supersede=Falseの場合は同じ名前のジョブを並べて実行し、すべてをキャンセル・終了処理の対象にする
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        初期化
+
+        Args:
+            max_workers: ワーカースレッド数の上限
+                    指定しない場合は環境変数JOB_MAX_WORKERSまたは4
+        """
+        if max_workers is None:
+            max_workers = int(os.getenv("JOB_MAX_WORKERS", str(DEFAULT_MAX_WORKERS)))
+        self.max_workers = max(1, max_workers)
+
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="job")
+        self._lock = threading.Lock()
+        # ジョブ名ごとの未完了のジョブ（投入順）
+        self._jobs: Dict[str, List[Job]] = {}
+
+        logger.info(f"JobManagerを初期化しました: ワーカー数={self.max_workers}")
+
+    def submit(self, name: str, func: Callable[..., Any], *args, supersede: bool = False) -> Job:
+        """
+        ジョブを投入
+
+        funcは先頭の引数にキャンセルトークンを受け取り、処理の区切りで確認する
+
+        Args:
+            name: ジョブ名
+            func: 実行する関数（func(token, *args)の形で呼び出す）
+            *args: 関数の引数
+            supersede: Trueの場合は同じ名前の実行中のジョブをすべてキャンセルする
+
+        Returns:
+            Job: 投入したジョブ
+        """
+        token = CancellationToken()
+
+        with self._lock:
+            jobs = self._jobs.setdefault(name, [])
+            previous = list(jobs) if supersede else []
+            future = self._executor.submit(self._run, token, func, *args)
+            job = Job(name=name, future=future, token=token)
+            jobs.append(job)
+
+        # 実行待ちのFutureのキャンセルは完了通知をその場で呼び出すため、ロックの外で行う
+        for previous_job in previous:
+            if not previous_job.is_cancelled:
+                previous_job.cancel()
+                logger.info(f"実行中のジョブをキャンセルしました: {name}")
+
+        future.add_done_callback(lambda _future: self._finished(job))
+        return job
+
+    def _run(self, token: CancellationToken, func: Callable[..., Any], *args) -> Any:
+        """
+        ジョブを実行（ワーカースレッド）
+
+        実行待ちの間にキャンセルされたジョブは実行しない
+
+        Args:
+            token: キャンセルトークン
+            func: 実行する関数
+            *args: 関数の引数
+
+        Returns:
+            Any: 関数の戻り値
+        """
+        token.raise_if_cancelled()
+        return func(token, *args)
+
+    def _finished(self, job: Job) -> None:
+        """
+        完了したジョブを実行中のジョブから外す
+
+        Args:
+            job: 完了したジョブ
+        """
+        with self._lock:
+            jobs = self._jobs.get(job.name)
+            if jobs is not None and job in jobs:
+                jobs.remove(job)
+                if not jobs:
+                    del self._jobs[job.name]
+
+    def jobs(self, name: str) -> List[Job]:
+        """
+        実行中（または実行待ち）のジョブをすべて取得
+
+        Args:
+            name: ジョブ名
+
+        Returns:
+            List[Job]: 未完了のジョブ（投入順）
+        """
+        with self._lock:
+            jobs = list(self._jobs.get(name, []))
+        # 完了通知の前でも、完了したジョブは実行中として扱わない
+        return [job for job in jobs if not job.future.done()]
+
+    def current(self, name: str) -> Optional[Job]:
+        """
+        実行中（または実行待ち）のジョブを取得
+
+        Args:
+            name: ジョブ名
+
+        Returns:
+            Optional[Job]: 最後に投入した未完了のジョブ（ない場合はNone）
+        """
+        jobs = self.jobs(name)
+        return jobs[-1] if jobs else None
+
+    def cancel(self, name: str) -> bool:
+        """
+        実行中のジョブをすべてキャンセル
+
+        Args:
+            name: ジョブ名
+
+        Returns:
+            bool: キャンセルしたジョブがあればTrue
+        """
+        cancelled = False
+        for job in self.jobs(name):
+            if not job.is_cancelled:
+                job.cancel()
+                cancelled = True
+        if cancelled:
+            logger.info(f"ジョブをキャンセルしました: {name}")
+        return cancelled
+
+    def shutdown(self) -> None:
+        """すべてのジョブをキャンセルし、ワーカープールを終了（実行中のジョブの終了は待たない）"""
+        with self._lock:
+            jobs = [job for name_jobs in self._jobs.values() for job in name_jobs]
+        for job in jobs:
+            job.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        logger.info("JobManagerを終了しました")
@@ -98,11 +98,13 @@ try:
     if len(recent) > 0:
         print(f"  ✓ HistoryService: 履歴取得成功")
 
-    # クリーンアップ
-    import os
-    if os.path.exists("test_core_check.db"):
-        os.remove("test_core_check.db")
-        print(f"  ✓ テストデータベースをクリーンアップ")
+    # クリーンアップ（接続を閉じてから、WALの-wal/-shmファイルも含めて削除）
+    history_service.close()
+    preset_service.close()
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists("test_core_check.db" + suffix):
+            os.remove("test_core_check.db" + suffix)
+    print(f"  ✓ テストデータベースをクリーンアップ")
 
 except Exception as e:
     print(f"  ❌ データベースサービスエラー: {e}")
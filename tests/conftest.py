@@ -0,0 +1,100 @@
+"""
+テスト共通設定
+"""
+import os
+import tempfile
+from datetime import datetime
+import pytest
+
+from src.database.connection import close_all_connections, close_connection_manager
+from src.domain.models import VideoInfo
+from src.infrastructure.youtube_client import clear_service_cache
+
+
+def make_video(video_id: str = "vid1", view_count: int = 1000, **overrides) -> VideoInfo:
+    """
+    テスト用の動画情報を生成
+
+    Args:
+        video_id: 動画ID
+        view_count: 再生回数
+        **overrides: 既定値を上書きするVideoInfoの属性
+
+    Returns:
+        VideoInfo: 動画情報
+    """
+    values = dict(
+        video_id=video_id,
+        title=f"title {video_id}",
+        url=f"https://www.youtube.com/watch?v={video_id}",
+        channel_name="channel",
+        channel_id="UC1234567890123456789012",
+        view_count=view_count,
+        like_count=10,
+        comment_count=1,
+        published_at=datetime(2024, 1, 1),
+        duration_seconds=120,
+        is_short=False
+    )
+    values.update(overrides)
+    return VideoInfo(**values)
+
+
+def make_video_item(video_id: str, view_count: int = 1000, duration: str = "PT3M30S") -> dict:
+    """
+    videos.list APIのレスポンスアイテムを生成
+
+    Args:
+        video_id: 動画ID
+        view_count: 再生回数
+        duration: 動画の長さ（ISO 8601形式）
+
+    Returns:
+        dict: レスポンスアイテム
+    """
+    return {
+        "id": video_id,
+        "snippet": {
+            "title": f"Video {video_id}",
+            "channelTitle": "Test Channel",
+            "channelId": "UC1234567890123456789012",
+            "publishedAt": "2023-01-01T00:00:00Z",
+            "description": "",
+            "thumbnails": {}
+        },
+        "statistics": {
+            "viewCount": str(view_count),
+            "likeCount": "0",
+            "commentCount": "0"
+        },
+        "contentDetails": {
+            "duration": duration
+        }
+    }
+
+
+@pytest.fixture(autouse=True)
+def _clear_youtube_service_cache():
+    """テストごとにbuildのモックが使われるよう、共有サービスオブジェクトを破棄する"""
+    clear_service_cache()
+    yield
+    clear_service_cache()
+
+
+@pytest.fixture(autouse=True)
+def _close_database_connections():
+    """一時データベースを使い回さないよう、テストごとに接続管理を破棄する"""
+    yield
+    close_all_connections()
+
+
+@pytest.fixture
+def db_path():
+    """一時データベースファイル（削除前に接続を閉じ、WALの-wal/-shmファイルも削除する）"""
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.db') as f:
+        path = f.name
+    yield path
+    close_connection_manager(path)
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.unlink(path + suffix)
@@ -0,0 +1,112 @@
+"""
+APIキープールのテスト
+"""
+import json
+import pytest
+from datetime import date
+from unittest.mock import Mock, patch, MagicMock
+from googleapiclient.errors import HttpError
+
+from src.infrastructure import api_key_pool
+from src.infrastructure.api_key_pool import ApiKeyPool, load_api_keys_from_env
+from src.infrastructure.youtube_client import YouTubeClient, QuotaExceededError
+
+
+def _http_error(status, reason):
+    """指定したステータス・理由のHttpErrorを生成"""
+    resp = Mock(status=status, reason="Forbidden")
+    content = json.dumps({"error": {"errors": [{"reason": reason}]}}).encode("utf-8")
+    return HttpError(resp, content)
+
+
+class TestApiKeyPool:
+    """ApiKeyPoolのテスト"""
+
+    def test_round_robin(self):
+        """キーを順番に割り当てる"""
+        pool = ApiKeyPool(["a", "b", "c"])
+        assert [pool.acquire() for _ in range(4)] == ["a", "b", "c", "a"]
+
+    def test_mark_exhausted_until_reset(self, monkeypatch):
+        """クォータ超過のキーは太平洋時間の日付が変わるまで除外"""
+        monkeypatch.setattr(api_key_pool, "pacific_today", lambda: date(2024, 1, 1))
+        pool = ApiKeyPool(["a", "b"])
+        pool.mark_exhausted("a")
+
+        assert [pool.acquire() for _ in range(3)] == ["b", "b", "b"]
+
+        monkeypatch.setattr(api_key_pool, "pacific_today", lambda: date(2024, 1, 2))
+        assert pool.available_keys() == ["a", "b"]
+
+    def test_rate_limit_cooldown(self):
+        """レート制限のキーは一定時間のみ除外"""
+        pool = ApiKeyPool(["a", "b"], rate_limit_cooldown=0)
+        pool.mark_rate_limited("a")
+        assert pool.available_keys() == ["a", "b"]
+
+        pool = ApiKeyPool(["a", "b"], rate_limit_cooldown=60)
+        pool.mark_rate_limited("a")
+        assert pool.available_keys() == ["b"]
+
+    def test_all_exhausted(self):
+        """すべてのキーが除外されたらNone"""
+        pool = ApiKeyPool(["a"])
+        pool.mark_exhausted("a")
+        assert pool.acquire() is None
+
+    @patch.dict('os.environ', {'YOUTUBE_API_KEY': 'k1', 'YOUTUBE_API_KEYS': 'k2, k1,,k3'}, clear=True)
+    def test_load_api_keys_from_env(self):
+        """環境変数から重複なく読み込む"""
+        assert load_api_keys_from_env() == ["k1", "k2", "k3"]
+
+
+class TestYouTubeClientKeyRotation:
+    """YouTubeClientのキーローテーションのテスト"""
+
+    @patch('src.infrastructure.youtube_client.build')
+    def test_retry_on_next_key(self, mock_build):
+        """quotaExceededのキーを除外し、次のキーで再実行する"""
+        services = {}
+
+        def build_side_effect(service_name, version, developerKey, **kwargs):
+            service = MagicMock()
+            request = Mock()
+            if developerKey == "key_a":
+                request.execute.side_effect = _http_error(403, "quotaExceeded")
+            else:
+                request.execute.return_value = {"items": [{"id": {"videoId": "abcdefghijk"}}]}
+            service.search.return_value.list.return_value = request
+            services[developerKey] = service
+            return service
+
+        mock_build.side_effect = build_side_effect
+        client = YouTubeClient(api_keys=["key_a", "key_b"])
+
+        response = client._execute(lambda youtube: youtube.search().list(q="test"), 100)
+
+        assert response["items"][0]["id"]["videoId"] == "abcdefghijk"
+        assert client.key_pool.available_keys() == ["key_b"]
+
+    @patch('src.infrastructure.youtube_client.build')
+    def test_all_keys_exhausted(self, mock_build):
+        """すべてのキーがクォータ超過ならQuotaExceededError"""
+        request = Mock()
+        request.execute.side_effect = _http_error(403, "quotaExceeded")
+        mock_build.return_value.search.return_value.list.return_value = request
+        client = YouTubeClient(api_keys=["key_a", "key_b"])
+
+        with pytest.raises(QuotaExceededError):
+            client._execute(lambda youtube: youtube.search().list(q="test"), 100)
+        assert request.execute.call_count == 2
+
+    @patch('src.infrastructure.youtube_client.build')
+    def test_other_errors_not_retried(self, mock_build):
+        """クォータ以外のエラーはそのまま送出"""
+        request = Mock()
+        request.execute.side_effect = _http_error(400, "badRequest")
+        mock_build.return_value.search.return_value.list.return_value = request
+        client = YouTubeClient(api_keys=["key_a", "key_b"])
+
+        with pytest.raises(HttpError):
+            client._execute(lambda youtube: youtube.search().list(q="test"), 100)
+        assert client.key_pool.available_keys() == ["key_a", "key_b"]
@@ -0,0 +1,340 @@
+"""
+非同期YouTubeクライアント・非同期検索サービスのテスト
+
+注意: これらのテストはフェイクのHTTPセッションを使用し、実際のAPIを呼び出しません
+"""
+import asyncio
+import json
+import sqlite3
+import threading
+import pytest
+from unittest.mock import Mock, patch
+
+from src.domain.models import SearchCriteria
+from src.infrastructure.async_youtube_client import AsyncYouTubeClient, YouTubeHTTPError
+from src.infrastructure.retry_policy import RetryPolicy
+from src.infrastructure.youtube_client import QuotaExceededError
+from src.application.async_video_search_service import AsyncVideoSearchService
+from tests.conftest import make_video_item
+
+
+class FakeResponse:
+    """aiohttpのレスポンスの代わり"""
+
+    def __init__(self, session, status, content):
+        self.session = session
+        self.status = status
+        self.content = content
+
+    async def __aenter__(self):
+        self.session.in_flight += 1
+        self.session.max_in_flight = max(self.session.max_in_flight, self.session.in_flight)
+        await asyncio.sleep(0)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.session.in_flight -= 1
+
+    async def text(self):
+        if isinstance(self.content, str):
+            return self.content
+        return json.dumps(self.content)
+
+
+class FakeSession:
+    """
+    aiohttp.ClientSessionの代わり
+
+    search.listはキーワードごとに pages（ページ数）× per_page 件の動画IDを返し、
+    videos.listは指定されたIDの動画を返す。errorsに(ステータス, 理由)を入れると先頭から順に返す
+    （理由がNoneの場合はJSONではないHTMLの本文を返す）
+    """
+
+    def __init__(self, pages=3, per_page=50, view_counts=None):
+        self.pages = pages
+        self.per_page = per_page
+        self.view_counts = view_counts or {}
+        self.errors = []
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def get(self, url, params=None):
+        self.requests.append((url.rsplit("/", 1)[-1], dict(params)))
+        if self.errors:
+            status, reason = self.errors.pop(0)
+            if reason is None:
+                return FakeResponse(self, status, f"<html><body>Error {status}</body></html>")
+            return FakeResponse(self, status, {"error": {"code": status, "errors": [{"reason": reason}]}})
+
+        if url.endswith("/search"):
+            page = int(params.get("pageToken", "0"))
+            content = {"items": [
+                {"id": {"videoId": f"{params['q']}-p{page}v{i:02d}"}} for i in range(self.per_page)
+            ]}
+            if page + 1 < self.pages:
+                content["nextPageToken"] = str(page + 1)
+        else:
+            content = {"items": [
+                make_video_item(video_id, self.view_counts.get(video_id, 1000))
+                for video_id in params["id"].split(",")
+            ]}
+        return FakeResponse(self, 200, content)
+
+    def endpoints(self):
+        return [endpoint for endpoint, _ in self.requests]
+
+
+def _client(session, **kwargs):
+    kwargs.setdefault("retry_policy", RetryPolicy(base_delay=0.0, deadline=None))
+    return AsyncYouTubeClient(api_key="test_api_key", session=session, **kwargs)
+
+
+class TestAsyncYouTubeClient:
+    """AsyncYouTubeClientのテスト"""
+
+    def test_search_videos(self):
+        """ページをまたいで検索順に結果を返し、max_results件で打ち切る"""
+        session = FakeSession(pages=3)
+        videos = asyncio.run(_client(session).search_videos(SearchCriteria(keyword="kw", max_results=120)))
+
+        assert len(videos) == 120
+        assert videos[0].video_id == "kw-p0v00"
+        assert videos[-1].video_id == "kw-p2v19"
+        assert session.endpoints().count("search") == 3
+        assert session.endpoints().count("videos") == 3
+
+        search_params = session.requests[0][1]
+        assert search_params["key"] == "test_api_key"
+        assert search_params["q"] == "kw"
+        assert search_params["maxResults"] == 50
+
+    def test_filtering_shared(self):
+        """同期クライアントと同じフィルタリングを適用"""
+        session = FakeSession(pages=1, per_page=4, view_counts={"kw-p0v02": 5000, "kw-p0v03": 9000})
+        criteria = SearchCriteria(keyword="kw", min_view_count=2000)
+        videos = asyncio.run(_client(session).search_videos(criteria))
+
+        assert [v.video_id for v in videos] == ["kw-p0v02", "kw-p0v03"]
+
+    def test_iter_batches_and_videos(self):
+        """ページごと・1件ずつの非同期イテレータ"""
+        session = FakeSession(pages=2, per_page=3)
+        client = _client(session)
+        criteria = SearchCriteria(keyword="kw")
+
+        async def collect():
+            batches = [[v.video_id for v in batch] async for batch in client.iter_batches(criteria)]
+            video_ids = [video.video_id async for video in client.iter_videos(criteria)]
+            return batches, video_ids
+
+        batches, video_ids = asyncio.run(collect())
+        assert batches == [["kw-p0v00", "kw-p0v01", "kw-p0v02"], ["kw-p1v00", "kw-p1v01", "kw-p1v02"]]
+        assert video_ids == [video_id for batch in batches for video_id in batch]
+
+    def test_iter_stop_early(self):
+        """途中で反復をやめた場合は残りのページを取得しない"""
+        session = FakeSession(pages=5, per_page=3)
+        client = _client(session)
+
+        async def first_batch():
+            iterator = client.iter_batches(SearchCriteria(keyword="kw"))
+            batch = await iterator.__anext__()
+            await iterator.aclose()
+            return batch
+
+        batch = asyncio.run(first_batch())
+        assert len(batch) == 3
+        assert session.endpoints().count("search") == 2
+
+    def test_quota_exceeded_switches_key(self):
+        """quotaExceededのキーは除外して次のキーで再実行"""
+        session = FakeSession(pages=1, per_page=2)
+        session.errors = [(403, "quotaExceeded")]
+        client = AsyncYouTubeClient(
+            api_keys=["key1", "key2"], session=session, retry_policy=RetryPolicy(base_delay=0.0, deadline=None)
+        )
+
+        videos = asyncio.run(client.search_videos(SearchCriteria(keyword="kw")))
+        assert len(videos) == 2
+        assert session.requests[0][1]["key"] == "key1"
+        assert session.requests[1][1]["key"] == "key2"
+        assert client.key_pool.available_keys() == ["key2"]
+
+    def test_all_keys_exhausted(self):
+        """すべてのキーがクォータ超過の場合はQuotaExceededError"""
+        session = FakeSession()
+        session.errors = [(403, "quotaExceeded")]
+
+        with pytest.raises(QuotaExceededError):
+            asyncio.run(_client(session).search_videos(SearchCriteria(keyword="kw")))
+
+    def test_retry_on_server_error(self):
+        """5xxはリトライポリシーに従って再試行"""
+        session = FakeSession(pages=1, per_page=2)
+        session.errors = [(503, "backendError")]
+
+        videos = asyncio.run(_client(session).search_videos(SearchCriteria(keyword="kw")))
+        assert len(videos) == 2
+        assert session.endpoints() == ["search", "search", "videos"]
+
+    def test_client_error_not_retried(self):
+        """4xxは再試行せずYouTubeHTTPError"""
+        session = FakeSession()
+        session.errors = [(400, "badRequest")]
+
+        with pytest.raises(YouTubeHTTPError) as exc_info:
+            asyncio.run(_client(session).search_videos(SearchCriteria(keyword="kw")))
+        assert exc_info.value.status == 400
+        assert session.endpoints() == ["search"]
+
+    def test_retry_on_non_json_server_error(self):
+        """本文がJSONではない5xxもクォータを記録してリトライポリシーに従って再試行"""
+        session = FakeSession(pages=1, per_page=2)
+        session.errors = [(502, None)]
+        quota_tracker = Mock()
+        quota_tracker.get_remaining.return_value = 10000
+
+        videos = asyncio.run(_client(session, quota_tracker=quota_tracker).search_videos(SearchCriteria(keyword="kw")))
+        assert len(videos) == 2
+        assert session.endpoints() == ["search", "search", "videos"]
+        assert quota_tracker.record.call_count == 3
+
+    def test_quota_recorded_off_event_loop(self):
+        """クォータの記録・残量の取得はイベントループ外のスレッドで行い、記録の失敗では検索を失敗させない"""
+        session = FakeSession(pages=1, per_page=2)
+        threads = []
+        quota_tracker = Mock()
+
+        def get_remaining(api_key):
+            threads.append(threading.get_ident())
+            return 10000
+
+        def record(api_key, cost):
+            threads.append(threading.get_ident())
+            raise sqlite3.OperationalError("database is locked")
+
+        quota_tracker.get_remaining.side_effect = get_remaining
+        quota_tracker.record.side_effect = record
+
+        async def search():
+            return threading.get_ident(), await _client(session, quota_tracker=quota_tracker).search_videos(
+                SearchCriteria(keyword="kw")
+            )
+
+        loop_thread, videos = asyncio.run(search())
+        assert len(videos) == 2
+        assert session.endpoints() == ["search", "videos"]
+        assert len(threads) == 3
+        assert loop_thread not in threads
+
+    def test_non_json_client_error_not_retried(self):
+        """本文がJSONではない4xxは再試行せずYouTubeHTTPError"""
+        session = FakeSession()
+        session.errors = [(404, None)]
+
+        with pytest.raises(YouTubeHTTPError) as exc_info:
+            asyncio.run(_client(session).search_videos(SearchCriteria(keyword="kw")))
+        assert exc_info.value.status == 404
+        assert exc_info.value.reasons == set()
+        assert session.endpoints() == ["search"]
+
+    def test_quota_budget_limits_pages(self):
+        """クォータ残量・max_unitsで取得できるページ数までに抑える"""
+        quota_tracker = Mock()
+        quota_tracker.get_remaining.return_value = 202
+        criteria = SearchCriteria(keyword="kw", max_results=200)
+
+        session = FakeSession(pages=4)
+        videos = asyncio.run(_client(session, quota_tracker=quota_tracker).search_videos(criteria))
+        assert len(videos) == 100
+        assert session.endpoints().count("search") == 2
+
+        session = FakeSession(pages=4)
+        videos = asyncio.run(_client(session, quota_tracker=quota_tracker).search_videos(criteria, max_units=101))
+        assert len(videos) == 50
+        assert session.endpoints().count("search") == 1
+
+    def test_quota_budget_too_small(self):
+        """1ページも取得できないほどクォータが不足している場合はリクエストを送らない"""
+        session = FakeSession()
+
+        with pytest.raises(QuotaExceededError):
+            asyncio.run(_client(session).search_videos(SearchCriteria(keyword="kw"), max_units=50))
+        assert session.requests == []
+
+    def test_deadline_returns_partial(self):
+        """期限を過ぎたら次のページを取得せず、取得済みのページで結果を返す"""
+        session = FakeSession(pages=5)
+        now = [0.0]
+        original_get = session.get
+
+        def slow_get(url, params=None):
+            # search.listの1ページに50秒かかる時計
+            if url.endswith("/search"):
+                now[0] += 50
+            return original_get(url, params)
+
+        session.get = slow_get
+        client = _client(session, retry_policy=RetryPolicy(base_delay=0.0, deadline=120))
+
+        fake_time = Mock()
+        fake_time.monotonic.side_effect = lambda: now[0]
+        with patch("src.infrastructure.async_youtube_client.time", fake_time), \
+                patch("src.infrastructure.youtube_client.time", fake_time):
+            videos = asyncio.run(client.search_videos(SearchCriteria(keyword="kw", max_results=250)))
+
+        # 3ページ目の取得後（150秒）に期限を過ぎるため、3ページ目の詳細は取得しない
+        assert len(videos) == 100
+        assert session.endpoints().count("search") == 3
+        assert session.endpoints().count("videos") == 2
+
+    def test_requires_aiohttp_without_session(self):
+        """セッションを指定せず、aiohttpがない場合はImportError"""
+        with patch("src.infrastructure.async_youtube_client.AIOHTTP_AVAILABLE", False):
+            with pytest.raises(ImportError):
+                AsyncYouTubeClient(api_key="test_api_key")
+
+
+class TestAsyncVideoSearchService:
+    """AsyncVideoSearchServiceのテスト"""
+
+    def test_search_many_bounded(self):
+        """多数の検索を1つのイベントループで並行して実行し、同時リクエスト数は上限まで"""
+        session = FakeSession(pages=2, per_page=10)
+        service = AsyncVideoSearchService(_client(session, max_concurrency=3))
+        criteria_list = [SearchCriteria(keyword=f"kw{i}") for i in range(20)]
+
+        results = asyncio.run(service.search_many(criteria_list))
+
+        assert [len(result) for result in results] == [20] * 20
+        assert results[7][0].video_id == "kw7-p0v00"
+        assert 1 < session.max_in_flight <= 3
+
+    def test_search_many_partial_failure(self):
+        """失敗した検索は例外として返し、他の検索は続ける"""
+        session = FakeSession(pages=1, per_page=2)
+        session.errors = [(400, "badRequest")]
+        service = AsyncVideoSearchService(_client(session))
+
+        results = asyncio.run(service.search_many([SearchCriteria(keyword="a"), SearchCriteria(keyword="b")]))
+
+        assert isinstance(results[0], YouTubeHTTPError)
+        assert [v.video_id for v in results[1]] == ["b-p0v00", "b-p0v01"]
+
+    def test_statistics_recorded(self):
+        """検索結果の統計情報を記録"""
+        statistics_store = Mock()
+        service = AsyncVideoSearchService(_client(FakeSession(pages=1, per_page=2)), statistics_store)
+
+        videos = asyncio.run(service.search(SearchCriteria(keyword="kw")))
+        statistics_store.record.assert_called_once_with(videos)
+
+    def test_validation_error(self):
+        """不正な検索条件はAPIを呼ばずにエラー"""
+        session = FakeSession()
+        service = AsyncVideoSearchService(_client(session))
+
+        with pytest.raises(ValueError):
+            asyncio.run(service.search(SearchCriteria(keyword="")))
+        assert session.requests == []
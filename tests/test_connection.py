@@ -0,0 +1,122 @@
+"""
+データベース接続管理のテスト
+"""
+import os
+import sqlite3
+import pytest
+import threading
+from unittest.mock import patch
+
+from src.database.connection import ConnectionManager, get_connection_manager
+from src.application.history_service import HistoryService
+from src.application.preset_service import PresetService
+from src.domain.models import SearchCriteria
+
+
+class TestConnectionManager:
+    """ConnectionManagerのテスト"""
+
+    def test_connection_per_thread(self, db_path):
+        """同じスレッドでは接続を使い回し、別スレッドでは別の接続"""
+        manager = ConnectionManager(db_path)
+        main_conn = manager.get_connection()
+        assert manager.get_connection() is main_conn
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(manager.get_connection()))
+        thread.start()
+        thread.join()
+
+        assert other[0] is not main_conn
+        manager.close_all()
+
+    def test_pragmas(self, db_path):
+        """WALモードとsynchronous=NORMALを設定"""
+        conn = ConnectionManager(db_path).get_connection()
+
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        # NORMAL = 1
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+    def test_rollback_on_error(self, db_path):
+        """例外時はトランザクションをロールバック"""
+        manager = ConnectionManager(db_path)
+        with manager.connection() as conn:
+            conn.execute("CREATE TABLE items (value INTEGER)")
+
+        with pytest.raises(RuntimeError):
+            with manager.connection() as conn:
+                conn.execute("INSERT INTO items VALUES (1)")
+                raise RuntimeError("failed")
+
+        assert manager.get_connection().execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+        manager.close_all()
+
+    def test_dead_thread_connections_closed(self, db_path):
+        """終了したスレッドの接続は次回の接続生成時に閉じる"""
+        manager = ConnectionManager(db_path)
+        for _ in range(3):
+            thread = threading.Thread(target=manager.get_connection)
+            thread.start()
+            thread.join()
+
+        assert len(manager._connections) == 1
+        manager.get_connection()
+        assert list(manager._connections) == [threading.current_thread()]
+        manager.close_all()
+
+
+class TestSharedConnectionManager:
+    """データベースごとの接続管理の共有のテスト"""
+
+    def test_schema_initialized_once(self, db_path):
+        """複数のサービスを生成してもスキーマの初期化は1回"""
+        with patch("src.database.init_db.DatabaseInitializer.initialize") as mock_initialize:
+            manager = get_connection_manager(db_path)
+            assert get_connection_manager(db_path) is manager
+            HistoryService(db_path)
+            PresetService(db_path)
+        assert mock_initialize.call_count == 1
+
+    def test_services_share_connection(self, db_path):
+        """同じスレッドのサービスは同じ接続を使用"""
+        history_service = HistoryService(db_path)
+        preset_service = PresetService(db_path)
+
+        history_service.add_history(SearchCriteria(keyword="test"), 10)
+        preset_service.save_preset("preset", SearchCriteria(keyword="test"))
+
+        assert history_service._db is preset_service._db
+        assert len(history_service._db._connections) == 1
+        assert len(history_service.get_recent_history()) == 1
+
+    def test_concurrent_history_writes(self, db_path):
+        """複数スレッドから同時に履歴を追加"""
+        service = HistoryService(db_path)
+
+        def add_many():
+            for i in range(20):
+                service.add_history(SearchCriteria(keyword=f"keyword{i}"), i)
+
+        threads = [threading.Thread(target=add_many) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(service.get_recent_history(limit=200)) == 80
+
+    def test_close_before_delete(self, db_path):
+        """close()で接続を閉じるとWALファイルが片付き、次回は接続管理を生成し直す"""
+        service = HistoryService(db_path)
+        service.add_history(SearchCriteria(keyword="test"), 10)
+        manager = service._db
+        connection = manager.get_connection()
+
+        service.close()
+
+        assert manager._connections == {}
+        with pytest.raises(sqlite3.ProgrammingError):
+            connection.execute("SELECT 1")
+        assert not os.path.exists(db_path + "-wal")
+        assert get_connection_manager(db_path) is not manager
@@ -0,0 +1,130 @@
+"""
+Excelエクスポートのテスト
+"""
+import os
+import pytest
+import tempfile
+from datetime import datetime, timezone
+from openpyxl import load_workbook
+
+from src.infrastructure.excel_exporter import (
+    ExcelExporter, ColumnWidthTracker, display_width, HEADERS, MAX_COLUMN_WIDTH, MIN_COLUMN_WIDTH
+)
+from tests.conftest import make_video
+
+
+@pytest.fixture
+def file_path():
+    """一時Excelファイル"""
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as f:
+        path = f.name
+    yield path
+    if os.path.exists(path):
+        os.unlink(path)
+
+
+def _load_sheet(file_path: str):
+    return load_workbook(file_path)["YouTube動画リスト"]
+
+
+class TestExcelExporter:
+    """ExcelExporterのテスト"""
+
+    def test_header_and_values(self, file_path):
+        """ヘッダーと動画情報の値"""
+        videos = [
+            make_video(
+                "vid1", view_count=1234567, published_at=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+                duration_seconds=185, description="概要", tags=["python", "入門"],
+                thumbnail_url="https://i.ytimg.com/vi/vid1/hqdefault.jpg"
+            ),
+            make_video("vid2", is_short=True)
+        ]
+        ExcelExporter().export(videos, file_path)
+        rows = list(_load_sheet(file_path).iter_rows(values_only=True))
+
+        assert list(rows[0]) == HEADERS
+        assert len(rows) == 3
+        assert rows[1][:9] == (
+            1, "title vid1", "https://www.youtube.com/watch?v=vid1", "channel",
+            "UC1234567890123456789012", 1234567, 10, 1, datetime(2024, 1, 2, 3, 4, 5)
+        )
+        assert rows[1][9:] == ("03:05", "通常", "概要", "python, 入門", "https://i.ytimg.com/vi/vid1/hqdefault.jpg")
+        assert rows[2][0] == 2
+        assert rows[2][10] == "ショート"
+        assert rows[2][12] is None
+
+    def test_cell_styles(self, file_path):
+        """ヘッダー・リンク・数値・日付の書式"""
+        ExcelExporter().export([make_video("vid1", thumbnail_url=None)], file_path)
+        ws = _load_sheet(file_path)
+
+        assert ws["A1"].font.bold
+        assert ws["A1"].fill.start_color.rgb.endswith("4472C4")
+        assert ws["C2"].hyperlink.target == "https://www.youtube.com/watch?v=vid1"
+        assert ws["C2"].font.underline == "single"
+        assert ws["F2"].number_format == "#,##0"
+        assert ws["H2"].number_format == "#,##0"
+        assert ws["I2"].number_format == "yyyy-mm-dd"
+        assert ws["N2"].value is None
+        assert ws["N2"].hyperlink is None
+
+    def test_column_widths(self, file_path):
+        """カラム幅は最長の値から計算し、20〜80文字に制限"""
+        videos = [
+            make_video("vid1", title="あ" * 15),
+            make_video("vid2", description="x" * 200),
+        ]
+        ExcelExporter().export(videos, file_path)
+        ws = _load_sheet(file_path)
+
+        # 日本語は2文字分 → 15 * 2 + 2
+        assert ws.column_dimensions["B"].width == 32
+        assert ws.column_dimensions["A"].width == MIN_COLUMN_WIDTH
+        assert ws.column_dimensions["L"].width == MAX_COLUMN_WIDTH
+
+    def test_omit_fields(self, file_path):
+        """取得を省略した属性の列は出力しない"""
+        ExcelExporter().export([make_video("vid1", description="概要")], file_path, ["description"])
+        rows = list(_load_sheet(file_path).iter_rows(values_only=True))
+
+        assert list(rows[0]) == [header for header in HEADERS if header != "概要"]
+        assert rows[1][10:] == ("通常", None, None)
+
+    def test_empty_videos(self, file_path):
+        """空のリストはエラー"""
+        with pytest.raises(ValueError):
+            ExcelExporter().export([], file_path)
+
+
+class TestColumnWidthTracker:
+    """カラム幅計算のテスト"""
+
+    def test_display_width(self):
+        """ASCII以外の文字は2文字分"""
+        assert display_width("abc") == 3
+        assert display_width("日本語") == 6
+        assert display_width("Python 入門") == 11
+        assert display_width(1234567) == 7
+        assert display_width(datetime(2024, 1, 1)) == 19
+
+    def test_display_width_cap(self):
+        """文字数が上限以上の場合は上限を返す"""
+        assert display_width("x" * 500, cap=78) == 78
+        assert display_width("あ" * 50, cap=78) == 100
+
+    def test_widths(self):
+        """ヘッダーと値の最長から幅を計算"""
+        tracker = ColumnWidthTracker(["No", "タイトル"])
+        tracker.update([1, "あ" * 15])
+        tracker.update([2, None])
+
+        assert tracker.widths() == [MIN_COLUMN_WIDTH, 32]
+
+    def test_saturated_columns_skipped(self):
+        """上限に達した列は以降の値を見ない"""
+        tracker = ColumnWidthTracker(["A", "B"])
+        tracker.update(["x" * 100, "y"])
+        tracker.update([object(), "z" * 100])
+
+        assert tracker.widths() == [MAX_COLUMN_WIDTH, MAX_COLUMN_WIDTH]
@@ -0,0 +1,136 @@
+"""
+CSV・JSON Lines・Parquetエクスポートのテスト
+"""
+import csv
+import json
+import os
+import pytest
+import tempfile
+from datetime import datetime, timezone
+
+from src.infrastructure.base_exporter import BaseExporter, EXPORT_FIELDS
+from src.infrastructure.csv_exporter import CsvExporter, CSV_ENCODING
+from src.infrastructure.excel_exporter import ExcelExporter
+from src.infrastructure.jsonl_exporter import JsonlExporter
+from src.infrastructure.parquet_exporter import ParquetExporter, PYARROW_AVAILABLE
+from src.infrastructure.video_fields import FIELD_PROFILES
+from tests.conftest import make_video
+
+# 書き出しの値を確認する動画の属性（区切り文字・引用符・改行を含む説明文、タイムゾーン付きの公開日時）
+DETAILS = dict(
+    view_count=1234567,
+    published_at=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    description="概要, \"引用\"\n改行",
+    tags=["python", "入門"],
+    thumbnail_url=None
+)
+
+
+@pytest.fixture
+def temp_dir():
+    """一時ディレクトリ"""
+    with tempfile.TemporaryDirectory() as path:
+        yield path
+
+
+class TestExporterInterface:
+    """エクスポーター共通のテスト"""
+
+    @pytest.mark.parametrize("exporter_class", [ExcelExporter, CsvExporter, JsonlExporter])
+    def test_shared_interface(self, exporter_class, temp_dir):
+        """同じインターフェースでエクスポートでき、空のリストはエラー"""
+        exporter = exporter_class()
+        assert isinstance(exporter, BaseExporter)
+
+        file_path = os.path.join(temp_dir, f"videos{exporter.file_extension}")
+        exporter.export([make_video("vid1")], file_path)
+        assert os.path.exists(file_path)
+
+        with pytest.raises(ValueError):
+            exporter.export([], file_path)
+
+    @pytest.mark.parametrize("exporter_class", [CsvExporter, JsonlExporter])
+    def test_omit_fields(self, exporter_class, temp_dir):
+        """取得を省略した属性の列は出力しない"""
+        file_path = os.path.join(temp_dir, f"videos{exporter_class.file_extension}")
+        exporter_class().export([make_video("vid1")], file_path, FIELD_PROFILES["compact"])
+
+        with open(file_path, encoding=CSV_ENCODING) as f:
+            if exporter_class is CsvExporter:
+                fields = list(next(csv.DictReader(f)).keys())
+            else:
+                fields = list(json.loads(f.readline()).keys())
+        assert fields == [field for field in EXPORT_FIELDS if field not in FIELD_PROFILES["compact"]]
+
+    def test_write_error(self, temp_dir):
+        """書き込みに失敗した場合はIOError"""
+        with pytest.raises(IOError):
+            CsvExporter().export([make_video("vid1")], os.path.join(temp_dir, "missing", "videos.csv"))
+
+
+class TestCsvExporter:
+    """CsvExporterのテスト"""
+
+    def test_export(self, temp_dir):
+        """列名と値（改行・引用符を含む値も1セル）"""
+        file_path = os.path.join(temp_dir, "videos.csv")
+        CsvExporter().export([make_video("vid1", **DETAILS), make_video("vid2", thumbnail_url=None)], file_path)
+
+        with open(file_path, encoding=CSV_ENCODING, newline="") as f:
+            rows = list(csv.DictReader(f))
+
+        assert list(rows[0].keys()) == EXPORT_FIELDS
+        assert len(rows) == 2
+        assert rows[0]["video_id"] == "vid1"
+        assert rows[0]["view_count"] == "1234567"
+        assert rows[0]["published_at"] == "2024-01-02T03:04:05+00:00"
+        assert rows[0]["description"] == "概要, \"引用\"\n改行"
+        assert rows[0]["tags"] == "python, 入門"
+        assert rows[1]["tags"] == ""
+        assert rows[1]["thumbnail_url"] == ""
+
+
+class TestJsonlExporter:
+    """JsonlExporterのテスト"""
+
+    def test_export(self, temp_dir):
+        """1行1動画のJSON"""
+        file_path = os.path.join(temp_dir, "videos.jsonl")
+        JsonlExporter().export([make_video("vid1", **DETAILS), make_video("vid2")], file_path)
+
+        with open(file_path, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+
+        assert [record["video_id"] for record in records] == ["vid1", "vid2"]
+        assert list(records[0].keys()) == EXPORT_FIELDS
+        assert records[0]["view_count"] == 1234567
+        assert records[0]["is_short"] is False
+        assert records[0]["tags"] == ["python", "入門"]
+        assert records[0]["published_at"] == "2024-01-02T03:04:05+00:00"
+        assert records[0]["thumbnail_url"] is None
+
+
+@pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrowがインストールされていません")
+class TestParquetExporter:
+    """ParquetExporterのテスト"""
+
+    def test_export(self, temp_dir):
+        """複数の行グループに分けて書き出し、型と値を保持"""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        file_path = os.path.join(temp_dir, "videos.parquet")
+        videos = [make_video(f"vid{i}", channel_name=f"チャンネル{i % 2}", **DETAILS) for i in range(5)]
+        ParquetExporter(batch_size=2).export(videos, file_path)
+
+        parquet_file = pq.ParquetFile(file_path)
+        assert parquet_file.metadata.num_row_groups == 3
+
+        table = parquet_file.read()
+        assert table.column_names == EXPORT_FIELDS
+        assert table.num_rows == 5
+        assert pa.types.is_dictionary(table.schema.field("channel_name").type)
+        assert table.column("channel_name").to_pylist() == [f"チャンネル{i % 2}" for i in range(5)]
+        assert table.column("view_count").to_pylist() == [1234567] * 5
+        assert table.column("tags").to_pylist()[0] == ["python", "入門"]
+        assert table.column("published_at").to_pylist()[0] == datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
@@ -0,0 +1,172 @@
+"""
+検索履歴サービスのテスト
+"""
+import sqlite3
+import pytest
+
+from src.application.history_service import HistoryService, _pack_counts, _unpack_counts
+from src.domain.models import SearchCriteria
+from src.infrastructure.video_cache import VideoCache
+from tests.conftest import make_video
+
+
+def _add(service: HistoryService, *keywords: str) -> None:
+    for keyword in keywords:
+        service.add_history(SearchCriteria(keyword=keyword), 10)
+
+
+def _keywords(histories) -> list:
+    return [history.criteria.keyword for history in histories]
+
+
+class TestHistoryFullTextSearch:
+    """検索履歴の全文検索のテスト"""
+
+    def test_fts_index_created(self, db_path):
+        """全文検索インデックスを使用"""
+        service = HistoryService(db_path)
+        assert service._fts_available
+
+    def test_japanese_substring(self, db_path):
+        """日本語キーワードの部分一致"""
+        service = HistoryService(db_path)
+        _add(service, "Python 入門講座", "プログラミング入門講座", "料理レシピ")
+
+        assert sorted(_keywords(service.search_history("入門講座"))) == [
+            "Python 入門講座", "プログラミング入門講座"
+        ]
+
+    def test_prefix_and_case_insensitive(self, db_path):
+        """語の先頭部分で、大文字小文字を区別せずに検索"""
+        service = HistoryService(db_path)
+        _add(service, "Python tutorial", "JavaScript tutorial")
+
+        assert _keywords(service.search_history("pyth")) == ["Python tutorial"]
+
+    def test_all_terms_required(self, db_path):
+        """空白区切りの語をすべて含む履歴のみ（3文字未満の語を含む場合も）"""
+        service = HistoryService(db_path)
+        _add(service, "Python 入門", "Python 応用", "Go 入門")
+
+        assert _keywords(service.search_history("python 入門")) == ["Python 入門"]
+        assert sorted(_keywords(service.search_history("入門"))) == ["Go 入門", "Python 入門"]
+
+    def test_ranking(self, db_path):
+        """完全一致 → 前方一致 → 部分一致の順"""
+        service = HistoryService(db_path)
+        _add(service, "learn python", "Python", "python tutorial")
+
+        assert _keywords(service.search_history("python")) == [
+            "Python", "python tutorial", "learn python"
+        ]
+
+    def test_same_rank_newest_first(self, db_path):
+        """同じ関連度の履歴は新しい順"""
+        service = HistoryService(db_path)
+        _add(service, "python", "python")
+        histories = service.search_history("python")
+
+        assert histories[0].history_id > histories[1].history_id
+
+    def test_index_follows_delete(self, db_path):
+        """削除した履歴はインデックスからも削除"""
+        service = HistoryService(db_path)
+        _add(service, "Python tutorial")
+        history = service.get_recent_history()[0]
+
+        service.delete_history(history.history_id)
+        assert service.search_history("tutorial") == []
+
+    def test_existing_history_indexed(self, db_path):
+        """インデックス作成前の履歴も検索できる"""
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE search_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                keyword TEXT NOT NULL,
+                min_view_count INTEGER,
+                max_view_count INTEGER,
+                video_type TEXT,
+                published_after TEXT,
+                published_before TEXT,
+                max_results INTEGER,
+                sort_order TEXT,
+                result_count INTEGER NOT NULL,
+                searched_at TEXT NOT NULL
+            )
+        """)
+        conn.execute("""
+            INSERT INTO search_history (keyword, video_type, max_results, sort_order, result_count, searched_at)
+            VALUES ('既存の検索キーワード', 'all', 50, 'viewCount', 5, '2024-01-01T00:00:00')
+        """)
+        conn.commit()
+        conn.close()
+
+        service = HistoryService(db_path)
+        assert _keywords(service.search_history("検索キー")) == ["既存の検索キーワード"]
+
+    def test_like_fallback(self, db_path):
+        """インデックスがない場合はLIKEで検索"""
+        service = HistoryService(db_path)
+        _add(service, "Python tutorial", "JavaScript tutorial")
+        service._fts_available = False
+
+        assert sorted(_keywords(service.search_history("tutorial"))) == [
+            "JavaScript tutorial", "Python tutorial"
+        ]
+
+
+class TestHistoryResults:
+    """検索結果の保存・復元のテスト"""
+
+    def test_pack_roundtrip(self):
+        """統計情報の配列変換"""
+        values = [0, 1, 2 ** 40, 9_999_999_999]
+        packed = _pack_counts(values)
+
+        assert len(packed) == 8 * len(values)
+        assert _unpack_counts(packed) == values
+
+    def test_restore_with_snapshot_statistics(self, db_path):
+        """保存時点の統計情報で、検索時の順に復元"""
+        cache = VideoCache(db_path)
+        videos = [make_video("vid00000002", 200, like_count=20), make_video("vid00000001", 100)]
+        cache.put_many(videos)
+        service = HistoryService(db_path, video_cache=cache)
+        history = service.add_history(SearchCriteria(keyword="test"), 2, videos)
+
+        # 検索後に統計情報が更新されても、履歴は検索時点の値
+        cache.update_statistics([make_video("vid00000002", 5000)])
+        restored = service.get_history_results(history.history_id)
+
+        assert [video.video_id for video in restored] == ["vid00000002", "vid00000001"]
+        assert [video.view_count for video in restored] == [200, 100]
+        assert restored[0].like_count == 20
+        assert restored[0].title == "title vid00000002"
+
+    def test_not_restorable(self, db_path):
+        """結果が保存されていない、またはキャッシュにない動画がある場合はNone"""
+        service = HistoryService(db_path)
+        without_results = service.add_history(SearchCriteria(keyword="test"), 1)
+        not_cached = service.add_history(SearchCriteria(keyword="test"), 1, [make_video("vid00000001", 1)])
+
+        assert service.get_history_results(without_results.history_id) is None
+        assert service.get_history_results(not_cached.history_id) is None
+
+    def test_empty_results(self, db_path):
+        """結果0件の検索も復元できる"""
+        service = HistoryService(db_path)
+        history = service.add_history(SearchCriteria(keyword="test"), 0, [])
+
+        assert service.get_history_results(history.history_id) == []
+
+    def test_results_deleted_with_history(self, db_path):
+        """履歴を削除すると保存した結果も削除"""
+        service = HistoryService(db_path)
+        history = service.add_history(SearchCriteria(keyword="test"), 1, [make_video("vid00000001", 1)])
+        service.clear_all_history()
+
+        count = service._db.get_connection().execute(
+            "SELECT COUNT(*) FROM search_history_results"
+        ).fetchone()[0]
+        assert count == 0
@@ -0,0 +1,94 @@
+"""
+HTTP接続プールのテスト
+"""
+import json
+import pytest
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from googleapiclient.http import HttpRequest
+from googleapiclient.model import JsonModel
+from googleapiclient.errors import HttpError
+
+from src.infrastructure import http_pool
+from src.infrastructure.http_pool import PooledHttp, get_shared_http, close_shared_http
+
+
+def _make_response(status_code=200, body=b"{}", headers=None):
+    """requests.Responseのモック"""
+    response = Mock()
+    response.status_code = status_code
+    response.reason = "OK" if status_code == 200 else "Error"
+    response.headers = headers or {"Content-Type": "application/json; charset=UTF-8"}
+    response.content = body
+    return response
+
+
+class TestPooledHttp:
+    """PooledHttpのテスト"""
+
+    def test_response_conversion(self):
+        """requestsのレスポンスをhttplib2形式に変換"""
+        http = PooledHttp(pool_size=2)
+        with patch.object(http.session, "request", return_value=_make_response(
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"}
+        )) as mock_request:
+            resp, content = http.request("https://example.com/api", "GET", headers={"a": "b"})
+
+        assert resp.status == 200
+        assert resp["content-type"] == "application/json"
+        # 本文は展開済みのため、content-encodingは引き継がない
+        assert "content-encoding" not in resp
+        assert content == b"{}"
+        assert mock_request.call_args.kwargs["timeout"] == http.timeout
+        http.close()
+
+    def test_execute_with_googleapiclient(self):
+        """HttpRequest.executeのhttpとして使用でき、エラーはHttpErrorになる"""
+        http = PooledHttp(pool_size=2)
+        body = json.dumps({"error": {"errors": [{"reason": "quotaExceeded"}], "message": "quota"}})
+        with patch.object(http.session, "request", side_effect=[
+            _make_response(body=b'{"items": []}'),
+            _make_response(status_code=403, body=body.encode("utf-8"))
+        ]):
+            request = HttpRequest(http, JsonModel().response, "https://example.com/api")
+            assert request.execute(http=http) == {"items": []}
+
+            with pytest.raises(HttpError) as exc_info:
+                request.execute(http=http)
+            assert exc_info.value.resp.status == 403
+        http.close()
+
+    def test_network_errors_mapped(self):
+        """requestsの例外は再試行可能な組み込み例外に変換"""
+        http = PooledHttp(pool_size=2)
+        with patch.object(http.session, "request", side_effect=requests.exceptions.ConnectionError("reset")):
+            with pytest.raises(ConnectionError):
+                http.request("https://example.com/api")
+        with patch.object(http.session, "request", side_effect=requests.exceptions.ReadTimeout("timeout")):
+            with pytest.raises(TimeoutError):
+                http.request("https://example.com/api")
+        http.close()
+
+    def test_pool_size_from_env(self):
+        """接続数は環境変数から設定"""
+        with patch.dict('os.environ', {'YOUTUBE_HTTP_POOL_SIZE': '7'}):
+            http = PooledHttp()
+        assert http.pool_size == 7
+        assert http.session.get_adapter("https://www.googleapis.com")._pool_maxsize == 7
+        http.close()
+
+
+class TestSharedHttp:
+    """共有HTTPクライアントのテスト"""
+
+    def test_shared_across_threads(self):
+        """複数スレッドから同じインスタンスを取得"""
+        close_shared_http()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            instances = list(executor.map(lambda _: get_shared_http(), range(8)))
+
+        assert all(instance is instances[0] for instance in instances)
+        close_shared_http()
+        assert http_pool._shared_http is None
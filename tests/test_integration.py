@@ -18,255 +18,181 @@ from src.infrastructure.excel_exporter import ExcelExporter
 class TestPresetIntegration:
     """プリセット機能の統合テスト"""
 
-    def test_preset_save_and_load(self):
+    def test_preset_save_and_load(self, db_path):
         """プリセットの保存と読み込み"""
-        # 一時データベースファイル
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.db') as f:
-            db_path = f.name
-
-        try:
-            service = PresetService(db_path)
-
-            # 検索条件を作成
-            criteria = SearchCriteria(
-                keyword="Python tutorial",
-                min_view_count=1000,
-                max_view_count=100000,
-                video_type=VideoType.NORMAL,
-                max_results=50
-            )
-
-            # プリセットを保存
-            preset = service.save_preset("テストプリセット", criteria)
-
-            assert preset is not None
-            assert preset.name == "テストプリセット"
-            assert preset.criteria.keyword == "Python tutorial"
-
-            # プリセットを読み込み
-            loaded_preset = service.load_preset("テストプリセット")
-
-            assert loaded_preset is not None
-            assert loaded_preset.name == "テストプリセット"
-            assert loaded_preset.criteria.keyword == "Python tutorial"
-            assert loaded_preset.criteria.min_view_count == 1000
-            assert loaded_preset.criteria.max_view_count == 100000
-            assert loaded_preset.criteria.video_type == VideoType.NORMAL
-
-        finally:
-            # クリーンアップ
-            if os.path.exists(db_path):
-                os.unlink(db_path)
-
-    def test_preset_update(self):
+        service = PresetService(db_path)
+
+        # 検索条件を作成
+        criteria = SearchCriteria(
+            keyword="Python tutorial",
+            min_view_count=1000,
+            max_view_count=100000,
+            video_type=VideoType.NORMAL,
+            max_results=50
+        )
+
+        # プリセットを保存
+        preset = service.save_preset("テストプリセット", criteria)
+
+        assert preset is not None
+        assert preset.name == "テストプリセット"
+        assert preset.criteria.keyword == "Python tutorial"
+
+        # プリセットを読み込み
+        loaded_preset = service.load_preset("テストプリセット")
+
+        assert loaded_preset is not None
+        assert loaded_preset.name == "テストプリセット"
+        assert loaded_preset.criteria.keyword == "Python tutorial"
+        assert loaded_preset.criteria.min_view_count == 1000
+        assert loaded_preset.criteria.max_view_count == 100000
+        assert loaded_preset.criteria.video_type == VideoType.NORMAL
+
+    def test_preset_update(self, db_path):
         """プリセットの更新"""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.db') as f:
-            db_path = f.name
+        service = PresetService(db_path)
 
-        try:
-            service = PresetService(db_path)
+        # 最初の保存
+        criteria1 = SearchCriteria(keyword="Python", max_results=50)
+        service.save_preset("更新テスト", criteria1)
 
-            # 最初の保存
-            criteria1 = SearchCriteria(keyword="Python", max_results=50)
-            service.save_preset("更新テスト", criteria1)
+        # 同じ名前で再保存（更新）
+        criteria2 = SearchCriteria(keyword="JavaScript", max_results=100)
+        service.save_preset("更新テスト", criteria2)
 
-            # 同じ名前で再保存（更新）
-            criteria2 = SearchCriteria(keyword="JavaScript", max_results=100)
-            service.save_preset("更新テスト", criteria2)
+        # 読み込み
+        preset = service.load_preset("更新テスト")
 
-            # 読み込み
-            preset = service.load_preset("更新テスト")
+        assert preset.criteria.keyword == "JavaScript"
+        assert preset.criteria.max_results == 100
 
-            assert preset.criteria.keyword == "JavaScript"
-            assert preset.criteria.max_results == 100
-
-        finally:
-            if os.path.exists(db_path):
-                os.unlink(db_path)
-
-    def test_preset_delete(self):
+    def test_preset_delete(self, db_path):
         """プリセットの削除"""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.db') as f:
-            db_path = f.name
-
-        try:
-            service = PresetService(db_path)
-
-            # プリセットを保存
-            criteria = SearchCriteria(keyword="Python", max_results=50)
-            service.save_preset("削除テスト", criteria)
+        service = PresetService(db_path)
 
-            # 削除
-            deleted = service.delete_preset("削除テスト")
-            assert deleted is True
+        # プリセットを保存
+        criteria = SearchCriteria(keyword="Python", max_results=50)
+        service.save_preset("削除テスト", criteria)
 
-            # 読み込み（存在しない）
-            preset = service.load_preset("削除テスト")
-            assert preset is None
+        # 削除
+        deleted = service.delete_preset("削除テスト")
+        assert deleted is True
 
-        finally:
-            if os.path.exists(db_path):
-                os.unlink(db_path)
+        # 読み込み（存在しない）
+        preset = service.load_preset("削除テスト")
+        assert preset is None
 
-    def test_preset_list(self):
+    def test_preset_list(self, db_path):
         """プリセット一覧の取得"""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.db') as f:
-            db_path = f.name
-
-        try:
-            service = PresetService(db_path)
+        service = PresetService(db_path)
 
-            # 複数のプリセットを保存
-            criteria1 = SearchCriteria(keyword="Python", max_results=50)
-            criteria2 = SearchCriteria(keyword="JavaScript", max_results=100)
-            criteria3 = SearchCriteria(keyword="Go", max_results=30)
+        # 複数のプリセットを保存
+        criteria1 = SearchCriteria(keyword="Python", max_results=50)
+        criteria2 = SearchCriteria(keyword="JavaScript", max_results=100)
+        criteria3 = SearchCriteria(keyword="Go", max_results=30)
 
-            service.save_preset("プリセット1", criteria1)
-            service.save_preset("プリセット2", criteria2)
-            service.save_preset("プリセット3", criteria3)
+        service.save_preset("プリセット1", criteria1)
+        service.save_preset("プリセット2", criteria2)
+        service.save_preset("プリセット3", criteria3)
 
-            # 一覧取得
-            presets = service.list_presets()
+        # 一覧取得
+        presets = service.list_presets()
 
-            assert len(presets) == 3
-            preset_names = [p.name for p in presets]
-            assert "プリセット1" in preset_names
-            assert "プリセット2" in preset_names
-            assert "プリセット3" in preset_names
-
-        finally:
-            if os.path.exists(db_path):
-                os.unlink(db_path)
+        assert len(presets) == 3
+        preset_names = [p.name for p in presets]
+        assert "プリセット1" in preset_names
+        assert "プリセット2" in preset_names
+        assert "プリセット3" in preset_names
 
 
 class TestHistoryIntegration:
     """検索履歴機能の統合テスト"""
 
-    def test_history_add_and_get(self):
+    def test_history_add_and_get(self, db_path):
         """検索履歴の追加と取得"""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.db') as f:
-            db_path = f.name
+        service = HistoryService(db_path)
 
-        try:
-            service = HistoryService(db_path)
+        # 検索履歴を追加
+        criteria = SearchCriteria(keyword="Python tutorial", max_results=50)
+        history = service.add_history(criteria, result_count=42)
 
-            # 検索履歴を追加
-            criteria = SearchCriteria(keyword="Python tutorial", max_results=50)
-            history = service.add_history(criteria, result_count=42)
+        assert history is not None
+        assert history.criteria.keyword == "Python tutorial"
+        assert history.result_count == 42
 
-            assert history is not None
-            assert history.criteria.keyword == "Python tutorial"
-            assert history.result_count == 42
+        # 履歴を取得
+        recent = service.get_recent_history(limit=10)
 
-            # 履歴を取得
-            recent = service.get_recent_history(limit=10)
+        assert len(recent) == 1
+        assert recent[0].criteria.keyword == "Python tutorial"
+        assert recent[0].result_count == 42
 
-            assert len(recent) == 1
-            assert recent[0].criteria.keyword == "Python tutorial"
-            assert recent[0].result_count == 42
-
-        finally:
-            if os.path.exists(db_path):
-                os.unlink(db_path)
-
-    def test_history_multiple_entries(self):
+    def test_history_multiple_entries(self, db_path):
         """複数の検索履歴"""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.db') as f:
-            db_path = f.name
-
-        try:
-            service = HistoryService(db_path)
-
-            # 複数の検索履歴を追加
-            service.add_history(SearchCriteria(keyword="Python", max_results=50), 10)
-            service.add_history(SearchCriteria(keyword="JavaScript", max_results=50), 20)
-            service.add_history(SearchCriteria(keyword="Go", max_results=50), 30)
+        service = HistoryService(db_path)
 
-            # 最近の履歴を取得
-            recent = service.get_recent_history(limit=10)
+        # 複数の検索履歴を追加
+        service.add_history(SearchCriteria(keyword="Python", max_results=50), 10)
+        service.add_history(SearchCriteria(keyword="JavaScript", max_results=50), 20)
+        service.add_history(SearchCriteria(keyword="Go", max_results=50), 30)
 
-            assert len(recent) == 3
-            # 新しい順に並んでいるか確認
-            assert recent[0].criteria.keyword == "Go"
-            assert recent[1].criteria.keyword == "JavaScript"
-            assert recent[2].criteria.keyword == "Python"
+        # 最近の履歴を取得
+        recent = service.get_recent_history(limit=10)
 
-        finally:
-            if os.path.exists(db_path):
-                os.unlink(db_path)
+        assert len(recent) == 3
+        # 新しい順に並んでいるか確認
+        assert recent[0].criteria.keyword == "Go"
+        assert recent[1].criteria.keyword == "JavaScript"
+        assert recent[2].criteria.keyword == "Python"
 
-    def test_history_search(self):
+    def test_history_search(self, db_path):
         """キーワードで履歴検索"""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.db') as f:
-            db_path = f.name
-
-        try:
-            service = HistoryService(db_path)
+        service = HistoryService(db_path)
 
-            # 複数の検索履歴を追加
-            service.add_history(SearchCriteria(keyword="Python tutorial", max_results=50), 10)
-            service.add_history(SearchCriteria(keyword="JavaScript basics", max_results=50), 20)
-            service.add_history(SearchCriteria(keyword="Python advanced", max_results=50), 30)
+        # 複数の検索履歴を追加
+        service.add_history(SearchCriteria(keyword="Python tutorial", max_results=50), 10)
+        service.add_history(SearchCriteria(keyword="JavaScript basics", max_results=50), 20)
+        service.add_history(SearchCriteria(keyword="Python advanced", max_results=50), 30)
 
-            # Pythonを含む履歴を検索
-            python_history = service.search_history("Python")
+        # Pythonを含む履歴を検索
+        python_history = service.search_history("Python")
 
-            assert len(python_history) == 2
-            keywords = [h.criteria.keyword for h in python_history]
-            assert "Python tutorial" in keywords
-            assert "Python advanced" in keywords
+        assert len(python_history) == 2
+        keywords = [h.criteria.keyword for h in python_history]
+        assert "Python tutorial" in keywords
+        assert "Python advanced" in keywords
 
-        finally:
-            if os.path.exists(db_path):
-                os.unlink(db_path)
-
-    def test_history_delete(self):
+    def test_history_delete(self, db_path):
         """検索履歴の削除"""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.db') as f:
-            db_path = f.name
-
-        try:
-            service = HistoryService(db_path)
+        service = HistoryService(db_path)
 
-            # 履歴を追加
-            history = service.add_history(SearchCriteria(keyword="Python", max_results=50), 10)
+        # 履歴を追加
+        history = service.add_history(SearchCriteria(keyword="Python", max_results=50), 10)
 
-            # 削除
-            deleted = service.delete_history(history.history_id)
-            assert deleted is True
+        # 削除
+        deleted = service.delete_history(history.history_id)
+        assert deleted is True
 
-            # 取得（存在しない）
-            retrieved = service.get_history_by_id(history.history_id)
-            assert retrieved is None
+        # 取得（存在しない）
+        retrieved = service.get_history_by_id(history.history_id)
+        assert retrieved is None
 
-        finally:
-            if os.path.exists(db_path):
-                os.unlink(db_path)
-
-    def test_history_clear_all(self):
+    def test_history_clear_all(self, db_path):
         """すべての検索履歴をクリア"""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.db') as f:
-            db_path = f.name
-
-        try:
-            service = HistoryService(db_path)
-
-            # 複数の履歴を追加
-            service.add_history(SearchCriteria(keyword="Python", max_results=50), 10)
-            service.add_history(SearchCriteria(keyword="JavaScript", max_results=50), 20)
-            service.add_history(SearchCriteria(keyword="Go", max_results=50), 30)
+        service = HistoryService(db_path)
 
-            # すべてクリア
-            count = service.clear_all_history()
-            assert count == 3
+        # 複数の履歴を追加
+        service.add_history(SearchCriteria(keyword="Python", max_results=50), 10)
+        service.add_history(SearchCriteria(keyword="JavaScript", max_results=50), 20)
+        service.add_history(SearchCriteria(keyword="Go", max_results=50), 30)
 
-            # 履歴が空になったことを確認
-            recent = service.get_recent_history(limit=10)
-            assert len(recent) == 0
+        # すべてクリア
+        count = service.clear_all_history()
+        assert count == 3
 
-        finally:
-            if os.path.exists(db_path):
-                os.unlink(db_path)
+        # 履歴が空になったことを確認
+        recent = service.get_recent_history(limit=10)
+        assert len(recent) == 0
 
 
 class TestExcelExportIntegration:
@@ -333,11 +259,9 @@ class TestExcelExportIntegration:
 class TestEndToEndWorkflow:
     """エンドツーエンドのワークフロー統合テスト"""
 
-    def test_search_save_export_workflow(self):
+    def test_search_save_export_workflow(self, db_path):
         """検索→保存→エクスポートのワークフロー"""
         # 一時ファイル
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.db') as f:
-            db_path = f.name
         with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as f:
             excel_path = f.name
 
@@ -402,7 +326,5 @@ class TestEndToEndWorkflow:
 
         finally:
             # クリーンアップ
-            if os.path.exists(db_path):
-                os.unlink(db_path)
             if os.path.exists(excel_path):
                 os.unlink(excel_path)
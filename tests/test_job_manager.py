@@ -0,0 +1,155 @@
+"""
+バックグラウンドジョブ管理のテスト
+"""
+import threading
+import time
+import pytest
+
+from src.utils.cancellation import CancellationToken, OperationCancelledError
+from src.utils.job_manager import JobManager
+
+
+@pytest.fixture
+def manager():
+    """ワーカー1つのJobManager"""
+    manager = JobManager(max_workers=1)
+    yield manager
+    manager.shutdown()
+
+
+def _wait_for_cancel(token: CancellationToken, started: threading.Event) -> None:
+    """キャンセルされるまで待つジョブ"""
+    started.set()
+    while not token.is_cancelled:
+        time.sleep(0.01)
+    token.raise_if_cancelled()
+
+
+class TestCancellationToken:
+    """CancellationTokenのテスト"""
+
+    def test_cancel(self):
+        """キャンセル後は例外を送出"""
+        token = CancellationToken()
+        token.raise_if_cancelled()
+        assert not token.is_cancelled
+
+        token.cancel()
+        assert token.is_cancelled
+        with pytest.raises(OperationCancelledError):
+            token.raise_if_cancelled()
+
+
+class TestJobManager:
+    """JobManagerのテスト"""
+
+    def test_result_and_token(self, manager):
+        """関数は先頭の引数にトークンを受け取り、戻り値はFutureで受け取れる"""
+        job = manager.submit("job", lambda token, value: (token, value * 2), 21)
+        token, value = job.future.result(timeout=5)
+
+        assert token is job.token
+        assert value == 42
+
+    def test_supersede(self, manager):
+        """同じ名前のジョブを置き換えると、実行中のジョブはキャンセルされる"""
+        started = threading.Event()
+        first = manager.submit("search", _wait_for_cancel, started, supersede=True)
+        assert started.wait(5)
+
+        second = manager.submit("search", lambda token: "done", supersede=True)
+
+        with pytest.raises(OperationCancelledError):
+            first.future.result(timeout=5)
+        assert second.future.result(timeout=5) == "done"
+        assert not second.is_cancelled
+
+    def test_without_supersede(self, manager):
+        """supersede=Falseのジョブは同じ名前でもキャンセルしない"""
+        first = manager.submit("export", lambda token: "first")
+        second = manager.submit("export", lambda token: "second")
+
+        assert first.future.result(timeout=5) == "first"
+        assert second.future.result(timeout=5) == "second"
+        assert not first.is_cancelled
+
+    def test_same_name_jobs_all_tracked(self):
+        """supersede=Falseで同じ名前のジョブを重ねても、すべてキャンセル・終了処理の対象になる"""
+        manager = JobManager(max_workers=2)
+        first_started = threading.Event()
+        second_started = threading.Event()
+        first = manager.submit("export", _wait_for_cancel, first_started)
+        second = manager.submit("export", _wait_for_cancel, second_started)
+        assert first_started.wait(5) and second_started.wait(5)
+
+        assert manager.jobs("export") == [first, second]
+        assert manager.current("export") is second
+
+        assert manager.cancel("export")
+        for job in (first, second):
+            with pytest.raises(OperationCancelledError):
+                job.future.result(timeout=5)
+        assert manager.jobs("export") == []
+
+        started = [threading.Event(), threading.Event()]
+        remaining = [manager.submit("export", _wait_for_cancel, event) for event in started]
+        assert all(event.wait(5) for event in started)
+        manager.shutdown()
+        for job in remaining:
+            with pytest.raises(OperationCancelledError):
+                job.future.result(timeout=5)
+
+    def test_queued_job_not_run(self, manager):
+        """実行待ちの間に置き換えられたジョブは実行しない"""
+        started = threading.Event()
+        blocker = manager.submit("blocker", _wait_for_cancel, started)
+        assert started.wait(5)
+
+        calls = []
+        queued = manager.submit("search", lambda token: calls.append("queued"), supersede=True)
+        latest = manager.submit("search", lambda token: calls.append("latest"), supersede=True)
+        manager.cancel("blocker")
+
+        latest.future.result(timeout=5)
+        assert queued.future.cancelled()
+        assert calls == ["latest"]
+        with pytest.raises(OperationCancelledError):
+            blocker.future.result(timeout=5)
+
+    def test_current_and_cancel(self, manager):
+        """完了したジョブは実行中のジョブから外れ、キャンセルの対象にならない"""
+        started = threading.Event()
+        job = manager.submit("search", _wait_for_cancel, started)
+        assert started.wait(5)
+        assert manager.current("search") is job
+
+        assert manager.cancel("search")
+        with pytest.raises(OperationCancelledError):
+            job.future.result(timeout=5)
+
+        assert manager.current("search") is None
+        assert not manager.cancel("search")
+
+    def test_bounded_workers(self):
+        """同時に実行するジョブはワーカー数まで"""
+        manager = JobManager(max_workers=2)
+        lock = threading.Lock()
+        running = []
+        peak = []
+        release = threading.Event()
+
+        def job(token):
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            release.wait(5)
+            with lock:
+                running.pop()
+
+        jobs = [manager.submit(f"job{i}", job) for i in range(6)]
+        release.set()
+        for submitted in jobs:
+            submitted.future.result(timeout=5)
+
+        assert max(peak) <= 2
+        manager.shutdown()
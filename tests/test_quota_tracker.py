@@ -0,0 +1,153 @@
+"""
+APIクォータ管理のテスト
+"""
+import sqlite3
+import pytest
+from datetime import datetime, date, timezone
+from unittest.mock import Mock, patch, MagicMock
+
+from src.domain.models import SearchCriteria
+from src.infrastructure import quota_tracker
+from src.infrastructure.quota_tracker import QuotaTracker, pacific_today
+from src.infrastructure.youtube_client import YouTubeClient, QuotaExceededError
+from tests.conftest import make_video_item
+
+
+class TestPacificToday:
+    """太平洋時間の日付計算のテスト"""
+
+    @pytest.mark.parametrize("use_zoneinfo", [True, False])
+    def test_date_boundary(self, use_zoneinfo, monkeypatch):
+        """UTCと太平洋時間で日付がずれる時刻"""
+        if not use_zoneinfo:
+            monkeypatch.setattr(quota_tracker, "_PACIFIC_TZ", None)
+        elif quota_tracker._PACIFIC_TZ is None:
+            pytest.skip("tzdataが利用できません")
+
+        # 冬時間（UTC-8）: 2024-01-15 07:59 UTC は 1/14 23:59 PST
+        assert pacific_today(datetime(2024, 1, 15, 7, 59, tzinfo=timezone.utc)) == date(2024, 1, 14)
+        assert pacific_today(datetime(2024, 1, 15, 8, 0, tzinfo=timezone.utc)) == date(2024, 1, 15)
+        # 夏時間（UTC-7）: 2024-07-15 06:59 UTC は 7/14 23:59 PDT
+        assert pacific_today(datetime(2024, 7, 15, 6, 59, tzinfo=timezone.utc)) == date(2024, 7, 14)
+        assert pacific_today(datetime(2024, 7, 15, 7, 0, tzinfo=timezone.utc)) == date(2024, 7, 15)
+
+
+class TestQuotaTracker:
+    """QuotaTrackerのテスト"""
+
+    def test_record_per_key(self, db_path):
+        """APIキーごとに使用量を記録"""
+        tracker = QuotaTracker(db_path, daily_limit=1000)
+        tracker.record("key_a", 100)
+        tracker.record("key_a", 1)
+        tracker.record("key_b", 100)
+
+        assert tracker.get_used("key_a") == 101
+        assert tracker.get_used("key_b") == 100
+        assert tracker.get_remaining("key_a") == 899
+        assert tracker.get_remaining("key_c") == 1000
+
+    def test_remaining_never_negative(self, db_path):
+        """上限を超えても残量は0"""
+        tracker = QuotaTracker(db_path, daily_limit=100)
+        tracker.record("key_a", 150)
+
+        assert tracker.get_remaining("key_a") == 0
+
+    def test_api_key_not_stored(self, db_path):
+        """APIキー自体はデータベースに保存しない"""
+        import sqlite3
+        tracker = QuotaTracker(db_path)
+        tracker.record("secret_key_value", 1)
+
+        conn = sqlite3.connect(db_path)
+        key_ids = [row[0] for row in conn.execute("SELECT key_id FROM api_quota_usage")]
+        conn.close()
+        assert "secret_key_value" not in key_ids
+
+
+class TestBudgetAwareSearch:
+    """クォータ予算に応じた検索のテスト"""
+
+    def _mock_youtube(self):
+        def search_side_effect(**kwargs):
+            page = int(kwargs.get("pageToken", "0"))
+            request = Mock()
+            request.execute.return_value = {
+                "items": [{"id": {"videoId": f"p{page}v{i:07d}"}} for i in range(50)],
+                "nextPageToken": str(page + 1)
+            }
+            return request
+
+        def videos_side_effect(part, id, **kwargs):
+            request = Mock()
+            request.execute.return_value = {"items": [
+                make_video_item(video_id, view_count=1, duration="PT2M") for video_id in id.split(",")
+            ]}
+            return request
+
+        mock_youtube = MagicMock()
+        mock_youtube.search.return_value.list.side_effect = search_side_effect
+        mock_youtube.videos.return_value.list.side_effect = videos_side_effect
+        return mock_youtube
+
+    @patch.dict('os.environ', {'YOUTUBE_API_KEY': 'test_api_key'})
+    @patch('src.infrastructure.youtube_client.build')
+    def test_usage_recorded(self, mock_build, db_path):
+        """search.listは100、videos.listは1ユニットとして記録"""
+        mock_build.return_value = self._mock_youtube()
+        tracker = QuotaTracker(db_path, daily_limit=10000)
+        client = YouTubeClient(quota_tracker=tracker)
+
+        client.search_videos(SearchCriteria(keyword="test", max_results=100))
+
+        assert tracker.get_used("test_api_key") == 2 * 100 + 2 * 1
+        assert client.get_remaining_quota() == 10000 - 202
+        client.close()
+
+    @patch.dict('os.environ', {'YOUTUBE_API_KEY': 'test_api_key'})
+    @patch('src.infrastructure.youtube_client.build')
+    def test_record_failure_keeps_response(self, mock_build):
+        """クォータの記録に失敗しても、受け取ったレスポンスを使い、APIを再度呼び出さない"""
+        mock_youtube = self._mock_youtube()
+        mock_build.return_value = mock_youtube
+        tracker = Mock()
+        tracker.get_remaining.return_value = 10000
+        tracker.record.side_effect = sqlite3.OperationalError("database is locked")
+        client = YouTubeClient(quota_tracker=tracker)
+
+        videos = client.search_videos(SearchCriteria(keyword="test", max_results=50))
+
+        assert len(videos) == 50
+        assert mock_youtube.search.return_value.list.call_count == 1
+        assert mock_youtube.videos.return_value.list.call_count == 1
+        assert tracker.record.call_count == 2
+        client.close()
+
+    @patch.dict('os.environ', {'YOUTUBE_API_KEY': 'test_api_key'})
+    @patch('src.infrastructure.youtube_client.build')
+    def test_max_units_limits_pages(self, mock_build, db_path):
+        """max_unitsに収まるページ数までで検索を打ち切る"""
+        mock_youtube = self._mock_youtube()
+        mock_build.return_value = mock_youtube
+        client = YouTubeClient(quota_tracker=QuotaTracker(db_path))
+
+        videos = client.search_videos(SearchCriteria(keyword="test", max_results=500), max_units=250)
+
+        assert len(videos) == 100
+        assert mock_youtube.search.return_value.list.call_count == 2
+        client.close()
+
+    @patch.dict('os.environ', {'YOUTUBE_API_KEY': 'test_api_key'})
+    @patch('src.infrastructure.youtube_client.build')
+    def test_insufficient_quota(self, mock_build, db_path):
+        """1ページも取得できない場合はAPIを呼ばずにエラー"""
+        mock_youtube = self._mock_youtube()
+        mock_build.return_value = mock_youtube
+        tracker = QuotaTracker(db_path, daily_limit=10000)
+        tracker.record("test_api_key", 9950)
+        client = YouTubeClient(quota_tracker=tracker)
+
+        with pytest.raises(QuotaExceededError):
+            client.search_videos(SearchCriteria(keyword="test"))
+        mock_youtube.search.return_value.list.assert_not_called()
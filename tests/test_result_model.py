@@ -0,0 +1,146 @@
+"""
+検索結果の表示用モデルのテスト
+"""
+import pytest
+from datetime import datetime
+
+from src.ui.result_model import ResultModel, format_row, COLUMNS
+from tests.conftest import make_video
+
+
+class TestResultModel:
+    """ResultModelのテスト"""
+
+    def test_format_row(self):
+        """表示用の文字列に整形"""
+        row = format_row(make_video(
+            "vid1", view_count=1234567, duration_seconds=3725, published_at=datetime(2024, 1, 2), is_short=True
+        ))
+
+        assert len(row) == len(COLUMNS)
+        assert row == (
+            "title vid1", "channel", "1,234,567", "01:02:05", "2024-01-02", "ショート",
+            "https://www.youtube.com/watch?v=vid1"
+        )
+
+    def test_window(self):
+        """表示位置の範囲の行のみ取得"""
+        model = ResultModel([make_video(f"vid{i}") for i in range(10)])
+
+        assert len(model) == 10
+        assert [row[0] for row in model.window(3, 2)] == ["title vid3", "title vid4"]
+        assert len(model.window(8, 5)) == 2
+        assert model.window(10, 5) == []
+
+    def test_video_at(self):
+        """表示位置の動画情報（範囲外はNone）"""
+        videos = [make_video(f"vid{i}") for i in range(3)]
+        model = ResultModel(videos)
+
+        assert model.video_at(1) is videos[1]
+        assert model.video_at(3) is None
+        assert model.video_at(-1) is None
+
+    def test_reorder(self):
+        """表示順を変えても元の動画リストの順は変えない"""
+        videos = [make_video(f"vid{i}") for i in range(3)]
+        model = ResultModel(videos)
+        model.reorder([2, 0, 1])
+
+        assert [row[0] for row in model.window(0, 3)] == ["title vid2", "title vid0", "title vid1"]
+        assert model.video_at(0) is videos[2]
+        assert model.videos == videos
+
+    def test_reorder_invalid(self):
+        """すべての行を1回ずつ含まない表示順はエラー"""
+        model = ResultModel([make_video(f"vid{i}") for i in range(3)])
+
+        with pytest.raises(ValueError):
+            model.reorder([0, 0, 1])
+
+    def test_empty(self):
+        """空のモデル"""
+        model = ResultModel()
+
+        assert len(model) == 0
+        assert model.window(0, 30) == []
+
+
+class TestResultModelSort:
+    """ResultModelのソートのテスト"""
+
+    def _titles(self, model: ResultModel) -> list:
+        return [row[0] for row in model.window(0, len(model))]
+
+    def test_numeric_sort(self):
+        """再生回数・長さは表示文字列ではなく数値で比較"""
+        model = ResultModel([
+            make_video("a", view_count=9000),
+            make_video("b", view_count=10000),
+            make_video("c", view_count=800),
+        ])
+        model.sort([("views", False)])
+        assert self._titles(model) == ["title c", "title a", "title b"]
+
+        model = ResultModel([
+            make_video("a", duration_seconds=600),
+            make_video("b", duration_seconds=3700),
+            make_video("c", duration_seconds=59),
+        ])
+        model.sort([("duration", True)])
+        assert self._titles(model) == ["title b", "title a", "title c"]
+
+    def test_date_and_title_sort(self):
+        """公開日は日時、タイトルは大文字小文字を区別せずに比較"""
+        model = ResultModel([
+            make_video("a", title="beta", published_at=datetime(2024, 3, 1)),
+            make_video("b", title="Alpha", published_at=datetime(2023, 12, 31)),
+            make_video("c", title="gamma", published_at=datetime(2024, 1, 15)),
+        ])
+
+        model.sort([("published", False)])
+        assert self._titles(model) == ["Alpha", "gamma", "beta"]
+
+        model.sort([("title", False)])
+        assert self._titles(model) == ["Alpha", "beta", "gamma"]
+
+    def test_multi_key_stable(self):
+        """第1キーが同じ行は第2キー、それも同じ行は元の順"""
+        model = ResultModel([
+            make_video("a", channel_name="X", view_count=100),
+            make_video("b", channel_name="Y", view_count=300),
+            make_video("c", channel_name="X", view_count=300),
+            make_video("d", channel_name="Y", view_count=300),
+            make_video("e", channel_name="X", view_count=100),
+        ])
+        model.sort([("views", True), ("channel", False)])
+
+        assert self._titles(model) == ["title c", "title b", "title d", "title a", "title e"]
+
+    def test_positions_follow_sort(self):
+        """ソート後の表示位置とインデックスの対応"""
+        videos = [make_video("a", view_count=3), make_video("b", view_count=1), make_video("c", view_count=2)]
+        model = ResultModel(videos)
+        model.sort([("views", False)])
+
+        assert model.index_at(0) == 1
+        assert model.position_of(0) == 2
+        assert model.video_at(0) is videos[1]
+
+    def test_unknown_column(self):
+        """不明なカラムはエラー"""
+        with pytest.raises(ValueError):
+            ResultModel([make_video("a")]).sort([("unknown", False)])
+
+    def test_extend(self):
+        """追加した行は整形済みの行とソートキーを引き継ぎ、並び替えにも含まれる"""
+        model = ResultModel([make_video("a", view_count=3), make_video("b", view_count=1)])
+        model.sort([("views", False)])
+        model.extend(ResultModel([make_video("c", view_count=2)]))
+
+        assert len(model) == 3
+        assert self._titles(model) == ["title b", "title a", "title c"]
+
+        model.sort([("views", False)])
+        assert self._titles(model) == ["title b", "title c", "title a"]
+        assert model.position_of(2) == 1
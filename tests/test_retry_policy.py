@@ -0,0 +1,135 @@
+"""
+リトライポリシーのテスト
+"""
+import json
+import time
+import pytest
+from unittest.mock import Mock, patch, MagicMock
+from googleapiclient.errors import HttpError
+
+from src.domain.models import SearchCriteria
+from src.infrastructure.retry_policy import RetryPolicy
+from src.infrastructure.youtube_client import YouTubeClient, YouTubeAPIError
+from tests.conftest import make_video_item
+
+
+def _http_error(status, reason="backendError"):
+    """指定したステータス・理由のHttpErrorを生成"""
+    resp = Mock(status=status, reason="Error")
+    content = json.dumps({"error": {"errors": [{"reason": reason}]}}).encode("utf-8")
+    return HttpError(resp, content)
+
+
+class TestRetryPolicy:
+    """RetryPolicyのテスト"""
+
+    def test_retryable_errors(self):
+        """5xx・429・接続エラーは再試行する"""
+        policy = RetryPolicy()
+        assert policy.is_retryable(_http_error(500))
+        assert policy.is_retryable(_http_error(503))
+        assert policy.is_retryable(_http_error(429))
+        assert policy.is_retryable(ConnectionResetError())
+        assert policy.is_retryable(TimeoutError())
+        assert policy.is_retryable(_http_error(403), {"rateLimitExceeded"})
+
+    def test_status_errors(self):
+        """HttpError以外でもHTTPステータスを持つエラーはステータスで判定"""
+        policy = RetryPolicy()
+        assert policy.is_retryable(Mock(spec=Exception, status=503))
+        assert not policy.is_retryable(Mock(spec=Exception, status=400))
+        assert policy.is_retryable(Mock(spec=Exception, status=403), {"userRateLimitExceeded"})
+
+    def test_non_retryable_errors(self):
+        """4xxや想定外のエラーは再試行しない"""
+        policy = RetryPolicy()
+        assert not policy.is_retryable(_http_error(400))
+        assert not policy.is_retryable(_http_error(404))
+        assert not policy.is_retryable(_http_error(403), {"forbidden"})
+        assert not policy.is_retryable(ValueError())
+
+    def test_delay_capped(self):
+        """待ち時間は指数的に増え、上限で頭打ちになる"""
+        policy = RetryPolicy(base_delay=1.0, max_delay=4.0)
+        for _ in range(100):
+            assert 0 <= policy.compute_delay(1) <= 1.0
+            assert 0 <= policy.compute_delay(2) <= 2.0
+            assert 0 <= policy.compute_delay(10) <= 4.0
+
+    def test_next_delay_limits(self):
+        """試行回数の上限・期限を超える場合は再試行しない"""
+        policy = RetryPolicy(max_attempts=3, base_delay=0.0)
+        assert policy.next_delay(_http_error(503), 1) == 0.0
+        assert policy.next_delay(_http_error(503), 3) is None
+        assert policy.next_delay(_http_error(400), 1) is None
+
+        policy = RetryPolicy(base_delay=10.0, max_delay=10.0)
+        with patch('src.infrastructure.retry_policy.random.uniform', return_value=10.0):
+            assert policy.next_delay(_http_error(503), 1, deadline_at=time.monotonic() + 1) is None
+
+    def test_invalid_policy(self):
+        """不正な設定"""
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+
+class TestYouTubeClientRetry:
+    """YouTubeClientの再試行・部分結果のテスト"""
+
+    @patch.dict('os.environ', {'YOUTUBE_API_KEY': 'test_api_key'})
+    @patch('src.infrastructure.youtube_client.build')
+    def test_retry_then_success(self, mock_build):
+        """一時的なエラーの後に成功すれば結果を返す"""
+        request = Mock()
+        request.execute.side_effect = [_http_error(503), ConnectionResetError(), {"items": []}]
+        mock_build.return_value.search.return_value.list.return_value = request
+        client = YouTubeClient(retry_policy=RetryPolicy(base_delay=0.0))
+
+        response = client._execute(lambda youtube: youtube.search().list(q="test"), 100)
+
+        assert response == {"items": []}
+        assert request.execute.call_count == 3
+
+    @patch.dict('os.environ', {'YOUTUBE_API_KEY': 'test_api_key'})
+    @patch('src.infrastructure.youtube_client.build')
+    def test_partial_result_salvage(self, mock_build):
+        """途中のページが失敗しても取得済みのページ分は返す"""
+        first_page = Mock()
+        first_page.execute.return_value = {
+            "items": [{"id": {"videoId": f"v{i:010d}"}} for i in range(50)],
+            "nextPageToken": "t1"
+        }
+        failing_page = Mock()
+        failing_page.execute.side_effect = _http_error(500)
+
+        def videos_side_effect(part, id, **kwargs):
+            request = Mock()
+            request.execute.return_value = {"items": [
+                make_video_item(video_id, view_count=1, duration="PT2M") for video_id in id.split(",")
+            ]}
+            return request
+
+        mock_youtube = MagicMock()
+        mock_youtube.search.return_value.list.side_effect = [first_page] + [failing_page] * 3
+        mock_youtube.videos.return_value.list.side_effect = videos_side_effect
+        mock_build.return_value = mock_youtube
+        client = YouTubeClient(retry_policy=RetryPolicy(max_attempts=3, base_delay=0.0))
+
+        videos = client.search_videos(SearchCriteria(keyword="test", max_results=200))
+
+        assert len(videos) == 50
+        assert failing_page.execute.call_count == 3
+        client.close()
+
+    @patch.dict('os.environ', {'YOUTUBE_API_KEY': 'test_api_key'})
+    @patch('src.infrastructure.youtube_client.build')
+    def test_first_page_failure_raises(self, mock_build):
+        """最初のページから失敗した場合はエラー"""
+        request = Mock()
+        request.execute.side_effect = _http_error(400, "badRequest")
+        mock_build.return_value.search.return_value.list.return_value = request
+        client = YouTubeClient(retry_policy=RetryPolicy(base_delay=0.0))
+
+        with pytest.raises(YouTubeAPIError):
+            client.search_videos(SearchCriteria(keyword="test"))
+        assert request.execute.call_count == 1
@@ -0,0 +1,108 @@
+"""
+検索結果キャッシュのテスト
+"""
+import pytest
+from datetime import datetime
+from unittest.mock import Mock, patch, MagicMock
+
+from src.domain.models import SearchCriteria, VideoType
+from src.infrastructure.search_cache import SearchResultCache, make_search_cache_key
+from src.infrastructure.youtube_client import YouTubeClient
+
+
+class TestSearchCacheKey:
+    """キャッシュキー生成のテスト"""
+
+    def test_keyword_normalization(self):
+        """全角・半角、大文字小文字、空白の違いは同じキー"""
+        key1 = make_search_cache_key(SearchCriteria(keyword="Python  入門"))
+        key2 = make_search_cache_key(SearchCriteria(keyword=" ｐｙｔｈｏｎ 入門 "))
+        assert key1 == key2
+
+    def test_post_filters_ignored(self):
+        """取得後のフィルタ条件はキーに含めない"""
+        key1 = make_search_cache_key(SearchCriteria(keyword="test", max_results=50))
+        key2 = make_search_cache_key(SearchCriteria(
+            keyword="test", max_results=200, min_view_count=1000, video_type=VideoType.SHORT
+        ))
+        assert key1 == key2
+
+    def test_api_parameters_distinguished(self):
+        """search.listのパラメータが異なれば別のキー"""
+        base = make_search_cache_key(SearchCriteria(keyword="test"))
+        assert base != make_search_cache_key(SearchCriteria(keyword="test", order="date"))
+        assert base != make_search_cache_key(SearchCriteria(keyword="test", region_code="US"))
+        assert base != make_search_cache_key(
+            SearchCriteria(keyword="test", published_after=datetime(2024, 1, 1))
+        )
+
+
+class TestSearchResultCache:
+    """SearchResultCacheのテスト"""
+
+    def test_put_and_get(self, db_path):
+        """保存したページを取得"""
+        cache = SearchResultCache(db_path)
+        criteria = SearchCriteria(keyword="test", max_results=3)
+        cache.put(criteria, [["a", "b"], ["c"]], exhausted=False)
+
+        assert cache.get(criteria) == [["a", "b"], ["c"]]
+
+    def test_insufficient_results(self, db_path):
+        """件数が不足し、続きのページがある場合はキャッシュを使わない"""
+        cache = SearchResultCache(db_path)
+        cache.put(SearchCriteria(keyword="test", max_results=2), [["a", "b"]], exhausted=False)
+
+        assert cache.get(SearchCriteria(keyword="test", max_results=10)) is None
+
+    def test_exhausted_results(self, db_path):
+        """最終ページまで取得済みなら件数不足でもキャッシュを使う"""
+        cache = SearchResultCache(db_path)
+        cache.put(SearchCriteria(keyword="test", max_results=2), [["a", "b"]], exhausted=True)
+
+        assert cache.get(SearchCriteria(keyword="test", max_results=10)) == [["a", "b"]]
+
+    def test_expired(self, db_path):
+        """有効期間切れのキャッシュは使わない"""
+        cache = SearchResultCache(db_path, max_age=0)
+        criteria = SearchCriteria(keyword="test", max_results=1)
+        cache.put(criteria, [["a"]], exhausted=True)
+
+        assert cache.get(criteria) is None
+
+    def test_lru_eviction(self, db_path):
+        """最大件数を超えると最終参照日時が古いものから削除"""
+        cache = SearchResultCache(db_path, max_entries=2)
+        first = SearchCriteria(keyword="first", max_results=1)
+        second = SearchCriteria(keyword="second", max_results=1)
+        third = SearchCriteria(keyword="third", max_results=1)
+
+        cache.put(first, [["a"]], exhausted=True)
+        cache.put(second, [["b"]], exhausted=True)
+        cache.get(first)  # firstを最近使ったものにする
+        cache.put(third, [["c"]], exhausted=True)
+
+        assert cache.get(first) == [["a"]]
+        assert cache.get(second) is None
+        assert cache.get(third) == [["c"]]
+
+    @patch.dict('os.environ', {'YOUTUBE_API_KEY': 'test_api_key'})
+    @patch('src.infrastructure.youtube_client.build')
+    def test_client_uses_cached_pages(self, mock_build, db_path):
+        """同じ検索条件の2回目はsearch.listを呼ばない"""
+        request = Mock()
+        request.execute.return_value = {
+            "items": [{"id": {"videoId": f"v{i:010d}"}} for i in range(5)]
+        }
+        mock_youtube = MagicMock()
+        mock_youtube.search.return_value.list.return_value = request
+        mock_build.return_value = mock_youtube
+        client = YouTubeClient(search_cache=SearchResultCache(db_path))
+
+        criteria = SearchCriteria(keyword="test", max_results=10)
+        first_ids = client._search_video_ids(criteria)
+        second_ids = client._search_video_ids(SearchCriteria(keyword="TEST", max_results=3))
+
+        assert len(first_ids) == 5
+        assert second_ids == first_ids[:3]
+        assert mock_youtube.search.return_value.list.call_count == 1
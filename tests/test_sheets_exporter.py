@@ -0,0 +1,371 @@
+"""
+Google Sheetsエクスポートのテスト
+"""
+import os
+import pytest
+import tempfile
+from unittest.mock import MagicMock, patch
+
+import gspread
+from gspread.utils import rowcol_to_a1
+
+from src.infrastructure.retry_policy import RetryPolicy
+from src.infrastructure.sheets_exporter import SheetsExporter, WriteRateLimiter, COLUMN_WIDTHS, APP_DIR
+from src.utils.cancellation import CancellationToken, OperationCancelledError
+from tests.conftest import make_video
+
+
+def _api_error(status: int, retry_after: str = None) -> gspread.exceptions.APIError:
+    response = MagicMock()
+    response.status_code = status
+    response.headers = {"Retry-After": retry_after} if retry_after else {}
+    response.json.return_value = {"error": {"code": status, "message": "error", "status": "ERROR"}}
+    return gspread.exceptions.APIError(response)
+
+
+@pytest.fixture
+def temp_dir():
+    """一時ディレクトリ"""
+    with tempfile.TemporaryDirectory() as path:
+        yield path
+
+
+@pytest.fixture
+def worksheet():
+    """モックのワークシート"""
+    worksheet = MagicMock()
+    worksheet.row_count = 1000
+    worksheet.id = 0
+    worksheet.spreadsheet.url = "https://docs.google.com/spreadsheets/d/test"
+    return worksheet
+
+
+@pytest.fixture
+def make_exporter(temp_dir, worksheet):
+    """モックのクライアントを使うSheetsExporterを作成"""
+    credentials_path = os.path.join(temp_dir, "credentials.json")
+    open(credentials_path, "w").close()
+
+    def make(**kwargs):
+        kwargs.setdefault("checkpoint_dir", os.path.join(temp_dir, "checkpoints"))
+        with patch("src.infrastructure.sheets_exporter.Credentials"), \
+                patch("src.infrastructure.sheets_exporter.gspread.authorize") as mock_authorize:
+            spreadsheet = worksheet.spreadsheet
+            spreadsheet.worksheet.return_value = worksheet
+            mock_authorize.return_value.open.return_value = spreadsheet
+            return SheetsExporter(
+                credentials_path,
+                retry_policy=RetryPolicy(max_attempts=3, base_delay=0.0, deadline=None),
+                **kwargs
+            )
+
+    return make
+
+
+def _requests(worksheet) -> list:
+    """batch_updateで送信したリクエスト（送信ごとのリスト）"""
+    return [call.args[0]["requests"] for call in worksheet.spreadsheet.batch_update.call_args_list]
+
+
+def _cell_writes(requests: list) -> list:
+    """updateCellsで書き込んだ(開始セル, 行数)"""
+    writes = []
+    for request in requests:
+        update = request.get("updateCells")
+        if update and "start" in update:
+            start = update["start"]
+            writes.append((rowcol_to_a1(start["rowIndex"] + 1, start["columnIndex"] + 1), len(update["rows"])))
+    return writes
+
+
+def _cell_values(request: dict) -> list:
+    """updateCellsで書き込んだ値"""
+    return [
+        [cell.get("userEnteredValue", {}).get("stringValue", "") for cell in row["values"]]
+        for row in request["updateCells"]["rows"]
+    ]
+
+
+def _has_clear(requests: list) -> bool:
+    return any("updateCells" in request and "range" in request["updateCells"] for request in requests)
+
+
+def _request_types(requests: list) -> set:
+    return {key for request in requests for key in request}
+
+
+class TestWriteRateLimiter:
+    """WriteRateLimiterのテスト"""
+
+    @patch("src.infrastructure.sheets_exporter.time.sleep")
+    @patch("src.infrastructure.sheets_exporter.time.monotonic")
+    def test_waits_when_limit_reached(self, mock_monotonic, mock_sleep):
+        """上限に達した場合は最も古いリクエストから1分経過するまで待つ"""
+        mock_monotonic.side_effect = [0.0, 10.0, 20.0, 60.0]
+        limiter = WriteRateLimiter(2)
+
+        limiter.wait()
+        limiter.wait()
+        mock_sleep.assert_not_called()
+
+        limiter.wait()
+        mock_sleep.assert_called_once_with(60.0 - 20.0)
+
+
+@patch("src.infrastructure.sheets_exporter.time.sleep")
+class TestSheetsExporter:
+    """SheetsExporterのテスト"""
+
+    def test_chunked_writes(self, mock_sleep, make_exporter, worksheet):
+        """チャンクごとに1回のbatch_updateで書き込み、クリア・ヘッダー・書式は最初の送信に含める"""
+        exporter = make_exporter(chunk_size=2)
+        url = exporter.export([make_video(f"vid{i}") for i in range(5)], "sheet")
+
+        assert url == "https://docs.google.com/spreadsheets/d/test"
+        batches = _requests(worksheet)
+        assert len(batches) == 3
+        assert _has_clear(batches[0])
+        assert _cell_writes(batches[0]) == [("A1", 1), ("A2", 2)]
+        assert {"repeatCell", "updateDimensionProperties", "updateSheetProperties"} <= _request_types(batches[0])
+        assert _cell_writes(batches[1]) == [("A4", 2)]
+        assert _cell_writes(batches[2]) == [("A6", 1)]
+
+        worksheet.clear.assert_not_called()
+        worksheet.update.assert_not_called()
+        worksheet.format.assert_not_called()
+        assert os.listdir(exporter.checkpoint_dir) == []
+
+    def test_sheet_format(self, mock_sleep, make_exporter, worksheet):
+        """ヘッダー行の書式・固定とカラム幅"""
+        make_exporter().export([make_video("vid1")], "sheet")
+        requests = _requests(worksheet)[0]
+
+        widths = [r["updateDimensionProperties"]["properties"]["pixelSize"]
+                  for r in requests if "updateDimensionProperties" in r]
+        assert widths == COLUMN_WIDTHS
+
+        frozen = [r["updateSheetProperties"]["properties"]["gridProperties"]
+                  for r in requests if "updateSheetProperties" in r]
+        assert {"frozenRowCount": 1} in frozen
+
+        header_format = next(r["repeatCell"] for r in requests if "repeatCell" in r)
+        text_format = header_format["cell"]["userEnteredFormat"]["textFormat"]
+        assert text_format["bold"] is True
+        assert text_format["foregroundColor"] == {"red": 1.0, "green": 1.0, "blue": 1.0}
+
+    def test_omit_fields(self, mock_sleep, make_exporter, worksheet):
+        """取得を省略した属性の列は出力せず、カラム幅も残りの列のみ設定"""
+        make_exporter().export([make_video("vid1")], "sheet", omit_fields=["description", "tags", "thumbnail_url"])
+        requests = _requests(worksheet)[0]
+
+        header, data = [r for r in requests if "start" in r.get("updateCells", {})][:2]
+        assert len(_cell_values(header)[0]) == 11
+        assert len(_cell_values(data)[0]) == 11
+        widths = [r["updateDimensionProperties"]["properties"]["pixelSize"]
+                  for r in requests if "updateDimensionProperties" in r]
+        assert widths == COLUMN_WIDTHS[:11]
+
+    def test_empty_values_cleared(self, mock_sleep, make_exporter, worksheet):
+        """空の値はセルをクリア"""
+        make_exporter().export([make_video("vid1")], "sheet")
+        data_request = [r for r in _requests(worksheet)[0] if "start" in r.get("updateCells", {})][1]
+
+        # サムネイルURLなし
+        assert data_request["updateCells"]["rows"][0]["values"][13] == {}
+        assert _cell_values(data_request)[0][:3] == ["1", "title vid1", "https://www.youtube.com/watch?v=vid1"]
+
+    def test_grows_worksheet(self, mock_sleep, make_exporter, worksheet):
+        """行数が足りない場合は同じリクエストでワークシートを拡張"""
+        worksheet.row_count = 3
+        exporter = make_exporter(chunk_size=10)
+        exporter.export([make_video(f"vid{i}") for i in range(5)], "sheet")
+
+        requests = _requests(worksheet)[0]
+        assert requests[0]["updateSheetProperties"]["properties"]["gridProperties"] == {"rowCount": 6}
+        worksheet.add_rows.assert_not_called()
+
+        # 拡張後の行数はエクスポーターで保持し、キャッシュしたワークシートで再度拡張しない
+        exporter.export([make_video(f"vid{i}") for i in range(4)], "sheet")
+        assert "updateSheetProperties" not in _requests(worksheet)[1][0]
+        assert worksheet.row_count == 3
+
+    def test_handles_cached(self, mock_sleep, make_exporter, worksheet):
+        """同じシートへの2回目以降のエクスポートはスプレッドシート・ワークシートを取得しない"""
+        exporter = make_exporter()
+        exporter.export([make_video("vid1")], "sheet")
+        exporter.export([make_video("vid2")], "sheet")
+
+        exporter.client.open.assert_called_once_with("sheet")
+        worksheet.spreadsheet.worksheet.assert_called_once()
+
+    def test_handles_forgotten_on_error(self, mock_sleep, make_exporter, worksheet):
+        """失敗した場合はキャッシュを破棄して次回取得し直す"""
+        exporter = make_exporter()
+        worksheet.spreadsheet.batch_update.side_effect = [_api_error(400), None]
+        with pytest.raises(Exception):
+            exporter.export([make_video("vid1")], "sheet")
+        exporter.export([make_video("vid1")], "sheet")
+
+        assert exporter.client.open.call_count == 2
+
+    def test_retry_on_rate_limit(self, mock_sleep, make_exporter, worksheet):
+        """429エラーはRetry-Afterに従って再試行"""
+        worksheet.spreadsheet.batch_update.side_effect = [_api_error(429, retry_after="7"), None]
+        make_exporter(chunk_size=10).export([make_video("vid1")], "sheet")
+
+        assert worksheet.spreadsheet.batch_update.call_count == 2
+        mock_sleep.assert_any_call(7.0)
+
+    def test_no_retry_on_client_error(self, mock_sleep, make_exporter, worksheet):
+        """400エラーは再試行しない"""
+        worksheet.spreadsheet.batch_update.side_effect = [_api_error(400)]
+
+        with pytest.raises(Exception):
+            make_exporter(chunk_size=10).export([make_video("vid1")], "sheet")
+        assert worksheet.spreadsheet.batch_update.call_count == 1
+
+    def test_resume_from_checkpoint(self, mock_sleep, make_exporter, worksheet):
+        """失敗した場合は同じ内容の再エクスポートで続きから書き込む"""
+        videos = [make_video(f"vid{i}") for i in range(5)]
+        exporter = make_exporter(chunk_size=2)
+        worksheet.spreadsheet.batch_update.side_effect = [None, _api_error(400)]
+
+        with pytest.raises(Exception, match="2/5行まで書き込み済み"):
+            exporter.export(videos, "sheet")
+
+        worksheet.reset_mock()
+        worksheet.spreadsheet.batch_update.side_effect = None
+        exporter.export(videos, "sheet")
+
+        batches = _requests(worksheet)
+        assert not any(_has_clear(batch) for batch in batches)
+        assert [write for batch in batches for write in _cell_writes(batch)] == [("A4", 2), ("A6", 1)]
+
+    def test_cancel_between_chunks(self, mock_sleep, make_exporter, worksheet):
+        """キャンセルした場合はチャンクの区切りで止め、再エクスポートで続きから書き込む"""
+        videos = [make_video(f"vid{i}") for i in range(5)]
+        exporter = make_exporter(chunk_size=2)
+        token = CancellationToken()
+        worksheet.spreadsheet.batch_update.side_effect = lambda body: token.cancel()
+
+        with pytest.raises(OperationCancelledError):
+            exporter.export(videos, "sheet", cancel_token=token)
+        assert len(_requests(worksheet)) == 1
+
+        worksheet.reset_mock()
+        worksheet.spreadsheet.batch_update.side_effect = None
+        exporter.export(videos, "sheet")
+
+        batches = _requests(worksheet)
+        assert [write for batch in batches for write in _cell_writes(batch)] == [("A4", 2), ("A6", 1)]
+
+    def test_changed_content_restarts(self, mock_sleep, make_exporter, worksheet):
+        """内容が異なる場合はチェックポイントを使わず最初から書き込む"""
+        exporter = make_exporter(chunk_size=2)
+        worksheet.spreadsheet.batch_update.side_effect = [None, _api_error(400)]
+        with pytest.raises(Exception):
+            exporter.export([make_video(f"vid{i}") for i in range(5)], "sheet")
+
+        worksheet.reset_mock()
+        worksheet.spreadsheet.batch_update.side_effect = None
+        exporter.export([make_video(f"other{i}") for i in range(3)], "sheet")
+
+        batches = _requests(worksheet)
+        assert _has_clear(batches[0])
+        assert [write for batch in batches for write in _cell_writes(batch)] == [("A1", 1), ("A2", 2), ("A4", 1)]
+
+    def test_empty_videos(self, mock_sleep, make_exporter):
+        """空のリストはエラー"""
+        with pytest.raises(ValueError):
+            make_exporter().export([], "sheet")
+
+    def test_checkpoint_dir_independent_of_cwd(self, mock_sleep, make_exporter, temp_dir, monkeypatch):
+        """チェックポイントのディレクトリは作業ディレクトリではなくアプリケーションのディレクトリ基準"""
+        monkeypatch.chdir(temp_dir)
+        monkeypatch.delenv("SHEETS_CHECKPOINT_DIR", raising=False)
+        assert make_exporter(checkpoint_dir=None).checkpoint_dir == str(APP_DIR / "sheets_checkpoints")
+
+        monkeypatch.setenv("SHEETS_CHECKPOINT_DIR", "custom_checkpoints")
+        assert make_exporter(checkpoint_dir=None).checkpoint_dir == str(APP_DIR / "custom_checkpoints")
+
+
+@patch("src.infrastructure.sheets_exporter.time.sleep")
+class TestSheetsUpsert:
+    """SheetsExporterの更新モードのテスト"""
+
+    def _existing_sheet(self, exporter, videos) -> list:
+        """エクスポート済みのシートの値"""
+        values = [exporter._create_headers()]
+        for idx, video in enumerate(videos, start=1):
+            values.append(exporter._normalize_row(exporter._create_video_row(idx, video)))
+        return values
+
+    def test_only_changed_cells(self, mock_sleep, make_exporter, worksheet):
+        """変更されたセルと追加する行のみを1回のbatch_updateで送信"""
+        exporter = make_exporter()
+        worksheet.get_all_values.return_value = self._existing_sheet(
+            exporter, [make_video("vid1"), make_video("vid2")]
+        )
+
+        exporter.export(
+            [make_video("vid2", view_count=500), make_video("vid1"), make_video("vid3")],
+            "sheet", upsert=True
+        )
+
+        worksheet.get_all_values.assert_called_once()
+        batches = _requests(worksheet)
+        assert len(batches) == 1
+        requests = batches[0]
+        assert not _has_clear(requests)
+        assert _cell_writes(requests) == [("F3", 1), ("A4", 1)]
+        assert _cell_values(requests[0]) == [["500"]]
+        assert _cell_values(requests[1])[0][:3] == ["3", "title vid3", "https://www.youtube.com/watch?v=vid3"]
+        assert "repeatCell" not in _request_types(requests)
+
+    def test_no_changes(self, mock_sleep, make_exporter, worksheet):
+        """変更がない場合は書き込まない"""
+        exporter = make_exporter()
+        worksheet.get_all_values.return_value = self._existing_sheet(exporter, [make_video("vid1")])
+
+        exporter.export([make_video("vid1")], "sheet", upsert=True)
+
+        worksheet.spreadsheet.batch_update.assert_not_called()
+
+    def test_adjacent_changes_merged(self, mock_sleep, make_exporter, worksheet):
+        """同じ行の隣接するセルの変更は1つの範囲にまとめる"""
+        exporter = make_exporter()
+        worksheet.get_all_values.return_value = self._existing_sheet(exporter, [make_video("vid1")])
+        video = make_video("vid1")
+        video.view_count, video.like_count, video.comment_count = 200, 20, 2
+
+        exporter.export([video], "sheet", upsert=True)
+
+        requests = _requests(worksheet)[0]
+        assert _cell_writes(requests) == [("F2", 1)]
+        assert _cell_values(requests[0]) == [["200", "20", "2"]]
+
+    def test_omitted_columns_kept(self, mock_sleep, make_exporter, worksheet):
+        """取得を省略した属性の列は既存の値を残す"""
+        exporter = make_exporter()
+        worksheet.get_all_values.return_value = self._existing_sheet(
+            exporter, [make_video("vid1", description="既存の概要")]
+        )
+
+        exporter.export(
+            [make_video("vid1", view_count=500, description="")], "sheet", upsert=True,
+            omit_fields=["description"]
+        )
+
+        assert _cell_writes(_requests(worksheet)[0]) == [("F2", 1)]
+
+    def test_empty_sheet(self, mock_sleep, make_exporter, worksheet):
+        """空のシートにはヘッダーと全行を書き込み、書式も同じリクエストで設定"""
+        worksheet.get_all_values.return_value = []
+
+        make_exporter().export([make_video("vid1"), make_video("vid2")], "sheet", upsert=True)
+
+        batches = _requests(worksheet)
+        assert len(batches) == 1
+        assert _cell_writes(batches[0]) == [("A1", 1), ("A2", 2)]
+        assert [row[0] for row in _cell_values(batches[0][1])] == ["1", "2"]
+        assert "repeatCell" in _request_types(batches[0])
@@ -0,0 +1,90 @@
+"""
+動画統計情報の時系列ストアのテスト
+"""
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+from src.application.video_search_service import VideoSearchService
+from src.domain.models import SearchCriteria
+from src.infrastructure.statistics_store import StatisticsStore
+from tests.conftest import make_video
+
+
+BASE = datetime(2024, 6, 1, 12, 0, 0)
+
+
+class TestStatisticsStore:
+    """StatisticsStoreのテスト"""
+
+    def test_unchanged_not_recorded(self, db_path):
+        """直前の観測値から変化のない動画は記録しない"""
+        store = StatisticsStore(db_path)
+
+        assert store.record([make_video("a", 100), make_video("b", 50)], BASE) == 2
+        assert store.record([make_video("a", 100), make_video("b", 60)], BASE + timedelta(hours=1)) == 1
+        assert store.record([make_video("a", 100, like_count=1)], BASE + timedelta(hours=2)) == 1
+
+        assert [o.view_count for o in store.get_history("b")] == [50, 60]
+        assert [o.like_count for o in store.get_history("a")] == [10, 1]
+
+    def test_range_query(self, db_path):
+        """期間指定で古い順に取得"""
+        store = StatisticsStore(db_path)
+        for day in range(5):
+            store.record([make_video("a", 100 + day)], BASE + timedelta(days=day))
+
+        history = store.get_history("a", start=BASE + timedelta(days=1), end=BASE + timedelta(days=3))
+
+        assert [o.view_count for o in history] == [101, 102]
+        assert history[0].observed_at == BASE + timedelta(days=1)
+
+    def test_as_of(self, db_path):
+        """基準日時以前で最新の観測値"""
+        store = StatisticsStore(db_path)
+        store.record([make_video("a", 100), make_video("b", 10)], BASE)
+        store.record([make_video("a", 300)], BASE + timedelta(days=2))
+
+        result = store.get_as_of(["a", "b", "c"], BASE + timedelta(days=1))
+
+        assert result["a"].view_count == 100
+        assert result["b"].view_count == 10
+        assert "c" not in result
+
+    def test_downsample(self, db_path):
+        """古い観測値は1日1件（最後の値）に間引き、新しい観測値は残す"""
+        store = StatisticsStore(db_path, downsample_after_days=30)
+        old_day = BASE - timedelta(days=60)
+        for hour in range(4):
+            store.record([make_video("a", 100 + hour)], old_day + timedelta(hours=hour))
+            store.record([make_video("a", 200 + hour)], BASE + timedelta(hours=hour))
+
+        assert store.downsample(now=BASE + timedelta(days=1)) == 3
+
+        view_counts = [o.view_count for o in store.get_history("a")]
+        assert view_counts == [103, 200, 201, 202, 203]
+
+
+class TestSearchRecordsStatistics:
+    """検索時の統計情報記録のテスト"""
+
+    def test_search_records_statistics(self, db_path):
+        """検索結果の統計情報を記録"""
+        client = Mock()
+        client.search_videos.return_value = [make_video("a", 100)]
+        store = StatisticsStore(db_path)
+        service = VideoSearchService(client, statistics_store=store)
+
+        service.search(SearchCriteria(keyword="test"))
+
+        assert [o.view_count for o in store.get_history("a")] == [100]
+
+    def test_record_failure_does_not_fail_search(self):
+        """記録に失敗しても検索結果を返す"""
+        client = Mock()
+        client.search_videos.return_value = [make_video("a", 100)]
+        store = Mock()
+        store.record.side_effect = RuntimeError("disk full")
+        service = VideoSearchService(client, statistics_store=store)
+
+        assert len(service.search(SearchCriteria(keyword="test"))) == 1
@@ -0,0 +1,113 @@
+"""
+動画メタデータキャッシュのテスト
+"""
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch, MagicMock
+
+from src.infrastructure.video_cache import VideoCache
+from src.infrastructure.youtube_client import YouTubeClient
+from tests.conftest import make_video, make_video_item
+
+
+def _expire(db_path, column, video_id):
+    """指定カラムの取得日時を過去に書き換える"""
+    import sqlite3
+    conn = sqlite3.connect(db_path)
+    old = (datetime.now() - timedelta(days=30)).isoformat()
+    conn.execute(f"UPDATE video_cache SET {column} = ? WHERE video_id = ?", (old, video_id))
+    conn.commit()
+    conn.close()
+
+
+class TestVideoCache:
+    """VideoCacheのテスト"""
+
+    def test_put_and_lookup(self, db_path):
+        """保存した動画は有効期間内ならfreshとして返る"""
+        cache = VideoCache(db_path)
+        cache.put_many([
+            make_video("aaaaaaaaaaa", duration_seconds=45, is_short=True, tags=["タグ", "test"]),
+            make_video("bbbbbbbbbbb")
+        ])
+
+        lookup = cache.lookup(["aaaaaaaaaaa", "bbbbbbbbbbb", "ccccccccccc"])
+
+        assert set(lookup.fresh) == {"aaaaaaaaaaa", "bbbbbbbbbbb"}
+        assert lookup.missing == ["ccccccccccc"]
+        video = lookup.fresh["aaaaaaaaaaa"]
+        assert video.tags == ["タグ", "test"]
+        assert video.is_short is True
+        assert video.published_at == datetime(2024, 1, 1)
+
+    def test_stale_statistics(self, db_path):
+        """statisticsのみ期限切れの動画を分類"""
+        cache = VideoCache(db_path)
+        cache.put_many([make_video("aaaaaaaaaaa")])
+        _expire(db_path, "statistics_fetched_at", "aaaaaaaaaaa")
+
+        lookup = cache.lookup(["aaaaaaaaaaa"])
+
+        assert not lookup.fresh
+        assert "aaaaaaaaaaa" in lookup.stale_statistics
+        assert lookup.missing == []
+
+    def test_stale_details(self, db_path):
+        """snippet/contentDetailsが期限切れの動画は未取得扱い"""
+        cache = VideoCache(db_path)
+        cache.put_many([make_video("aaaaaaaaaaa")])
+        _expire(db_path, "details_fetched_at", "aaaaaaaaaaa")
+
+        lookup = cache.lookup(["aaaaaaaaaaa"])
+
+        assert lookup.missing == ["aaaaaaaaaaa"]
+
+    def test_update_statistics(self, db_path):
+        """統計情報の更新"""
+        cache = VideoCache(db_path)
+        cache.put_many([make_video("aaaaaaaaaaa", view_count=1000)])
+        _expire(db_path, "statistics_fetched_at", "aaaaaaaaaaa")
+
+        cache.update_statistics([make_video("aaaaaaaaaaa", view_count=2000)])
+        lookup = cache.lookup(["aaaaaaaaaaa"])
+
+        assert lookup.fresh["aaaaaaaaaaa"].view_count == 2000
+
+    @patch.dict('os.environ', {'YOUTUBE_API_KEY': 'test_api_key'})
+    @patch('src.infrastructure.youtube_client.build')
+    def test_client_requests_only_missing_and_stale(self, mock_build, db_path):
+        """YouTubeClientは未取得・期限切れの動画のみAPIに問い合わせる"""
+        cache = VideoCache(db_path)
+        cache.put_many([make_video("aaaaaaaaaaa"), make_video("bbbbbbbbbbb", view_count=1000)])
+        _expire(db_path, "statistics_fetched_at", "bbbbbbbbbbb")
+
+        def list_side_effect(part, id, **kwargs):
+            request = Mock()
+            if part == "statistics":
+                assert id == "bbbbbbbbbbb"
+                request.execute.return_value = {"items": [
+                    {"id": "bbbbbbbbbbb", "statistics": {"viewCount": "5000", "likeCount": "1"}}
+                ]}
+            else:
+                assert id == "ccccccccccc"
+                request.execute.return_value = {"items": [
+                    make_video_item("ccccccccccc", view_count=10, duration="PT2M")
+                ]}
+            return request
+
+        mock_youtube = MagicMock()
+        mock_youtube.videos.return_value.list.side_effect = list_side_effect
+        mock_build.return_value = mock_youtube
+        client = YouTubeClient(video_cache=cache)
+
+        videos = client._get_video_details(["aaaaaaaaaaa", "bbbbbbbbbbb", "ccccccccccc"])
+
+        assert [v.video_id for v in videos] == ["aaaaaaaaaaa", "bbbbbbbbbbb", "ccccccccccc"]
+        assert videos[1].view_count == 5000
+        assert mock_youtube.videos.return_value.list.call_count == 2
+
+        # 2回目はすべてキャッシュから取得
+        mock_youtube.videos.return_value.list.reset_mock()
+        videos = client._get_video_details(["aaaaaaaaaaa", "bbbbbbbbbbb", "ccccccccccc"])
+        assert len(videos) == 3
+        mock_youtube.videos.return_value.list.assert_not_called()
@@ -0,0 +1,117 @@
+"""
+APIレスポンスのフィールド指定のテスト
+"""
+import pytest
+from dataclasses import fields
+from unittest.mock import Mock, patch, MagicMock
+
+from src.domain.models import VideoInfo, SearchCriteria
+from src.infrastructure.video_cache import VideoCache
+from src.infrastructure.video_fields import (
+    VIDEO_FIELD_PATHS, build_video_fields, resolve_omit_fields, FIELD_PROFILES
+)
+from src.infrastructure.youtube_client import YouTubeClient
+from src.application.video_search_service import VideoSearchService
+from tests.conftest import make_video_item
+
+
+class TestVideoFields:
+    """fieldsパラメータ生成のテスト"""
+
+    def test_all_attributes_mapped(self):
+        """VideoInfoの属性（URL以外）はすべてフィールドに対応付ける"""
+        attributes = {f.name for f in fields(VideoInfo)} - {"url"}
+        assert attributes == set(VIDEO_FIELD_PATHS)
+
+    def test_full_fields(self):
+        """省略なしの場合は必要なフィールドをすべて含む"""
+        assert build_video_fields() == (
+            "items(id,"
+            "snippet(title,channelTitle,channelId,publishedAt,description,tags,thumbnails/high/url),"
+            "statistics(viewCount,likeCount,commentCount),"
+            "contentDetails(duration))"
+        )
+
+    def test_omit_fields(self):
+        """省略した属性のフィールドは含まない"""
+        result = build_video_fields(FIELD_PROFILES["compact"])
+
+        assert "description" not in result
+        assert "tags" not in result
+        assert "thumbnails" not in result
+        assert "snippet(title,channelTitle,channelId,publishedAt)" in result
+
+    def test_resolve_profile_from_env(self):
+        """環境変数のプロファイルを使用"""
+        with patch.dict('os.environ', {'YOUTUBE_FIELD_PROFILE': 'no_description'}):
+            assert resolve_omit_fields() == frozenset({"description"})
+        with patch.dict('os.environ', {'YOUTUBE_FIELD_PROFILE': 'unknown'}):
+            with pytest.raises(ValueError):
+                resolve_omit_fields()
+
+    def test_required_fields_cannot_be_omitted(self):
+        """検索・フィルタに必要な属性は省略できない"""
+        with pytest.raises(ValueError, match="view_count"):
+            resolve_omit_fields(["view_count"])
+
+
+class TestClientFieldMask:
+    """YouTubeClientのフィールド指定のテスト"""
+
+    def _mock_youtube(self):
+        search_request = Mock()
+        search_request.execute.return_value = {"items": [{"id": {"videoId": "abc12345678"}}]}
+        videos_request = Mock()
+        videos_request.execute.return_value = {"items": [
+            make_video_item("abc12345678", view_count=10, duration="PT2M")
+        ]}
+        mock_youtube = MagicMock()
+        mock_youtube.search.return_value.list.return_value = search_request
+        mock_youtube.videos.return_value.list.return_value = videos_request
+        return mock_youtube
+
+    @patch.dict('os.environ', {'YOUTUBE_API_KEY': 'test_api_key'})
+    @patch('src.infrastructure.youtube_client.build')
+    def test_fields_passed_to_api(self, mock_build):
+        """search.list・videos.listにfieldsを指定"""
+        mock_youtube = self._mock_youtube()
+        mock_build.return_value = mock_youtube
+        client = YouTubeClient(omit_fields=["description"])
+
+        videos = client.search_videos(SearchCriteria(keyword="test", max_results=10))
+
+        assert len(videos) == 1
+        assert videos[0].description == ""
+        search_kwargs = mock_youtube.search.return_value.list.call_args.kwargs
+        assert search_kwargs["fields"] == "nextPageToken,items/id/videoId"
+        videos_kwargs = mock_youtube.videos.return_value.list.call_args.kwargs
+        assert "description" not in videos_kwargs["fields"]
+        assert "viewCount" in videos_kwargs["fields"]
+
+    @patch.dict('os.environ', {'YOUTUBE_API_KEY': 'test_api_key'})
+    @patch('src.infrastructure.youtube_client.build')
+    def test_fields_per_search(self, mock_build):
+        """検索ごとに出力先のプロファイルで取得するフィールドを選ぶ"""
+        mock_youtube = self._mock_youtube()
+        mock_build.return_value = mock_youtube
+        service = VideoSearchService(YouTubeClient(omit_fields=[]))
+
+        service.search(SearchCriteria(keyword="test", max_results=10), field_profile="compact")
+        assert mock_youtube.videos.return_value.list.call_args.kwargs["fields"] == \
+            build_video_fields(FIELD_PROFILES["compact"])
+
+        service.search(SearchCriteria(keyword="other", max_results=10))
+        assert mock_youtube.videos.return_value.list.call_args.kwargs["fields"] == build_video_fields()
+
+    @patch.dict('os.environ', {'YOUTUBE_API_KEY': 'test_api_key'})
+    @patch('src.infrastructure.youtube_client.build')
+    def test_reduced_records_not_cached(self, mock_build, db_path):
+        """属性を省略して取得した動画はキャッシュに保存しない"""
+        mock_build.return_value = self._mock_youtube()
+        cache = VideoCache(db_path)
+
+        YouTubeClient(video_cache=cache, omit_fields=["description"]).get_video_by_id("abc12345678")
+        assert cache.get_many(["abc12345678"]) == {}
+
+        YouTubeClient(video_cache=cache, omit_fields=[]).get_video_by_id("abc12345678")
+        assert "abc12345678" in cache.get_many(["abc12345678"])
@@ -44,7 +44,9 @@ class TestVideoSearchService:
 
         assert len(results) == 1
         assert results[0].video_id == "1"
-        mock_client.search_videos.assert_called_once_with(criteria)
+        mock_client.search_videos.assert_called_once_with(
+            criteria, max_units=None, on_batch=None, cancel_token=None, omit_fields=None
+        )
 
     def test_search_validation_error(self):
         """検索時のバリデーションエラー"""
@@ -7,7 +7,18 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 from src.infrastructure.youtube_client import YouTubeClient, YouTubeAPIError
+from src.infrastructure.retry_policy import RetryPolicy
+from src.utils.cancellation import CancellationToken, OperationCancelledError
 from src.domain.models import SearchCriteria, VideoType
+from tests.conftest import make_video_item
+
+
+def _videos_list_side_effect(**kwargs):
+    """videos().list()のモック（指定IDの動画をそのまま返す）"""
+    items = [make_video_item(video_id) for video_id in kwargs["id"].split(",")]
+    request = Mock()
+    request.execute.return_value = {"items": items}
+    return request
 
 
 class TestYouTubeClient:
@@ -16,11 +27,30 @@ class TestYouTubeClient:
     @patch.dict('os.environ', {'YOUTUBE_API_KEY': 'test_api_key'})
     @patch('src.infrastructure.youtube_client.build')
     def test_initialization_success(self, mock_build):
-        """正常な初期化"""
+        """正常な初期化（サービスオブジェクトは初回参照時に生成）"""
         mock_build.return_value = MagicMock()
         client = YouTubeClient()
         assert client.api_key == 'test_api_key'
-        mock_build.assert_called_once_with("youtube", "v3", developerKey='test_api_key')
+        mock_build.assert_not_called()
+
+        assert client.youtube is mock_build.return_value
+        mock_build.assert_called_once_with(
+            "youtube", "v3",
+            developerKey='test_api_key',
+            static_discovery=True,
+            cache_discovery=False
+        )
+
+    @patch.dict('os.environ', {'YOUTUBE_API_KEY': 'test_api_key'})
+    @patch('src.infrastructure.youtube_client.build')
+    def test_service_shared_between_clients(self, mock_build):
+        """サービスオブジェクトはクライアント間で共有"""
+        mock_build.return_value = MagicMock()
+        first = YouTubeClient()
+        second = YouTubeClient()
+
+        assert first.youtube is second.youtube
+        assert mock_build.call_count == 1
 
     @patch.dict('os.environ', {}, clear=True)
     def test_initialization_no_api_key(self):
@@ -181,3 +211,192 @@ class TestYouTubeClient:
         criteria_all = SearchCriteria(keyword="test", video_type=VideoType.ALL)
         filtered_all = client._filter_videos(videos, criteria_all)
         assert len(filtered_all) == 2
+
+    @patch.dict('os.environ', {'YOUTUBE_API_KEY': 'test_api_key'})
+    @patch('src.infrastructure.youtube_client.build')
+    def test_get_video_details_concurrent_keeps_order(self, mock_build):
+        """並列取得でも入力順で動画情報を返す"""
+        mock_youtube = MagicMock()
+        mock_youtube.videos.return_value.list.side_effect = _videos_list_side_effect
+        mock_build.return_value = mock_youtube
+        client = YouTubeClient(max_workers=4)
+
+        video_ids = [f"id{i:08d}" for i in range(180)]
+        videos = client._get_video_details(video_ids)
+
+        assert [v.video_id for v in videos] == video_ids
+        # 50件ずつ4バッチに分割される
+        assert mock_youtube.videos.return_value.list.call_count == 4
+
+    @patch.dict('os.environ', {'YOUTUBE_API_KEY': 'test_api_key'})
+    @patch('src.infrastructure.youtube_client.build')
+    def test_get_video_details_sequential(self, mock_build):
+        """同時実行数1では逐次取得"""
+        mock_youtube = MagicMock()
+        mock_youtube.videos.return_value.list.side_effect = _videos_list_side_effect
+        mock_build.return_value = mock_youtube
+        client = YouTubeClient(max_workers=1)
+
+        video_ids = [f"id{i:08d}" for i in range(120)]
+        videos = client._get_video_details(video_ids)
+
+        assert [v.video_id for v in videos] == video_ids
+        assert mock_youtube.videos.return_value.list.call_count == 3
+
+    @patch.dict('os.environ', {'YOUTUBE_API_KEY': 'test_api_key'})
+    @patch('src.infrastructure.youtube_client.build')
+    def test_search_videos_pipeline(self, mock_build):
+        """search.listのページごとに詳細取得を行い、検索順で結果を返す"""
+        pages = [
+            {"items": [{"id": {"videoId": f"p0v{i:07d}"}} for i in range(50)], "nextPageToken": "t1"},
+            {"items": [{"id": {"videoId": f"p1v{i:07d}"}} for i in range(50)], "nextPageToken": "t2"},
+            {"items": [{"id": {"videoId": f"p2v{i:07d}"}} for i in range(50)]},
+        ]
+        search_requests = []
+        for page in pages:
+            request = Mock()
+            request.execute.return_value = page
+            search_requests.append(request)
+
+        mock_youtube = MagicMock()
+        mock_youtube.search.return_value.list.side_effect = search_requests
+        mock_youtube.videos.return_value.list.side_effect = _videos_list_side_effect
+        mock_build.return_value = mock_youtube
+        client = YouTubeClient(max_workers=4)
+
+        criteria = SearchCriteria(keyword="test", max_results=120)
+        videos = client.search_videos(criteria)
+
+        expected_ids = [item["id"]["videoId"] for page in pages for item in page["items"]][:120]
+        assert [v.video_id for v in videos] == expected_ids
+        assert mock_youtube.search.return_value.list.call_count == 3
+        assert mock_youtube.videos.return_value.list.call_count == 3
+        client.close()
+
+    @patch.dict('os.environ', {'YOUTUBE_API_KEY': 'test_api_key'})
+    @patch('src.infrastructure.youtube_client.build')
+    def test_search_videos_on_batch(self, mock_build):
+        """取得したバッチを検索順にコールバックへ渡し、連結すると結果と一致する"""
+        pages = [
+            {"items": [{"id": {"videoId": f"p0v{i:07d}"}} for i in range(50)], "nextPageToken": "t1"},
+            {"items": [{"id": {"videoId": f"p1v{i:07d}"}} for i in range(50)], "nextPageToken": "t2"},
+            {"items": [{"id": {"videoId": f"p2v{i:07d}"}} for i in range(50)]},
+        ]
+        search_requests = []
+        for page in pages:
+            request = Mock()
+            request.execute.return_value = page
+            search_requests.append(request)
+
+        mock_youtube = MagicMock()
+        mock_youtube.search.return_value.list.side_effect = search_requests
+        mock_youtube.videos.return_value.list.side_effect = _videos_list_side_effect
+        mock_build.return_value = mock_youtube
+        client = YouTubeClient(max_workers=4)
+
+        batches = []
+        criteria = SearchCriteria(keyword="test", max_results=120)
+        videos = client.search_videos(criteria, on_batch=batches.append)
+
+        assert [len(batch) for batch in batches] == [50, 50, 20]
+        assert [v.video_id for batch in batches for v in batch] == [v.video_id for v in videos]
+        client.close()
+
+    @patch.dict('os.environ', {'YOUTUBE_API_KEY': 'test_api_key'})
+    @patch('src.infrastructure.youtube_client.build')
+    def test_search_videos_cancelled_between_pages(self, mock_build):
+        """キャンセルされた場合は次のページを取得せずに打ち切る"""
+        token = CancellationToken()
+
+        def first_page(**kwargs):
+            token.cancel()
+            return {"items": [{"id": {"videoId": f"p0v{i:07d}"}} for i in range(50)], "nextPageToken": "t1"}
+
+        mock_youtube = MagicMock()
+        mock_youtube.search.return_value.list.return_value.execute.side_effect = first_page
+        mock_youtube.videos.return_value.list.side_effect = _videos_list_side_effect
+        mock_build.return_value = mock_youtube
+        client = YouTubeClient(max_workers=1)
+
+        with pytest.raises(OperationCancelledError):
+            client.search_videos(SearchCriteria(keyword="test", max_results=120), cancel_token=token)
+
+        assert mock_youtube.search.return_value.list.call_count == 1
+        mock_youtube.videos.return_value.list.assert_not_called()
+
+    @patch.dict('os.environ', {'YOUTUBE_API_KEY': 'test_api_key'})
+    @patch('src.infrastructure.youtube_client.time')
+    @patch('src.infrastructure.youtube_client.build')
+    def test_search_videos_deadline_returns_partial(self, mock_build, mock_time):
+        """期限を過ぎたら次のページ・バッチを取得せず、取得済みの分で結果を返す"""
+        now = [0.0]
+        mock_time.monotonic.side_effect = lambda: now[0]
+
+        def search_page(**kwargs):
+            page = int(kwargs.get("pageToken") or 0)
+            request = Mock()
+            # 1ページの取得に50秒かかる時計
+            request.execute.side_effect = lambda **_: (now.__setitem__(0, now[0] + 50), {
+                "items": [{"id": {"videoId": f"p{page}v{i:08d}"}} for i in range(50)],
+                "nextPageToken": str(page + 1)
+            })[1]
+            return request
+
+        mock_youtube = MagicMock()
+        mock_youtube.search.return_value.list.side_effect = search_page
+        mock_youtube.videos.return_value.list.side_effect = _videos_list_side_effect
+        mock_build.return_value = mock_youtube
+        client = YouTubeClient(max_workers=1, retry_policy=RetryPolicy(base_delay=0.0, deadline=120))
+
+        videos = client.search_videos(SearchCriteria(keyword="test", max_results=500))
+
+        # 3ページ目の取得後（150秒）に期限を過ぎるため、3ページ目の詳細は取得しない
+        assert len(videos) == 100
+        assert videos[-1].video_id == "p1v00000049"
+        assert mock_youtube.search.return_value.list.call_count == 3
+        assert mock_youtube.videos.return_value.list.call_count == 2
+
+    @patch.dict('os.environ', {'YOUTUBE_API_KEY': 'test_api_key'})
+    @patch('src.infrastructure.youtube_client.build')
+    def test_search_videos_cancelled_before_start(self, mock_build):
+        """キャンセル済みのトークンではAPIを呼び出さない"""
+        mock_youtube = MagicMock()
+        mock_build.return_value = mock_youtube
+        client = YouTubeClient()
+        token = CancellationToken()
+        token.cancel()
+
+        with pytest.raises(OperationCancelledError):
+            client.search_videos(SearchCriteria(keyword="test"), cancel_token=token)
+        mock_youtube.search.assert_not_called()
+        client.close()
+
+    @patch.dict('os.environ', {'YOUTUBE_API_KEY': 'test_api_key'})
+    @patch('src.infrastructure.youtube_client.build')
+    def test_search_videos_on_batch_filtered(self, mock_build):
+        """コールバックに渡すバッチにもフィルタリングを適用し、コールバックの例外は無視する"""
+        mock_youtube = MagicMock()
+        mock_search_request = Mock()
+        mock_search_request.execute.return_value = {
+            "items": [{"id": {"videoId": f"vid{i:08d}"}} for i in range(4)]
+        }
+        mock_youtube.search.return_value.list.return_value = mock_search_request
+        mock_videos_request = Mock()
+        mock_videos_request.execute.return_value = {
+            "items": [make_video_item(f"vid{i:08d}", view_count=i * 1000) for i in range(4)]
+        }
+        mock_youtube.videos.return_value.list.return_value = mock_videos_request
+        mock_build.return_value = mock_youtube
+        client = YouTubeClient(max_workers=1)
+
+        batches = []
+
+        def on_batch(batch):
+            batches.append(batch)
+            raise RuntimeError("UIの更新に失敗")
+
+        criteria = SearchCriteria(keyword="test", min_view_count=2000)
+        videos = client.search_videos(criteria, on_batch=on_batch)
+
+        assert [v.video_id for v in videos] == ["vid00000002", "vid00000003"]
+        assert batches == [videos]
@@ -43,8 +43,13 @@ a = Analysis(
         'google.auth',
         'google.auth.transport.requests',
         'google_auth_oauthlib',
+        'requests',
+        'requests.adapters',
         # gspread（オプション）
         'gspread',
+        # pyarrow（オプション、Parquetエクスポート）
+        'pyarrow',
+        'pyarrow.parquet',
         # その他
         'openpyxl',
         'openpyxl.styles',